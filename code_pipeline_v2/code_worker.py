@@ -20,7 +20,6 @@ from __future__ import annotations
 import argparse
 import dataclasses
 import fnmatch
-import gzip
 import hashlib
 import json
 import re
@@ -30,9 +29,15 @@ from pathlib import Path
 from typing import Any
 
 from collector_core.config_validator import read_yaml as read_yaml_config
+from collector_core.shard_index import SHARD_INDEX_EVERY
+from collector_core.sharding import StreamingShardWriter
+from collector_core.utils.io import ZstdSettings
 
 VERSION = "0.2"
 
+# Shard compressions written as such; anything else is plain JSONL.
+SHARD_COMPRESSIONS = ("gzip", "zstd", "zst")
+
 
 def utc_now() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
@@ -64,6 +69,9 @@ class ShardingConfig:
     max_records_per_shard: int
     compression: str
     prefix: str = "code"
+    max_bytes_per_shard: int | None = None
+    index_every: int = SHARD_INDEX_EVERY
+    zstd: ZstdSettings | None = None
 
 
 @dataclasses.dataclass
@@ -95,41 +103,38 @@ class WorkerContext:
 
 
 class Sharder:
+    """Code shard writer; rows stream to disk through ``StreamingShardWriter``.
+
+    Each shard is compressed on a background thread as rows arrive and is
+    renamed into place once it holds ``max_records_per_shard`` rows or
+    ``max_bytes_per_shard`` uncompressed bytes.
+    """
+
     def __init__(self, cfg: ShardingConfig, base_dir: Path):
         self.cfg = cfg
         self.base_dir = base_dir
-        self.rows: list[dict[str, Any]] = []
-        self.idx = 0
+        self.writer = StreamingShardWriter(
+            base_dir,
+            prefix=cfg.prefix,
+            compression=cfg.compression if cfg.compression in SHARD_COMPRESSIONS else "none",
+            max_records=cfg.max_records_per_shard,
+            max_bytes=cfg.max_bytes_per_shard,
+            index_every=cfg.index_every,
+            zstd_settings=cfg.zstd,
+        )
+
+    @property
+    def idx(self) -> int:
+        return self.writer.shard_index
 
     def _path(self) -> Path:
-        suffix = "jsonl.gz" if self.cfg.compression == "gzip" else "jsonl"
-        return self.base_dir / f"{self.cfg.prefix}_{self.idx:05d}.{suffix}"
+        return self.writer.current_path
 
     def add(self, row: dict[str, Any]) -> Path | None:
-        self.rows.append(row)
-        if len(self.rows) >= self.cfg.max_records_per_shard:
-            path = self.flush()
-            self.idx += 1
-            return path
-        return None
+        return self.writer.write(row)
 
     def flush(self) -> Path | None:
-        if not self.rows:
-            return None
-        path = self._path()
-        ensure_dir(path.parent)
-        opener = gzip.open if path.suffix.endswith("gz") else open
-        mode = "ab" if path.suffix.endswith("gz") else "at"
-        if path.suffix.endswith("gz"):
-            with opener(path, mode) as f:  # type: ignore
-                for row in self.rows:
-                    f.write((json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8"))
-        else:
-            with opener(path, mode, encoding="utf-8") as f:  # type: ignore
-                for row in self.rows:
-                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
-        self.rows = []
-        return path
+        return self.writer.close()
 
 
 SECRET_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
@@ -362,6 +367,9 @@ def sharding_from_cfg(cfg: dict[str, Any]) -> ShardingConfig:
         max_records_per_shard=int(g.get("max_records_per_shard", 50000)),
         compression=str(g.get("compression", "gzip")),
         prefix="code",
+        max_bytes_per_shard=int(g["max_bytes_per_shard"]) if g.get("max_bytes_per_shard") else None,
+        index_every=int(g.get("index_every", SHARD_INDEX_EVERY)),
+        zstd=ZstdSettings.from_dict(g.get("zstd")),
     )
 
 
@@ -414,11 +422,7 @@ def run_extraction(
         }
     }
     processing_cfg = processing_from_cfg(cfg_wrapper, {})
-    sharding_cfg = ShardingConfig(
-        max_records_per_shard=int((sharding or {}).get("max_records_per_shard", 50000)),
-        compression=str((sharding or {}).get("compression", "gzip")),
-        prefix="code",
-    )
+    sharding_cfg = sharding_from_cfg(cfg_wrapper)
     ctx = WorkerContext(
         target_id=target_id,
         bucket=bucket,
@@ -4,10 +4,14 @@ import dataclasses
 import ipaddress
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from collector_core.acquire_limits import RunByteBudget
 from collector_core.stability import stable_api
+from collector_core.utils.http import HttpSessionPool
+
+if TYPE_CHECKING:
+    from collector_core.acquire.strategies.http_async import AsyncHttpPool
 
 StrategyHandler = Callable[["AcquireContext", dict[str, Any], Path], list[dict[str, Any]]]
 PostProcessor = Callable[
@@ -74,6 +78,10 @@ class AcquireContext:
     )
     cfg: dict[str, Any] | None = None
     checks_run_id: str = ""
+    # Shared keep-alive sessions; strategies fall back to ``requests.get`` without one.
+    http: HttpSessionPool | None = None
+    # Set by the async engine; async HTTP handlers share its client and slots.
+    http_async: AsyncHttpPool | None = None
 
 
 @stable_api
@@ -0,0 +1,291 @@
+"""Host-aware, size-aware ordering of acquire targets.
+
+The acquire worker pool used to start targets strictly in queue order, so a run
+of consecutive targets on one host (e.g. zenodo.org) put every worker on that
+server while other hosts sat idle, and a huge target queued last finished long
+after everything else. ``TargetScheduler`` instead:
+
+- groups queued targets by the host their ``download`` block points at
+  (``target_host``) and keeps at most ``per_host`` of them in flight per host;
+- interleaves hosts, giving a free worker to the host with the fewest targets
+  in flight;
+- within and across hosts, starts the largest expected download first
+  (``expected_bytes``), so long transfers overlap with the rest of the queue.
+
+Usage:
+    scheduler = TargetScheduler(rows, per_host=4)
+    while scheduler.pending:
+        picked = scheduler.next()
+        if picked is None:
+            ...  # every host with queued work is at its cap: wait for a target
+        else:
+            idx, row = picked  # start row; call scheduler.done(idx) when it ends
+    summary["scheduler"] = scheduler.stats()
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+from collector_core.stability import stable_api
+from collector_core.utils.download import normalize_download
+
+# Download keys holding a URL the strategy talks to, in order of preference.
+HOST_URL_KEYS = (
+    "url",
+    "urls",
+    "base_url",
+    "api",
+    "api_base",
+    "record_url",
+    "article_url",
+    "repo_url",
+    "repo",
+    "instance",
+)
+
+# Hosts used by strategies whose download block may name no URL at all.
+STRATEGY_DEFAULT_HOSTS = {
+    "zenodo": "zenodo.org",
+    "dataverse": "dataverse.harvard.edu",
+    "figshare": "api.figshare.com",
+    "figshare_article": "api.figshare.com",
+    "figshare_files": "api.figshare.com",
+    "github_release": "api.github.com",
+    "huggingface_datasets": "huggingface.co",
+    "hf": "huggingface.co",
+}
+
+# Decisions between snapshots of every host's queue depth in ``stats()``.
+DEPTH_SNAPSHOT_EVERY = 100
+
+_SIZE_EXPONENTS = {"": 0, "k": 1, "m": 2, "g": 3, "t": 4, "p": 5}
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:([kmgtp]?)(i?)b)?", re.IGNORECASE)
+
+
+def _url_host(value: str) -> str | None:
+    parsed = urlparse(value)
+    if not parsed.scheme or not parsed.hostname:
+        return None
+    if parsed.scheme == "s3":
+        return f"{parsed.hostname}.s3.amazonaws.com"
+    return parsed.hostname.lower()
+
+
+@stable_api
+def target_host(row: dict[str, Any]) -> str:
+    """Host a queued target downloads from, used to group and cap its work.
+
+    The first URL among ``HOST_URL_KEYS`` in the target's ``download`` block
+    wins (``s3://bucket/...`` maps to ``bucket.s3.amazonaws.com``); otherwise
+    the strategy's default host, an S3 ``bucket``, or ``<strategy>`` for
+    strategies without one (e.g. ``<torrent>``).
+    """
+    download = normalize_download(row.get("download") or {})
+    for key in HOST_URL_KEYS:
+        value = download.get(key)
+        if isinstance(value, list):
+            value = next((item for item in value if isinstance(item, str)), None)
+        if isinstance(value, str) and (host := _url_host(value)):
+            return host
+    strategy = str(download.get("strategy") or "unknown")
+    if strategy in STRATEGY_DEFAULT_HOSTS:
+        return STRATEGY_DEFAULT_HOSTS[strategy]
+    if isinstance(download.get("bucket"), str) and download["bucket"]:
+        return f"{download['bucket']}.s3.amazonaws.com"
+    return f"<{strategy}>"
+
+
+@stable_api
+def parse_size_hint(value: Any) -> int | None:
+    """Bytes in a size hint such as ``1048576``, ``"~500MB"``, ``"~2TB"`` or ``"1.5 GiB"``.
+
+    Decimal units (``KB``/``MB``/...) are powers of 1000 and binary units
+    (``KiB``/``MiB``/...) powers of 1024. Returns None when nothing parses.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value >= 0 else None
+    if not isinstance(value, str):
+        return None
+    match = _SIZE_RE.search(value)
+    if not match:
+        return None
+    number, unit, binary = match.groups()
+    scale = (1024 if binary else 1000) ** _SIZE_EXPONENTS[(unit or "").lower()]
+    return int(float(number) * scale)
+
+
+@stable_api
+def expected_bytes(row: dict[str, Any]) -> int | None:
+    """Expected download size of a target from its ``download`` size hints.
+
+    Uses ``expected_size`` (an int, or the sum of a list or mapping of
+    per-file sizes) and falls back to ``expected.size_hint`` / ``size_hint``
+    strings like ``"~100GB+"``. Returns None when the target gives no hint.
+    """
+    download = normalize_download(row.get("download") or {})
+    sizes = download.get("expected_size")
+    if isinstance(sizes, dict):
+        sizes = list(sizes.values())
+    if isinstance(sizes, list):
+        parsed = [parse_size_hint(size) for size in sizes]
+        known = [size for size in parsed if size is not None]
+        if known:
+            return sum(known)
+    elif (size := parse_size_hint(sizes)) is not None:
+        return size
+    expected = download.get("expected")
+    hints = [expected.get("size_hint")] if isinstance(expected, dict) else []
+    hints.append(download.get("size_hint"))
+    for hint in hints:
+        if (size := parse_size_hint(hint)) is not None:
+            return size
+    return None
+
+
+@dataclass
+class _HostQueue:
+    host: str
+    pending: deque[tuple[int, int | None]] = field(default_factory=deque)
+    in_flight: int = 0
+    targets: int = 0
+    expected_bytes: int = 0
+    unknown_size: int = 0
+    peak_in_flight: int = 0
+    capped: int = 0
+    last_served: int = -1
+
+    def head_size(self) -> int:
+        size = self.pending[0][1]
+        return -1 if size is None else size
+
+
+@stable_api
+class TargetScheduler:
+    """Pick which queued target to start next on a bounded worker pool.
+
+    ``next()`` returns ``(queue_index, row)`` for the target to start, or None
+    when every host with queued work already has ``per_host`` targets in
+    flight (or nothing is left); ``done(queue_index)`` frees the target's host
+    slot. Each host's queue is ordered largest ``expected_bytes`` first, with
+    targets without a size hint last in queue order. A free worker goes to the
+    host with the fewest targets in flight, then the largest queued target,
+    then the least recently served host.
+
+    Not thread-safe: call it from the thread (or event loop) that starts
+    targets. ``stats()`` reports, for the acquire summary, per-host totals,
+    every decision with the chosen host's remaining queue depth, and the
+    depths of all hosts with queued work every ``snapshot_every`` decisions,
+    so its size grows with targets plus targets/``snapshot_every`` x hosts.
+    """
+
+    def __init__(
+        self,
+        rows: list[dict[str, Any]],
+        *,
+        per_host: int,
+        snapshot_every: int = DEPTH_SNAPSHOT_EVERY,
+    ) -> None:
+        self.per_host = max(int(per_host), 1)
+        self.snapshot_every = max(int(snapshot_every), 1)
+        self._rows = rows
+        self._hosts: dict[str, _HostQueue] = {}
+        self._host_of: dict[int, _HostQueue] = {}
+        self._decisions: list[dict[str, Any]] = []
+        self._depth_snapshots: list[dict[str, Any]] = []
+        self._pending = len(rows)
+        for idx, row in enumerate(rows):
+            host = target_host(row)
+            queue = self._hosts.setdefault(host, _HostQueue(host))
+            size = expected_bytes(row)
+            queue.pending.append((idx, size))
+            queue.targets += 1
+            if size is None:
+                queue.unknown_size += 1
+            else:
+                queue.expected_bytes += size
+            self._host_of[idx] = queue
+        for queue in self._hosts.values():
+            queue.pending = deque(
+                sorted(queue.pending, key=lambda item: (item[1] is None, -(item[1] or 0), item[0]))
+            )
+
+    @property
+    def pending(self) -> int:
+        """Targets not yet handed out by ``next()``."""
+        return self._pending
+
+    def next(self) -> tuple[int, dict[str, Any]] | None:
+        ready: list[_HostQueue] = []
+        for queue in self._hosts.values():
+            if not queue.pending:
+                continue
+            if queue.in_flight >= self.per_host:
+                queue.capped += 1
+            else:
+                ready.append(queue)
+        if not ready:
+            return None
+        queue = min(ready, key=lambda q: (q.in_flight, -q.head_size(), q.last_served))
+        idx, size = queue.pending.popleft()
+        self._pending -= 1
+        queue.in_flight += 1
+        queue.peak_in_flight = max(queue.peak_in_flight, queue.in_flight)
+        decision = len(self._decisions)
+        queue.last_served = decision
+        self._decisions.append(
+            {
+                "id": self._rows[idx].get("id"),
+                "host": queue.host,
+                "expected_bytes": size,
+                "host_in_flight": queue.in_flight,
+                "queue_depth": len(queue.pending),
+            }
+        )
+        if decision % self.snapshot_every == 0:
+            self._depth_snapshots.append(
+                {
+                    "decision": decision,
+                    "queue_depths": {
+                        q.host: len(q.pending) for q in self._hosts.values() if q.pending
+                    },
+                }
+            )
+        return idx, self._rows[idx]
+
+    def done(self, idx: int) -> None:
+        self._host_of[idx].in_flight -= 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "per_host": self.per_host,
+            "hosts": {
+                queue.host: {
+                    "targets": queue.targets,
+                    "expected_bytes": queue.expected_bytes,
+                    "unknown_size": queue.unknown_size,
+                    "peak_in_flight": queue.peak_in_flight,
+                    "capped": queue.capped,
+                }
+                for queue in self._hosts.values()
+            },
+            "decisions": self._decisions,
+            "depth_snapshots": self._depth_snapshots,
+        }
+
+
+__all__ = [
+    "DEPTH_SNAPSHOT_EVERY",
+    "HOST_URL_KEYS",
+    "STRATEGY_DEFAULT_HOSTS",
+    "TargetScheduler",
+    "expected_bytes",
+    "parse_size_hint",
+    "target_host",
+]
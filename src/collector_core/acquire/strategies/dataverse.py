@@ -11,7 +11,8 @@ from collector_core.acquire_limits import build_target_limit_enforcer
 from collector_core.acquire_strategies import normalize_download
 from collector_core.dependencies import _try_import, requires
 from collector_core.stability import stable_api
-from collector_core.utils.hash import sha256_file
+from collector_core.utils.hash import HashingSink
+from collector_core.utils.http import pooled_get
 from collector_core.utils.paths import ensure_dir, safe_filename
 
 requests = _try_import("requests")
@@ -60,7 +61,8 @@ def handle_dataverse(
     if not ctx.mode.execute:
         return [{"status": "noop", "path": str(out_dir)}]
     url = f"{instance}/api/access/dvobject/{pid}"
-    resp = requests.get(url, allow_redirects=True, timeout=60)
+    http_get = pooled_get(ctx.http, requests.get)
+    resp = http_get(url, allow_redirects=True, timeout=60)
     resp.raise_for_status()
     size_hint = resp.headers.get("Content-Length")
     limit_error = enforcer.check_size_hint(int(size_hint) if size_hint else None, pid)
@@ -70,12 +72,10 @@ def handle_dataverse(
     out_path = out_dir / filename
     ensure_dir(out_path.parent)
     temp_path = out_path.with_name(f"{out_path.name}.part")
-    with temp_path.open("wb") as f:
-        f.write(resp.content)
+    with HashingSink(temp_path) as sink:
+        sink.write(resp.content)
     content_length = temp_path.stat().st_size
-    sha256 = sha256_file(temp_path)
-    if sha256 is None:
-        sha256 = ""
+    sha256 = sink.hexdigest()
     expected_sha256 = download.get("expected_sha256")
     if expected_sha256 and sha256.lower() != expected_sha256.lower():
         temp_path.unlink(missing_ok=True)
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from collector_core.acquire.context import AcquireContext, StrategyHandler
+from collector_core.acquire.strategies.http import segmented_kwargs
 from collector_core.acquire_limits import (
     build_target_limit_enforcer,
     cleanup_path,
@@ -17,6 +18,7 @@ from collector_core.dependencies import _try_import, requires
 from collector_core.network_utils import _with_retries
 from collector_core.rate_limit import get_resolver_rate_limiter
 from collector_core.stability import stable_api
+from collector_core.utils.http import pooled_get
 from collector_core.utils.io import write_json
 from collector_core.utils.paths import ensure_dir, safe_filename
 
@@ -60,12 +62,13 @@ def handle_figshare_article(
 
     # Get rate limiter from config
     rate_limiter, rate_config = get_resolver_rate_limiter(ctx.cfg, "figshare")
+    http_get = pooled_get(ctx.http, requests.get)
 
     def _fetch() -> requests.Response:
         # Acquire rate limit token before API request
         if rate_limiter:
             rate_limiter.acquire()
-        resp = requests.get(endpoint, timeout=60)
+        resp = http_get(endpoint, timeout=60)
         resp.raise_for_status()
         return resp
 
@@ -108,7 +111,9 @@ def handle_figshare_article(
             results.append(limit_error)
             continue
         out_path = out_dir / fname
-        result = _http_download_with_resume(ctx, download_url, out_path, expected_size)
+        result = _http_download_with_resume(
+            ctx, download_url, out_path, expected_size, **segmented_kwargs(download)
+        )
         size_bytes = resolve_result_bytes(result, out_path)
         limit_error = enforcer.record_bytes(size_bytes, fname)
         if limit_error:
@@ -155,12 +160,13 @@ def handle_figshare_files(
 
     # Get rate limiter from config
     rate_limiter, rate_config = get_resolver_rate_limiter(ctx.cfg, "figshare")
+    http_get = pooled_get(ctx.http, requests.get)
 
     def _fetch() -> requests.Response:
         # Acquire rate limit token before API request
         if rate_limiter:
             rate_limiter.acquire()
-        resp = requests.get(api, timeout=120)
+        resp = http_get(api, timeout=120)
         resp.raise_for_status()
         return resp
 
@@ -203,7 +209,7 @@ def handle_figshare_files(
         if limit_error:
             results.append(limit_error)
             continue
-        result = _http_download_with_resume(ctx, link, out_path)
+        result = _http_download_with_resume(ctx, link, out_path, **segmented_kwargs(download))
         size_bytes = resolve_result_bytes(result, out_path)
         limit_error = enforcer.record_bytes(size_bytes, filename)
         if limit_error:
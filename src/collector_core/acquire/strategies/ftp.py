@@ -12,7 +12,7 @@ from collector_core.acquire_limits import build_target_limit_enforcer
 from collector_core.acquire_strategies import normalize_download
 from collector_core.dependencies import _try_import, requires
 from collector_core.stability import stable_api
-from collector_core.utils.hash import sha256_file
+from collector_core.utils.hash import HashingSink
 from collector_core.utils.paths import ensure_dir
 
 FTP = _try_import("ftplib", "FTP")
@@ -109,15 +109,15 @@ def handle_ftp(ctx: AcquireContext, row: dict[str, Any], out_dir: Path) -> list[
                 local = out_dir / fname
                 ensure_dir(local.parent)
                 temp_path = local.with_name(f"{local.name}.part")
-                with temp_path.open("wb") as f:
-                    ftp.retrbinary(f"RETR {fname}", f.write)
+                with HashingSink(temp_path) as sink:
+                    ftp.retrbinary(f"RETR {fname}", sink.write)
                 content_length = temp_path.stat().st_size
                 limit_error = enforcer.check_size_hint(content_length, fname)
                 if limit_error:
                     temp_path.unlink(missing_ok=True)
                     results.append(limit_error)
                     continue
-                sha256 = sha256_file(temp_path)
+                sha256 = sink.hexdigest()
                 limit_error = enforcer.record_bytes(content_length, fname)
                 if limit_error:
                     temp_path.unlink(missing_ok=True)
@@ -27,6 +27,7 @@ from collector_core.dependencies import _try_import, requires
 from collector_core.network_utils import _with_retries
 from collector_core.rate_limit import get_resolver_rate_limiter
 from collector_core.stability import stable_api
+from collector_core.utils.http import pooled_get
 from collector_core.utils.io import write_json
 from collector_core.utils.paths import ensure_dir, safe_filename
 
@@ -119,12 +120,13 @@ def make_github_release_handler(user_agent: str) -> StrategyHandler:
 
         # Get rate limiter from config - GitHub uses 403 for rate limits
         rate_limiter, rate_config = get_resolver_rate_limiter(ctx.cfg, "github")
+        http_get = pooled_get(ctx.http, requests.get)
 
         def _fetch() -> requests.Response:
             # Acquire rate limit token before API request
             if rate_limiter:
                 rate_limiter.acquire()
-            resp = requests.get(url, headers=headers, timeout=60)
+            resp = http_get(url, headers=headers, timeout=60)
             resp.raise_for_status()
             return resp
 
@@ -6,7 +6,14 @@ URL validation, and multi-file download capabilities.
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import os
+import threading
 import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin, urlparse
@@ -29,6 +36,9 @@ from collector_core.acquire_limits import (
 from collector_core.dependencies import _try_import, requires
 from collector_core.stability import stable_api
 from collector_core.utils.download import normalize_download as _normalize_download_impl
+from collector_core.utils.hash import HashingSink, file_hexdigests
+from collector_core.utils.http import pooled_get
+from collector_core.utils.io import read_json, write_json
 from collector_core.utils.paths import ensure_dir, safe_filename
 
 if TYPE_CHECKING:
@@ -109,12 +119,373 @@ def _validate_redirect_chain(
     return result.allowed, result.reason, result.blocked_url
 
 
+def _is_transient_error(exc: Exception) -> bool:
+    if isinstance(exc, requests.exceptions.HTTPError):
+        status_code = exc.response.status_code if exc.response is not None else None
+        return status_code is not None and status_code >= 500
+    return isinstance(
+        exc,
+        (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ContentDecodingError,
+            requests.exceptions.TooManyRedirects,
+        ),
+    )
+
+
+def _blocked_redirect_result(
+    url: str, reason: str | None, blocked_url: str | None
+) -> dict[str, Any]:
+    return DownloadResult(
+        status="error",
+        error="blocked_url",
+        reason=reason,
+        url=url,
+        blocked_url=blocked_url,
+    ).to_dict()
+
+
+def _finish_download(
+    temp_path: Path,
+    out_path: Path,
+    *,
+    expected_size: int | None,
+    expected_sha256: str | None,
+    content_length: int | None,
+    resolved_url: str | None,
+    hashes: dict[str, str],
+) -> dict[str, Any]:
+    """Check a complete ``.part`` against the expected size and sha256, then move it into place."""
+    actual_size = temp_path.stat().st_size
+    if content_length is None:
+        content_length = actual_size
+    if expected_size is not None and actual_size != expected_size:
+        temp_path.unlink(missing_ok=True)
+        return DownloadResult(
+            status="error",
+            error="size_mismatch",
+            message=(
+                f"Expected size {expected_size} bytes "
+                f"but downloaded {actual_size} bytes."
+            ),
+            resolved_url=resolved_url,
+            content_length=content_length,
+        ).to_dict()
+    sha256 = hashes["sha256"]
+    if expected_sha256 and sha256.lower() != expected_sha256.lower():
+        temp_path.unlink(missing_ok=True)
+        return DownloadResult(
+            status="error",
+            error="sha256_mismatch",
+            message="Expected sha256 did not match downloaded content.",
+            expected_sha256=expected_sha256,
+            sha256=sha256,
+            resolved_url=resolved_url,
+            content_length=content_length,
+        ).to_dict()
+    temp_path.replace(out_path)
+    result: dict[str, Any] = DownloadResult(
+        status="ok",
+        path=str(out_path),
+        resolved_url=resolved_url,
+        content_length=content_length,
+        sha256=sha256,
+    ).to_dict()
+    result.update((name, value) for name, value in hashes.items() if name != "sha256")
+    return result
+
+
+DEFAULT_SEGMENTED_MIN_BYTES = 64 * 1024 * 1024
+MIN_SEGMENT_BYTES = CHUNK_SIZE
+SEGMENT_CHECKPOINT_BYTES = 8 * CHUNK_SIZE
+SEGMENT_STATE_SUFFIX = ".segments.json"
+
+
+@stable_api
+@dataclass(frozen=True)
+class SegmentedDownload:
+    """Parallel range download settings from a target's ``download`` block.
+
+    ``download.segments`` (2 or more) turns it on. Files of at least
+    ``download.segmented_min_bytes`` (default 64 MiB) whose server answers a
+    ``Range`` probe with ``206 Partial Content`` and a total size are fetched
+    as up to ``segments`` concurrent byte ranges (at least ``MIN_SEGMENT_BYTES``
+    each) into a preallocated ``.part``; anything else streams as usual.
+    """
+
+    segments: int
+    min_bytes: int = DEFAULT_SEGMENTED_MIN_BYTES
+
+    @classmethod
+    def from_download(cls, download: dict[str, Any]) -> SegmentedDownload | None:
+        segments = int(download.get("segments") or 1)
+        if segments < 2:
+            return None
+        min_bytes = download.get("segmented_min_bytes")
+        return cls(
+            segments=segments,
+            min_bytes=DEFAULT_SEGMENTED_MIN_BYTES if min_bytes is None else int(min_bytes),
+        )
+
+    def plan(self, total: int) -> list[list[int]]:
+        """Split ``total`` bytes into ``[start, end, next]`` segments (``end`` inclusive)."""
+        count = max(1, min(self.segments, total // MIN_SEGMENT_BYTES))
+        step = -(-total // count)
+        return [[start, min(start + step, total) - 1, start] for start in range(0, total, step)]
+
+
+@stable_api
+def segmented_kwargs(download: dict[str, Any]) -> dict[str, Any]:
+    """``_http_download_with_resume`` keyword arguments for a target's segment settings.
+
+    Empty unless the target opts in, so strategies only pass ``segmented`` when
+    it is set.
+    """
+    segmented = SegmentedDownload.from_download(download)
+    return {"segmented": segmented} if segmented is not None else {}
+
+
+class _SegmentState:
+    """Per-segment progress of a segmented download, persisted next to its ``.part``."""
+
+    def __init__(
+        self, path: Path, url: str, resolved_url: str | None, size: int, segments: list[list[int]]
+    ) -> None:
+        self.path = path
+        self.url = url
+        self.resolved_url = resolved_url
+        self.size = size
+        self.segments = segments
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path, url: str, temp_path: Path) -> _SegmentState | None:
+        """The saved state, if it belongs to ``url`` and its ``.part`` is intact."""
+        try:
+            data = read_json(path)
+            state = cls(path, data["url"], data.get("resolved_url"), data["size"], data["segments"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if state.url != url or not temp_path.exists() or temp_path.stat().st_size != state.size:
+            return None
+        return state
+
+    def save(self) -> None:
+        with self._lock:
+            write_json(
+                self.path,
+                {
+                    "url": self.url,
+                    "resolved_url": self.resolved_url,
+                    "size": self.size,
+                    "segments": [list(segment) for segment in self.segments],
+                },
+            )
+
+
+class _BlockedRedirect(Exception):
+    def __init__(self, reason: str | None, blocked_url: str | None) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.blocked_url = blocked_url
+
+
+def _probe_range_total(response: requests_module.Response) -> int | None:
+    """Total size from a ``206`` answer to ``Range: bytes=0-0``, else None."""
+    content_range = response.headers.get("Content-Range")
+    if (
+        response.status_code != 206
+        or content_range is None
+        or not HttpDownloadBase.valid_content_range(content_range, 0)
+    ):
+        return None
+    total = content_range.rsplit("/", 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+def _write_segment(
+    response: requests_module.Response,
+    temp_path: Path,
+    segment: list[int],
+    state: _SegmentState,
+    stop: threading.Event,
+) -> None:
+    unsaved = 0
+    with temp_path.open("r+b") as f:
+        f.seek(segment[2])
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if stop.is_set():
+                break
+            chunk = chunk[: segment[1] + 1 - segment[2]]
+            if not chunk:
+                continue
+            f.write(chunk)
+            segment[2] += len(chunk)
+            unsaved += len(chunk)
+            if unsaved >= SEGMENT_CHECKPOINT_BYTES or segment[2] > segment[1]:
+                # Progress is recorded only for bytes already on disk.
+                f.flush()
+                os.fsync(f.fileno())
+                state.save()
+                unsaved = 0
+            if segment[2] > segment[1]:
+                break
+    if segment[2] <= segment[1] and not stop.is_set():
+        assert requests is not None  # _http_download_with_resume checked it
+        raise requests.exceptions.ChunkedEncodingError("Download segment ended early.")
+
+
+def _fetch_segment(
+    ctx: AcquireContext,
+    url: str,
+    temp_path: Path,
+    segment: list[int],
+    state: _SegmentState,
+    stop: threading.Event,
+) -> None:
+    assert requests is not None  # _http_download_with_resume checked it
+    max_attempts = max(1, ctx.retry.max_attempts)
+    # Each segment keeps its own connection; the run's pool is sized for one per worker.
+    with requests.Session() as session:
+        if ctx.http is not None:
+            session.headers.update(ctx.http.headers)
+        for attempt in range(max_attempts):
+            if segment[2] > segment[1] or stop.is_set():
+                return
+            headers = {"Range": f"bytes={segment[2]}-{segment[1]}"}
+            try:
+                with session.get(url, stream=True, headers=headers, timeout=(15, 300)) as r:
+                    r.raise_for_status()
+                    allowed, reason, blocked = _validate_redirect_chain(
+                        r, ctx.allow_non_global_download_hosts, ctx.internal_mirror_allowlist
+                    )
+                    if not allowed:
+                        raise _BlockedRedirect(reason, blocked)
+                    if r.status_code != 206 or not HttpDownloadBase.valid_content_range(
+                        r.headers.get("Content-Range"), segment[2]
+                    ):
+                        raise RuntimeError("Expected 206 Partial Content for download segment.")
+                    _write_segment(r, temp_path, segment, state, stop)
+                return
+            except Exception as exc:
+                if not _is_transient_error(exc) or attempt >= max_attempts - 1:
+                    raise
+                time.sleep(min(ctx.retry.backoff_base**attempt, ctx.retry.backoff_max))
+
+
+def _segmented_download(
+    ctx: AcquireContext,
+    url: str,
+    out_path: Path,
+    temp_path: Path,
+    config: SegmentedDownload,
+    expected_size: int | None,
+    expected_sha256: str | None,
+    digests: Iterable[str],
+) -> dict[str, Any] | None:
+    """Fetch ``url`` as concurrent byte ranges into a preallocated ``temp_path``.
+
+    Progress is saved per segment in ``<name>.part.segments.json``, so a rerun
+    resumes each segment where it stopped. Returns None when the file should be
+    streamed instead: the probe found no range support or total size, the file
+    is smaller than ``config.min_bytes``, or a streamed ``.part`` is waiting to
+    be resumed. Segments land out of order, so the file is hashed in one read
+    once complete.
+    """
+    assert requests is not None  # _http_download_with_resume checked it
+    state_path = temp_path.with_name(f"{temp_path.name}{SEGMENT_STATE_SUFFIX}")
+    state = _SegmentState.load(state_path, url, temp_path) if ctx.mode.enable_resume else None
+    if state is None:
+        state_path.unlink(missing_ok=True)
+        if temp_path.exists():
+            if ctx.mode.enable_resume:
+                return None
+            temp_path.unlink()
+        if expected_size is not None and expected_size < config.min_bytes:
+            return None
+        http_get = pooled_get(ctx.http, requests.get)
+        try:
+            with http_get(
+                url, stream=True, headers={"Range": "bytes=0-0"}, timeout=(15, 300)
+            ) as probe:
+                probe.raise_for_status()
+                allowed, reason, blocked = _validate_redirect_chain(
+                    probe, ctx.allow_non_global_download_hosts, ctx.internal_mirror_allowlist
+                )
+                if not allowed:
+                    return _blocked_redirect_result(url, reason, blocked)
+                total = _probe_range_total(probe)
+                resolved_url = probe.url
+        except Exception as exc:
+            # The streaming path retries transient failures itself.
+            if _is_transient_error(exc):
+                return None
+            raise
+        if total is None or total < max(config.min_bytes, 1):
+            return None
+        state = _SegmentState(state_path, url, resolved_url, total, config.plan(total))
+        with temp_path.open("wb") as f:
+            f.truncate(total)
+            if hasattr(os, "posix_fallocate"):
+                with contextlib.suppress(OSError):
+                    os.posix_fallocate(f.fileno(), 0, total)
+        state.save()
+
+    pending = [segment for segment in state.segments if segment[2] <= segment[1]]
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _fetch_segment,
+                    ctx,
+                    url,
+                    temp_path,
+                    segment,
+                    state,
+                    stop,
+                )
+                for segment in pending
+            ]
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is not None:
+                    stop.set()
+                    errors.append(error)
+    if errors:
+        if isinstance(errors[0], _BlockedRedirect):
+            temp_path.unlink(missing_ok=True)
+            state_path.unlink(missing_ok=True)
+            return _blocked_redirect_result(url, errors[0].reason, errors[0].blocked_url)
+        state.save()
+        raise errors[0]
+    state_path.unlink(missing_ok=True)
+    result = _finish_download(
+        temp_path,
+        out_path,
+        expected_size=expected_size,
+        expected_sha256=expected_sha256,
+        content_length=state.size,
+        resolved_url=state.resolved_url,
+        hashes=file_hexdigests(temp_path, digests),
+    )
+    if result["status"] == "ok":
+        result["segments"] = len(state.segments)
+    return result
+
+
 def _http_download_with_resume(
     ctx: AcquireContext,
     url: str,
     out_path: Path,
     expected_size: int | None = None,
     expected_sha256: str | None = None,
+    digests: Iterable[str] = (),
+    segmented: SegmentedDownload | None = None,
 ) -> dict[str, Any]:
     """Download a file via HTTP with resume support.
 
@@ -125,12 +496,20 @@ def _http_download_with_resume(
     - Size verification
     - Redirect chain validation
 
+    The file is hashed while it streams to disk (a resumed download re-reads
+    only its existing prefix), so it is never read back just to hash it.
+
     Args:
         ctx: Acquire context with configuration
         url: URL to download from
         out_path: Output file path
         expected_size: Optional expected file size for verification
         expected_sha256: Optional expected SHA-256 hash for verification
+        digests: Extra hashlib algorithms (e.g. ``"md5"``) to compute in the
+            same pass; each is added to the result under its name
+        segmented: Parallel range download settings (see
+            :class:`SegmentedDownload`); files that qualify are fetched as
+            concurrent byte ranges instead of one stream
 
     Returns:
         Result dictionary with status and metadata
@@ -141,39 +520,27 @@ def _http_download_with_resume(
     ensure_dir(out_path.parent)
     temp_path = out_path.with_name(f"{out_path.name}.part")
     max_attempts = max(1, ctx.retry.max_attempts)
+    http_get = pooled_get(ctx.http, requests.get)
 
     content_length: int | None = None
     resolved_url: str | None = None
     blocked_url: str | None = None
     blocked_reason: str | None = None
+    hashes: dict[str, str] = {}
 
     def _stream_response(
         response: requests_module.Response, write_mode: str, existing_offset: int
     ) -> None:
-        nonlocal content_length, resolved_url
+        nonlocal content_length, resolved_url, hashes
         resolved_url = response.url
         content_length = HttpDownloadBase.parse_content_length(
             response.headers, response.status_code, existing_offset
         )
-        with temp_path.open(write_mode) as f:
+        with HashingSink(temp_path, write_mode, digests) as sink:
             for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
                 if chunk:
-                    f.write(chunk)
-
-    def _is_transient_error(exc: Exception) -> bool:
-        if isinstance(exc, requests.exceptions.HTTPError):
-            status_code = exc.response.status_code if exc.response is not None else None
-            return status_code is not None and status_code >= 500
-        return isinstance(
-            exc,
-            (
-                requests.exceptions.ConnectionError,
-                requests.exceptions.Timeout,
-                requests.exceptions.ChunkedEncodingError,
-                requests.exceptions.ContentDecodingError,
-                requests.exceptions.TooManyRedirects,
-            ),
-        )
+                    sink.write(chunk)
+        hashes = sink.hexdigests()
 
     validation = HttpDownloadBase.validate_download_url(
         url, ctx.allow_non_global_download_hosts, ctx.internal_mirror_allowlist
@@ -186,6 +553,13 @@ def _http_download_with_resume(
             url=url,
         ).to_dict()
 
+    if segmented is not None:
+        result = _segmented_download(
+            ctx, url, out_path, temp_path, segmented, expected_size, expected_sha256, digests
+        )
+        if result is not None:
+            return result
+
     for attempt in range(max_attempts):
         headers: dict[str, str] = {}
         mode = "wb"
@@ -198,7 +572,7 @@ def _http_download_with_resume(
         content_length = None
         resolved_url = None
         try:
-            with requests.get(url, stream=True, headers=headers, timeout=(15, 300)) as r:
+            with http_get(url, stream=True, headers=headers, timeout=(15, 300)) as r:
                 r.raise_for_status()
                 allowed, reason, blocked = _validate_redirect_chain(
                     r, ctx.allow_non_global_download_hosts, ctx.internal_mirror_allowlist
@@ -220,7 +594,7 @@ def _http_download_with_resume(
                         _stream_response(r, mode, existing)
                     else:
                         if r.status_code == 200:
-                            with requests.get(url, stream=True, timeout=(15, 300)) as fresh:
+                            with http_get(url, stream=True, timeout=(15, 300)) as fresh:
                                 fresh.raise_for_status()
                                 allowed, reason, blocked = _validate_redirect_chain(
                                     fresh,
@@ -247,51 +621,16 @@ def _http_download_with_resume(
         break
     if blocked_url:
         temp_path.unlink(missing_ok=True)
-        return DownloadResult(
-            status="error",
-            error="blocked_url",
-            reason=blocked_reason,
-            url=url,
-            blocked_url=blocked_url,
-        ).to_dict()
-    actual_size = temp_path.stat().st_size
-    if content_length is None:
-        content_length = actual_size
-    if expected_size is not None and actual_size != expected_size:
-        temp_path.unlink(missing_ok=True)
-        return DownloadResult(
-            status="error",
-            error="size_mismatch",
-            message=(
-                f"Expected size {expected_size} bytes "
-                f"but downloaded {actual_size} bytes."
-            ),
-            resolved_url=resolved_url,
-            content_length=content_length,
-        ).to_dict()
-    sha256 = HttpDownloadBase.sha256_file(temp_path)
-    if expected_sha256 and sha256.lower() != expected_sha256.lower():
-        temp_path.unlink(missing_ok=True)
-        return DownloadResult(
-            status="error",
-            error="sha256_mismatch",
-            message="Expected sha256 did not match downloaded content.",
-            expected_sha256=expected_sha256,
-            sha256=sha256,
-            resolved_url=resolved_url,
-            content_length=content_length,
-        ).to_dict()
-    temp_path.replace(out_path)
-    result: dict[str, Any] = DownloadResult(
-        status="ok",
-        path=str(out_path),
-        resolved_url=resolved_url,
+        return _blocked_redirect_result(url, blocked_reason, blocked_url)
+    return _finish_download(
+        temp_path,
+        out_path,
+        expected_size=expected_size,
+        expected_sha256=expected_sha256,
         content_length=content_length,
-        sha256=sha256,
-    ).to_dict()
-    if ctx.mode.verify_sha256 and "sha256" not in result:
-        result["sha256"] = HttpDownloadBase.sha256_file(out_path)
-    return result
+        resolved_url=resolved_url,
+        hashes=hashes or file_hexdigests(temp_path, digests),
+    )
 
 
 @stable_api
@@ -387,7 +726,9 @@ def handle_http_multi(
         if limit_error:
             results.append(limit_error)
             continue
-        result = _http_download_with_resume(ctx, url, out_path, size_hint, expected)
+        result = _http_download_with_resume(
+            ctx, url, out_path, size_hint, expected, **segmented_kwargs(download)
+        )
         size_bytes = resolve_result_bytes(result, out_path)
         limit_error = enforcer.record_bytes(size_bytes, filename)
         if limit_error:
@@ -451,7 +792,12 @@ def handle_http_single(
     if not ctx.mode.execute:
         return [{"status": "noop", "path": str(out_path)}]
     result = _http_download_with_resume(
-        ctx, url, out_path, size_hint, download.get("expected_sha256")
+        ctx,
+        url,
+        out_path,
+        size_hint,
+        download.get("expected_sha256"),
+        **segmented_kwargs(download),
     )
     size_bytes = resolve_result_bytes(result, out_path)
     limit_error = enforcer.record_bytes(size_bytes, filename)
@@ -24,8 +24,10 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin, urlparse
@@ -33,7 +35,9 @@ from urllib.parse import urljoin, urlparse
 from collector_core.acquire.context import (
     AcquireContext,
     InternalMirrorAllowlist,
+    StrategyHandler,
 )
+from collector_core.acquire.strategies import http as http_sync
 from collector_core.acquire.strategies.http import normalize_download
 from collector_core.acquire.strategies.http_base import (
     CHUNK_SIZE,
@@ -49,6 +53,8 @@ from collector_core.acquire_limits import (
 )
 from collector_core.dependencies import _try_import, requires
 from collector_core.stability import stable_api
+from collector_core.utils.hash import HashingSink
+from collector_core.utils.http import build_user_agent
 from collector_core.utils.paths import ensure_dir, safe_filename
 
 if TYPE_CHECKING:
@@ -68,6 +74,9 @@ AsyncStrategyHandler = Callable[
 
 # Default concurrency settings
 DEFAULT_MAX_CONCURRENT_DOWNLOADS = 5
+# Defaults for the acquire worker's --engine async run-wide caps.
+DEFAULT_ENGINE_MAX_CONCURRENT = 64
+DEFAULT_ENGINE_PER_HOST = 8
 
 
 def is_async_available() -> bool:
@@ -110,6 +119,149 @@ def _check_async_dependency() -> str | None:
     )
 
 
+_SLOT_HELD: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "acquire_http_async_slot_held", default=False
+)
+
+
+@stable_api
+class AsyncHttpPool:
+    """One event loop's shared async HTTP client and download concurrency caps.
+
+    The acquire worker's async engine opens one pool per run and hands it to
+    handlers as ``AcquireContext.http_async``. Downloads then reuse the pool's
+    client (and its keep-alive connections) instead of opening a client per
+    file, and each download holds one of ``max_concurrent`` run-wide slots and
+    one of ``per_host`` slots for its URL's host while it transfers.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = DEFAULT_ENGINE_MAX_CONCURRENT,
+        per_host: int = DEFAULT_ENGINE_PER_HOST,
+        user_agent: str | None = None,
+    ) -> None:
+        dep_error = _check_async_dependency()
+        if dep_error:
+            raise RuntimeError(dep_error)
+        self.library = _get_async_library()
+        self.max_concurrent = max(int(max_concurrent), 1)
+        self.per_host = max(int(per_host), 1)
+        self.headers = {"User-Agent": user_agent or build_user_agent()}
+        self.client: Any = None
+        self.downloads = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        self._global = asyncio.Semaphore(self.max_concurrent)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> AsyncHttpPool:
+        # Connection limits stay open: the slots below bound concurrency, and a
+        # resume that falls back to a fresh request needs a second connection.
+        if self.library == "aiohttp":
+            assert aiohttp is not None  # checked in __init__
+            self.client = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(
+                    connect=DEFAULT_CONNECT_TIMEOUT, total=None, sock_read=DEFAULT_READ_TIMEOUT
+                ),
+                connector=aiohttp.TCPConnector(limit=0, limit_per_host=0),
+                headers=self.headers,
+            )
+        else:
+            assert httpx is not None  # checked in __init__
+            self.client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    connect=DEFAULT_CONNECT_TIMEOUT,
+                    read=DEFAULT_READ_TIMEOUT,
+                    write=None,
+                    pool=None,
+                ),
+                limits=httpx.Limits(
+                    max_connections=None, max_keepalive_connections=self.max_concurrent
+                ),
+                follow_redirects=True,
+                headers=self.headers,
+            )
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        if self.client is not None:
+            if self.library == "aiohttp":
+                await self.client.close()
+            else:
+                await self.client.aclose()
+            self.client = None
+
+    @contextlib.asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a run-wide and a per-host download slot for ``url``.
+
+        Re-entering from a task that already holds a slot is a no-op, so a
+        handler can take the slot before its limit checks and then call the
+        download helpers, which take it again.
+        """
+        if _SLOT_HELD.get():
+            yield
+            return
+        host = (urlparse(url).hostname or "").lower()
+        host_slot = self._hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with self._global, host_slot:
+            self.downloads += 1
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+            token = _SLOT_HELD.set(True)
+            try:
+                yield
+            finally:
+                _SLOT_HELD.reset(token)
+                self._in_flight -= 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "library": self.library,
+            "max_concurrent": self.max_concurrent,
+            "per_host": self.per_host,
+            "downloads": self.downloads,
+            "peak_in_flight": self.peak_in_flight,
+            "hosts": len(self._hosts),
+        }
+
+
+@contextlib.asynccontextmanager
+async def _download_slot(
+    ctx: AcquireContext, url: str, semaphore: asyncio.Semaphore | None
+) -> AsyncIterator[None]:
+    async with contextlib.AsyncExitStack() as stack:
+        if semaphore is not None:
+            await stack.enter_async_context(semaphore)
+        if ctx.http_async is not None:
+            await stack.enter_async_context(ctx.http_async.slot(url))
+        yield
+
+
+@contextlib.asynccontextmanager
+async def _aiohttp_session(ctx: AcquireContext, timeout: Any) -> AsyncIterator[Any]:
+    """The run's shared aiohttp session, or a new one for this download."""
+    if ctx.http_async is not None and ctx.http_async.library == "aiohttp":
+        yield ctx.http_async.client
+        return
+    assert aiohttp is not None  # only chosen by _get_async_library when installed
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        yield session
+
+
+@contextlib.asynccontextmanager
+async def _httpx_client(ctx: AcquireContext, timeout: Any) -> AsyncIterator[Any]:
+    """The run's shared httpx client, or a new one for this download."""
+    if ctx.http_async is not None and ctx.http_async.library == "httpx":
+        yield ctx.http_async.client
+        return
+    assert httpx is not None  # only chosen by _get_async_library when installed
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        yield client
+
+
 class _AsyncDownloadState:
     """Mutable state container for async download operations."""
 
@@ -118,6 +270,7 @@ class _AsyncDownloadState:
         self.resolved_url: str | None = None
         self.blocked_url: str | None = None
         self.blocked_reason: str | None = None
+        self.sha256: str | None = None
 
 
 def _is_transient_status_code(status_code: int) -> bool:
@@ -264,7 +417,7 @@ async def _stream_response_aiohttp(
     existing_offset: int,
     state: _AsyncDownloadState,
 ) -> None:
-    """Stream response content to file (aiohttp version).
+    """Stream response content to file, hashing it as it is written (aiohttp version).
 
     Args:
         response: aiohttp ClientResponse object
@@ -279,10 +432,11 @@ async def _stream_response_aiohttp(
         headers, response.status, existing_offset
     )
 
-    with temp_path.open(write_mode) as f:
+    with HashingSink(temp_path, write_mode) as sink:
         async for chunk in response.content.iter_chunked(CHUNK_SIZE):
             if chunk:
-                f.write(chunk)
+                sink.write(chunk)
+    state.sha256 = sink.hexdigest()
 
 
 async def _stream_response_httpx(
@@ -292,7 +446,7 @@ async def _stream_response_httpx(
     existing_offset: int,
     state: _AsyncDownloadState,
 ) -> None:
-    """Stream response content to file (httpx version).
+    """Stream response content to file, hashing it as it is written (httpx version).
 
     Args:
         response: httpx Response object
@@ -307,10 +461,11 @@ async def _stream_response_httpx(
         headers, response.status_code, existing_offset
     )
 
-    with temp_path.open(write_mode) as f:
+    with HashingSink(temp_path, write_mode) as sink:
         async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
             if chunk:
-                f.write(chunk)
+                sink.write(chunk)
+    state.sha256 = sink.hexdigest()
 
 
 async def _async_download_aiohttp(
@@ -379,7 +534,7 @@ async def _async_download_aiohttp(
             state = _AsyncDownloadState()
 
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with _aiohttp_session(ctx, timeout) as session:
                     async with session.get(url, headers=headers) as response:
                         response.raise_for_status()
 
@@ -457,11 +612,8 @@ async def _async_download_aiohttp(
                 )
                 await asyncio.sleep(sleep_time)
 
-    # Execute with optional semaphore for concurrency control
-    if semaphore:
-        async with semaphore:
-            await _do_download()
-    else:
+    # Execute under the optional semaphore and the run's global/per-host slots
+    async with _download_slot(ctx, url, semaphore):
         await _do_download()
 
     # Check for blocked redirect
@@ -493,7 +645,7 @@ async def _async_download_aiohttp(
             content_length=state.content_length,
         ).to_dict()
 
-    sha256 = HttpDownloadBase.sha256_file(temp_path)
+    sha256 = state.sha256 or HttpDownloadBase.sha256_file(temp_path)
     if expected_sha256 and sha256.lower() != expected_sha256.lower():
         temp_path.unlink(missing_ok=True)
         return DownloadResult(
@@ -517,9 +669,6 @@ async def _async_download_aiohttp(
         sha256=sha256,
     ).to_dict()
 
-    if ctx.mode.verify_sha256 and "sha256" not in result:
-        result["sha256"] = HttpDownloadBase.sha256_file(out_path)
-
     return result
 
 
@@ -590,9 +739,7 @@ async def _async_download_httpx(
             state = _AsyncDownloadState()
 
             try:
-                async with httpx.AsyncClient(
-                    timeout=timeout, follow_redirects=True
-                ) as client:
+                async with _httpx_client(ctx, timeout) as client:
                     async with client.stream("GET", url, headers=headers) as response:
                         response.raise_for_status()
 
@@ -670,11 +817,8 @@ async def _async_download_httpx(
                 )
                 await asyncio.sleep(sleep_time)
 
-    # Execute with optional semaphore for concurrency control
-    if semaphore:
-        async with semaphore:
-            await _do_download()
-    else:
+    # Execute under the optional semaphore and the run's global/per-host slots
+    async with _download_slot(ctx, url, semaphore):
         await _do_download()
 
     # Check for blocked redirect
@@ -706,7 +850,7 @@ async def _async_download_httpx(
             content_length=state.content_length,
         ).to_dict()
 
-    sha256 = HttpDownloadBase.sha256_file(temp_path)
+    sha256 = state.sha256 or HttpDownloadBase.sha256_file(temp_path)
     if expected_sha256 and sha256.lower() != expected_sha256.lower():
         temp_path.unlink(missing_ok=True)
         return DownloadResult(
@@ -730,9 +874,6 @@ async def _async_download_httpx(
         sha256=sha256,
     ).to_dict()
 
-    if ctx.mode.verify_sha256 and "sha256" not in result:
-        result["sha256"] = HttpDownloadBase.sha256_file(out_path)
-
     return result
 
 
@@ -906,11 +1047,6 @@ async def handle_http_async_multi(
         else:
             size_hint = int(expected_size) if expected_size is not None else None
 
-        limit_error = enforcer.check_size_hint(size_hint, filename)
-        if limit_error:
-            results.append(limit_error)
-            continue
-
         download_tasks.append((idx, url, out_path, size_hint, expected))
 
     if not download_tasks:
@@ -918,6 +1054,7 @@ async def handle_http_async_multi(
 
     # Create semaphore for bounded concurrency
     semaphore = asyncio.Semaphore(max_concurrent)
+    stopped = False
 
     async def download_with_tracking(
         task_idx: int,
@@ -925,28 +1062,47 @@ async def handle_http_async_multi(
         task_out_path: Path,
         task_size_hint: int | None,
         task_expected_sha256: str | None,
-    ) -> tuple[int, dict[str, Any]]:
-        """Download and return result with index for ordering."""
-        try:
-            result = await async_download_with_resume(
-                ctx,
-                task_url,
-                task_out_path,
-                task_size_hint,
-                task_expected_sha256,
-                semaphore,
-            )
-            return (task_idx, result)
-        except Exception as exc:
-            return (
-                task_idx,
-                {
+    ) -> tuple[int, dict[str, Any] | None]:
+        """Download one file under the target's limits, as the sync handler does.
+
+        Byte limits are checked once the file gets a download slot and its bytes
+        are recorded as soon as it finishes, so files queued behind an exhausted
+        budget are never fetched (``None``).
+        """
+        nonlocal stopped
+        filename = task_out_path.name
+        async with _download_slot(ctx, task_url, semaphore):
+            if stopped:
+                return (task_idx, None)
+            limit_error = enforcer.check_remaining_bytes(filename)
+            if limit_error:
+                stopped = True
+                return (task_idx, limit_error)
+            limit_error = enforcer.check_size_hint(task_size_hint, filename)
+            if limit_error:
+                return (task_idx, limit_error)
+            try:
+                result = await async_download_with_resume(
+                    ctx,
+                    task_url,
+                    task_out_path,
+                    task_size_hint,
+                    task_expected_sha256,
+                )
+            except Exception as exc:
+                result = {
                     "status": "error",
                     "error": "download_failed",
                     "message": str(exc),
                     "url": task_url,
-                },
-            )
+                }
+            size_bytes = resolve_result_bytes(result, task_out_path)
+            limit_error = enforcer.record_bytes(size_bytes, filename)
+            if limit_error:
+                if result.get("status") == "ok" and not result.get("cached"):
+                    cleanup_path(task_out_path)
+                return (task_idx, limit_error)
+            return (task_idx, result)
 
     # Execute downloads concurrently
     coros = [
@@ -956,24 +1112,10 @@ async def handle_http_async_multi(
 
     download_results = await asyncio.gather(*coros)
 
-    # Sort results by original index and process
-    download_results_sorted = sorted(download_results, key=lambda x: x[0])
-
-    for task_idx, result in download_results_sorted:
-        # Find the corresponding task info
-        task_info = next(t for t in download_tasks if t[0] == task_idx)
-        _idx, _url, out_path, _size_hint, _expected = task_info
-        filename = out_path.name
-
-        size_bytes = resolve_result_bytes(result, out_path)
-        limit_error = enforcer.record_bytes(size_bytes, filename)
-
-        if limit_error:
-            if result.get("status") == "ok" and not result.get("cached"):
-                cleanup_path(out_path)
-            results.append(limit_error)
-        else:
-            results.append(result)
+    # Keep the original URL order
+    for _task_idx, download_result in sorted(download_results, key=lambda x: x[0]):
+        if download_result is not None:
+            results.append(download_result)
 
     return results
 
@@ -1099,6 +1241,23 @@ async def handle_http_async(
     return await handle_http_async_single(ctx, row, out_dir)
 
 
+@stable_api
+def async_handler_for(handler: StrategyHandler | None) -> AsyncStrategyHandler | None:
+    """The async equivalent of a stock sync HTTP handler, else None.
+
+    Only the handlers ``build_default_handlers`` installs are mapped, so a
+    pipeline's own ``http`` handler keeps running as written.
+    """
+    if handler is None:
+        return None
+    stock: dict[StrategyHandler, AsyncStrategyHandler] = {
+        http_sync.handle_http: handle_http_async,
+        http_sync.handle_http_multi: handle_http_async_multi,
+        http_sync.handle_http_single: handle_http_async_single,
+    }
+    return stock.get(handler)
+
+
 def resolve_async_http_handler(
     variant: str = "multi",
     max_concurrent: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
@@ -1189,7 +1348,9 @@ def get_single_handler() -> AsyncStrategyHandler:
 
 
 __all__ = [
+    "AsyncHttpPool",
     "async_download_with_resume",
+    "async_handler_for",
     "handle_http_async",
     "handle_http_async_multi",
     "handle_http_async_single",
@@ -1200,4 +1361,6 @@ __all__ = [
     "is_async_available",
     "AsyncStrategyHandler",
     "DEFAULT_MAX_CONCURRENT_DOWNLOADS",
+    "DEFAULT_ENGINE_MAX_CONCURRENT",
+    "DEFAULT_ENGINE_PER_HOST",
 ]
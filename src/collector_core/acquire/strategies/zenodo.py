@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any
 
 from collector_core.acquire.context import AcquireContext, StrategyHandler
+from collector_core.acquire.strategies.http import segmented_kwargs
 from collector_core.acquire_limits import (
     build_target_limit_enforcer,
     cleanup_path,
@@ -24,6 +25,7 @@ from collector_core.network_utils import _with_retries
 from collector_core.stability import stable_api
 from collector_core.utils.download import normalize_download
 from collector_core.utils.hash import md5_file
+from collector_core.utils.http import pooled_get
 from collector_core.utils.paths import ensure_dir, safe_filename
 
 # P0.4: Validation patterns for Zenodo identifiers
@@ -92,8 +94,10 @@ def handle_zenodo(ctx: AcquireContext, row: dict[str, Any], out_dir: Path) -> li
     if not ctx.mode.execute:
         return [{"status": "noop", "path": str(out_dir)}]
 
+    http_get = pooled_get(ctx.http, requests.get)
+
     def _fetch() -> requests.Response:
-        resp = requests.get(api_url, timeout=60)
+        resp = http_get(api_url, timeout=60)
         resp.raise_for_status()
         return resp
 
@@ -140,10 +144,18 @@ def handle_zenodo(ctx: AcquireContext, row: dict[str, Any], out_dir: Path) -> li
             continue
         out_path = out_dir / filename
         ensure_dir(out_path.parent)
-        r = _http_download_with_resume(ctx, link, out_path)
-        if ctx.mode.verify_zenodo_md5 and f.get("checksum", "").startswith("md5:"):
+        verify_md5 = ctx.mode.verify_zenodo_md5 and f.get("checksum", "").startswith("md5:")
+        # md5 is computed while the file streams, not by re-reading it afterwards.
+        r = _http_download_with_resume(
+            ctx,
+            link,
+            out_path,
+            digests=("md5",) if verify_md5 else (),
+            **segmented_kwargs(download),
+        )
+        if verify_md5 and r.get("status") == "ok":
             expected_md5 = f["checksum"].split(":", 1)[1]
-            actual_md5 = md5_file(out_path)
+            actual_md5 = r.get("md5") or md5_file(out_path)
             if actual_md5 is None or actual_md5 != expected_md5:
                 r = {"status": "error", "error": "md5_mismatch"}
         size_bytes = resolve_result_bytes(r, out_path)
@@ -4,6 +4,7 @@ This module contains the worker functions for running acquisition pipelines:
 - resolve_output_dir: Resolve the output directory for a target
 - write_done_marker: Write completion marker for acquired target
 - run_target: Run acquisition for a single target
+- run_target_async: Run a single target on an event loop (--engine async)
 - load_config: Load targets configuration
 - load_roots: Load and resolve acquisition roots
 - run_acquire_worker: Main worker entrypoint
@@ -25,6 +26,10 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextvars
+import dataclasses
+import functools
 import logging
 import sys
 import time
@@ -46,6 +51,9 @@ from collector_core.acquire.context import (
     _build_internal_mirror_allowlist,
     _normalize_internal_mirror_allowlist,
 )
+from collector_core.acquire.scheduler import TargetScheduler
+from collector_core.acquire.strategies import http_async
+from collector_core.acquire.strategies.http import SegmentedDownload
 from collector_core.acquire_limits import build_run_budget, resolve_result_bytes
 from collector_core.artifact_metadata import build_artifact_metadata
 from collector_core.checks.runner import generate_run_id, run_checks_for_target
@@ -53,6 +61,9 @@ from collector_core.config_validator import read_yaml
 from collector_core.dataset_root import ensure_data_root_allowed, resolve_dataset_root
 from collector_core.logging_config import LogContext, add_logging_args, configure_logging
 from collector_core.stability import stable_api
+from collector_core.utils.download import normalize_download
+from collector_core.utils.http import HttpSessionPool, build_user_agent
+from collector_core.utils.http import requests as http_requests
 from collector_core.utils.io import read_jsonl_list, write_json
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir, safe_filename
@@ -174,29 +185,42 @@ def _sum_result_bytes(results: list[dict[str, Any]], out_dir: Path) -> int | Non
     return total if found else None
 
 
-@stable_api
-def run_target(
-    ctx: AcquireContext,
-    bucket: str,
-    row: dict[str, Any],
-    strategy_handlers: dict[str, StrategyHandler],
-    postprocess: PostProcessor | None = None,
-) -> dict[str, Any]:
-    """Run acquisition for a single target.
+@dataclasses.dataclass
+class _TargetRun:
+    """Per-target state shared by the threaded and async run paths."""
 
-    Executes the appropriate strategy handler for the target's download
-    configuration, writes manifests, and optionally runs postprocessing.
+    tid: str
+    pool: str
+    strategy: str
+    domain: str | None
+    content_checks: list[str]
+    out_dir: Path
+    start_time: float
+    manifest: dict[str, Any]
+    error_types: list[str] = dataclasses.field(default_factory=list)
 
-    Args:
-        ctx: Acquire context with configuration and limits
-        bucket: Bucket name (green, yellow)
-        row: Target row dict with id, download config, etc.
-        strategy_handlers: Dict mapping strategy names to handler functions
-        postprocess: Optional postprocessor function
+    def log_context(self, ctx: AcquireContext) -> LogContext:
+        return LogContext(
+            run_id=ctx.checks_run_id,
+            domain=self.domain,
+            target_id=self.tid,
+            strategy=self.strategy,
+        )
 
-    Returns:
-        Result dict with id, status, bucket, license_pool, strategy
-    """
+    def set_results(self, results: list[dict[str, Any]]) -> None:
+        self.manifest["results"] = results or [
+            {"status": "failed", "reason": "handler_returned_no_results"}
+        ]
+
+    def set_error(self, exc: Exception) -> None:
+        self.error_types.append(type(exc).__name__)
+        self.manifest["results"] = [{"status": "error", "error": repr(exc)}]
+
+    def set_unsupported(self) -> None:
+        self.manifest["results"] = [{"status": "noop", "reason": f"unsupported: {self.strategy}"}]
+
+
+def _begin_target(ctx: AcquireContext, bucket: str, row: dict[str, Any]) -> _TargetRun:
     tid = row["id"]
     pool = resolve_license_pool(row)
     content_checks = row.get("content_checks") or []
@@ -220,94 +244,171 @@ def run_target(
         "output_dir": str(out_dir),
         "results": [],
     }
+    return _TargetRun(tid, pool, strat, domain, content_checks, out_dir, start_time, manifest)
+
 
-    error_types: list[str] = []
-    handler = strategy_handlers.get(strat)
-    with LogContext(
+def _finish_target(
+    ctx: AcquireContext,
+    bucket: str,
+    row: dict[str, Any],
+    run: _TargetRun,
+    postprocess: PostProcessor | None,
+) -> dict[str, Any]:
+    """Post-process, write the manifest and done marker, run checks; the target's result."""
+    manifest = run.manifest
+    out_dir = run.out_dir
+    post_processors: dict[str, Any] | None = None
+    if postprocess:
+        post_processors = postprocess(ctx, row, out_dir, bucket, manifest)
+        if post_processors:
+            manifest["post_processors"] = post_processors
+
+    manifest["finished_at_utc"] = utc_now()
+    git_info: dict[str, Any] | None = None
+    for result in manifest["results"]:
+        if result.get("git_commit"):
+            git_info = {"git_commit": result["git_commit"]}
+            if result.get("git_revision"):
+                git_info["git_revision"] = result["git_revision"]
+            break
+    if git_info:
+        manifest.update(git_info)
+    manifest.update(
+        build_artifact_metadata(
+            written_at_utc=manifest["finished_at_utc"],
+            git_commit=git_info.get("git_commit") if git_info else None,
+        )
+    )
+    write_json(out_dir / "download_manifest.json", manifest)
+
+    results = manifest["results"]
+    if any(r.get("status") == "ok" for r in results):
+        status = "ok"
+    elif results:
+        status = results[0].get("status", "error")
+    else:
+        status = "error"
+    if post_processors:
+        for proc in post_processors.values():
+            if isinstance(proc, dict) and proc.get("status") not in {"ok", "noop"}:
+                status = proc.get("status", status)
+    if ctx.mode.execute:
+        write_done_marker(ctx, run.tid, bucket, status, git_info)
+    run_checks_for_target(
+        content_checks=run.content_checks,
+        ledger_root=ctx.roots.ledger_root,
         run_id=ctx.checks_run_id,
-        domain=domain,
-        target_id=tid,
-        strategy=strat,
-    ):
+        target_id=run.tid,
+        stage="acquire",
+        row=row,
+        extra={"bucket": bucket, "status": status},
+    )
+    error_types = list(run.error_types)
+    for result in manifest["results"]:
+        err = result.get("error") or result.get("reason")
+        if err:
+            error_types.append(str(err))
+    error_types = sorted(set(error_types))
+    duration_ms = (time.monotonic() - run.start_time) * 1000
+    bytes_total = _sum_result_bytes(manifest["results"], out_dir)
+    with LogContext(bytes=bytes_total, duration_ms=duration_ms, error_types=error_types):
+        if status not in {"ok", "noop"}:
+            logger.warning("Acquire target finished with errors.")
+        else:
+            logger.info("Acquire target finished.")
+    return {
+        "id": run.tid,
+        "status": status,
+        "bucket": bucket,
+        "license_pool": run.pool,
+        "strategy": run.strategy,
+    }
+
+
+@stable_api
+def run_target(
+    ctx: AcquireContext,
+    bucket: str,
+    row: dict[str, Any],
+    strategy_handlers: dict[str, StrategyHandler],
+    postprocess: PostProcessor | None = None,
+) -> dict[str, Any]:
+    """Run acquisition for a single target.
+
+    Executes the appropriate strategy handler for the target's download
+    configuration, writes manifests, and optionally runs postprocessing.
+
+    Args:
+        ctx: Acquire context with configuration and limits
+        bucket: Bucket name (green, yellow)
+        row: Target row dict with id, download config, etc.
+        strategy_handlers: Dict mapping strategy names to handler functions
+        postprocess: Optional postprocessor function
+
+    Returns:
+        Result dict with id, status, bucket, license_pool, strategy
+    """
+    run = _begin_target(ctx, bucket, row)
+    handler = strategy_handlers.get(run.strategy)
+    with run.log_context(ctx):
         logger.info("Acquire target started.")
-        if not handler or strat in {"none", ""}:
-            manifest["results"] = [{"status": "noop", "reason": f"unsupported: {strat}"}]
+        if not handler or run.strategy in {"none", ""}:
+            run.set_unsupported()
         else:
             try:
-                manifest["results"] = handler(ctx, row, out_dir)
-                if not manifest["results"]:
-                    manifest["results"] = [
-                        {"status": "failed", "reason": "handler_returned_no_results"}
-                    ]
+                run.set_results(handler(ctx, row, run.out_dir))
             except Exception as e:
-                error_types.append(type(e).__name__)
-                manifest["results"] = [{"status": "error", "error": repr(e)}]
-
-        post_processors: dict[str, Any] | None = None
-        if postprocess:
-            post_processors = postprocess(ctx, row, out_dir, bucket, manifest)
-            if post_processors:
-                manifest["post_processors"] = post_processors
-
-        manifest["finished_at_utc"] = utc_now()
-        git_info: dict[str, Any] | None = None
-        for result in manifest["results"]:
-            if result.get("git_commit"):
-                git_info = {"git_commit": result["git_commit"]}
-                if result.get("git_revision"):
-                    git_info["git_revision"] = result["git_revision"]
-                break
-        if git_info:
-            manifest.update(git_info)
-        manifest.update(
-            build_artifact_metadata(
-                written_at_utc=manifest["finished_at_utc"],
-                git_commit=git_info.get("git_commit") if git_info else None,
-            )
-        )
-        write_json(out_dir / "download_manifest.json", manifest)
+                run.set_error(e)
+        return _finish_target(ctx, bucket, row, run, postprocess)
+
 
-        results = manifest["results"]
-        if any(r.get("status") == "ok" for r in results):
-            status = "ok"
-        elif results:
-            status = results[0].get("status", "error")
+@stable_api
+async def run_target_async(
+    ctx: AcquireContext,
+    bucket: str,
+    row: dict[str, Any],
+    strategy_handlers: dict[str, StrategyHandler],
+    postprocess: PostProcessor | None = None,
+    *,
+    executor: ThreadPoolExecutor | None = None,
+) -> dict[str, Any]:
+    """Async counterpart of :func:`run_target` with the same manifests and markers.
+
+    Stock HTTP handlers run as their ``http_async`` equivalents on the calling
+    event loop; every other handler, and HTTP targets that set
+    ``download.segments``, runs on ``executor`` (or the loop's default executor).
+    Postprocessing, content checks, the manifest and the done marker also run
+    on ``executor``.
+    """
+    run = _begin_target(ctx, bucket, row)
+    handler = strategy_handlers.get(run.strategy)
+    with run.log_context(ctx):
+        logger.info("Acquire target started.")
+        if not handler or run.strategy in {"none", ""}:
+            run.set_unsupported()
         else:
-            status = "error"
-        if post_processors:
-            for proc in post_processors.values():
-                if isinstance(proc, dict) and proc.get("status") not in {"ok", "noop"}:
-                    status = proc.get("status", status)
-        if ctx.mode.execute:
-            write_done_marker(ctx, tid, bucket, status, git_info)
-        run_checks_for_target(
-            content_checks=content_checks,
-            ledger_root=ctx.roots.ledger_root,
-            run_id=ctx.checks_run_id,
-            target_id=tid,
-            stage="acquire",
-            row=row,
-            extra={"bucket": bucket, "status": status},
+            # Segmented range downloads are only implemented by the threaded handlers.
+            segmented = SegmentedDownload.from_download(
+                normalize_download(row.get("download", {}) or {})
+            )
+            async_handler = None if segmented else http_async.async_handler_for(handler)
+            try:
+                if async_handler is not None:
+                    results = await async_handler(ctx, row, run.out_dir)
+                else:
+                    call = functools.partial(
+                        contextvars.copy_context().run, handler, ctx, row, run.out_dir
+                    )
+                    results = await asyncio.get_running_loop().run_in_executor(executor, call)
+                run.set_results(results)
+            except Exception as e:
+                run.set_error(e)
+        # Postprocessors, content checks and manifest writes block, so keep them
+        # off the loop that is driving every other target's transfers.
+        finish = functools.partial(
+            contextvars.copy_context().run, _finish_target, ctx, bucket, row, run, postprocess
         )
-        for result in manifest["results"]:
-            err = result.get("error") or result.get("reason")
-            if err:
-                error_types.append(str(err))
-        error_types = sorted(set(error_types))
-        duration_ms = (time.monotonic() - start_time) * 1000
-        bytes_total = _sum_result_bytes(manifest["results"], out_dir)
-        with LogContext(bytes=bytes_total, duration_ms=duration_ms, error_types=error_types):
-            if status not in {"ok", "noop"}:
-                logger.warning("Acquire target finished with errors.")
-            else:
-                logger.info("Acquire target finished.")
-        return {
-            "id": tid,
-            "status": status,
-            "bucket": bucket,
-            "license_pool": pool,
-            "strategy": strat,
-        }
+        return await asyncio.get_running_loop().run_in_executor(executor, finish)
 
 
 @stable_api
@@ -385,6 +486,116 @@ def load_roots(
     return roots
 
 
+def _run_targets(
+    ctx: AcquireContext,
+    bucket: str,
+    rows: list[dict[str, Any]],
+    strategy_handlers: dict[str, StrategyHandler],
+    postprocess: PostProcessor | None,
+    scheduler: TargetScheduler,
+) -> list[dict[str, Any]]:
+    """Run every queued row, on ``ctx.mode.workers`` threads when executing.
+
+    The thread pool starts targets in the order ``scheduler`` picks them (per-host
+    caps, hosts interleaved, largest first); results keep queue order.
+    """
+    if ctx.mode.workers > 1 and ctx.mode.execute:
+        with ThreadPoolExecutor(max_workers=ctx.mode.workers) as ex:
+            results_by_index: list[dict[str, Any] | None] = [None] * len(rows)
+            futures: dict[object, int] = {}
+
+            def submit_next() -> bool:
+                if ctx.run_budget and ctx.run_budget.exhausted():
+                    return False
+                picked = scheduler.next()
+                if picked is None:
+                    return False
+                idx, row = picked
+                fut = ex.submit(run_target, ctx, bucket, row, strategy_handlers, postprocess)
+                futures[fut] = idx
+                return True
+
+            while len(futures) < ctx.mode.workers and submit_next():
+                continue
+            while futures:
+                for fut in as_completed(futures):
+                    idx = futures.pop(fut)
+                    scheduler.done(idx)
+                    try:
+                        res = fut.result()
+                    except Exception as e:
+                        res = {"id": rows[idx].get("id"), "status": "error", "error": repr(e)}
+                    results_by_index[idx] = res
+                    while len(futures) < ctx.mode.workers and submit_next():
+                        continue
+                    break
+            return [result for result in results_by_index if result is not None]
+    results: list[dict[str, Any]] = []
+    for row in rows:
+        if ctx.run_budget and ctx.run_budget.exhausted():
+            break
+        results.append(run_target(ctx, bucket, row, strategy_handlers, postprocess))
+    return results
+
+
+async def _run_targets_async(
+    ctx: AcquireContext,
+    bucket: str,
+    rows: list[dict[str, Any]],
+    strategy_handlers: dict[str, StrategyHandler],
+    postprocess: PostProcessor | None,
+    scheduler: TargetScheduler,
+    *,
+    max_concurrent: int,
+    per_host: int,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Run every queued row from one event loop; the results and the engine's stats.
+
+    Up to ``max_concurrent`` targets are in flight at once, started in the order
+    ``scheduler`` picks them. Their HTTP downloads share one ``AsyncHttpPool``
+    (run-wide and per-host slots, one client), and other strategies run on
+    ``ctx.mode.workers`` threads. As in the threaded path, no new target starts
+    once the run byte budget is exhausted.
+    """
+    results_by_index: list[dict[str, Any] | None] = [None] * len(rows)
+    slot_freed = asyncio.Event()
+    pool = http_async.AsyncHttpPool(
+        max_concurrent=max_concurrent,
+        per_host=per_host,
+        user_agent=build_user_agent("acquire-worker"),
+    )
+    async with pool:
+        async_ctx = dataclasses.replace(ctx, http_async=pool)
+        with ThreadPoolExecutor(max_workers=ctx.mode.workers) as executor:
+
+            async def drain() -> None:
+                while scheduler.pending and not (ctx.run_budget and ctx.run_budget.exhausted()):
+                    picked = scheduler.next()
+                    if picked is None:
+                        slot_freed.clear()
+                        await slot_freed.wait()
+                        continue
+                    idx, row = picked
+                    try:
+                        res = await run_target_async(
+                            async_ctx,
+                            bucket,
+                            row,
+                            strategy_handlers,
+                            postprocess,
+                            executor=executor,
+                        )
+                    except Exception as e:
+                        res = {"id": row.get("id"), "status": "error", "error": repr(e)}
+                    results_by_index[idx] = res
+                    scheduler.done(idx)
+                    slot_freed.set()
+
+            await asyncio.gather(*(drain() for _ in range(min(pool.max_concurrent, len(rows)))))
+    results = [result for result in results_by_index if result is not None]
+    return results, pool.stats()
+
+
 @stable_api
 def run_acquire_worker(
     *,
@@ -467,11 +678,37 @@ def run_acquire_worker(
     ap.add_argument("--limit-files", type=int, default=None)
     ap.add_argument("--max-bytes-per-target", type=int, default=None)
     ap.add_argument("--workers", type=int, default=1)
+    ap.add_argument(
+        "--engine",
+        choices=["threads", "async"],
+        default="threads",
+        help=(
+            "threads: one worker thread per in-flight target (default). async: one event "
+            "loop drives HTTP downloads for all targets; other strategies use --workers threads."
+        ),
+    )
+    ap.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=http_async.DEFAULT_ENGINE_MAX_CONCURRENT,
+        help="async engine: targets and HTTP downloads in flight across the run.",
+    )
+    ap.add_argument(
+        "--per-host-concurrency",
+        type=int,
+        default=http_async.DEFAULT_ENGINE_PER_HOST,
+        help=(
+            "Targets started concurrently per download host (with --workers > 1 or the "
+            "async engine); the async engine also caps HTTP downloads per host."
+        ),
+    )
     ap.add_argument("--retry-max", type=int, default=3)
     ap.add_argument("--retry-backoff", type=float, default=2.0)
     ap.add_argument("--strict", "--fail-on-error", dest="strict", action="store_true")
     add_logging_args(ap)
     args = ap.parse_args()
+    if args.engine == "async" and not http_async.is_async_available():
+        ap.error("--engine async requires aiohttp or httpx (pip install dataset-collector[async])")
     configure_logging(level=args.log_level, fmt=args.log_format)
 
     queue_path = Path(args.queue).expanduser().resolve()
@@ -524,6 +761,11 @@ def run_acquire_worker(
         internal_mirror_allowlist=internal_mirror_allowlist,
         cfg=cfg,
         checks_run_id=generate_run_id("acquire"),
+        http=(
+            HttpSessionPool(workers=args.workers, user_agent=build_user_agent("acquire-worker"))
+            if args.execute and http_requests is not None
+            else None
+        ),
     )
 
     if ctx.limits.limit_targets:
@@ -536,49 +778,35 @@ def run_acquire_worker(
         "queue": str(queue_path),
         "bucket": args.bucket,
         "execute": ctx.mode.execute,
+        "engine": args.engine,
         "results": [],
     }
     summary.update(build_artifact_metadata(written_at_utc=summary["run_at_utc"]))
-
-    if ctx.mode.workers > 1 and ctx.mode.execute:
-        with ThreadPoolExecutor(max_workers=ctx.mode.workers) as ex:
-            results_by_index: list[dict[str, Any] | None] = [None] * len(rows)
-            futures: dict[object, tuple[int, dict[str, Any]]] = {}
-            row_iter = iter(enumerate(rows))
-
-            def submit_next() -> bool:
-                if ctx.run_budget and ctx.run_budget.exhausted():
-                    return False
-                try:
-                    idx, row = next(row_iter)
-                except StopIteration:
-                    return False
-                fut = ex.submit(
-                    run_target, ctx, args.bucket, row, strategy_handlers, postprocess
+    scheduler = TargetScheduler(rows, per_host=args.per_host_concurrency)
+
+    try:
+        if args.engine == "async" and ctx.mode.execute:
+            summary["results"], summary["async_engine"] = asyncio.run(
+                _run_targets_async(
+                    ctx,
+                    args.bucket,
+                    rows,
+                    strategy_handlers,
+                    postprocess,
+                    scheduler,
+                    max_concurrent=args.max_concurrent,
+                    per_host=args.per_host_concurrency,
                 )
-                futures[fut] = (idx, row)
-                return True
-
-            while len(futures) < ctx.mode.workers and submit_next():
-                continue
-            while futures:
-                for fut in as_completed(futures):
-                    idx, row = futures.pop(fut)
-                    try:
-                        res = fut.result()
-                    except Exception as e:
-                        res = {"id": row.get("id"), "status": "error", "error": repr(e)}
-                    results_by_index[idx] = res
-                    while len(futures) < ctx.mode.workers and submit_next():
-                        continue
-                    break
-            summary["results"] = [result for result in results_by_index if result is not None]
-    else:
-        for row in rows:
-            if ctx.run_budget and ctx.run_budget.exhausted():
-                break
-            res = run_target(ctx, args.bucket, row, strategy_handlers, postprocess)
-            summary["results"].append(res)
+            )
+        else:
+            summary["results"] = _run_targets(
+                ctx, args.bucket, rows, strategy_handlers, postprocess, scheduler
+            )
+    finally:
+        if ctx.http is not None:
+            ctx.http.close()
+    if ctx.mode.execute and (args.engine == "async" or ctx.mode.workers > 1):
+        summary["scheduler"] = scheduler.stats()
 
     status_counts = Counter(result.get("status") or "unknown" for result in summary["results"])
     summary["counts"] = {"total": len(summary["results"]), **dict(status_counts)}
@@ -603,6 +831,7 @@ __all__ = [
     "resolve_output_dir",
     "write_done_marker",
     "run_target",
+    "run_target_async",
     "load_config",
     "load_roots",
     "run_acquire_worker",
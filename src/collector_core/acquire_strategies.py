@@ -22,7 +22,7 @@ Example migration:
 from __future__ import annotations
 
 import warnings
-from collections.abc import ItemsView, KeysView, ValuesView
+from collections.abc import ItemsView, Iterable, KeysView, ValuesView
 from typing import TYPE_CHECKING, Any
 
 # Import for backward compatibility (tests may monkeypatch these)
@@ -55,6 +55,8 @@ from collector_core.acquire_limits import (
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from collector_core.acquire.strategies.http import SegmentedDownload
+
 # Deprecation warning configuration
 _DEPRECATION_WARNING = (
     "collector_core.acquire_strategies is deprecated; "
@@ -204,11 +206,13 @@ def _http_download_with_resume(
     out_path: Path,
     expected_size: int | None = None,
     expected_sha256: str | None = None,
+    digests: Iterable[str] = (),
+    segmented: SegmentedDownload | None = None,
 ) -> dict[str, Any]:
     """DEPRECATED: Use collector_core.acquire.strategies.http._http_download_with_resume."""
     _emit_deprecation_warning()
     from collector_core.acquire.strategies.http import _http_download_with_resume as _impl
-    return _impl(ctx, url, out_path, expected_size, expected_sha256)
+    return _impl(ctx, url, out_path, expected_size, expected_sha256, digests, segmented)
 
 
 # ============================================================================
@@ -10,7 +10,6 @@ when applicable.
 from __future__ import annotations
 
 import argparse
-import gzip
 import json
 from collections import Counter
 from pathlib import Path
@@ -20,18 +19,28 @@ from collector_core.__version__ import __version__ as PIPELINE_VERSION
 from collector_core.artifact_metadata import build_artifact_metadata
 from collector_core.config_validator import read_yaml
 from collector_core.dataset_root import ensure_data_root_allowed
+from collector_core.merge.parquet import parquet_num_rows
+from collector_core.shard_index import count_shard_records
+from collector_core.utils.io import JsonlReadStats, iter_decompressed_blocks, read_jsonl
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir
 
 
 def count_lines(path: Path, max_lines: int = 0) -> int:
-    opener = gzip.open if path.suffix == ".gz" else open
     count = 0
-    with opener(path, "rt", encoding="utf-8", errors="ignore") as f:
-        for count, _ in enumerate(f, start=1):
-            if max_lines and count >= max_lines:
-                break
-    return count
+    last = b"\n"
+    for block in iter_decompressed_blocks(path):
+        count += block.count(b"\n")
+        last = block[-1:]
+        if max_lines and count >= max_lines:
+            return max_lines
+    # A final line without a trailing newline still counts.
+    return count + (last != b"\n")
+
+
+def _count_records(path: Path) -> int:
+    records = count_shard_records(path)
+    return records if records is not None else count_lines(path, max_lines=1000)
 
 
 def file_stats(path: Path) -> dict[str, Any]:
@@ -40,7 +49,10 @@ def file_stats(path: Path) -> dict[str, Any]:
         return {
             "name": path.name,
             "bytes": path.stat().st_size,
-            "lines_estimate": count_lines(path, max_lines=1000),
+            # Parquet footers and shard index sidecars carry the exact row count.
+            "lines_estimate": parquet_num_rows(path)
+            if path.suffix == ".parquet"
+            else _count_records(path),
         }
     except FileNotFoundError:
         return {
@@ -95,20 +107,10 @@ def collect_raw_stats(root: Path, top_n: int) -> dict[str, Any]:
     return stats
 
 
-def iter_jsonl(path: Path) -> list[dict[str, Any]]:
+def iter_jsonl(path: Path, stats: JsonlReadStats | None = None) -> list[dict[str, Any]]:
     if not path.exists():
         return []
-    rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rows.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return rows
+    return list(read_jsonl(path, stats=stats))
 
 
 def collect_queue_stats(root: Path) -> dict[str, Any]:
@@ -121,13 +123,18 @@ def collect_queue_stats(root: Path) -> dict[str, Any]:
     license_counts: Counter[str] = Counter()
     for bucket, path in queue_files.items():
         pool_counts: Counter[str] = Counter()
-        rows = iter_jsonl(path)
+        read_stats = JsonlReadStats()
+        rows = iter_jsonl(path, read_stats)
         for row in rows:
             pool = row.get("output_pool") or row.get("license_profile") or "unknown"
             pool_counts[str(pool)] += 1
             license_name = row.get("resolved_spdx") or row.get("spdx_hint") or "unknown"
             license_counts[str(license_name)] += 1
-        stats["buckets"][bucket] = {"targets": len(rows), "pools": dict(pool_counts)}
+        stats["buckets"][bucket] = {
+            "targets": len(rows),
+            "pools": dict(pool_counts),
+            "malformed_lines": read_stats.malformed,
+        }
     stats["license_counts"] = dict(license_counts)
     return stats
 
@@ -176,11 +183,18 @@ def collect_shard_stage(root: Path) -> dict[str, Any]:
         shard_dir = pool_dir / "shards"
         pool_stats = {"files": 0, "bytes": 0, "examples": []}
         if shard_dir.exists():
-            for fp in shard_dir.glob("*.jsonl*"):
+            shard_files = [*shard_dir.glob("*.jsonl*"), *shard_dir.glob("*.parquet")]
+            for fp in shard_files:
                 pool_stats["files"] += 1
                 pool_stats["bytes"] += fp.stat().st_size
                 if len(pool_stats["examples"]) < 3:
                     pool_stats["examples"].append(file_stats(fp))
+        # Provenance sidecars written by merge for late duplicates (see merge.updates).
+        updates_dir = pool_dir / "shard_updates"
+        if updates_dir.exists():
+            update_files = sorted(updates_dir.glob("*.jsonl"))
+            pool_stats["update_files"] = len(update_files)
+            pool_stats["update_rows"] = sum(count_lines(fp) for fp in update_files)
         stage["pools"][pool_dir.name] = pool_stats
     return stage
 
@@ -1,19 +1,42 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib.util
+import itertools
+import json
+import math
 import re
+import shutil
 import time
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from collector_core.stability import stable_api
+from collector_core.utils.io import write_json
+from collector_core.utils.paths import ensure_dir
 
 DEFAULT_THRESHOLD = 0.85
 DEFAULT_NUM_PERM = 128
 DEFAULT_SHINGLE_SIZE = 3
 DEFAULT_MAX_TOKENS = 2000
 DEFAULT_MAX_CANDIDATES = 50
+DEFAULT_HAMMING_BITS = 3
+SIMHASH_BITS = 64
+INITIAL_CAPACITY = 1024
+MINHASH_SEED = 1
+SIGNATURE_BLOCK_ROWS = 16_384
+TOKEN_HASH_CACHE_SIZE = 1 << 16
+BACKENDS = ("datasketch", "numpy", "python", "simhash")
+INDEX_FORMAT_VERSION = 1
+INDEX_META_NAME = "meta.json"
+_SHINGLE_PRIME = np.uint64(0x100000001B3)
+_SHINGLE_FINALIZER = np.uint64(0xBF58476D1CE4E5B9)
+_POPCOUNT8 = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
 
 
 @stable_api
@@ -30,6 +53,10 @@ class DuplicateResult:
 @stable_api
 @dataclass
 class DetectorStats:
+    """Per-stage counters: ``prepare`` (tokenize, shingle, sketch), ``query`` (candidate
+    lookup and scoring) and ``index`` (insert). ``wait`` is time the merge consumer
+    spent blocked on a pipelined prepare stage."""
+
     indexed: int = 0
     queries: int = 0
     duplicates: int = 0
@@ -37,6 +64,16 @@ class DetectorStats:
     total_query_ms: float = 0.0
     last_index_ms: float | None = None
     last_query_ms: float | None = None
+    prepared: int = 0
+    total_prepare_ms: float = 0.0
+    total_wait_ms: float = 0.0
+
+    def record_prepare(self, elapsed_ms: float, *, count: int = 1) -> None:
+        self.prepared += count
+        self.total_prepare_ms += elapsed_ms
+
+    def record_wait(self, elapsed_ms: float) -> None:
+        self.total_wait_ms += elapsed_ms
 
     def record_index(self, elapsed_ms: float) -> None:
         self.indexed += 1
@@ -53,6 +90,7 @@ class DetectorStats:
     def to_dict(self) -> dict[str, float | int | None]:
         avg_index = self.total_index_ms / self.indexed if self.indexed else 0.0
         avg_query = self.total_query_ms / self.queries if self.queries else 0.0
+        avg_prepare = self.total_prepare_ms / self.prepared if self.prepared else 0.0
         return {
             "indexed": self.indexed,
             "queries": self.queries,
@@ -63,6 +101,10 @@ class DetectorStats:
             "avg_query_ms": round(avg_query, 3),
             "last_index_ms": None if self.last_index_ms is None else round(self.last_index_ms, 3),
             "last_query_ms": None if self.last_query_ms is None else round(self.last_query_ms, 3),
+            "prepared": self.prepared,
+            "total_prepare_ms": round(self.total_prepare_ms, 3),
+            "avg_prepare_ms": round(avg_prepare, 3),
+            "total_wait_ms": round(self.total_wait_ms, 3),
         }
 
 
@@ -91,6 +133,508 @@ def _jaccard(lhs: Iterable[str], rhs: Iterable[str]) -> float:
     return len(lhs_set & rhs_set) / len(lhs_set | rhs_set)
 
 
+@functools.lru_cache(maxsize=TOKEN_HASH_CACHE_SIZE)
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _shingle_hashes(tokens: list[str], size: int) -> np.ndarray:
+    """Sorted, unique, process-stable 64-bit hashes of the ``size``-token shingles.
+
+    Shingles follow :func:`_build_shingles`; each token is hashed once and the
+    window hashes are combined polynomially and finalized in vectorized uint64
+    arithmetic instead of hashing every joined shingle string.
+    """
+    return np.unique(_shingle_hash_sequence(tokens, size))
+
+
+def _shingle_hash_sequence(tokens: list[str], size: int) -> np.ndarray:
+    """Hashes of every shingle in document order, repeats included."""
+    token_hashes = np.fromiter(map(_token_hash, tokens), dtype=np.uint64, count=len(tokens))
+    if size <= 1 or len(tokens) <= size:
+        return token_hashes
+    count = len(tokens) - size + 1
+    hashes = token_hashes[:count].copy()
+    for offset in range(1, size):
+        hashes *= _SHINGLE_PRIME
+        hashes += token_hashes[offset : offset + count]
+    hashes ^= hashes >> np.uint64(31)
+    hashes *= _SHINGLE_FINALIZER
+    hashes ^= hashes >> np.uint64(29)
+    return np.asarray(hashes)
+
+
+def _hash_jaccard(lhs: np.ndarray, rhs: np.ndarray) -> float:
+    """Exact Jaccard similarity of two sorted, unique hash arrays."""
+    if not lhs.size and not rhs.size:
+        return 1.0
+    if not lhs.size or not rhs.size:
+        return 0.0
+    inter = np.intersect1d(lhs, rhs, assume_unique=True).size
+    return inter / (lhs.size + rhs.size - inter)
+
+
+def _grow(array: np.ndarray, needed: int) -> np.ndarray:
+    capacity = max(array.shape[0] * 2, needed, INITIAL_CAPACITY)
+    grown = np.empty((capacity, *array.shape[1:]), dtype=array.dtype)
+    grown[: array.shape[0]] = array
+    return grown
+
+
+class _Postings:
+    """``key -> rows`` as key-sorted parallel arrays (memory-mappable), by binary search."""
+
+    def __init__(self, keys: np.ndarray, rows: np.ndarray) -> None:
+        self.keys = keys
+        self.rows = rows
+
+    @classmethod
+    def build(cls, keys: np.ndarray, rows: np.ndarray) -> _Postings:
+        order = np.argsort(keys, kind="stable")
+        return cls(keys[order], rows[order])
+
+    def lookup(self, keys: np.ndarray) -> list[np.ndarray]:
+        """Row arrays for every key in ``keys`` that has postings."""
+        lo = np.searchsorted(self.keys, keys, side="left")
+        hi = np.searchsorted(self.keys, keys, side="right")
+        return [self.rows[start:end] for start, end in zip(lo, hi, strict=True) if end > start]
+
+
+class _RowIds:
+    """Doc id <-> row map: a frozen, possibly memory-mapped base plus appended ids.
+
+    The base keeps utf-8 ids in row order and a sorted copy with its rows, so
+    membership is a binary search over the mapped arrays rather than a dict
+    rebuilt on load.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray | None = None,
+        sorted_ids: np.ndarray | None = None,
+        sorted_rows: np.ndarray | None = None,
+    ) -> None:
+        self.base_ids = ids if ids is not None else np.empty(0, dtype="S1")
+        self.sorted_ids = sorted_ids if sorted_ids is not None else self.base_ids
+        self.sorted_rows = sorted_rows if sorted_rows is not None else np.empty(0, dtype=np.int64)
+        self.base = len(self.base_ids)
+        self.rows: dict[str, int] = {}
+        self.ids: list[str] = []
+
+    def __len__(self) -> int:
+        return self.base + len(self.ids)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return isinstance(doc_id, str) and self.row(doc_id) is not None
+
+    def row(self, doc_id: str) -> int | None:
+        row = self.rows.get(doc_id)
+        if row is not None or not self.base:
+            return row
+        key = doc_id.encode("utf-8")
+        if len(key) > self.sorted_ids.dtype.itemsize:
+            return None
+        pos = int(np.searchsorted(self.sorted_ids, key))
+        if pos < self.base and self.sorted_ids[pos] == key:
+            return int(self.sorted_rows[pos])
+        return None
+
+    def append(self, doc_id: str) -> int:
+        row = len(self)
+        self.rows[doc_id] = row
+        self.ids.append(doc_id)
+        return row
+
+    def doc_id(self, row: int) -> str:
+        if row < self.base:
+            return bytes(self.base_ids[row]).decode("utf-8")
+        return self.ids[row - self.base]
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        appended = [doc_id.encode("utf-8") for doc_id in self.ids]
+        width = max([self.base_ids.dtype.itemsize, *map(len, appended), 1])
+        ids = np.concatenate(
+            [self.base_ids.astype(f"S{width}"), np.array(appended, dtype=f"S{width}")]
+        )
+        order = np.argsort(ids, kind="stable")
+        return {"ids": ids, "sorted_ids": ids[order], "sorted_rows": order.astype(np.int64)}
+
+
+def _gather(base: np.ndarray, tail: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Rows of ``base`` followed by ``tail``, addressed by one global row index."""
+    split = base.shape[0]
+    if not split:
+        return np.asarray(tail[rows])
+    in_base = rows < split
+    if in_base.all():
+        return np.asarray(base[rows])
+    if not in_base.any():
+        return np.asarray(tail[rows - split])
+    out = np.empty((rows.size, *tail.shape[1:]), dtype=tail.dtype)
+    out[in_base] = base[rows[in_base]]
+    out[~in_base] = tail[rows[~in_base] - split]
+    return out
+
+
+class _SignatureStore:
+    """Fixed-width uint64 MinHash signatures by row: a frozen base plus a preallocated tail."""
+
+    def __init__(
+        self, width: int, *, base: np.ndarray | None = None, ids: _RowIds | None = None
+    ) -> None:
+        self.ids = ids if ids is not None else _RowIds()
+        self.base = base if base is not None else np.empty((0, width), dtype=np.uint64)
+        self.matrix = np.empty((0, width), dtype=np.uint64)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, doc_id: str, signature: np.ndarray) -> int:
+        row = self.ids.append(doc_id)
+        tail = row - self.base.shape[0]
+        if tail >= self.matrix.shape[0]:
+            self.matrix = _grow(self.matrix, tail + 1)
+        self.matrix[tail] = signature
+        return row
+
+    def similarities(self, rows: np.ndarray, signature: np.ndarray) -> np.ndarray:
+        """Estimated Jaccard (fraction of equal slots) of ``signature`` vs each row."""
+        return np.asarray((_gather(self.base, self.matrix, rows) == signature).mean(axis=1))
+
+    def all_signatures(self) -> np.ndarray:
+        return np.concatenate([self.base, self.matrix[: len(self) - self.base.shape[0]]])
+
+
+class _ShingleHashStore:
+    """Sorted shingle hashes per row in flat uint64 buffers with row offsets.
+
+    Rows below ``len(base_offsets) - 1`` live in the frozen base arrays; later
+    rows are appended to the growable ``data``/``offsets`` tail.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_data: np.ndarray | None = None,
+        base_offsets: np.ndarray | None = None,
+        ids: _RowIds | None = None,
+    ) -> None:
+        self.ids = ids if ids is not None else _RowIds()
+        self.base_data = base_data if base_data is not None else np.empty(0, dtype=np.uint64)
+        self.base_offsets = (
+            base_offsets if base_offsets is not None else np.zeros(1, dtype=np.int64)
+        )
+        self.data = np.empty(0, dtype=np.uint64)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.size = 0
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, doc_id: str, hashes: np.ndarray) -> int:
+        row = self.ids.append(doc_id)
+        tail = row - self.ids.base
+        end = self.size + hashes.size
+        if end > self.data.shape[0]:
+            self.data = _grow(self.data, end)
+        if tail + 2 > self.offsets.shape[0]:
+            self.offsets = _grow(self.offsets, tail + 2)
+        self.data[self.size : end] = hashes
+        self.offsets[tail + 1] = end
+        self.size = end
+        return row
+
+    def get_row(self, row: int) -> np.ndarray:
+        if row < self.ids.base:
+            return self.base_data[self.base_offsets[row] : self.base_offsets[row + 1]]
+        tail = row - self.ids.base
+        return self.data[self.offsets[tail] : self.offsets[tail + 1]]
+
+    def row_sizes(self, rows: np.ndarray) -> np.ndarray:
+        split = self.ids.base
+        sizes = np.empty(rows.size, dtype=np.int64)
+        in_base = rows < split
+        base_rows = rows[in_base]
+        sizes[in_base] = self.base_offsets[base_rows + 1] - self.base_offsets[base_rows]
+        tail_rows = rows[~in_base] - split
+        sizes[~in_base] = self.offsets[tail_rows + 1] - self.offsets[tail_rows]
+        return sizes
+
+    def all_hashes(self) -> tuple[np.ndarray, np.ndarray]:
+        """``(data, offsets)`` for every row, base and tail combined."""
+        tail_rows = len(self) - self.ids.base
+        data = np.concatenate([self.base_data, self.data[: self.size]])
+        offsets = np.concatenate(
+            [self.base_offsets, self.offsets[1 : tail_rows + 1] + self.base_offsets[-1]]
+        )
+        return data, offsets
+
+
+def _prefix_length(size: int, threshold: float) -> int:
+    """Tokens of a ``size``-set that any set with Jaccard >= ``threshold`` must hit.
+
+    Two sets with Jaccard >= t share at least ``ceil(t * |x|)`` of ``x``'s tokens,
+    so under one global token order their first ``|x| - ceil(t * |x|) + 1``
+    tokens (the prefix) must overlap.
+    """
+    required = math.ceil(threshold * size - 1e-9)
+    return min(max(size - required + 1, 1), size)
+
+
+def _prefix_lengths(sizes: np.ndarray, threshold: float) -> np.ndarray:
+    """Vectorized :func:`_prefix_length` for non-empty sets."""
+    required = np.ceil(threshold * sizes - 1e-9).astype(np.int64)
+    return np.asarray(np.minimum(np.maximum(sizes - required + 1, 1), sizes))
+
+
+def _count_rows(found: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Distinct rows across posting lists and how many lists each appears in."""
+    if not found:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    return np.unique(np.concatenate(found).astype(np.int64), return_counts=True)
+
+
+def _rank_rows(rows: np.ndarray, counts: np.ndarray) -> list[int]:
+    """Rows by descending hit count, then insertion order."""
+    ranked: list[int] = rows[np.lexsort((rows, -counts))].tolist()
+    return ranked
+
+
+class _PrefixIndex:
+    """Inverted index from shingle hash to doc rows over each doc's prefix.
+
+    Hash value order is the global token order, so a doc's prefix is the head of
+    its sorted hash array. Only prefixes are posted (prefix filtering), and a
+    query probes only its own prefix, then drops rows whose set size rules out
+    Jaccard >= threshold. Postings loaded from disk stay in a sorted ``base``;
+    documents added afterwards go to an in-memory dict.
+    """
+
+    def __init__(self, threshold: float, base: _Postings | None = None) -> None:
+        self.threshold = threshold
+        self.base = base
+        self.postings: dict[int, list[int]] = {}
+
+    def add(self, row: int, hashes: np.ndarray) -> None:
+        for value in hashes[: _prefix_length(hashes.size, self.threshold)].tolist():
+            rows = self.postings.get(value)
+            if rows is None:
+                self.postings[value] = [row]
+            else:
+                rows.append(row)
+
+    def candidates(self, hashes: np.ndarray, store: _ShingleHashStore) -> list[int]:
+        """Rows sharing a prefix token, most shared prefix tokens first, then insertion order."""
+        prefix = hashes[: _prefix_length(hashes.size, self.threshold)]
+        found = self.base.lookup(prefix) if self.base is not None else []
+        for value in prefix.tolist():
+            posting = self.postings.get(value)
+            if posting:
+                found.append(np.asarray(posting, dtype=np.int64))
+        rows, counts = _count_rows(found)
+        if self.threshold > 0 and rows.size:
+            row_sizes = store.row_sizes(rows)
+            lower = self.threshold * hashes.size - 1e-9
+            upper = hashes.size / self.threshold + 1e-9
+            keep = (row_sizes >= lower) & (row_sizes <= upper)
+            rows, counts = rows[keep], counts[keep]
+        return _rank_rows(rows, counts)
+
+    @staticmethod
+    def build(data: np.ndarray, offsets: np.ndarray, threshold: float) -> _Postings:
+        """Sorted postings of every row's prefix in ``(data, offsets)``."""
+        sizes = np.diff(offsets)
+        lengths = _prefix_lengths(sizes, threshold)
+        rows = np.repeat(np.arange(sizes.size, dtype=np.int64), lengths)
+        starts = np.repeat(offsets[:-1] - (np.cumsum(lengths) - lengths), lengths)
+        return _Postings.build(data[starts + np.arange(rows.size)], rows)
+
+
+def _minhash_permutations(num_perm: int, seed: int = MINHASH_SEED) -> tuple[np.ndarray, np.ndarray]:
+    """Multiply-add hash parameters ``(a, b)``; odd ``a`` makes each one a bijection of uint64."""
+    rng = np.random.default_rng(seed)
+    info = np.iinfo(np.uint64)
+    a = rng.integers(1, info.max, size=num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+    b = rng.integers(0, info.max, size=num_perm, dtype=np.uint64, endpoint=True)
+    return a, b
+
+
+def _minhash_signatures(hash_arrays: list[np.ndarray], a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """MinHash signatures for non-empty shingle hash arrays, one row per array.
+
+    Documents are concatenated into blocks of about ``SIGNATURE_BLOCK_ROWS``
+    shingles; every permutation is applied to a block at once (wrapping uint64
+    arithmetic) and ``np.minimum.reduceat`` takes the per-document minimums.
+    """
+    signatures = np.empty((len(hash_arrays), a.size), dtype=np.uint64)
+    start = 0
+    while start < len(hash_arrays):
+        end = start + 1
+        total = hash_arrays[start].size
+        while end < len(hash_arrays) and total + hash_arrays[end].size <= SIGNATURE_BLOCK_ROWS:
+            total += hash_arrays[end].size
+            end += 1
+        block = hash_arrays[start:end]
+        offsets = np.zeros(len(block), dtype=np.intp)
+        np.cumsum([arr.size for arr in block[:-1]], out=offsets[1:])
+        # Permutations x shingles keeps each document's values contiguous for reduceat.
+        values = a[:, None] * np.concatenate(block)[None, :] + b[:, None]
+        signatures[start:end] = np.minimum.reduceat(values, offsets, axis=1).T
+        start = end
+    return signatures
+
+
+def _band_error(threshold: float, bands: int, rows: int) -> float:
+    """Equal-weight false positive + false negative area of an LSH ``bands x rows`` curve."""
+    below = np.linspace(0.0, threshold, 200)
+    above = np.linspace(threshold, 1.0, 200)
+    false_pos = (1.0 - (1.0 - below**rows) ** bands).mean() * threshold
+    false_neg = ((1.0 - above**rows) ** bands).mean() * (1.0 - threshold)
+    return float(0.5 * false_pos + 0.5 * false_neg)
+
+
+@functools.lru_cache(maxsize=32)
+def _optimal_bands(threshold: float, num_perm: int) -> tuple[int, int]:
+    """``(bands, rows_per_band)`` minimizing LSH error for ``threshold``."""
+    best = (1, num_perm)
+    best_error = float("inf")
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            error = _band_error(threshold, bands, rows)
+            if error < best_error:
+                best_error = error
+                best = (bands, rows)
+    return best
+
+
+class _BandIndex:
+    """LSH banding over signature rows: ``band hash -> rows`` buckets per band.
+
+    Buckets loaded from disk stay in one sorted :class:`_Postings` per band;
+    rows inserted afterwards go to one in-memory dict per band.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        num_perm: int,
+        seed: int = MINHASH_SEED,
+        base: list[_Postings] | None = None,
+    ) -> None:
+        self.bands, self.rows_per_band = _optimal_bands(threshold, num_perm)
+        rng = np.random.default_rng(seed + 1)
+        self.mix = rng.integers(
+            0, np.iinfo(np.uint64).max, size=self.rows_per_band, dtype=np.uint64, endpoint=True
+        ) | np.uint64(1)
+        self.base = base
+        self.tables: list[dict[int, list[int]]] = [{} for _ in range(self.bands)]
+
+    def keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Band hashes, shape ``(len(signatures), bands)``."""
+        span = self.bands * self.rows_per_band
+        banded = signatures[:, :span].reshape(len(signatures), self.bands, self.rows_per_band)
+        return np.asarray((banded * self.mix).sum(axis=2, dtype=np.uint64))
+
+    def insert(self, row: int, keys: np.ndarray) -> None:
+        for table, key in zip(self.tables, keys.tolist(), strict=True):
+            bucket = table.get(key)
+            if bucket is None:
+                table[key] = [row]
+            else:
+                bucket.append(row)
+
+    def candidates(self, keys: np.ndarray) -> list[int]:
+        """Rows sharing a bucket with ``keys``, most shared bands first, then insertion order."""
+        found: list[np.ndarray] = []
+        if self.base is not None:
+            for postings, key in zip(self.base, keys, strict=True):
+                found.extend(postings.lookup(key[None]))
+        for table, key in zip(self.tables, keys.tolist(), strict=True):
+            bucket = table.get(key)
+            if bucket:
+                found.append(np.asarray(bucket, dtype=np.int64))
+        return _rank_rows(*_count_rows(found))
+
+    def arrays(self, signatures: np.ndarray) -> dict[str, np.ndarray]:
+        """Per-band sorted ``band_keys``/``band_rows``, shape ``(bands, len(signatures))``."""
+        keys = self.keys(signatures).T
+        order = np.argsort(keys, axis=1, kind="stable")
+        return {
+            "band_keys": np.take_along_axis(keys, order, axis=1),
+            "band_rows": order.astype(np.int64),
+        }
+
+
+def _simhash(shingles: np.ndarray) -> np.ndarray:
+    """64-bit SimHash of a shingle-hash sequence, each shingle weighted by its count.
+
+    Returned as a one-element uint64 array (a width-1 signature row).
+    """
+    hashes, counts = np.unique(shingles, return_counts=True)
+    bits = np.unpackbits(hashes.astype("<u8").view(np.uint8), bitorder="little")
+    votes = counts.astype(np.float64) @ bits.reshape(-1, SIMHASH_BITS)
+    packed = np.packbits(votes * 2 > counts.sum(), bitorder="little")
+    return packed.view("<u8").astype(np.uint64)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """Set bits per element of a uint64 array."""
+    as_bytes = np.ascontiguousarray(values, dtype=np.uint64).view(np.uint8)
+    return np.asarray(_POPCOUNT8[as_bytes].reshape(-1, 8).sum(axis=1))
+
+
+class _FingerprintStore(_SignatureStore):
+    """One 64-bit SimHash fingerprint (8 bytes) per row, scored by Hamming distance."""
+
+    def __init__(self, *, base: np.ndarray | None = None, ids: _RowIds | None = None) -> None:
+        super().__init__(1, base=base, ids=ids)
+
+    def similarities(self, rows: np.ndarray, signature: np.ndarray) -> np.ndarray:
+        """``1 - hamming / 64`` of ``signature`` vs each row."""
+        distances = _popcount(_gather(self.base, self.matrix, rows)[:, 0] ^ signature[0])
+        return 1.0 - distances / SIMHASH_BITS
+
+
+def _simhash_masks(hamming_bits: int) -> np.ndarray:
+    """Table masks for fingerprints within ``hamming_bits`` of each other.
+
+    The 64 bits are cut into ``hamming_bits + 2`` contiguous blocks; two
+    fingerprints differing in at most ``hamming_bits`` bits agree on at least two
+    whole blocks, so one table per pair of blocks (keyed on those bits only) is
+    guaranteed to bucket them together. Masking is equivalent to the permuted
+    tables of Manku et al. without storing permuted copies.
+    """
+    edges = np.linspace(0, SIMHASH_BITS, hamming_bits + 3).round().astype(int)
+    blocks = [
+        ((1 << int(hi)) - 1) ^ ((1 << int(lo)) - 1)
+        for lo, hi in zip(edges, edges[1:], strict=False)
+    ]
+    return np.array(
+        [first | second for first, second in itertools.combinations(blocks, 2)], dtype=np.uint64
+    )
+
+
+class _SimhashIndex(_BandIndex):
+    """:class:`_BandIndex` over SimHash fingerprints: one table per pair of bit blocks."""
+
+    def __init__(self, hamming_bits: int, base: list[_Postings] | None = None) -> None:
+        self.masks = _simhash_masks(hamming_bits)
+        self.bands = len(self.masks)
+        self.base = base
+        self.tables = [{} for _ in range(self.bands)]
+
+    def keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Masked fingerprints, shape ``(len(signatures), tables)``."""
+        return np.asarray(signatures[:, :1] & self.masks)
+
+
 def _datasketch_available() -> bool:
     return importlib.util.find_spec("datasketch") is not None
 
@@ -101,10 +645,27 @@ class NearDuplicateDetector:
     Near-duplicate detector optimized for large corpora.
 
     Performance target (<1ms per query on ~100K docs) assumes:
-      - Datasketch MinHashLSH backend
+      - a MinHash LSH backend (``numpy`` or ``datasketch``)
       - max_candidates capped (default: 50)
       - tokens capped (default: 2000) and short shingles
-    The pure-Python fallback is intended for small corpora or testing only.
+    The python backend computes exact Jaccard and is meant for smaller corpora;
+    it finds candidates through a prefix-filtered inverted index, so it only
+    reports matches at or above ``threshold`` (best-effort scores below it).
+
+    Indexed documents are not kept as token sets. The MinHash backends store
+    each document's ``num_perm`` uint64 MinHash values as one row of a
+    preallocated matrix (1 KiB per document at 128 permutations) and score
+    candidates by estimated Jaccard; the python backend stores sorted 64-bit
+    shingle hashes in a flat array and scores by exact Jaccard over the hashes.
+
+    The ``numpy`` backend hashes each shingle once, applies all permutations
+    with vectorized multiply-add hashing and buckets signatures by band hash
+    itself; ``add_many``/``query_many`` batch that work across documents.
+
+    The ``simhash`` backend keeps one 64-bit SimHash of the count-weighted
+    shingles per document (8 bytes) and reports a duplicate when the closest
+    candidate is within ``hamming_bits`` differing bits; ``score`` is
+    ``1 - hamming / 64`` and ``threshold`` is not used.
     """
 
     def __init__(
@@ -116,6 +677,7 @@ class NearDuplicateDetector:
         shingle_size: int = DEFAULT_SHINGLE_SIZE,
         max_tokens: int = DEFAULT_MAX_TOKENS,
         max_candidates: int = DEFAULT_MAX_CANDIDATES,
+        hamming_bits: int = DEFAULT_HAMMING_BITS,
     ) -> None:
         self.backend = backend
         self.threshold = threshold
@@ -123,19 +685,157 @@ class NearDuplicateDetector:
         self.shingle_size = shingle_size
         self.max_tokens = max_tokens
         self.max_candidates = max_candidates
+        self.hamming_bits = hamming_bits
         self.stats = DetectorStats()
-        self._token_sets: dict[str, set[str]] = {}
+        self._store: _SignatureStore | _ShingleHashStore
+        self._lsh: Any = None
+        self._bands: _BandIndex | None = None
+        self._min_score = threshold
         if backend == "datasketch":
             from datasketch import MinHashLSH
 
             self._lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+            self._store = _SignatureStore(num_perm)
+        elif backend == "numpy":
+            self._perm_a, self._perm_b = _minhash_permutations(num_perm)
+            self._bands = _BandIndex(threshold, num_perm)
+            self._store = _SignatureStore(num_perm)
+        elif backend == "simhash":
+            if not 0 <= hamming_bits < SIMHASH_BITS // 2:
+                raise ValueError(
+                    f"hamming_bits must be between 0 and {SIMHASH_BITS // 2 - 1}, "
+                    f"got {hamming_bits}"
+                )
+            self._bands = _SimhashIndex(hamming_bits)
+            self._store = _FingerprintStore()
+            self._min_score = 1.0 - hamming_bits / SIMHASH_BITS
         else:
-            self._lsh = None
+            self._store = _ShingleHashStore()
+            self._prefix = _PrefixIndex(threshold)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._store
+
+    def settings(self) -> dict[str, Any]:
+        """Parameters that shape the index; a saved index only serves matching settings."""
+        settings: dict[str, Any] = {
+            "backend": self.backend,
+            "threshold": self.threshold,
+            "num_perm": self.num_perm,
+            "shingle_size": self.shingle_size,
+            "max_tokens": self.max_tokens,
+        }
+        if self.backend == "simhash":
+            settings["hamming_bits"] = self.hamming_bits
+        return settings
+
+    def save(self, path: Path) -> None:
+        """Write the index to directory ``path`` as ``.npy`` arrays plus ``meta.json``.
+
+        The directory is built next to ``path`` and swapped in, so a reader never
+        sees a partial index. Arrays hold the id map (row order and sorted), the
+        per-row signatures or shingle hashes, and the sorted LSH band / prefix
+        postings, so :meth:`load` can memory-map them without rebuilding.
+        """
+        arrays = self._store.ids.arrays()
+        if isinstance(self._store, _SignatureStore):
+            signatures = self._store.all_signatures()
+            arrays["signatures"] = signatures
+            if self._bands is not None:
+                arrays.update(self._bands.arrays(signatures))
+        else:
+            data, offsets = self._store.all_hashes()
+            postings = _PrefixIndex.build(data, offsets, self.threshold)
+            arrays.update(hashes=data, offsets=offsets, prefix_keys=postings.keys)
+            arrays["prefix_rows"] = postings.rows
+        tmp_path = path.with_name(path.name + ".tmp")
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        ensure_dir(tmp_path)
+        for name, array in arrays.items():
+            np.save(tmp_path / f"{name}.npy", array)
+        write_json(
+            tmp_path / INDEX_META_NAME,
+            {
+                "format_version": INDEX_FORMAT_VERSION,
+                **self.settings(),
+                "max_candidates": self.max_candidates,
+                "documents": len(self),
+                "arrays": sorted(arrays),
+            },
+        )
+        old_path = path.with_name(path.name + ".old")
+        shutil.rmtree(old_path, ignore_errors=True)
+        if path.exists():
+            path.rename(old_path)
+        tmp_path.rename(path)
+        shutil.rmtree(old_path, ignore_errors=True)
+
+    @classmethod
+    def load(cls, path: Path, *, mmap: bool = True) -> NearDuplicateDetector:
+        """Reopen an index written by :meth:`save`.
+
+        With ``mmap`` (default) the arrays are memory-mapped read-only and shared
+        through the page cache; documents added afterwards are kept in memory
+        until the next :meth:`save`. The datasketch backend re-inserts the stored
+        signatures into a fresh ``MinHashLSH``.
+        """
+        meta = json.loads((path / INDEX_META_NAME).read_text(encoding="utf-8"))
+        if meta.get("format_version") != INDEX_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported near-duplicate index format {meta.get('format_version')!r} in {path}"
+            )
+        detector = cls(
+            backend=meta["backend"],
+            threshold=meta["threshold"],
+            num_perm=meta["num_perm"],
+            shingle_size=meta["shingle_size"],
+            max_tokens=meta["max_tokens"],
+            max_candidates=meta["max_candidates"],
+            hamming_bits=meta.get("hamming_bits", DEFAULT_HAMMING_BITS),
+        )
+        arrays = {
+            name: np.load(path / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in meta["arrays"]
+        }
+        ids = _RowIds(arrays["ids"], arrays["sorted_ids"], arrays["sorted_rows"])
+        if detector.backend == "python":
+            detector._store = _ShingleHashStore(
+                base_data=arrays["hashes"], base_offsets=arrays["offsets"], ids=ids
+            )
+            detector._prefix = _PrefixIndex(
+                detector.threshold, _Postings(arrays["prefix_keys"], arrays["prefix_rows"])
+            )
+            return detector
+        signatures = arrays["signatures"]
+        if detector.backend == "simhash":
+            detector._store = _FingerprintStore(base=signatures, ids=ids)
+        else:
+            detector._store = _SignatureStore(detector.num_perm, base=signatures, ids=ids)
+        if detector._bands is not None:
+            detector._bands.base = [
+                _Postings(keys, rows)
+                for keys, rows in zip(arrays["band_keys"], arrays["band_rows"], strict=True)
+            ]
+        else:
+            from datasketch import MinHash
+
+            for row in range(len(ids)):
+                minhash = MinHash(num_perm=detector.num_perm)
+                # datasketch's LSH keys hash the raw bytes, so keep its native dtype.
+                minhash.hashvalues = signatures[row].astype(minhash.hashvalues.dtype)
+                detector._lsh.insert(ids.doc_id(row), minhash)
+        return detector
 
     def _prepare_tokens(self, text: str) -> list[str]:
         tokens = _tokenize(text, max_tokens=self.max_tokens)
         return _build_shingles(tokens, self.shingle_size)
 
+    def _prepare_hashes(self, text: str) -> np.ndarray:
+        return _shingle_hashes(_tokenize(text, max_tokens=self.max_tokens), self.shingle_size)
+
     def _build_minhash(self, tokens: list[str]) -> Any:
         from datasketch import MinHash
 
@@ -144,74 +844,195 @@ class NearDuplicateDetector:
             minhash.update(token.encode("utf-8"))
         return minhash
 
+    def _signatures(self, texts: list[str]) -> tuple[list[int], np.ndarray]:
+        """Indices of ``texts`` with shingles, and their MinHash signatures or SimHash
+        fingerprints (``numpy`` / ``simhash`` backends)."""
+        kept: list[int] = []
+        hash_arrays: list[np.ndarray] = []
+        for idx, text in enumerate(texts):
+            tokens = _tokenize(text, max_tokens=self.max_tokens)
+            if self.backend == "simhash":
+                hashes = _shingle_hash_sequence(tokens, self.shingle_size)
+            else:
+                hashes = _shingle_hashes(tokens, self.shingle_size)
+            if hashes.size:
+                kept.append(idx)
+                hash_arrays.append(hashes)
+        if self.backend == "simhash":
+            return kept, np.array([_simhash(hashes) for hashes in hash_arrays], dtype=np.uint64)
+        if not kept:
+            return kept, np.empty((0, self.num_perm), dtype=np.uint64)
+        return kept, _minhash_signatures(hash_arrays, self._perm_a, self._perm_b)
+
+    def prepare(self, text: str) -> Any:
+        """Backend sketch of ``text`` (see :meth:`prepare_many`)."""
+        return self.prepare_many([text])[0]
+
+    def prepare_many(self, texts: list[str]) -> list[Any]:
+        """Shingle and sketch ``texts`` without touching the index.
+
+        A sketch is the numpy signature row, a datasketch ``MinHash`` or the
+        python backend's sorted shingle hashes, or ``None`` for a text without
+        tokens. It depends only on the text and the detector settings, so it can
+        be computed in another process and passed to :meth:`query_prepared` /
+        :meth:`add_prepared` with the same results as :meth:`query` / :meth:`add`.
+        """
+        start = time.perf_counter()
+        prepared: list[Any] = [None] * len(texts)
+        if self._bands is not None:
+            kept, signatures = self._signatures(texts)
+            for pos, idx in enumerate(kept):
+                prepared[idx] = signatures[pos]
+        elif self._lsh is not None:
+            for idx, text in enumerate(texts):
+                tokens = self._prepare_tokens(text)
+                if tokens:
+                    prepared[idx] = self._build_minhash(tokens)
+        else:
+            for idx, text in enumerate(texts):
+                hashes = self._prepare_hashes(text)
+                if hashes.size:
+                    prepared[idx] = hashes
+        if texts:
+            self.stats.record_prepare((time.perf_counter() - start) * 1000, count=len(texts))
+        return prepared
+
     def add(self, doc_id: str, text: str) -> None:
-        if doc_id in self._token_sets:
+        if doc_id in self._store:
+            return
+        self.add_prepared(doc_id, self.prepare(text))
+
+    def add_many(self, docs: Iterable[tuple[str, str]]) -> None:
+        """Index ``(doc_id, text)`` pairs; ids already indexed (or repeated) are skipped."""
+        pending: dict[str, str] = {}
+        for doc_id, text in docs:
+            if doc_id not in self._store and doc_id not in pending:
+                pending[doc_id] = text
+        prepared = self.prepare_many(list(pending.values()))
+        if self._bands is None:
+            for doc_id, sketch in zip(pending, prepared, strict=True):
+                self.add_prepared(doc_id, sketch)
+            return
+        # numpy: band keys for the whole batch in one pass.
+        kept = [
+            (doc_id, sketch)
+            for doc_id, sketch in zip(pending, prepared, strict=True)
+            if sketch is not None
+        ]
+        if not kept:
             return
         start = time.perf_counter()
-        tokens = self._prepare_tokens(text)
-        if not tokens:
+        keys = self._bands.keys(np.stack([sketch for _, sketch in kept]))
+        for (doc_id, sketch), row_keys in zip(kept, keys, strict=True):
+            self._bands.insert(self._store.add(doc_id, sketch), row_keys)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / len(kept)
+        for _ in kept:
+            self.stats.record_index(elapsed_ms)
+
+    def add_prepared(self, doc_id: str, prepared: Any) -> None:
+        """Insert a sketch from :meth:`prepare`; no-op for ``None`` or an indexed id."""
+        if prepared is None or doc_id in self._store:
             return
-        token_set = set(tokens)
-        self._token_sets[doc_id] = token_set
+        start = time.perf_counter()
         if self._lsh is not None:
-            minhash = self._build_minhash(tokens)
-            self._lsh.insert(doc_id, minhash)
+            self._lsh.insert(doc_id, prepared)
+            self._store.add(doc_id, prepared.hashvalues)
+        elif self._bands is not None:
+            row = self._store.add(doc_id, prepared)
+            self._bands.insert(row, self._bands.keys(prepared[None, :])[0])
+        else:
+            self._prefix.add(self._store.add(doc_id, prepared), prepared)
         elapsed_ms = (time.perf_counter() - start) * 1000
         self.stats.record_index(elapsed_ms)
 
     def query(self, text: str) -> DuplicateResult:
         start = time.perf_counter()
-        tokens = self._prepare_tokens(text)
-        if not tokens:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            result = DuplicateResult(
-                is_duplicate=False,
-                score=0.0,
-                match_id=None,
-                backend=self.backend,
-                elapsed_ms=elapsed_ms,
-                candidates_checked=0,
-            )
-            self.stats.record_query(elapsed_ms, is_duplicate=False)
-            return result
+        result = self.query_prepared(self.prepare(text))
+        return replace(result, elapsed_ms=(time.perf_counter() - start) * 1000)
+
+    def query_many(self, texts: list[str]) -> list[DuplicateResult]:
+        """Query each text against the current index (texts are not compared to each other)."""
+        start = time.perf_counter()
+        prepared = self.prepare_many(texts)
+        # Sketching is batched, so its time is attributed evenly to every text.
+        share_ms = (time.perf_counter() - start) * 1000 / max(len(texts), 1)
+        return [
+            replace(result, elapsed_ms=result.elapsed_ms + share_ms)
+            for result in map(self.query_prepared, prepared)
+        ]
+
+    def query_prepared(self, prepared: Any) -> DuplicateResult:
+        """Best match for a sketch from :meth:`prepare`; ``elapsed_ms`` covers the lookup only."""
+        start = time.perf_counter()
+        if prepared is None:
+            return self._result(0.0, None, 0, (time.perf_counter() - start) * 1000)
 
         best_score = 0.0
-        best_id: str | None = None
-        candidates: list[str]
+        best_row: int | None = None
+        rows: list[int]
         if self._lsh is not None:
-            minhash = self._build_minhash(tokens)
-            raw_candidates = self._lsh.query(minhash)
-            candidates = sorted(raw_candidates)
+            raw_candidates = self._lsh.query(prepared)
+            rows = [
+                row
+                for doc_id in sorted(raw_candidates)
+                if (row := self._store.ids.row(doc_id)) is not None
+            ]
+            signature = prepared.hashvalues
+        elif self._bands is not None:
+            rows = self._bands.candidates(self._bands.keys(prepared[None, :])[0])
+            signature = prepared
         else:
-            candidates = list(self._token_sets.keys())
-        if self.max_candidates and len(candidates) > self.max_candidates:
-            candidates = candidates[: self.max_candidates]
-
-        for candidate_id in candidates:
-            candidate_tokens = self._token_sets.get(candidate_id)
-            if not candidate_tokens:
-                continue
-            score = _jaccard(tokens, candidate_tokens)
-            if score > best_score:
-                best_score = score
-                best_id = candidate_id
-            if best_score >= 1.0:
-                break
+            assert isinstance(self._store, _ShingleHashStore)
+            rows = self._prefix.candidates(prepared, self._store)
+        if self.max_candidates and len(rows) > self.max_candidates:
+            rows = rows[: self.max_candidates]
 
+        if isinstance(self._store, _SignatureStore):
+            if rows:
+                scores = self._store.similarities(np.asarray(rows), signature)
+                best = int(scores.argmax())
+                if scores[best] > 0.0:
+                    best_score = float(scores[best])
+                    best_row = rows[best]
+        else:
+            for row in rows:
+                score = _hash_jaccard(prepared, self._store.get_row(row))
+                if score > best_score:
+                    best_score = score
+                    best_row = row
+                if best_score >= 1.0:
+                    break
+        best_id = None if best_row is None else self._store.ids.doc_id(best_row)
         elapsed_ms = (time.perf_counter() - start) * 1000
-        is_duplicate = best_score >= self.threshold
+        return self._result(best_score, best_id, len(rows), elapsed_ms)
+
+    def _result(
+        self, score: float, match_id: str | None, candidates_checked: int, elapsed_ms: float
+    ) -> DuplicateResult:
+        is_duplicate = match_id is not None and score >= self._min_score
         result = DuplicateResult(
             is_duplicate=is_duplicate,
-            score=best_score,
-            match_id=best_id,
+            score=score,
+            match_id=match_id,
             backend=self.backend,
             elapsed_ms=elapsed_ms,
-            candidates_checked=len(candidates),
+            candidates_checked=candidates_checked,
         )
         self.stats.record_query(elapsed_ms, is_duplicate=is_duplicate)
         return result
 
 
+@stable_api
+def resolve_backend(backend: str | None = None) -> str:
+    """Backend ``create_detector`` would use for ``backend`` (``None`` means auto)."""
+    resolved_backend = backend or ("datasketch" if _datasketch_available() else "python")
+    if resolved_backend not in BACKENDS:
+        raise ValueError(f"Unsupported near-duplicate backend: {resolved_backend}")
+    if resolved_backend == "datasketch" and not _datasketch_available():
+        resolved_backend = "python"
+    return resolved_backend
+
+
 @stable_api
 def create_detector(
     *,
@@ -221,17 +1042,14 @@ def create_detector(
     shingle_size: int = DEFAULT_SHINGLE_SIZE,
     max_tokens: int = DEFAULT_MAX_TOKENS,
     max_candidates: int = DEFAULT_MAX_CANDIDATES,
+    hamming_bits: int = DEFAULT_HAMMING_BITS,
 ) -> NearDuplicateDetector:
-    resolved_backend = backend or ("datasketch" if _datasketch_available() else "python")
-    if resolved_backend not in {"datasketch", "python"}:
-        raise ValueError(f"Unsupported near-duplicate backend: {resolved_backend}")
-    if resolved_backend == "datasketch" and not _datasketch_available():
-        resolved_backend = "python"
     return NearDuplicateDetector(
-        backend=resolved_backend,
+        backend=resolve_backend(backend),
         threshold=threshold,
         num_perm=num_perm,
         shingle_size=shingle_size,
         max_tokens=max_tokens,
         max_candidates=max_candidates,
+        hamming_bits=hamming_bits,
     )
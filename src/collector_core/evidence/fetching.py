@@ -24,6 +24,7 @@ from collector_core.network_utils import _with_retries
 from collector_core.secrets import REDACTED, SecretStr, redact_headers
 from collector_core.stability import stable_api
 from collector_core.utils.hash import sha256_bytes, sha256_file
+from collector_core.utils.http import HttpSessionPool, pooled_get
 from collector_core.utils.io import write_json
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir
@@ -38,6 +39,8 @@ logger = logging.getLogger(__name__)
 PdfReader = _try_import("pypdf", "PdfReader")
 
 EVIDENCE_EXTENSIONS = [".html", ".pdf", ".txt", ".json"]
+# Default thread count of fetch_evidence_batch, and the per-host keep-alive pool size.
+EVIDENCE_FETCH_WORKERS = 8
 
 
 class EvidenceFetchCache:
@@ -277,8 +280,12 @@ def fetch_url_with_retry(
     headers: dict[str, str] | None = None,
     max_bytes: int | None = None,
     allow_private_hosts: bool = False,
+    http: HttpSessionPool | None = None,
 ) -> tuple[bytes | None, str | None, dict[str, Any]]:
-    """Fetch URL with retry and exponential backoff."""
+    """Fetch URL with retry and exponential backoff.
+
+    Requests go through ``http``'s keep-alive sessions when given, else ``requests.get``.
+    """
     meta: dict[str, Any] = {
         "retries": 0,
         "errors": [],
@@ -295,8 +302,10 @@ def fetch_url_with_retry(
         meta["retries"] = attempt
         meta["errors"].append({"attempt": attempt, "error": repr(exc)})
 
+    http_get = pooled_get(http, requests.get)
+
     def _fetch_once() -> tuple[bytes, str]:
-        with requests.get(
+        with http_get(
             url,
             timeout=timeout_s,
             headers={"User-Agent": user_agent, **(headers or {})},
@@ -428,6 +437,7 @@ def _fetch_url_with_cache(
     max_bytes: int | None = None,
     allow_private_hosts: bool = False,
     fetch_cache: EvidenceFetchCache | None = None,
+    http: HttpSessionPool | None = None,
 ) -> tuple[bytes | None, str | None, dict[str, Any]]:
     if fetch_cache is None:
         return fetch_url_with_retry(
@@ -439,6 +449,7 @@ def _fetch_url_with_cache(
             headers=headers,
             max_bytes=max_bytes,
             allow_private_hosts=allow_private_hosts,
+            http=http,
         )
     cache_key = _build_fetch_cache_key(
         url=url,
@@ -460,6 +471,7 @@ def _fetch_url_with_cache(
             headers=headers,
             max_bytes=max_bytes,
             allow_private_hosts=allow_private_hosts,
+            http=http,
         )
 
     return fetch_cache.get_or_fetch(cache_key, _fetch)
@@ -479,6 +491,7 @@ def snapshot_evidence(
     allow_private_hosts: bool = False,
     max_bytes: int = 20 * 1024 * 1024,
     fetch_cache: EvidenceFetchCache | None = None,
+    http: HttpSessionPool | None = None,
 ) -> dict[str, Any]:
     result: dict[str, Any] = {
         "url": url,
@@ -517,6 +530,7 @@ def snapshot_evidence(
         max_bytes=max_bytes,
         allow_private_hosts=allow_private_hosts,
         fetch_cache=fetch_cache,
+        http=http,
     )
     result["fetch_meta"] = meta
 
@@ -706,6 +720,7 @@ def fetch_evidence(
             allow_private_hosts=cfg.args.allow_private_evidence_hosts,
             max_bytes=max_bytes,
             fetch_cache=fetch_cache,
+            http=cfg.http,
         )
         evidence_text = extract_text_for_scanning(evidence_snapshot)
         license_change_detected = bool(evidence_snapshot.get("changed_from_previous"))
@@ -753,7 +768,7 @@ def fetch_evidence_batch(
     if not ctxs:
         return []
     fetch_cache = EvidenceFetchCache()
-    worker_count = max_workers or min(8, len(ctxs))
+    worker_count = max_workers or min(EVIDENCE_FETCH_WORKERS, len(ctxs))
     if worker_count <= 1:
         return [
             fetch_evidence(
@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import argparse
 import cProfile
-import gzip
 import importlib.util
-import json
 import logging
-import os
 import pstats
+import sys
+import time
 import tracemalloc
 from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
@@ -17,31 +16,60 @@ logger = logging.getLogger(__name__)
 
 from collector_core.__version__ import __version__ as VERSION
 from collector_core.artifact_metadata import build_artifact_metadata
-from collector_core.checks.near_duplicate import create_detector
+from collector_core.checks.near_duplicate import (
+    DEFAULT_HAMMING_BITS,
+    NearDuplicateDetector,
+    create_detector,
+    resolve_backend,
+)
 from collector_core.config_validator import read_yaml
 from collector_core.dataset_root import ensure_data_root_allowed, resolve_dataset_root
 from collector_core.merge.contract import (
-    canonicalize_row,
+    CanonicalizePlans,
     normalize_record,
     resolve_canonicalize_config,
 )
 from collector_core.merge.dedupe import (
+    DEDUPE_BACKENDS,
+    DEFAULT_MAX_DUPLICATES,
+    DEFAULT_MAX_SOURCE_URLS,
     build_dedupe_index,
     build_dedupe_update,
-    merge_provenance_update,
     merge_update_payload,
 )
 from collector_core.merge.hf import iter_hf_dataset_dirs, iter_hf_inputs
+from collector_core.merge.incremental import (
+    INPUT_MANIFEST_NAME,
+    NEAR_DEDUP_INDEX_NAME,
+    InputWatermarks,
+    load_input_manifest,
+    write_input_manifest,
+)
+from collector_core.merge.near_dedup import NEAR_DEDUP_BATCH_SIZE, SignaturePrefetcher
 from collector_core.merge.shard import Sharder, ensure_shard_dir, sharding_cfg
 from collector_core.merge.types import (
     GreenInput,
     GreenSkip,
+    GreenUnit,
     MergeRuntimeConfig,
     MergeState,
     RootDefaults,
     Roots,
 )
-from collector_core.utils.io import append_jsonl, read_jsonl, write_json
+from collector_core.merge.updates import (
+    PROVENANCE_UPDATE_MODES,
+    compact_pool_updates,
+    rewrite_shard_with_updates,
+    write_shard_updates,
+)
+from collector_core.utils.io import (
+    JsonlReadStats,
+    LedgerWriter,
+    append_ledger,
+    read_jsonl,
+    set_zstd_settings,
+    write_json,
+)
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir
 
@@ -51,6 +79,11 @@ if importlib.util.find_spec("tqdm"):
 else:  # pragma: no cover - optional dependency
     tqdm_progress = None
 
+if importlib.util.find_spec("resource"):
+    import resource
+else:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
 
 LICENSE_POOL_MAP = {
     "permissive": "permissive",
@@ -72,10 +105,6 @@ def default_merge_roots(prefix: str) -> RootDefaults:
     )
 
 
-DEFAULT_MAX_SOURCE_URLS = 10
-DEFAULT_MAX_DUPLICATES = 20
-
-
 def resolve_roots(
     cfg: dict[str, Any],
     defaults: RootDefaults,
@@ -117,6 +146,11 @@ def resolve_merge_runtime(
     profile_path: str | None = None,
     profile_sort: str | None = None,
     dedupe_partitions: int | None = None,
+    dedupe_backend: str | None = None,
+    merge_workers: int | None = None,
+    incremental: bool | None = None,
+    provenance_updates: str | None = None,
+    compact_provenance: bool | None = None,
     ledger_root: Path | None = None,
 ) -> MergeRuntimeConfig:
     g = cfg.get("globals", {}) or {}
@@ -137,6 +171,37 @@ def resolve_merge_runtime(
         dedupe_partitions if dedupe_partitions is not None else g_merge.get("dedupe_partitions", 1)
     )
     resolved_partitions = max(int(partitions_value or 1), 1)
+    resolved_backend = str(dedupe_backend or g_merge.get("dedupe_backend") or "sqlite").lower()
+    if resolved_backend not in DEDUPE_BACKENDS:
+        raise ValueError(
+            f"Unknown dedupe backend {resolved_backend!r}; "
+            f"expected one of {', '.join(DEDUPE_BACKENDS)}."
+        )
+    resolved_expected_items = max(int(g_merge.get("dedupe_expected_items", 10_000_000) or 1), 1)
+    resolved_batch_size = max(int(g_merge.get("dedupe_batch_size", 10_000) or 1), 1)
+    workers_value = merge_workers if merge_workers is not None else g_merge.get("merge_workers", 1)
+    resolved_workers = max(int(workers_value or 1), 1)
+    resolved_incremental = bool(
+        incremental if incremental is not None else g_merge.get("incremental", False)
+    )
+    resolved_incremental_sha256 = bool(g_merge.get("incremental_sha256", False))
+    if resolved_incremental and resolved_backend == "memory":
+        raise ValueError(
+            "Incremental merge needs a persistent dedupe backend (sqlite or bloom), not memory."
+        )
+    resolved_updates = str(
+        provenance_updates or g_merge.get("provenance_updates") or "sidecar"
+    ).lower()
+    if resolved_updates not in PROVENANCE_UPDATE_MODES:
+        raise ValueError(
+            f"Unknown provenance update mode {resolved_updates!r}; "
+            f"expected one of {', '.join(PROVENANCE_UPDATE_MODES)}."
+        )
+    resolved_compact = bool(
+        compact_provenance
+        if compact_provenance is not None
+        else g_merge.get("compact_provenance", False)
+    )
     near_cfg = g_merge.get("near_dedup", {}) or {}
     resolved_near_enabled = bool(near_cfg.get("enabled", False))
     resolved_near_text = str(near_cfg.get("text_field", "text"))
@@ -146,6 +211,11 @@ def resolve_merge_runtime(
     resolved_near_shingle_size = int(near_cfg.get("shingle_size", 3))
     resolved_near_max_tokens = int(near_cfg.get("max_tokens", 2000))
     resolved_near_max_candidates = int(near_cfg.get("max_candidates", 50))
+    resolved_near_hamming_bits = int(near_cfg.get("hamming_bits", DEFAULT_HAMMING_BITS))
+    resolved_near_workers = max(int(near_cfg.get("workers", 1) or 1), 1)
+    resolved_near_batch_size = max(
+        int(near_cfg.get("batch_size", NEAR_DEDUP_BATCH_SIZE) or NEAR_DEDUP_BATCH_SIZE), 1
+    )
     resolved_profile_path: Path | None = None
     if resolved_profile:
         profile_value = profile_path or g_merge.get("profile_path")
@@ -161,6 +231,14 @@ def resolve_merge_runtime(
         profile_path=resolved_profile_path,
         profile_sort=resolved_profile_sort,
         dedupe_partitions=resolved_partitions,
+        dedupe_backend=resolved_backend,
+        dedupe_expected_items=resolved_expected_items,
+        dedupe_batch_size=resolved_batch_size,
+        merge_workers=resolved_workers,
+        incremental=resolved_incremental,
+        incremental_sha256=resolved_incremental_sha256,
+        provenance_updates=resolved_updates,
+        compact_provenance=resolved_compact,
         near_dedup=resolved_near_enabled,
         near_dedup_text_field=resolved_near_text,
         near_dedup_threshold=resolved_near_threshold,
@@ -169,10 +247,13 @@ def resolve_merge_runtime(
         near_dedup_shingle_size=resolved_near_shingle_size,
         near_dedup_max_tokens=resolved_near_max_tokens,
         near_dedup_max_candidates=resolved_near_max_candidates,
+        near_dedup_hamming_bits=resolved_near_hamming_bits,
+        near_dedup_workers=resolved_near_workers,
+        near_dedup_batch_size=resolved_near_batch_size,
     )
 
 
-def iter_green_records(roots: Roots) -> Iterator[GreenInput | GreenSkip]:
+def iter_green_units(roots: Roots) -> Iterator[GreenUnit | GreenSkip]:
     base = roots.raw_root / "green"
     for pool_dir in sorted(base.iterdir()) if base.exists() else []:
         if not pool_dir.is_dir():
@@ -187,13 +268,12 @@ def iter_green_records(roots: Roots) -> Iterator[GreenInput | GreenSkip]:
             )
             jsonl_set = {fp.resolve() for fp in jsonl_files}
             for fp in jsonl_files:
-                for raw in read_jsonl(fp):
-                    yield GreenInput(raw, target_id, pool_dir.name, fp, "jsonl")
+                yield GreenUnit(target_id, pool_dir.name, fp, "jsonl")
 
             hf_dirs = iter_hf_dataset_dirs(target_dir)
             hf_dir_set = {p.resolve() for p in hf_dirs}
-            for item in iter_hf_inputs(hf_dirs, target_id=target_id, pool=pool_dir.name):
-                yield item
+            for ds_path in hf_dirs:
+                yield GreenUnit(target_id, pool_dir.name, ds_path, "hf_dataset")
 
             for fp in sorted([p for p in target_dir.rglob("*") if p.is_file()]):
                 resolved = fp.resolve()
@@ -211,14 +291,52 @@ def iter_green_records(roots: Roots) -> Iterator[GreenInput | GreenSkip]:
                 )
 
 
-def iter_screened_yellow(roots: Roots) -> Iterator[dict[str, Any]]:
+def iter_unit_records(
+    unit: GreenUnit, stats: JsonlReadStats | None = None, start_offset: int = 0
+) -> Iterator[GreenInput | GreenSkip]:
+    if unit.source_kind == "hf_dataset":
+        yield from iter_hf_inputs([unit.source_path], target_id=unit.target_id, pool=unit.pool)
+        return
+    for raw in read_jsonl(unit.source_path, stats=stats, start_offset=start_offset):
+        yield GreenInput(raw, unit.target_id, unit.pool, unit.source_path, unit.source_kind)
+
+
+def iter_green_records(
+    roots: Roots,
+    keep: Callable[[Path], bool] | None = None,
+    stats: JsonlReadStats | None = None,
+    start_at: Callable[[Path], int] | None = None,
+) -> Iterator[GreenInput | GreenSkip]:
+    for unit in iter_green_units(roots):
+        if isinstance(unit, GreenSkip):
+            yield unit
+            continue
+        if keep is not None and not keep(unit.source_path):
+            continue
+        offset = start_at(unit.source_path) if start_at is not None else 0
+        yield from iter_unit_records(unit, stats, offset)
+
+
+def iter_screened_yellow_files(roots: Roots) -> Iterator[Path]:
     base = roots.screened_root
     for pool_dir in sorted(base.iterdir()) if base.exists() else []:
         shards_dir = pool_dir / "shards"
         if not shards_dir.exists():
             continue
-        for fp in sorted(shards_dir.glob("*.jsonl*")):
-            yield from read_jsonl(fp)
+        yield from sorted(shards_dir.glob("*.jsonl*"))
+
+
+def iter_screened_yellow(
+    roots: Roots,
+    keep: Callable[[Path], bool] | None = None,
+    stats: JsonlReadStats | None = None,
+    start_at: Callable[[Path], int] | None = None,
+) -> Iterator[dict[str, Any]]:
+    for fp in iter_screened_yellow_files(roots):
+        if keep is not None and not keep(fp):
+            continue
+        offset = start_at(fp) if start_at is not None else 0
+        yield from read_jsonl(fp, stats=stats, start_offset=offset)
 
 
 def route_pool(record: dict[str, Any]) -> str:
@@ -237,6 +355,8 @@ def record_skip(
     source_kind: str,
     execute: bool,
     detail: dict[str, Any] | None = None,
+    *,
+    ledger: LedgerWriter | None = None,
 ) -> None:
     if not execute:
         return
@@ -252,7 +372,7 @@ def record_skip(
         row["source_path"] = str(source_path)
     if detail:
         row.update(detail)
-    append_jsonl(roots.ledger_root / "combined_skipped.jsonl", [row])
+    append_ledger(ledger, roots.ledger_root / "combined_skipped.jsonl", row)
 
 
 def record_dedupe_event(
@@ -265,6 +385,7 @@ def record_dedupe_event(
     pool: str,
     record: dict[str, Any],
     retained_shard: str | None,
+    ledger: LedgerWriter | None = None,
 ) -> None:
     row: dict[str, Any] = {
         "stage": "merge",
@@ -280,7 +401,7 @@ def record_dedupe_event(
         row["source_path"] = str(source_path)
     if retained_shard:
         row["retained_shard"] = retained_shard
-    append_jsonl(roots.ledger_root / "combined_deduped.jsonl", [row])
+    append_ledger(ledger, roots.ledger_root / "combined_deduped.jsonl", row)
 
 
 def record_near_dedupe_event(
@@ -296,6 +417,7 @@ def record_near_dedupe_event(
     score: float,
     backend: str,
     text_field: str,
+    ledger: LedgerWriter | None = None,
 ) -> None:
     row: dict[str, Any] = {
         "stage": "merge",
@@ -313,24 +435,19 @@ def record_near_dedupe_event(
     }
     if source_path is not None:
         row["source_path"] = str(source_path)
-    append_jsonl(roots.ledger_root / "combined_near_deduped.jsonl", [row])
+    append_ledger(ledger, roots.ledger_root / "combined_near_deduped.jsonl", row)
 
 
 def register_flushed_records(
     state: MergeState,
     *,
     shard_path: Path | None,
-    records: list[dict[str, Any]],
+    content_hashes: list[str],
 ) -> None:
     if not shard_path:
         return
-    shard_str = str(shard_path)
-    for rec in records:
-        content_hash = rec.get("content_sha256")
-        if not content_hash:
-            continue
-        state.shard_index[content_hash] = shard_str
-        state.inflight_records.pop(content_hash, None)
+    # The dedupe index keeps hash -> shard id; records themselves never stay in memory.
+    state.dedupe.assign_shard(content_hashes, str(shard_path))
 
 
 def build_target_meta(cfg: dict[str, Any]) -> dict[str, dict[str, Any]]:
@@ -360,6 +477,8 @@ def build_target_canon(
 def get_sharder(pool: str, roots: Roots, state: MergeState) -> Sharder:
     if pool not in state.pool_sharders:
         sharder = Sharder(roots.combined_root / pool / "shards", state.shard_cfg)
+        if state.incremental:
+            sharder.resume()
         state.pool_sharders[pool] = sharder
         ensure_shard_dir(sharder)
     return state.pool_sharders[pool]
@@ -395,22 +514,31 @@ def handle_record(
     state: MergeState,
     target_id: str | None = None,
     pool_hint: str | None = None,
+    *,
+    normalized: bool = False,
+    near_prepared: tuple[str, Any] | None = None,
 ) -> None:
     resolved_target = target_id or (rec.get("source", {}) or {}).get("target_id") or "unknown"
     pool_value = pool_hint or rec.get("pool") or route_pool(rec)
-    record = normalize_record(
-        rec,
-        target_id=resolved_target,
-        pool=pool_value,
-        pipeline_id=state.pipeline_id,
-        target_meta=state.target_meta.get(resolved_target, {}),
-        context=f"{source_kind}/{resolved_target}",
+    # Records from a CanonicalizePlan already satisfy the output contract.
+    record = (
+        rec
+        if normalized
+        else normalize_record(
+            rec,
+            target_id=resolved_target,
+            pool=pool_value,
+            pipeline_id=state.pipeline_id,
+            target_meta=state.target_meta.get(resolved_target, {}),
+            context=f"{source_kind}/{resolved_target}",
+        )
     )
     content_hash = record["content_sha256"]
     if not state.dedupe.add_if_new(content_hash):
         state.summary["deduped"] += 1
         update = build_dedupe_update(record, source_kind=source_kind, source_path=source_path)
-        retained_shard = state.shard_index.get(content_hash)
+        # None while the retained record's shard is still open.
+        retained_shard = state.dedupe.shard_for(content_hash)
         if state.execute:
             record_dedupe_event(
                 roots,
@@ -421,31 +549,30 @@ def handle_record(
                 pool=pool_value,
                 record=record,
                 retained_shard=retained_shard,
+                ledger=state.ledger,
             )
-        retained = state.inflight_records.get(content_hash)
-        if retained:
-            merge_provenance_update(
-                retained,
+        # The retained record is already streamed to its shard, so provenance for
+        # every duplicate is applied by apply_pending_updates.
+        pending = state.pending_updates.get(content_hash)
+        if pending:
+            state.pending_updates[content_hash] = merge_update_payload(
+                pending,
                 update,
                 max_source_urls=state.max_source_urls,
                 max_duplicates=state.max_duplicates,
             )
         else:
-            pending = state.pending_updates.get(content_hash)
-            if pending:
-                state.pending_updates[content_hash] = merge_update_payload(
-                    pending,
-                    update,
-                    max_source_urls=state.max_source_urls,
-                    max_duplicates=state.max_duplicates,
-                )
-            else:
-                state.pending_updates[content_hash] = update
+            state.pending_updates[content_hash] = update
         return
     if state.near_dedup is not None:
         text_value = record.get(state.near_dedup_text_field)
         if isinstance(text_value, str) and text_value.strip():
-            result = state.near_dedup.query(text_value)
+            # A prefetched sketch is only valid for the exact text it was built from.
+            if near_prepared is not None and near_prepared[0] == text_value:
+                prepared = near_prepared[1]
+            else:
+                prepared = state.near_dedup.prepare(text_value)
+            result = state.near_dedup.query_prepared(prepared)
             if result.is_duplicate:
                 state.summary["near_deduped"] += 1
                 if state.execute:
@@ -461,153 +588,189 @@ def handle_record(
                         score=result.score,
                         backend=result.backend,
                         text_field=state.near_dedup_text_field,
+                        ledger=state.ledger,
                     )
                 return
-            state.near_dedup.add(content_hash, text_value)
+            state.near_dedup.add_prepared(content_hash, prepared)
     pool = record.get("pool") or pool_value
     sharder = get_sharder(pool, roots, state)
     shard_path = str(sharder._path())
     if state.execute:
-        state.inflight_records[content_hash] = record
-        path, flushed_records = sharder.add(record)
+        path, flushed_hashes = sharder.add(record)
         if path:
             shard_path = str(path)
             state.summary["shards"].append(shard_path)
-            register_flushed_records(state, shard_path=path, records=flushed_records)
-        append_jsonl(
+            register_flushed_records(state, shard_path=path, content_hashes=flushed_hashes)
+        append_ledger(
+            state.ledger,
             roots.ledger_root / "combined_index.jsonl",
-            [
-                {
-                    "content_sha256": content_hash,
-                    "license_pool": pool,
-                    "output_shard": shard_path,
-                    "source": record.get("source", {}),
-                    "seen_at_utc": utc_now(),
-                }
-            ],
+            {
+                "content_sha256": content_hash,
+                "license_pool": pool,
+                "output_shard": shard_path,
+                "source": record.get("source", {}),
+                "seen_at_utc": utc_now(),
+            },
         )
     state.summary["written"] += 1
 
 
-def process_green_records(
+def iter_green_canonical(
     roots: Roots,
     state: MergeState,
-    target_canon: dict[str, tuple[list[str], int | None]],
-    default_canon: tuple[list[str], int | None],
-) -> None:
-    for item in iter_with_progress(
-        iter_green_records(roots),
-        enabled=state.progress,
-        desc="GREEN merge",
-        interval=state.progress_interval,
-    ):
-        candidates, max_chars = target_canon.get(item.target_id, default_canon)
-        meta = state.target_meta.get(item.target_id, {})
+    plans: CanonicalizePlans,
+) -> Iterator[tuple[GreenInput, dict[str, Any]] | GreenSkip]:
+    """GREEN records with their canonical row; canonicalize failures become skips."""
+    watermarks = state.watermarks
+    keep = watermarks.should_process if watermarks is not None else None
+    start_at = watermarks.resume_offset if watermarks is not None else None
+    for item in iter_green_records(roots, keep, state.read_stats, start_at):
         if isinstance(item, GreenSkip):
-            state.summary["skipped"] += 1
-            record_skip(
-                roots,
+            yield item
+            continue
+        canonical, reason = plans.canonicalize(item.raw, item.target_id, item.pool)
+        if not canonical:
+            yield GreenSkip(
                 item.target_id,
                 item.pool,
-                item.reason,
                 item.source_path,
                 item.source_kind,
-                state.execute,
-                detail=item.detail,
+                reason or "canonicalize_failed",
             )
             continue
-        canonical, reason = canonicalize_row(
-            item.raw,
-            item.target_id,
-            item.pool,
-            candidates,
-            max_chars,
-            meta,
-            pipeline_id=state.pipeline_id,
-        )
-        if not canonical:
+        yield item, canonical
+
+
+def with_near_prepared(
+    items: Iterable[Any], state: MergeState, text_of: Callable[[Any], Any]
+) -> Iterator[tuple[Any, tuple[str, Any] | None]]:
+    """Pair items with prefetched near-dedup sketches when a prefetcher is running."""
+    if state.near_dedup_prefetcher is None:
+        for item in items:
+            yield item, None
+        return
+    yield from state.near_dedup_prefetcher.iter(items, text_of)
+
+
+def process_green_records(
+    roots: Roots,
+    state: MergeState,
+    plans: CanonicalizePlans,
+) -> None:
+    def text_of(item: tuple[GreenInput, dict[str, Any]] | GreenSkip) -> Any:
+        return None if isinstance(item, GreenSkip) else item[1].get(state.near_dedup_text_field)
+
+    for item, near_prepared in with_near_prepared(
+        iter_with_progress(
+            iter_green_canonical(roots, state, plans),
+            enabled=state.progress,
+            desc="GREEN merge",
+            interval=state.progress_interval,
+        ),
+        state,
+        text_of,
+    ):
+        if isinstance(item, GreenSkip):
             state.summary["skipped"] += 1
             record_skip(
                 roots,
                 item.target_id,
                 item.pool,
-                reason or "canonicalize_failed",
+                item.reason,
                 item.source_path,
                 item.source_kind,
                 state.execute,
+                detail=item.detail,
+                ledger=state.ledger,
             )
             continue
+        green, canonical = item
         handle_record(
-            canonical, item.source_kind, item.source_path, roots, state, item.target_id, item.pool
+            canonical,
+            green.source_kind,
+            green.source_path,
+            roots,
+            state,
+            green.target_id,
+            green.pool,
+            normalized=True,
+            near_prepared=near_prepared,
         )
 
 
 def process_screened_yellow(roots: Roots, state: MergeState) -> None:
-    for rec in iter_with_progress(
-        iter_screened_yellow(roots),
-        enabled=state.progress,
-        desc="screened YELLOW merge",
-        interval=state.progress_interval,
+    watermarks = state.watermarks
+    keep = watermarks.should_process if watermarks is not None else None
+    start_at = watermarks.resume_offset if watermarks is not None else None
+    # Sketches are prefetched from the raw text; handle_record re-prepares any record
+    # whose normalized text differs.
+    for rec, near_prepared in with_near_prepared(
+        iter_with_progress(
+            iter_screened_yellow(roots, keep, state.read_stats, start_at),
+            enabled=state.progress,
+            desc="screened YELLOW merge",
+            interval=state.progress_interval,
+        ),
+        state,
+        lambda rec: rec.get(state.near_dedup_text_field),
     ):
         target_id = (rec.get("source", {}) or {}).get("target_id") or "unknown"
-        handle_record(rec, "screened_yellow", None, roots, state, target_id)
+        handle_record(
+            rec, "screened_yellow", None, roots, state, target_id, near_prepared=near_prepared
+        )
 
 
 def finalize_shards(state: MergeState) -> None:
     if not state.execute:
         return
     for sharder in state.pool_sharders.values():
-        flushed_path, flushed_records = sharder.flush()
+        flushed_path, flushed_hashes = sharder.flush()
         if flushed_path:
             state.summary["shards"].append(str(flushed_path))
-            register_flushed_records(state, shard_path=flushed_path, records=flushed_records)
+            register_flushed_records(state, shard_path=flushed_path, content_hashes=flushed_hashes)
 
 
 def apply_pending_updates(roots: Roots, state: MergeState) -> None:
     if not state.execute or not state.pending_updates:
         return
+    started = time.perf_counter()
     updates_by_shard: dict[str, dict[str, dict[str, Any]]] = {}
     for content_hash, update in state.pending_updates.items():
-        shard = state.shard_index.get(content_hash)
+        # Includes shards from earlier runs when the index was reopened incrementally.
+        shard = state.dedupe.shard_for(content_hash)
         if not shard:
             continue
         updates_by_shard.setdefault(shard, {})[content_hash] = update
     for shard_path, updates in updates_by_shard.items():
-        path = Path(shard_path)
-        temp_path = path.with_suffix(path.suffix + ".tmp")
-        opener = gzip.open if path.suffix == ".gz" else open
-        with (
-            opener(path, "rt", encoding="utf-8", errors="ignore") as src,
-            opener(
-                temp_path,
-                "wt",
-                encoding="utf-8",
-            ) as dst,
-        ):
-            for line in src:
-                raw = line.strip()
-                if not raw:
-                    continue
-                try:
-                    record = json.loads(raw)
-                except json.JSONDecodeError:
-                    dst.write(line)
-                    continue
-                content_hash = record.get("content_sha256")
-                update = updates.get(content_hash) if content_hash else None
-                if update:
-                    merge_provenance_update(
-                        record,
-                        update,
-                        max_source_urls=state.max_source_urls,
-                        max_duplicates=state.max_duplicates,
-                    )
-                dst.write(json.dumps(record, ensure_ascii=False) + "\n")
-            # P1.3C: Flush and fsync before atomic rename
-            dst.flush()
-            if hasattr(dst, "fileno"):
-                os.fsync(dst.fileno())
-        temp_path.replace(path)
+        if state.provenance_updates == "rewrite":
+            rewrite_shard_with_updates(
+                Path(shard_path),
+                updates,
+                max_source_urls=state.max_source_urls,
+                max_duplicates=state.max_duplicates,
+            )
+        else:
+            write_shard_updates(Path(shard_path), updates)
+    state.summary["updated_shards"] = len(updates_by_shard)
+    state.summary["provenance_update_seconds"] = round(time.perf_counter() - started, 3)
+
+
+def compact_combined_updates(roots: Roots, summary: dict[str, Any]) -> None:
+    """Fold every provenance sidecar under ``combined/<pool>/`` into its shard."""
+    started = time.perf_counter()
+    base = roots.combined_root
+    compacted = [
+        shard
+        for pool_dir in (sorted(base.iterdir()) if base.exists() else [])
+        if pool_dir.is_dir()
+        for shard in compact_pool_updates(
+            pool_dir,
+            max_source_urls=DEFAULT_MAX_SOURCE_URLS,
+            max_duplicates=DEFAULT_MAX_DUPLICATES,
+        )
+    ]
+    summary["compacted_shards"] = len(compacted)
+    summary["provenance_compact_seconds"] = round(time.perf_counter() - started, 3)
 
 
 def write_profile_stats(profile: cProfile.Profile, path: Path, sort: str) -> tuple[Path, Path]:
@@ -621,6 +784,23 @@ def write_profile_stats(profile: cProfile.Profile, path: Path, sort: str) -> tup
     return path, text_path
 
 
+def near_dedup_settings(runtime: MergeRuntimeConfig) -> dict[str, Any] | None:
+    """Settings a saved near-dedup index must match to be reused, or None when disabled."""
+    if not runtime.near_dedup:
+        return None
+    settings: dict[str, Any] = {
+        "backend": resolve_backend(runtime.near_dedup_backend),
+        "threshold": runtime.near_dedup_threshold,
+        "num_perm": runtime.near_dedup_num_perm,
+        "shingle_size": runtime.near_dedup_shingle_size,
+        "max_tokens": runtime.near_dedup_max_tokens,
+        "text_field": runtime.near_dedup_text_field,
+    }
+    if settings["backend"] == "simhash":
+        settings["hamming_bits"] = runtime.near_dedup_hamming_bits
+    return settings
+
+
 def merge_records(
     cfg: dict[str, Any],
     roots: Roots,
@@ -630,20 +810,86 @@ def merge_records(
     runtime: MergeRuntimeConfig | None = None,
 ) -> dict[str, Any]:
     runtime = runtime or resolve_merge_runtime(cfg, ledger_root=roots.ledger_root)
+    manifest_path = roots.ledger_root / INPUT_MANIFEST_NAME
+    if runtime.merge_workers > 1 and runtime.near_dedup:
+        logger.warning(
+            "Near-duplicate detection needs a single global index; ignoring merge_workers=%d.",
+            runtime.merge_workers,
+        )
+    elif runtime.merge_workers > 1 and runtime.incremental:
+        logger.warning(
+            "Incremental merge reuses the sequential dedupe index; ignoring merge_workers=%d.",
+            runtime.merge_workers,
+        )
+    elif runtime.merge_workers > 1:
+        # Imported lazily: the parallel engine is built on this module's helpers.
+        from collector_core.merge.parallel import merge_records_parallel
+
+        if execute:
+            # Worker-partitioned indexes cannot be resumed by a later incremental run.
+            manifest_path.unlink(missing_ok=True)
+        summary = merge_records_parallel(
+            cfg, roots, execute, pipeline_id=pipeline_id, runtime=runtime
+        )
+        if execute and runtime.compact_provenance:
+            compact_combined_updates(roots, summary)
+        return finalize_merge_summary(summary)
+    previous_manifest = load_input_manifest(manifest_path) if runtime.incremental else None
+    near_settings = near_dedup_settings(runtime)
+    near_index_path = roots.ledger_root / NEAR_DEDUP_INDEX_NAME
+    if previous_manifest is not None and (
+        previous_manifest.get("dedupe_backend") not in ("sqlite", "bloom")
+        or previous_manifest.get("dedupe_partitions") != runtime.dedupe_partitions
+        or (
+            near_settings is not None
+            and (
+                previous_manifest.get("near_dedup") != near_settings or not near_index_path.exists()
+            )
+        )
+    ):
+        logger.warning(
+            "Merge input manifest %s was written with a different dedupe or near-dedup "
+            "layout; running a full merge.",
+            manifest_path,
+        )
+        previous_manifest = None
+    incremental = previous_manifest is not None
+    if execute or (not incremental and runtime.dedupe_backend != "memory"):
+        # Executed runs commit new hashes to the on-disk index as they go and only
+        # write the manifest once they finish; dry runs without it recreate the index.
+        # Either way, a run that stops early leaves the next one to merge in full
+        # rather than resume against an index holding hashes it never wrote.
+        manifest_path.unlink(missing_ok=True)
     shard_cfg = sharding_cfg(cfg)
-    dedupe = build_dedupe_index(roots, runtime.dedupe_partitions)
-    near_dedup = (
-        create_detector(
+    # Ledgers written as .zst follow the shard zstd settings.
+    set_zstd_settings(shard_cfg.zstd)
+    # Dry runs must not touch the persisted index, so they dedupe the delta in memory.
+    dedupe = build_dedupe_index(
+        roots,
+        runtime.dedupe_partitions,
+        backend=runtime.dedupe_backend if execute or not incremental else "memory",
+        expected_items=runtime.dedupe_expected_items,
+        batch_size=runtime.dedupe_batch_size,
+        persist=incremental and execute,
+    )
+    watermarks = InputWatermarks(
+        previous_manifest.get("inputs") if previous_manifest else None,
+        with_sha256=runtime.incremental_sha256,
+    )
+    near_dedup: NearDuplicateDetector | None = None
+    if runtime.near_dedup and incremental:
+        near_dedup = NearDuplicateDetector.load(near_index_path)
+        near_dedup.max_candidates = runtime.near_dedup_max_candidates
+    elif runtime.near_dedup:
+        near_dedup = create_detector(
             backend=runtime.near_dedup_backend,
             threshold=runtime.near_dedup_threshold,
             num_perm=runtime.near_dedup_num_perm,
             shingle_size=runtime.near_dedup_shingle_size,
             max_tokens=runtime.near_dedup_max_tokens,
             max_candidates=runtime.near_dedup_max_candidates,
+            hamming_bits=runtime.near_dedup_hamming_bits,
         )
-        if runtime.near_dedup
-        else None
-    )
     summary = {"written": 0, "deduped": 0, "near_deduped": 0, "skipped": 0, "shards": []}
     target_meta = build_target_meta(cfg)
     target_canon, default_canon = build_target_canon(cfg)
@@ -659,13 +905,18 @@ def merge_records(
         execute=execute,
         progress=runtime.progress,
         progress_interval=runtime.progress_interval,
-        inflight_records={},
-        shard_index={},
         pending_updates={},
         max_source_urls=DEFAULT_MAX_SOURCE_URLS,
         max_duplicates=DEFAULT_MAX_DUPLICATES,
+        ledger=LedgerWriter() if execute else None,
+        incremental=incremental,
+        watermarks=watermarks,
+        provenance_updates=runtime.provenance_updates,
     )
     summary["dedupe_partitions"] = runtime.dedupe_partitions
+    summary["dedupe_backend"] = runtime.dedupe_backend
+    summary["incremental"] = incremental
+    summary["provenance_updates"] = runtime.provenance_updates
     if runtime.near_dedup:
         summary["near_dedup"] = {
             "enabled": True,
@@ -676,20 +927,52 @@ def merge_records(
             "shingle_size": runtime.near_dedup_shingle_size,
             "max_tokens": runtime.near_dedup_max_tokens,
             "max_candidates": runtime.near_dedup_max_candidates,
+            "workers": runtime.near_dedup_workers,
         }
+        if near_dedup is not None and near_dedup.backend == "simhash":
+            summary["near_dedup"]["hamming_bits"] = near_dedup.hamming_bits
     profiler: cProfile.Profile | None = None
     if runtime.profile:
         profiler = cProfile.Profile()
         profiler.enable()
     if runtime.trace_memory:
         tracemalloc.start()
+    if near_dedup is not None and runtime.near_dedup_workers > 1:
+        state.near_dedup_prefetcher = SignaturePrefetcher(
+            near_dedup,
+            workers=runtime.near_dedup_workers,
+            batch_size=runtime.near_dedup_batch_size,
+        )
     try:
-        process_green_records(roots, state, target_canon, default_canon)
+        process_green_records(
+            roots,
+            state,
+            CanonicalizePlans(target_canon, default_canon, target_meta, pipeline_id=pipeline_id),
+        )
         process_screened_yellow(roots, state)
+        summary["malformed_lines"] = state.read_stats.malformed
         finalize_shards(state)
         apply_pending_updates(roots, state)
+        if execute and runtime.compact_provenance:
+            compact_combined_updates(roots, summary)
+        summary.update(watermarks.summary())
+        if execute:
+            if near_dedup is not None:
+                near_dedup.save(near_index_path)
+                summary["near_dedup"]["indexed_documents"] = len(near_dedup)
+            write_input_manifest(
+                manifest_path,
+                watermarks,
+                dedupe_backend=runtime.dedupe_backend,
+                dedupe_partitions=runtime.dedupe_partitions,
+                near_dedup=near_settings,
+            )
     finally:
+        if state.near_dedup_prefetcher is not None:
+            state.near_dedup_prefetcher.close()
         dedupe.close()
+        if state.ledger is not None:
+            state.ledger.close()
         if runtime.trace_memory:
             current, peak = tracemalloc.get_traced_memory()
             tracemalloc.stop()
@@ -707,13 +990,32 @@ def merge_records(
                 summary["profile_text_path"] = str(text_path)
         if near_dedup is not None:
             summary.setdefault("near_dedup", {})["stats"] = near_dedup.stats.to_dict()
+    return finalize_merge_summary(summary)
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process and its (merge worker) children."""
+    if resource is None:  # pragma: no cover - Windows
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is bytes on macOS and KiB elsewhere.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def finalize_merge_summary(summary: dict[str, Any]) -> dict[str, Any]:
     summary["counts"] = {
         "written": summary["written"],
         "deduped": summary["deduped"],
         "near_deduped": summary["near_deduped"],
         "skipped": summary["skipped"],
+        "malformed_lines": summary.get("malformed_lines", 0),
     }
     summary["failed_targets"] = []
+    summary["peak_rss_mb"] = peak_rss_mb()
     summary["finished_at_utc"] = utc_now()
     summary.update(build_artifact_metadata(written_at_utc=summary["finished_at_utc"]))
     return summary
@@ -758,6 +1060,37 @@ def main(*, pipeline_id: str, defaults: RootDefaults) -> None:
         default=None,
         help="Number of SQLite partitions for dedupe index",
     )
+    ap.add_argument(
+        "--dedupe-backend",
+        choices=DEDUPE_BACKENDS,
+        default=None,
+        help="Exact dedupe index backend (default: sqlite)",
+    )
+    ap.add_argument(
+        "--merge-workers",
+        type=int,
+        default=None,
+        help="Number of partition-owning merge worker processes (default: 1, sequential)",
+    )
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        default=None,
+        help="Only merge inputs that are new or changed since the last executed merge",
+    )
+    ap.add_argument(
+        "--provenance-updates",
+        choices=PROVENANCE_UPDATE_MODES,
+        default=None,
+        help="Record late-duplicate provenance in per-shard sidecars or rewrite shards "
+        "(default: sidecar)",
+    )
+    ap.add_argument(
+        "--compact-provenance",
+        action="store_true",
+        default=None,
+        help="After merging, fold every provenance sidecar into its combined shard",
+    )
     args = ap.parse_args()
 
     cfg = read_yaml(Path(args.targets), schema_name="targets") or {}
@@ -776,6 +1109,11 @@ def main(*, pipeline_id: str, defaults: RootDefaults) -> None:
         profile_path=args.profile_path,
         profile_sort=args.profile_sort,
         dedupe_partitions=args.dedupe_partitions,
+        dedupe_backend=args.dedupe_backend,
+        merge_workers=args.merge_workers,
+        incremental=args.incremental,
+        provenance_updates=args.provenance_updates,
+        compact_provenance=args.compact_provenance,
         ledger_root=roots.ledger_root,
     )
     summary = merge_records(cfg, roots, args.execute, pipeline_id=pipeline_id, runtime=runtime)
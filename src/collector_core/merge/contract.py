@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import dataclasses
 import json
+from collections.abc import Callable, Sequence
 from typing import Any
 
-from collector_core.output_contract import normalize_output_record, validate_output_contract
+from collector_core.output_contract import (
+    apply_output_defaults,
+    normalize_output_record,
+    validate_output_contract,
+)
 from collector_core.stability import stable_api
 from collector_core.utils.hash import sha256_text
-from collector_core.utils.logging import utc_now
+from collector_core.utils.logging import UtcClock, utc_now
 
 
 @stable_api
@@ -42,7 +48,7 @@ def coerce_text(value: Any) -> str:
 
 
 @stable_api
-def extract_text(row: dict[str, Any], candidates: list[str]) -> str | None:
+def extract_text(row: dict[str, Any], candidates: Sequence[str]) -> str | None:
     if "text" in row and row["text"]:
         return coerce_text(row["text"])
     for key in candidates:
@@ -127,3 +133,98 @@ def normalize_record(
     )
     validate_output_contract(normalized, context)
     return normalized
+
+
+@stable_api
+@dataclasses.dataclass(frozen=True)
+class CanonicalizePlan:
+    """Per-target canonicalization resolved once instead of per record.
+
+    ``canonicalize`` produces the same record as ``canonicalize_row`` followed by
+    ``normalize_record``, but copies the raw row once, fills contract fields in
+    place and validates once.
+    """
+
+    target_id: str
+    pipeline_id: str
+    candidates: tuple[str, ...]
+    max_chars: int | None
+    dataset_id: str | None
+    config: str | None
+    context: str
+
+    def canonicalize(
+        self,
+        raw: dict[str, Any],
+        pool: str,
+        *,
+        now: str,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        if not isinstance(raw, dict):
+            return None, "unsupported_row_type"
+        text = extract_text(raw, self.candidates)
+        if not text:
+            return None, "missing_text"
+        max_chars = self.max_chars
+        if max_chars is not None and max_chars > 0 and len(text) > max_chars:
+            text = text[:max_chars]
+        record = dict(raw)
+        record.setdefault("text", text)
+        if "record_id" not in record:
+            record["record_id"] = str(record.get("id") or sha256_text(f"{self.target_id}:{text}"))
+        apply_output_defaults(
+            record,
+            target_id=self.target_id,
+            pool=pool,
+            pipeline=self.pipeline_id,
+            dataset_id=self.dataset_id,
+            config=self.config,
+            now=now,
+        )
+        validate_output_contract(record, self.context)
+        return record, None
+
+
+@stable_api
+class CanonicalizePlans:
+    """Compiled ``CanonicalizePlan`` per target, plus a per-second timestamp clock."""
+
+    def __init__(
+        self,
+        target_canon: dict[str, tuple[list[str], int | None]],
+        default_canon: tuple[list[str], int | None],
+        target_meta: dict[str, dict[str, Any]],
+        *,
+        pipeline_id: str,
+        clock: Callable[[], str] | None = None,
+    ) -> None:
+        self.target_canon = target_canon
+        self.default_canon = default_canon
+        self.target_meta = target_meta
+        self.pipeline_id = pipeline_id
+        self.clock = clock or UtcClock()
+        self._plans: dict[str, CanonicalizePlan] = {}
+        for target_id in target_canon:
+            self.for_target(target_id)
+
+    def for_target(self, target_id: str) -> CanonicalizePlan:
+        plan = self._plans.get(target_id)
+        if plan is None:
+            candidates, max_chars = self.target_canon.get(target_id, self.default_canon)
+            meta = self.target_meta.get(target_id, {})
+            plan = CanonicalizePlan(
+                target_id=target_id,
+                pipeline_id=self.pipeline_id,
+                candidates=tuple(candidates),
+                max_chars=max_chars,
+                dataset_id=meta.get("dataset_id"),
+                config=meta.get("config"),
+                context=f"green/{target_id}",
+            )
+            self._plans[target_id] = plan
+        return plan
+
+    def canonicalize(
+        self, raw: dict[str, Any], target_id: str, pool: str
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        return self.for_target(target_id).canonicalize(raw, pool, now=self.clock())
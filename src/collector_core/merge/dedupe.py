@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+import math
 import sqlite3
-from collections.abc import Iterable
+from array import array
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +12,9 @@ from collector_core.stability import stable_api
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir
 
+DEFAULT_MAX_SOURCE_URLS = 10
+DEFAULT_MAX_DUPLICATES = 20
+
 
 @stable_api
 def merge_distinct_urls(
@@ -104,16 +110,68 @@ def merge_provenance_update(
 
 
 @stable_api
-class DedupeIndex:
-    def __init__(self, path: Path) -> None:
+def dedupe_partition_for_hash(content_hash: str, partitions: int) -> int:
+    if not content_hash or partitions < 2:
+        return 0
+    return int(content_hash[:8], 16) % partitions
+
+
+@stable_api
+def dedupe_partition_path(path: Path, idx: int) -> Path:
+    suffix = path.suffix or ".sqlite"
+    return path.with_name(f"{path.stem}_part{idx:03d}{suffix}")
+
+
+class _ShardLookup:
+    """Map content hashes to the shard that retained them, as small integer ids.
+
+    Backends store one shard id per hash next to the dedupe key and keep a tiny
+    id <-> path registry, so the merge never holds a hash -> path dict in memory.
+    """
+
+    def shard_id(self, shard_path: str) -> int:
+        raise NotImplementedError
+
+    def shard_path(self, shard_id: int) -> str | None:
+        raise NotImplementedError
+
+    def set_shard_ids(self, content_hashes: Iterable[str], shard_id: int) -> None:
+        raise NotImplementedError
+
+    def get_shard_id(self, content_hash: str) -> int | None:
+        raise NotImplementedError
+
+    def assign_shard(self, content_hashes: Iterable[str], shard_path: str) -> None:
+        self.set_shard_ids(content_hashes, self.shard_id(shard_path))
+
+    def shard_for(self, content_hash: str) -> str | None:
+        shard_id = self.get_shard_id(content_hash)
+        return None if shard_id is None else self.shard_path(shard_id)
+
+
+@stable_api
+class DedupeIndex(_ShardLookup):
+    def __init__(self, path: Path, *, reset: bool = True) -> None:
         self.path = path
         ensure_dir(path.parent)
-        if path.exists():
+        if reset and path.exists():
             path.unlink()
         self.conn = sqlite3.connect(str(path))
         self.conn.execute("PRAGMA journal_mode=WAL;")
         self.conn.execute("PRAGMA synchronous=OFF;")
-        self.conn.execute("CREATE TABLE IF NOT EXISTS seen (content_sha256 TEXT PRIMARY KEY)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (content_sha256 TEXT PRIMARY KEY, shard_id INTEGER)"
+        )
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(seen)")}
+        if "shard_id" not in columns:
+            self.conn.execute("ALTER TABLE seen ADD COLUMN shard_id INTEGER")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS shards (shard_id INTEGER PRIMARY KEY, path TEXT UNIQUE)"
+        )
+        self._shard_paths: dict[int, str] = dict(
+            self.conn.execute("SELECT shard_id, path FROM shards")
+        )
+        self._shard_ids = {shard: shard_id for shard_id, shard in self._shard_paths.items()}
 
     def add_if_new(self, content_hash: str) -> bool:
         cursor = self.conn.execute(
@@ -122,47 +180,371 @@ class DedupeIndex:
         )
         return cursor.rowcount == 1
 
+    def shard_id(self, shard_path: str) -> int:
+        shard_id = self._shard_ids.get(shard_path)
+        if shard_id is None:
+            shard_id = len(self._shard_paths)
+            self.conn.execute(
+                "INSERT INTO shards (shard_id, path) VALUES (?, ?)", (shard_id, shard_path)
+            )
+            self._shard_paths[shard_id] = shard_path
+            self._shard_ids[shard_path] = shard_id
+        return shard_id
+
+    def shard_path(self, shard_id: int) -> str | None:
+        return self._shard_paths.get(shard_id)
+
+    def set_shard_ids(self, content_hashes: Iterable[str], shard_id: int) -> None:
+        self.conn.executemany(
+            "UPDATE seen SET shard_id = ? WHERE content_sha256 = ?",
+            [(shard_id, content_hash) for content_hash in sorted(content_hashes)],
+        )
+
+    def get_shard_id(self, content_hash: str) -> int | None:
+        row = self.conn.execute(
+            "SELECT shard_id FROM seen WHERE content_sha256 = ?", (content_hash,)
+        ).fetchone()
+        return row[0] if row else None
+
     def close(self) -> None:
         self.conn.commit()
         self.conn.close()
 
 
+def _hash_digest(content_hash: str) -> bytes:
+    """Pack a hex content hash into 16 bytes (blake2b for non-hex input)."""
+    try:
+        digest = bytes.fromhex(content_hash[:32])
+    except ValueError:
+        digest = b""
+    if len(digest) != 16:
+        digest = hashlib.blake2b(content_hash.encode("utf-8"), digest_size=16).digest()
+    return digest
+
+
+_EMPTY_SLOT = bytes(16)
+_NO_SHARD = -1
+
+
+@stable_api
+class MemoryDedupeIndex(_ShardLookup):
+    """In-memory exact dedupe over packed 16-byte digests.
+
+    Digests live in one open-addressing table backed by a ``bytearray`` (16 bytes
+    per slot, doubled at 70% load) rather than a ``set`` of hex strings, which costs
+    well over 100 bytes per entry. A parallel ``array`` holds each slot's 4-byte
+    shard id. Use it when the corpus's hashes fit in RAM.
+    """
+
+    LOAD_FACTOR = 0.7
+
+    def __init__(self, capacity: int = 1 << 16) -> None:
+        slots = 1 << max(int(capacity / self.LOAD_FACTOR), 16).bit_length()
+        self._table = bytearray(slots * 16)
+        self._shards = array("i", [_NO_SHARD]) * slots
+        self._mask = slots - 1
+        self._limit = int(slots * self.LOAD_FACTOR)
+        self._count = 0
+        self._has_empty_digest = False
+        self._empty_digest_shard = _NO_SHARD
+        self._shard_paths: list[str] = []
+        self._shard_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    @staticmethod
+    def _probe(table: bytearray, mask: int, digest: bytes | bytearray) -> tuple[int, bool]:
+        """Return ``(slot, found)``: the digest's slot, or the empty slot it would fill."""
+        idx = int.from_bytes(digest[:8], "little") & mask
+        while True:
+            off = idx << 4
+            slot = table[off : off + 16]
+            if slot == digest:
+                return idx, True
+            if slot == _EMPTY_SLOT:
+                return idx, False
+            idx = (idx + 1) & mask
+
+    def _grow(self) -> None:
+        old, old_shards = self._table, self._shards
+        slots = (self._mask + 1) * 2
+        table = bytearray(slots * 16)
+        shards = array("i", [_NO_SHARD]) * slots
+        mask = slots - 1
+        for old_idx in range(len(old_shards)):
+            off = old_idx << 4
+            slot = old[off : off + 16]
+            if slot != _EMPTY_SLOT:
+                idx, _ = self._probe(table, mask, slot)
+                table[idx << 4 : (idx << 4) + 16] = slot
+                shards[idx] = old_shards[old_idx]
+        self._table = table
+        self._shards = shards
+        self._mask = mask
+        self._limit = int(slots * self.LOAD_FACTOR)
+
+    def add_if_new(self, content_hash: str) -> bool:
+        digest = _hash_digest(content_hash)
+        if digest == _EMPTY_SLOT:
+            # The all-zero digest marks empty slots, so track it out of band.
+            if self._has_empty_digest:
+                return False
+            self._has_empty_digest = True
+            self._count += 1
+            return True
+        if self._count >= self._limit:
+            self._grow()
+        idx, found = self._probe(self._table, self._mask, digest)
+        if found:
+            return False
+        self._table[idx << 4 : (idx << 4) + 16] = digest
+        self._count += 1
+        return True
+
+    def shard_id(self, shard_path: str) -> int:
+        shard_id = self._shard_ids.get(shard_path)
+        if shard_id is None:
+            shard_id = len(self._shard_paths)
+            self._shard_paths.append(shard_path)
+            self._shard_ids[shard_path] = shard_id
+        return shard_id
+
+    def shard_path(self, shard_id: int) -> str | None:
+        return self._shard_paths[shard_id] if 0 <= shard_id < len(self._shard_paths) else None
+
+    def set_shard_ids(self, content_hashes: Iterable[str], shard_id: int) -> None:
+        for content_hash in content_hashes:
+            digest = _hash_digest(content_hash)
+            if digest == _EMPTY_SLOT:
+                if self._has_empty_digest:
+                    self._empty_digest_shard = shard_id
+                continue
+            idx, found = self._probe(self._table, self._mask, digest)
+            if found:
+                self._shards[idx] = shard_id
+
+    def get_shard_id(self, content_hash: str) -> int | None:
+        digest = _hash_digest(content_hash)
+        if digest == _EMPTY_SLOT:
+            shard_id = self._empty_digest_shard
+        else:
+            idx, found = self._probe(self._table, self._mask, digest)
+            shard_id = self._shards[idx] if found else _NO_SHARD
+        return None if shard_id == _NO_SHARD else shard_id
+
+    def close(self) -> None:
+        self._table = bytearray()
+        self._shards = array("i")
+
+
+@stable_api
+class BloomDedupeIndex(DedupeIndex):
+    """SQLite exact dedupe with an in-memory Bloom filter in front.
+
+    Hashes the filter has never seen are new without touching SQLite; they are
+    buffered and inserted with ``executemany``, one transaction per batch. Only
+    filter hits (real duplicates or false positives) are looked up in the pending
+    batch and the database. Correctness does not depend on ``expected_items``;
+    undersizing only raises the false-positive rate and hence the lookup count.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        expected_items: int = 10_000_000,
+        false_positive_rate: float = 0.01,
+        batch_size: int = 10_000,
+        reset: bool = True,
+    ) -> None:
+        super().__init__(path, reset=reset)
+        items = max(int(expected_items), 1)
+        rate = min(max(float(false_positive_rate), 1e-9), 0.5)
+        bits = max(int(math.ceil(-items * math.log(rate) / (math.log(2) ** 2))), 64)
+        self.num_bits = bits
+        self.num_hashes = max(int(round(bits / items * math.log(2))), 1)
+        self.batch_size = max(int(batch_size), 1)
+        self._bits = bytearray((bits + 7) // 8)
+        # Hashes not yet inserted, with the shard id assigned while they waited.
+        self._pending: dict[str, int | None] = {}
+        self.bloom_hits = 0
+        self.db_lookups = 0
+        if not reset:
+            # Reopened index: seed the filter from the hashes already on disk.
+            for (content_hash,) in self.conn.execute("SELECT content_sha256 FROM seen"):
+                self._set_bits(self._positions(content_hash))
+
+    def _positions(self, content_hash: str) -> list[int]:
+        digest = _hash_digest(content_hash)
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def _set_bits(self, positions: list[int]) -> None:
+        bits = self._bits
+        for pos in positions:
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        # Sorted keys turn random B-tree inserts into one ordered sweep per batch.
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO seen (content_sha256, shard_id) VALUES (?, ?)",
+            sorted(self._pending.items()),
+        )
+        self.conn.commit()
+        self._pending.clear()
+
+    def add_if_new(self, content_hash: str) -> bool:
+        positions = self._positions(content_hash)
+        bits = self._bits
+        for pos in positions:
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                break
+        else:
+            self.bloom_hits += 1
+            if content_hash in self._pending:
+                return False
+            self.db_lookups += 1
+            row = self.conn.execute(
+                "SELECT 1 FROM seen WHERE content_sha256 = ?", (content_hash,)
+            ).fetchone()
+            if row is not None:
+                return False
+        self._set_bits(positions)
+        self._pending[content_hash] = None
+        if len(self._pending) >= self.batch_size:
+            self._flush_pending()
+        return True
+
+    def set_shard_ids(self, content_hashes: Iterable[str], shard_id: int) -> None:
+        stored: list[str] = []
+        for content_hash in content_hashes:
+            if content_hash in self._pending:
+                self._pending[content_hash] = shard_id
+            else:
+                stored.append(content_hash)
+        if stored:
+            super().set_shard_ids(stored, shard_id)
+
+    def get_shard_id(self, content_hash: str) -> int | None:
+        if content_hash in self._pending:
+            return self._pending[content_hash]
+        return super().get_shard_id(content_hash)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "bloom_bits": self.num_bits,
+            "bloom_hashes": self.num_hashes,
+            "bloom_hits": self.bloom_hits,
+            "db_lookups": self.db_lookups,
+        }
+
+    def close(self) -> None:
+        self._flush_pending()
+        super().close()
+
+
 @stable_api
-class PartitionedDedupeIndex:
-    def __init__(self, path: Path, partitions: int) -> None:
+class PartitionedDedupeIndex(_ShardLookup):
+    def __init__(
+        self,
+        path: Path,
+        partitions: int,
+        index_factory: Callable[[Path], DedupeIndex | MemoryDedupeIndex] = DedupeIndex,
+    ) -> None:
         if partitions < 2:
             raise ValueError("PartitionedDedupeIndex requires at least 2 partitions.")
         self.partitions = partitions
         self.paths = [self._partition_path(path, idx) for idx in range(partitions)]
-        self.indices = [DedupeIndex(part_path) for part_path in self.paths]
+        self.indices = [index_factory(part_path) for part_path in self.paths]
 
     @staticmethod
     def _partition_path(path: Path, idx: int) -> Path:
-        suffix = path.suffix or ".sqlite"
-        stem = path.stem
-        return path.with_name(f"{stem}_part{idx:03d}{suffix}")
+        return dedupe_partition_path(path, idx)
 
     def _partition_index(self, content_hash: str) -> int:
-        if not content_hash:
-            return 0
-        return int(content_hash[:8], 16) % self.partitions
+        return dedupe_partition_for_hash(content_hash, self.partitions)
 
     def add_if_new(self, content_hash: str) -> bool:
         idx = self._partition_index(content_hash)
         return self.indices[idx].add_if_new(content_hash)
 
+    # The shard registry lives in the first partition so ids are global.
+    def shard_id(self, shard_path: str) -> int:
+        return self.indices[0].shard_id(shard_path)
+
+    def shard_path(self, shard_id: int) -> str | None:
+        return self.indices[0].shard_path(shard_id)
+
+    def set_shard_ids(self, content_hashes: Iterable[str], shard_id: int) -> None:
+        by_partition: dict[int, list[str]] = {}
+        for content_hash in content_hashes:
+            by_partition.setdefault(self._partition_index(content_hash), []).append(content_hash)
+        for idx, hashes in by_partition.items():
+            self.indices[idx].set_shard_ids(hashes, shard_id)
+
+    def get_shard_id(self, content_hash: str) -> int | None:
+        return self.indices[self._partition_index(content_hash)].get_shard_id(content_hash)
+
     def close(self) -> None:
         for index in self.indices:
             index.close()
 
 
+DedupeBackend = DedupeIndex | PartitionedDedupeIndex | MemoryDedupeIndex
+
+DEDUPE_BACKENDS = ("sqlite", "bloom", "memory")
+
+
+@stable_api
+def dedupe_index_factory(
+    backend: str = "sqlite",
+    *,
+    expected_items: int = 10_000_000,
+    batch_size: int = 10_000,
+    persist: bool = False,
+) -> Callable[[Path], DedupeIndex | MemoryDedupeIndex]:
+    """Return a ``path -> index`` constructor for a ``globals.merge.dedupe_backend`` name.
+
+    With ``persist`` the SQLite-backed indexes reopen an existing file instead of
+    starting empty (incremental merges); the ``memory`` backend cannot persist.
+    """
+    if backend == "sqlite":
+        return lambda path: DedupeIndex(path, reset=not persist)
+    if backend == "bloom":
+        return lambda path: BloomDedupeIndex(
+            path, expected_items=expected_items, batch_size=batch_size, reset=not persist
+        )
+    if backend == "memory":
+        if persist:
+            raise ValueError("The memory dedupe backend cannot be persisted across runs.")
+        return lambda path: MemoryDedupeIndex()
+    raise ValueError(
+        f"Unknown dedupe backend {backend!r}; expected one of {', '.join(DEDUPE_BACKENDS)}."
+    )
+
+
 @stable_api
 def build_dedupe_index(
     roots: Roots,
     partitions: int,
-) -> DedupeIndex | PartitionedDedupeIndex:
-
+    *,
+    backend: str = "sqlite",
+    expected_items: int = 10_000_000,
+    batch_size: int = 10_000,
+    persist: bool = False,
+) -> DedupeBackend:
+    factory = dedupe_index_factory(
+        backend, expected_items=expected_items, batch_size=batch_size, persist=persist
+    )
     base_path = roots.ledger_root / "combined_dedupe.sqlite"
+    if backend == "memory":
+        # A single in-process table; SQLite partitioning does not apply.
+        return factory(base_path)
     if partitions > 1:
-        return PartitionedDedupeIndex(base_path, partitions)
-    return DedupeIndex(base_path)
+        return PartitionedDedupeIndex(base_path, partitions, index_factory=factory)
+    return factory(base_path)
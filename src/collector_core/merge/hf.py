@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
 
-from datasets import DatasetDict, load_from_disk
+from datasets import load_from_disk
 
 from collector_core.merge.types import GreenInput, GreenSkip
 from collector_core.stability import stable_api
+from collector_core.utils.hf import HF_BATCH_SIZE, iter_dataset_rows, iter_dataset_splits
 
 
 @stable_api
@@ -45,6 +45,7 @@ def iter_hf_inputs(
     *,
     target_id: str,
     pool: str,
+    batch_size: int = HF_BATCH_SIZE,
 ) -> Iterator[GreenInput | GreenSkip]:
     for ds_path in dataset_dirs:
         try:
@@ -59,15 +60,7 @@ def iter_hf_inputs(
                 detail={"error": str(exc)},
             )
             continue
-        if isinstance(dataset_obj, DatasetDict):
-            for split_name in sorted(dataset_obj.keys()):
-                dataset = dataset_obj[split_name]
-                for raw in dataset:
-                    row: dict[str, Any] = dict(raw)
-                    row.setdefault("split", split_name)
-                    yield GreenInput(row, target_id, pool, ds_path, "hf_dataset")
-        else:
-            for raw in dataset_obj:
-                row = dict(raw)
-                row.setdefault("split", "train")
+        for split_name, dataset in iter_dataset_splits(dataset_obj):
+            for row in iter_dataset_rows(dataset, batch_size=batch_size):
+                row.setdefault("split", split_name)
                 yield GreenInput(row, target_id, pool, ds_path, "hf_dataset")
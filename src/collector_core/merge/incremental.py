@@ -0,0 +1,216 @@
+"""Input watermarks for incremental merges.
+
+A merge run records a fingerprint (size, mtime and optionally sha256) for every
+input it reads in ``_ledger/merge_inputs.json``. An incremental run compares the
+current inputs against that manifest and only reads files that are new or
+changed, reusing the persisted dedupe index and appending shards after the
+existing ones. A file that only grew since the previous run (its old bytes are
+unchanged) is read from its previous size onwards, so appended JSONL rows are
+merged without replaying the ones already merged. When near-dedup is enabled
+the detector index is saved to ``_ledger/near_dedup_index/`` and reopened
+(memory-mapped) by the next run, so only new documents are indexed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from collector_core.stability import stable_api
+from collector_core.utils.hash import sha256_file
+from collector_core.utils.io import write_json
+from collector_core.utils.logging import utc_now
+
+logger = logging.getLogger(__name__)
+
+INPUT_MANIFEST_NAME = "merge_inputs.json"
+NEAR_DEDUP_INDEX_NAME = "near_dedup_index"
+INPUT_MANIFEST_VERSION = 1
+# Bytes before the end of a file hashed into ``tail_sha256`` to detect appends.
+APPEND_CHECK_BYTES = 64 * 1024
+_COMPRESSED_SUFFIXES = (".gz", ".zst")
+
+
+def _range_sha256(path: Path, start: int, end: int) -> tuple[str, bytes]:
+    """sha256 of ``path`` bytes ``[start, end)`` and the last byte of that range."""
+    digest = hashlib.sha256()
+    last = b""
+    with path.open("rb") as handle:
+        handle.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = handle.read(min(remaining, 1024 * 1024))
+            if not chunk:
+                break
+            digest.update(chunk)
+            last = chunk[-1:]
+            remaining -= len(chunk)
+    return digest.hexdigest(), last
+
+
+def _tail_sha256(path: Path, size: int) -> str:
+    return _range_sha256(path, max(size - APPEND_CHECK_BYTES, 0), size)[0]
+
+
+def _dir_fingerprint(path: Path, with_sha256: bool) -> dict[str, Any]:
+    files = sorted(fp for fp in path.rglob("*") if fp.is_file())
+    size = 0
+    mtime_ns = 0
+    digest = hashlib.sha256()
+    for fp in files:
+        stat = fp.stat()
+        size += stat.st_size
+        mtime_ns = max(mtime_ns, stat.st_mtime_ns)
+        if with_sha256:
+            digest.update(fp.relative_to(path).as_posix().encode("utf-8"))
+            digest.update((sha256_file(fp) or "").encode("utf-8"))
+    entry: dict[str, Any] = {"size": size, "mtime_ns": mtime_ns, "files": len(files)}
+    if with_sha256:
+        entry["sha256"] = digest.hexdigest()
+    return entry
+
+
+@stable_api
+def input_fingerprint(path: Path, *, with_sha256: bool = False) -> dict[str, Any]:
+    """Return the watermark entry for an input file or HF dataset directory."""
+    if path.is_dir():
+        return _dir_fingerprint(path, with_sha256)
+    stat = path.stat()
+    entry: dict[str, Any] = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "tail_sha256": _tail_sha256(path, stat.st_size),
+    }
+    if with_sha256:
+        entry["sha256"] = sha256_file(path)
+    return entry
+
+
+@stable_api
+def fingerprint_unchanged(previous: dict[str, Any] | None, current: dict[str, Any]) -> bool:
+    if not previous:
+        return False
+    if previous.get("size") != current.get("size"):
+        return False
+    if previous.get("files") != current.get("files"):
+        return False
+    if "sha256" in current and "sha256" in previous:
+        # Content hashes are authoritative; a touched-but-identical file is unchanged.
+        return bool(previous["sha256"] == current["sha256"])
+    return previous.get("mtime_ns") == current.get("mtime_ns")
+
+
+@stable_api
+def append_offset(path: Path, previous: dict[str, Any] | None, current: dict[str, Any]) -> int:
+    """Byte offset to resume ``path`` from if it only grew since ``previous``, else 0.
+
+    The previous size is returned when the file is larger now and the bytes it
+    had then are unchanged: the ``tail_sha256`` of the last ``APPEND_CHECK_BYTES``
+    before that size still matches and, for plain JSONL, ends on a newline;
+    when both watermarks carry a ``sha256`` the whole old prefix must hash to
+    the previous one. Compressed inputs must be appended to as new gzip
+    members / zstd frames. Directories are never resumed.
+    """
+    if not previous or "files" in previous or "files" in current:
+        return 0
+    size = previous.get("size")
+    tail = previous.get("tail_sha256")
+    if not isinstance(size, int) or size <= 0 or not tail or current["size"] <= size:
+        return 0
+    digest, last = _range_sha256(path, max(size - APPEND_CHECK_BYTES, 0), size)
+    if digest != tail:
+        return 0
+    if path.suffix not in _COMPRESSED_SUFFIXES and last != b"\n":
+        return 0
+    if "sha256" in previous and "sha256" in current:
+        if _range_sha256(path, 0, size)[0] != previous["sha256"]:
+            return 0
+    return size
+
+
+@stable_api
+class InputWatermarks:
+    """Track which merge inputs are new, appended to or changed since the previous run.
+
+    ``should_process`` is the ``keep`` filter for the merge input iterators;
+    ``resume_offset`` then gives the byte offset to start reading an input
+    that was only appended to (0 for new or rewritten inputs).
+    """
+
+    def __init__(
+        self,
+        previous: dict[str, dict[str, Any]] | None = None,
+        *,
+        with_sha256: bool = False,
+    ) -> None:
+        self.previous = previous or {}
+        self.with_sha256 = with_sha256
+        self.current: dict[str, dict[str, Any]] = {}
+        self.offsets: dict[str, int] = {}
+        self.processed = 0
+        self.unchanged = 0
+        self.appended = 0
+
+    def should_process(self, path: Path) -> bool:
+        key = str(path)
+        current = input_fingerprint(path, with_sha256=self.with_sha256)
+        self.current[key] = current
+        previous = self.previous.get(key)
+        if fingerprint_unchanged(previous, current):
+            self.unchanged += 1
+            return False
+        offset = append_offset(path, previous, current)
+        if offset:
+            self.offsets[key] = offset
+            self.appended += 1
+        self.processed += 1
+        return True
+
+    def resume_offset(self, path: Path) -> int:
+        return self.offsets.get(str(path), 0)
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "processed_inputs": self.processed,
+            "unchanged_inputs": self.unchanged,
+            "appended_inputs": self.appended,
+        }
+
+
+@stable_api
+def load_input_manifest(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        logger.warning("Ignoring unreadable merge input manifest %s", path, exc_info=True)
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != INPUT_MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+@stable_api
+def write_input_manifest(
+    path: Path,
+    watermarks: InputWatermarks,
+    *,
+    dedupe_backend: str,
+    dedupe_partitions: int,
+    near_dedup: dict[str, Any] | None = None,
+) -> None:
+    write_json(
+        path,
+        {
+            "version": INPUT_MANIFEST_VERSION,
+            "written_at_utc": utc_now(),
+            "dedupe_backend": dedupe_backend,
+            "dedupe_partitions": dedupe_partitions,
+            "near_dedup": near_dedup,
+            "inputs": watermarks.current,
+        },
+    )
@@ -0,0 +1,134 @@
+"""Pipelined near-duplicate signatures for the sequential merge.
+
+Shingling and MinHash sketching dominate near-dedup cost but depend only on a
+record's text, so a process pool computes them for batches of upcoming records
+while the merge loop consumes earlier ones. The consumer still performs every
+LSH query and insert itself, in input order, so dedupe decisions match the
+single-process path exactly (``globals.merge.near_dedup.workers``).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, TypeVar
+
+from collector_core.checks.near_duplicate import NearDuplicateDetector, create_detector
+from collector_core.stability import stable_api
+
+T = TypeVar("T")
+
+NEAR_DEDUP_BATCH_SIZE = 256
+# Batches in flight per worker; bounds how far the reader runs ahead of the consumer.
+NEAR_DEDUP_PENDING_PER_WORKER = 2
+
+_WORKER_DETECTOR: NearDuplicateDetector | None = None
+
+# What ``_prepare_batch`` returns: per-text sketches (None for blank texts) and its ms.
+_PreparedBatch = tuple[list[Any], float]
+
+
+def _init_worker(settings: dict[str, Any]) -> None:
+    global _WORKER_DETECTOR
+    _WORKER_DETECTOR = create_detector(**settings)
+
+
+def _prepare_batch(texts: list[str | None]) -> _PreparedBatch:
+    assert _WORKER_DETECTOR is not None
+    start = time.perf_counter()
+    present: list[int] = []
+    present_texts: list[str] = []
+    for idx, text in enumerate(texts):
+        if text is not None:
+            present.append(idx)
+            present_texts.append(text)
+    sketches = _WORKER_DETECTOR.prepare_many(present_texts)
+    prepared: list[Any] = [None] * len(texts)
+    for idx, sketch in zip(present, sketches, strict=True):
+        prepared[idx] = sketch
+    return prepared, (time.perf_counter() - start) * 1000
+
+
+@stable_api
+class SignaturePrefetcher:
+    """Compute :meth:`NearDuplicateDetector.prepare` sketches in worker processes.
+
+    ``iter`` yields every item in its original order together with
+    ``(text, sketch)`` for items that have a text (``None`` otherwise). Worker
+    prepare time and the time the consumer spends waiting on a batch are added
+    to ``detector.stats``.
+    """
+
+    def __init__(
+        self,
+        detector: NearDuplicateDetector,
+        *,
+        workers: int,
+        batch_size: int = NEAR_DEDUP_BATCH_SIZE,
+        max_pending: int | None = None,
+    ) -> None:
+        self.detector = detector
+        self.workers = max(workers, 1)
+        self.batch_size = max(batch_size, 1)
+        self.max_pending = max(max_pending or self.workers * NEAR_DEDUP_PENDING_PER_WORKER, 1)
+        self._pool: ProcessPoolExecutor | None = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(detector.settings(),),
+        )
+
+    def __enter__(self) -> SignaturePrefetcher:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def iter(
+        self, items: Iterable[T], text_of: Callable[[T], str | None]
+    ) -> Iterator[tuple[T, tuple[str, Any] | None]]:
+        if self._pool is None:
+            raise RuntimeError("SignaturePrefetcher is closed")
+        pending: deque[tuple[list[T], list[str | None], Future[_PreparedBatch]]] = deque()
+        batch: list[T] = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                pending.append(self._submit(batch, text_of))
+                batch = []
+                if len(pending) >= self.max_pending:
+                    yield from self._drain(pending.popleft())
+        if batch:
+            pending.append(self._submit(batch, text_of))
+        while pending:
+            yield from self._drain(pending.popleft())
+
+    def _submit(
+        self, batch: list[T], text_of: Callable[[T], str | None]
+    ) -> tuple[list[T], list[str | None], Future[_PreparedBatch]]:
+        assert self._pool is not None
+        texts: list[str | None] = []
+        for item in batch:
+            text = text_of(item)
+            texts.append(text if isinstance(text, str) and text.strip() else None)
+        return batch, texts, self._pool.submit(_prepare_batch, texts)
+
+    def _drain(
+        self, entry: tuple[list[T], list[str | None], Future[_PreparedBatch]]
+    ) -> Iterator[tuple[T, tuple[str, Any] | None]]:
+        batch, texts, future = entry
+        start = time.perf_counter()
+        prepared, prepare_ms = future.result()
+        stats = self.detector.stats
+        stats.record_wait((time.perf_counter() - start) * 1000)
+        present = sum(text is not None for text in texts)
+        if present:
+            stats.record_prepare(prepare_ms, count=present)
+        for item, text, sketch in zip(batch, texts, prepared, strict=True):
+            yield item, (None if text is None else (text, sketch))
@@ -0,0 +1,370 @@
+"""Multi-process merge engine partitioned by content hash.
+
+Readers canonicalize and hash one input unit at a time (a GREEN JSONL file, an HF
+dataset directory or a screened YELLOW shard) and spill each record into the file of
+the partition that owns its hash prefix. One worker per partition then replays its
+spill files in input order, owning its SQLite dedupe partition and per-pool sharders,
+so first-seen-wins decisions match the sequential engine. A final stitch step
+concatenates per-unit skip ledgers and per-worker ledgers in a fixed order, giving a
+deterministic ``combined_index.jsonl`` and ``merge_summary.json`` for a given worker
+count.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any
+
+from collector_core import merge
+from collector_core.merge.contract import CanonicalizePlans, normalize_record
+from collector_core.merge.dedupe import (
+    DEFAULT_MAX_DUPLICATES,
+    DEFAULT_MAX_SOURCE_URLS,
+    dedupe_index_factory,
+    dedupe_partition_for_hash,
+    dedupe_partition_path,
+)
+from collector_core.merge.shard import sharding_cfg
+from collector_core.merge.types import (
+    GreenSkip,
+    GreenUnit,
+    MergeRuntimeConfig,
+    MergeState,
+    Roots,
+    ShardingConfig,
+)
+from collector_core.stability import stable_api
+from collector_core.utils.io import (
+    JsonlReadStats,
+    LedgerWriter,
+    json_dumps,
+    json_loads,
+    read_jsonl,
+    set_zstd_settings,
+)
+from collector_core.utils.paths import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+PARALLEL_DIRNAME = "merge_parallel"
+WORKER_LEDGERS = ("combined_index.jsonl", "combined_deduped.jsonl")
+SCREENED_YELLOW_KIND = "screened_yellow"
+
+
+@dataclasses.dataclass(frozen=True)
+class ParallelMergeContext:
+    roots: Roots
+    spill_root: Path
+    partitions: int
+    unit_count: int
+    pipeline_id: str
+    execute: bool
+    shard_cfg: ShardingConfig
+    target_meta: dict[str, dict[str, Any]]
+    target_canon: dict[str, tuple[list[str], int | None]]
+    default_canon: tuple[list[str], int | None]
+    dedupe_backend: str = "sqlite"
+    dedupe_expected_items: int = 10_000_000
+    dedupe_batch_size: int = 10_000
+    provenance_updates: str = "sidecar"
+
+
+_CONTEXT: ParallelMergeContext | None = None
+_PLANS: CanonicalizePlans | None = None
+
+
+def _init_context(ctx: ParallelMergeContext) -> None:
+    global _CONTEXT, _PLANS
+    _CONTEXT = ctx
+    set_zstd_settings(ctx.shard_cfg.zstd)
+    _PLANS = CanonicalizePlans(
+        ctx.target_canon, ctx.default_canon, ctx.target_meta, pipeline_id=ctx.pipeline_id
+    )
+
+
+def _context() -> ParallelMergeContext:
+    if _CONTEXT is None:
+        raise RuntimeError("Parallel merge context is not initialized in this process.")
+    return _CONTEXT
+
+
+def _plans() -> CanonicalizePlans:
+    if _PLANS is None:
+        raise RuntimeError("Parallel merge context is not initialized in this process.")
+    return _PLANS
+
+
+def _unit_dir(ctx: ParallelMergeContext, unit_idx: int) -> Path:
+    return ctx.spill_root / "units" / f"{unit_idx:06d}"
+
+
+def _worker_dir(ctx: ParallelMergeContext, worker_idx: int) -> Path:
+    return ctx.spill_root / f"worker{worker_idx:03d}"
+
+
+class _PartitionSpill:
+    """Lazily opened per-partition spill files for one input unit."""
+
+    def __init__(self, unit_dir: Path, partitions: int) -> None:
+        self.unit_dir = unit_dir
+        self.partitions = partitions
+        self.handles: dict[int, IO[bytes]] = {}
+
+    def write(self, content_hash: str, entry: dict[str, Any]) -> None:
+        idx = dedupe_partition_for_hash(content_hash, self.partitions)
+        handle = self.handles.get(idx)
+        if handle is None:
+            ensure_dir(self.unit_dir)
+            handle = (self.unit_dir / f"part{idx:03d}.jsonl").open("wb")
+            self.handles[idx] = handle
+        handle.write(json_dumps(entry) + b"\n")
+
+    def close(self) -> None:
+        for handle in self.handles.values():
+            handle.close()
+
+
+def _route_unit(unit_idx: int, unit: GreenUnit | GreenSkip) -> tuple[int, int]:
+    """Canonicalize one input unit into partition spill files.
+
+    Returns the skipped record count and the malformed JSONL line count.
+    """
+    ctx = _context()
+    unit_dir = _unit_dir(ctx, unit_idx)
+    skip_roots = dataclasses.replace(ctx.roots, ledger_root=unit_dir)
+    if isinstance(unit, GreenSkip):
+        merge.record_skip(
+            skip_roots,
+            unit.target_id,
+            unit.pool,
+            unit.reason,
+            unit.source_path,
+            unit.source_kind,
+            ctx.execute,
+            detail=unit.detail,
+        )
+        return 1, 0
+    skipped = 0
+    read_stats = JsonlReadStats()
+    spill = _PartitionSpill(unit_dir, ctx.partitions)
+    try:
+        if unit.source_kind == SCREENED_YELLOW_KIND:
+            for rec in read_jsonl(unit.source_path, stats=read_stats):
+                target_id = (rec.get("source", {}) or {}).get("target_id") or "unknown"
+                record = normalize_record(
+                    rec,
+                    target_id=target_id,
+                    pool=rec.get("pool") or merge.route_pool(rec),
+                    pipeline_id=ctx.pipeline_id,
+                    target_meta=ctx.target_meta.get(target_id, {}),
+                    context=f"{SCREENED_YELLOW_KIND}/{target_id}",
+                )
+                spill.write(
+                    record["content_sha256"],
+                    {
+                        "source_kind": SCREENED_YELLOW_KIND,
+                        "source_path": None,
+                        "target_id": target_id,
+                        "pool": None,
+                        "record": record,
+                    },
+                )
+            return 0, read_stats.malformed
+        plans = _plans()
+        for item in merge.iter_unit_records(unit, read_stats):
+            if isinstance(item, GreenSkip):
+                skipped += 1
+                merge.record_skip(
+                    skip_roots,
+                    item.target_id,
+                    item.pool,
+                    item.reason,
+                    item.source_path,
+                    item.source_kind,
+                    ctx.execute,
+                    detail=item.detail,
+                )
+                continue
+            canonical, reason = plans.canonicalize(item.raw, item.target_id, item.pool)
+            if not canonical:
+                skipped += 1
+                merge.record_skip(
+                    skip_roots,
+                    item.target_id,
+                    item.pool,
+                    reason or "canonicalize_failed",
+                    item.source_path,
+                    item.source_kind,
+                    ctx.execute,
+                )
+                continue
+            spill.write(
+                canonical["content_sha256"],
+                {
+                    "source_kind": item.source_kind,
+                    "source_path": str(item.source_path),
+                    "target_id": item.target_id,
+                    "pool": item.pool,
+                    "record": canonical,
+                },
+            )
+    finally:
+        spill.close()
+    return skipped, read_stats.malformed
+
+
+def _merge_partition(worker_idx: int) -> dict[str, Any]:
+    """Dedupe and shard every record routed to ``worker_idx``, in input order."""
+    ctx = _context()
+    worker_roots = dataclasses.replace(ctx.roots, ledger_root=_worker_dir(ctx, worker_idx))
+    ensure_dir(worker_roots.ledger_root)
+    index_factory = dedupe_index_factory(
+        ctx.dedupe_backend,
+        # Each worker only sees its share of the hashes.
+        expected_items=max(ctx.dedupe_expected_items // ctx.partitions, 1),
+        batch_size=ctx.dedupe_batch_size,
+    )
+    dedupe = index_factory(
+        dedupe_partition_path(ctx.roots.ledger_root / "combined_dedupe.sqlite", worker_idx)
+    )
+    state = MergeState(
+        summary={"written": 0, "deduped": 0, "near_deduped": 0, "skipped": 0, "shards": []},
+        dedupe=dedupe,
+        near_dedup=None,
+        near_dedup_text_field="text",
+        shard_cfg=dataclasses.replace(
+            ctx.shard_cfg, prefix=f"{ctx.shard_cfg.prefix}_w{worker_idx:03d}"
+        ),
+        pool_sharders={},
+        target_meta=ctx.target_meta,
+        pipeline_id=ctx.pipeline_id,
+        execute=ctx.execute,
+        progress=False,
+        progress_interval=0,
+        pending_updates={},
+        max_source_urls=DEFAULT_MAX_SOURCE_URLS,
+        max_duplicates=DEFAULT_MAX_DUPLICATES,
+        ledger=LedgerWriter() if ctx.execute else None,
+        provenance_updates=ctx.provenance_updates,
+    )
+    try:
+        for unit_idx in range(ctx.unit_count):
+            spill_path = _unit_dir(ctx, unit_idx) / f"part{worker_idx:03d}.jsonl"
+            if not spill_path.exists():
+                continue
+            with spill_path.open("rb") as handle:
+                for line in handle:
+                    entry = json_loads(line)
+                    source_path = entry["source_path"]
+                    merge.handle_record(
+                        entry["record"],
+                        entry["source_kind"],
+                        Path(source_path) if source_path else None,
+                        worker_roots,
+                        state,
+                        entry["target_id"],
+                        entry["pool"],
+                        # Readers normalized every spilled record already.
+                        normalized=True,
+                    )
+        merge.finalize_shards(state)
+        merge.apply_pending_updates(worker_roots, state)
+    finally:
+        dedupe.close()
+        if state.ledger is not None:
+            state.ledger.close()
+    return state.summary
+
+
+def _append_file(dest: Path, src: Path) -> None:
+    if not src.exists():
+        return
+    ensure_dir(dest.parent)
+    with src.open("rb") as inp, dest.open("ab") as out:
+        shutil.copyfileobj(inp, out, 1024 * 1024)
+
+
+def _stitch_ledgers(ctx: ParallelMergeContext) -> None:
+    ledger_root = ctx.roots.ledger_root
+    for unit_idx in range(ctx.unit_count):
+        _append_file(
+            ledger_root / "combined_skipped.jsonl",
+            _unit_dir(ctx, unit_idx) / "combined_skipped.jsonl",
+        )
+    for name in WORKER_LEDGERS:
+        for worker_idx in range(ctx.partitions):
+            _append_file(ledger_root / name, _worker_dir(ctx, worker_idx) / name)
+
+
+@stable_api
+def merge_records_parallel(
+    cfg: dict[str, Any],
+    roots: Roots,
+    execute: bool,
+    *,
+    pipeline_id: str,
+    runtime: MergeRuntimeConfig,
+) -> dict[str, Any]:
+    workers = max(runtime.merge_workers, 1)
+    units: list[GreenUnit | GreenSkip] = list(merge.iter_green_units(roots))
+    units.extend(
+        GreenUnit("", "", fp, SCREENED_YELLOW_KIND)
+        for fp in merge.iter_screened_yellow_files(roots)
+    )
+    spill_root = roots.ledger_root / PARALLEL_DIRNAME
+    if spill_root.exists():
+        shutil.rmtree(spill_root)
+    ensure_dir(spill_root)
+    target_canon, default_canon = merge.build_target_canon(cfg)
+    ctx = ParallelMergeContext(
+        roots=roots,
+        spill_root=spill_root,
+        partitions=workers,
+        unit_count=len(units),
+        pipeline_id=pipeline_id,
+        execute=execute,
+        shard_cfg=sharding_cfg(cfg),
+        target_meta=merge.build_target_meta(cfg),
+        target_canon=target_canon,
+        default_canon=default_canon,
+        dedupe_backend=runtime.dedupe_backend,
+        dedupe_expected_items=runtime.dedupe_expected_items,
+        dedupe_batch_size=runtime.dedupe_batch_size,
+        provenance_updates=runtime.provenance_updates,
+    )
+    summary: dict[str, Any] = {
+        "written": 0,
+        "deduped": 0,
+        "near_deduped": 0,
+        "skipped": 0,
+        "malformed_lines": 0,
+        "shards": [],
+        "updated_shards": 0,
+    }
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_context, initargs=(ctx,)
+        ) as pool:
+            logger.info("Parallel merge: routing %d input units to %d workers", len(units), workers)
+            for skipped, malformed in pool.map(_route_unit, range(len(units)), units):
+                summary["skipped"] += skipped
+                summary["malformed_lines"] += malformed
+            worker_summaries = list(pool.map(_merge_partition, range(workers)))
+        for worker_summary in worker_summaries:
+            for key in ("written", "deduped", "near_deduped"):
+                summary[key] += worker_summary[key]
+            summary["updated_shards"] += worker_summary.get("updated_shards", 0)
+            summary["shards"].extend(worker_summary["shards"])
+        if execute:
+            _stitch_ledgers(ctx)
+    finally:
+        shutil.rmtree(spill_root, ignore_errors=True)
+    summary["dedupe_partitions"] = workers
+    summary["dedupe_backend"] = runtime.dedupe_backend
+    summary["provenance_updates"] = runtime.provenance_updates
+    summary["merge_workers"] = workers
+    return summary
@@ -0,0 +1,261 @@
+"""Parquet combined shards (``globals.sharding.format: parquet``).
+
+The output contract fields (``output_contract.REQUIRED_FIELDS``) plus ``record_id``
+and ``text`` are typed columns. Low-cardinality string columns are dictionary
+encoded and every column carries row-group statistics, so readers can prune by
+``pool``, ``license_spdx`` or ``pipeline`` without decoding text. All other record
+keys (``source``, ``provenance``, routing, ...) are kept as one JSON object in
+``extra_json`` so rows read back exactly as merge wrote them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from collector_core.output_contract import REQUIRED_FIELDS
+from collector_core.sharding import get_shard_filename, get_tmp_path
+from collector_core.stability import stable_api
+from collector_core.utils.paths import ensure_dir
+
+SHARD_FORMATS = ("jsonl", "parquet")
+PARQUET_ROW_GROUP_SIZE = 10_000
+EXTRA_COLUMN = "extra_json"
+DICTIONARY_COLUMNS = (
+    "dataset_id",
+    "split",
+    "config",
+    "license_spdx",
+    "license_profile",
+    "reviewer_notes",
+    "pool",
+    "pipeline",
+    "target_name",
+)
+_PARQUET_CODECS = {
+    "none": "none",
+    "gzip": "gzip",
+    "zstd": "zstd",
+    "zst": "zstd",
+    "snappy": "snappy",
+}
+
+
+def _build_schema() -> pa.Schema:
+    fields = [pa.field("record_id", pa.string()), pa.field("text", pa.string())]
+    for name, expected_type in REQUIRED_FIELDS.items():
+        fields.append(
+            pa.field(name, pa.list_(pa.string()) if expected_type is list else pa.string())
+        )
+    fields.append(pa.field(EXTRA_COLUMN, pa.string()))
+    return pa.schema(fields)
+
+
+OUTPUT_PARQUET_SCHEMA = _build_schema()
+_TYPED_COLUMNS = tuple(name for name in OUTPUT_PARQUET_SCHEMA.names if name != EXTRA_COLUMN)
+_LIST_COLUMNS = frozenset(name for name, typ in REQUIRED_FIELDS.items() if typ is list)
+
+
+@stable_api
+def parquet_codec(compression: str) -> str:
+    """Map ``globals.sharding.compression`` to a Parquet codec name."""
+    try:
+        return _PARQUET_CODECS[compression]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported Parquet compression {compression!r}; "
+            f"expected one of {sorted(_PARQUET_CODECS)}"
+        ) from None
+
+
+def _typed_value(name: str, value: Any) -> bool:
+    if name in _LIST_COLUMNS:
+        return isinstance(value, list) and all(isinstance(item, str) for item in value)
+    return isinstance(value, str)
+
+
+@stable_api
+def record_to_columns(record: dict[str, Any]) -> dict[str, Any]:
+    """Split a record into typed column values and the ``extra_json`` remainder."""
+    row: dict[str, Any] = {}
+    extra: dict[str, Any] = {}
+    for key, value in record.items():
+        if key in _TYPED_COLUMNS and _typed_value(key, value):
+            row[key] = value
+        else:
+            extra[key] = value
+    row[EXTRA_COLUMN] = json.dumps(extra, ensure_ascii=False) if extra else None
+    return row
+
+
+@stable_api
+def columns_to_record(row: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of :func:`record_to_columns`."""
+    record = {name: row[name] for name in _TYPED_COLUMNS if row.get(name) is not None}
+    extra = row.get(EXTRA_COLUMN)
+    if extra:
+        record.update(json.loads(extra))
+    return record
+
+
+def _table(rows: list[dict[str, Any]]) -> pa.Table:
+    return pa.Table.from_pylist(rows, schema=OUTPUT_PARQUET_SCHEMA)
+
+
+def _open_writer(path: Path, codec: str) -> pq.ParquetWriter:
+    return pq.ParquetWriter(
+        str(path),
+        OUTPUT_PARQUET_SCHEMA,
+        compression=codec,
+        use_dictionary=list(DICTIONARY_COLUMNS),
+        write_statistics=True,
+    )
+
+
+def _finish(writer: pq.ParquetWriter, tmp_path: Path, path: Path) -> None:
+    writer.close()
+    with tmp_path.open("rb") as handle:
+        os.fsync(handle.fileno())
+    tmp_path.replace(path)
+
+
+@stable_api
+class ParquetShardWriter:
+    """Rotating Parquet shard writer with the same interface as ``StreamingShardWriter``.
+
+    Rows are buffered for at most one row group (``row_group_size``) before being
+    encoded; shards rotate on ``max_records`` rows or an estimate of ``max_bytes``
+    uncompressed bytes, checked per row.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        *,
+        prefix: str,
+        compression: str = "zstd",
+        max_records: int = 50_000,
+        max_bytes: int | None = None,
+        shard_index: int = 0,
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+    ) -> None:
+        self.base_dir = base_dir
+        self.prefix = prefix
+        self.codec = parquet_codec(compression)
+        self.max_records = max(max_records, 1)
+        self.max_bytes = max_bytes if max_bytes and max_bytes > 0 else None
+        self.shard_index = shard_index
+        self.row_group_size = max(row_group_size, 1)
+        self.records = 0
+        self.bytes = 0
+        self._rows: list[dict[str, Any]] = []
+        self._writer: pq.ParquetWriter | None = None
+        self._tmp_path: Path | None = None
+
+    @property
+    def current_path(self) -> Path:
+        """Path of the shard the next row is written to."""
+        return self.base_dir / get_shard_filename(
+            self.shard_index, self.prefix, extension="parquet"
+        )
+
+    def write(self, row: dict[str, Any]) -> Path | None:
+        """Append one row; return the shard path if this row completed a shard."""
+        columns = record_to_columns(row)
+        self._rows.append(columns)
+        self.records += 1
+        if self.max_bytes is not None:
+            self.bytes += sum(len(value) for value in columns.values() if isinstance(value, str))
+        if len(self._rows) >= self.row_group_size:
+            self._write_row_group()
+        if self.records >= self.max_records or (
+            self.max_bytes is not None and self.bytes >= self.max_bytes
+        ):
+            return self._finish_shard()
+        return None
+
+    def flush(self) -> Path | None:
+        return self._finish_shard() if self.records else None
+
+    def close(self) -> Path | None:
+        return self.flush()
+
+    def abort(self) -> None:
+        self._rows = []
+        self.records = 0
+        self.bytes = 0
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._tmp_path is not None:
+            self._tmp_path.unlink(missing_ok=True)
+            self._tmp_path = None
+
+    def _write_row_group(self) -> None:
+        if not self._rows:
+            return
+        if self._writer is None:
+            ensure_dir(self.base_dir)
+            self._tmp_path = get_tmp_path(self.current_path)
+            self._writer = _open_writer(self._tmp_path, self.codec)
+        self._writer.write_table(_table(self._rows), row_group_size=self.row_group_size)
+        self._rows = []
+
+    def _finish_shard(self) -> Path:
+        path = self.current_path
+        self._write_row_group()
+        assert self._writer is not None and self._tmp_path is not None
+        _finish(self._writer, self._tmp_path, path)
+        self._writer = None
+        self._tmp_path = None
+        self.records = 0
+        self.bytes = 0
+        self.shard_index += 1
+        return path
+
+
+@stable_api
+def iter_parquet_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield merge records from a Parquet shard, one row group at a time."""
+    parquet_file = pq.ParquetFile(str(path))
+    for idx in range(parquet_file.num_row_groups):
+        for row in parquet_file.read_row_group(idx).to_pylist():
+            yield columns_to_record(row)
+
+
+@stable_api
+def rewrite_parquet_shard(
+    path: Path, transform: Callable[[dict[str, Any]], dict[str, Any]]
+) -> None:
+    """Rewrite ``path`` in place row group by row group, keeping its codec and layout."""
+    parquet_file = pq.ParquetFile(str(path))
+    metadata = parquet_file.metadata
+    codec = "none"
+    if metadata.num_row_groups and metadata.num_columns:
+        codec = str(metadata.row_group(0).column(0).compression).lower()
+        codec = "none" if codec == "uncompressed" else codec
+    tmp_path = get_tmp_path(path)
+    writer = _open_writer(tmp_path, codec)
+    try:
+        for idx in range(parquet_file.num_row_groups):
+            rows = [
+                record_to_columns(transform(columns_to_record(row)))
+                for row in parquet_file.read_row_group(idx).to_pylist()
+            ]
+            writer.write_table(_table(rows), row_group_size=len(rows) or 1)
+    except BaseException:
+        writer.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _finish(writer, tmp_path, path)
+
+
+@stable_api
+def parquet_num_rows(path: Path) -> int:
+    return int(pq.read_metadata(str(path)).num_rows)
@@ -1,51 +1,113 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Any
 
+from collector_core.merge.parquet import SHARD_FORMATS, ParquetShardWriter, parquet_codec
 from collector_core.merge.types import ShardingConfig
+from collector_core.shard_index import SHARD_INDEX_EVERY
+from collector_core.sharding import StreamingShardWriter
 from collector_core.stability import stable_api
-from collector_core.utils.io import append_jsonl
+from collector_core.utils.io import ZstdSettings
 from collector_core.utils.paths import ensure_dir
 
+# Compressions a JSONL combined shard can be written with; anything else is plain.
+JSONL_COMPRESSIONS = ("gzip", "zstd", "zst")
+
 
 @stable_api
 class Sharder:
+    """Per-pool combined shard writer.
+
+    Records stream straight to disk through ``StreamingShardWriter`` (or
+    ``ParquetShardWriter`` for ``format: parquet``); only the content hashes of the
+    open shard are kept so the caller can map them to the shard once it is finished.
+    """
+
     def __init__(self, base_dir: Path, cfg: ShardingConfig) -> None:
         self.base_dir = base_dir
         self.cfg = cfg
-        self.current: list[dict[str, Any]] = []
-        self.shard_idx = 0
+        self.writer: StreamingShardWriter | ParquetShardWriter
+        if cfg.format == "parquet":
+            self.writer = ParquetShardWriter(
+                base_dir,
+                prefix=cfg.prefix,
+                compression=cfg.compression,
+                max_records=cfg.max_records_per_shard,
+                max_bytes=cfg.max_bytes_per_shard,
+            )
+        else:
+            self.writer = StreamingShardWriter(
+                base_dir,
+                prefix=cfg.prefix,
+                compression=cfg.compression if cfg.compression in JSONL_COMPRESSIONS else "none",
+                max_records=cfg.max_records_per_shard,
+                max_bytes=cfg.max_bytes_per_shard,
+                index_every=cfg.index_every,
+                zstd_settings=cfg.zstd,
+            )
+        self.current: list[str] = []
+
+    @property
+    def shard_idx(self) -> int:
+        return self.writer.shard_index
 
     def _path(self) -> Path:
-        suffix = "jsonl.gz" if self.cfg.compression == "gzip" else "jsonl"
-        return self.base_dir / f"{self.cfg.prefix}_{self.shard_idx:05d}.{suffix}"
-
-    def add(self, row: dict[str, Any]) -> tuple[Path | None, list[dict[str, Any]]]:
-        self.current.append(row)
-        if len(self.current) >= self.cfg.max_records_per_shard:
-            path, flushed = self.flush()
-            self.shard_idx += 1
-            return path, flushed
-        return None, []
-
-    def flush(self) -> tuple[Path | None, list[dict[str, Any]]]:
-        if not self.current:
+        return self.writer.current_path
+
+    def resume(self) -> int:
+        """Continue numbering after the highest ``<prefix>_NNNNN`` shard already on disk."""
+        pattern = re.compile(rf"^{re.escape(self.cfg.prefix)}_(\d+)\.")
+        highest = -1
+        if self.base_dir.exists():
+            for fp in self.base_dir.iterdir():
+                match = pattern.match(fp.name)
+                if match:
+                    highest = max(highest, int(match.group(1)))
+        self.writer.shard_index = max(self.writer.shard_index, highest + 1)
+        return self.writer.shard_index
+
+    def add(self, row: dict[str, Any]) -> tuple[Path | None, list[str]]:
+        """Write ``row``; return ``(shard_path, content_hashes)`` if it finished a shard."""
+        content_hash = row.get("content_sha256")
+        if content_hash:
+            self.current.append(content_hash)
+        path = self.writer.write(row)
+        if path is None:
+            return None, []
+        hashes, self.current = self.current, []
+        return path, hashes
+
+    def flush(self) -> tuple[Path | None, list[str]]:
+        """Finish the open shard and wait for every shard of this pool to reach disk."""
+        path = self.writer.close()
+        hashes, self.current = self.current, []
+        if path is None:
             return None, []
-        path = self._path()
-        records = self.current
-        append_jsonl(path, records)
-        self.current = []
-        return path, records
+        return path, hashes
 
 
 @stable_api
 def sharding_cfg(cfg: dict[str, Any]) -> ShardingConfig:
     g = cfg.get("globals", {}).get("sharding", {}) or {}
+    shard_format = str(g.get("format", "jsonl"))
+    if shard_format not in SHARD_FORMATS:
+        raise ValueError(
+            f"Unsupported globals.sharding.format {shard_format!r}; expected one of {SHARD_FORMATS}"
+        )
+    default_compression = "zstd" if shard_format == "parquet" else "gzip"
+    compression = str(g.get("compression", default_compression))
+    if shard_format == "parquet":
+        parquet_codec(compression)  # fail fast on codecs Parquet cannot write
     return ShardingConfig(
         max_records_per_shard=int(g.get("max_records_per_shard", 50000)),
-        compression=str(g.get("compression", "gzip")),
+        compression=compression,
         prefix="combined",
+        max_bytes_per_shard=int(g["max_bytes_per_shard"]) if g.get("max_bytes_per_shard") else None,
+        format=shard_format,
+        index_every=int(g.get("index_every", SHARD_INDEX_EVERY)),
+        zstd=ZstdSettings.from_dict(g.get("zstd")),
     )
 
 
@@ -4,12 +4,17 @@ import dataclasses
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from collector_core.shard_index import SHARD_INDEX_EVERY
 from collector_core.stability import stable_api
+from collector_core.utils.io import JsonlReadStats, ZstdSettings
 
 if TYPE_CHECKING:
     from collector_core.checks.near_duplicate import NearDuplicateDetector
-    from collector_core.merge.dedupe import DedupeIndex, PartitionedDedupeIndex
+    from collector_core.merge.dedupe import DedupeBackend
+    from collector_core.merge.incremental import InputWatermarks
+    from collector_core.merge.near_dedup import SignaturePrefetcher
     from collector_core.merge.shard import Sharder
+    from collector_core.utils.io import LedgerWriter
 
 
 @stable_api
@@ -36,6 +41,14 @@ class ShardingConfig:
     max_records_per_shard: int
     compression: str
     prefix: str
+    # Rotate once a shard holds this many uncompressed bytes (``None``: records only).
+    max_bytes_per_shard: int | None = None
+    # Records per independently decodable block in the shard index sidecar (0: no index).
+    index_every: int = SHARD_INDEX_EVERY
+    # zstd level/threads/long-distance matching for ``compression: zstd`` shards.
+    zstd: ZstdSettings = dataclasses.field(default_factory=ZstdSettings)
+    # ``jsonl`` or ``parquet`` (see ``collector_core.merge.parquet``).
+    format: str = "jsonl"
 
 
 @stable_api
@@ -48,6 +61,15 @@ class GreenInput:
     source_kind: str
 
 
+@stable_api
+@dataclasses.dataclass(frozen=True)
+class GreenUnit:
+    target_id: str
+    pool: str
+    source_path: Path
+    source_kind: str
+
+
 @stable_api
 @dataclasses.dataclass
 class GreenSkip:
@@ -63,7 +85,7 @@ class GreenSkip:
 @dataclasses.dataclass
 class MergeState:
     summary: dict[str, Any]
-    dedupe: DedupeIndex | PartitionedDedupeIndex
+    dedupe: DedupeBackend
     near_dedup: NearDuplicateDetector | None
     near_dedup_text_field: str
     shard_cfg: ShardingConfig
@@ -73,11 +95,16 @@ class MergeState:
     execute: bool
     progress: bool
     progress_interval: int
-    inflight_records: dict[str, dict[str, Any]]
-    shard_index: dict[str, str]
     pending_updates: dict[str, dict[str, Any]]
     max_source_urls: int
     max_duplicates: int
+    ledger: LedgerWriter | None = None
+    incremental: bool = False
+    watermarks: InputWatermarks | None = None
+    provenance_updates: str = "sidecar"
+    # Set when near-dedup sketches are computed ahead by a process pool.
+    near_dedup_prefetcher: SignaturePrefetcher | None = None
+    read_stats: JsonlReadStats = dataclasses.field(default_factory=JsonlReadStats)
 
 
 @stable_api
@@ -90,6 +117,14 @@ class MergeRuntimeConfig:
     profile_path: Path | None = None
     profile_sort: str = "tottime"
     dedupe_partitions: int = 1
+    dedupe_backend: str = "sqlite"
+    dedupe_expected_items: int = 10_000_000
+    dedupe_batch_size: int = 10_000
+    merge_workers: int = 1
+    incremental: bool = False
+    incremental_sha256: bool = False
+    provenance_updates: str = "sidecar"
+    compact_provenance: bool = False
     near_dedup: bool = False
     near_dedup_text_field: str = "text"
     near_dedup_threshold: float = 0.85
@@ -98,3 +133,8 @@ class MergeRuntimeConfig:
     near_dedup_shingle_size: int = 3
     near_dedup_max_tokens: int = 2000
     near_dedup_max_candidates: int = 50
+    # Hamming tolerance of the ``simhash`` near-dedup backend.
+    near_dedup_hamming_bits: int = 3
+    # Processes computing shingles and signatures ahead of the merge loop (1: inline).
+    near_dedup_workers: int = 1
+    near_dedup_batch_size: int = 256
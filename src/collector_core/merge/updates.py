@@ -0,0 +1,318 @@
+"""Per-shard provenance delta files for combined shards.
+
+Duplicates that arrive after their retained record was flushed used to force a
+full decompress/rewrite of the shard. Instead, each affected shard gets a small
+sidecar under ``combined/<pool>/shard_updates/`` holding one row per changed
+record. :func:`iter_shard_records` overlays the sidecar when reading, and
+:func:`compact_shard_updates` folds it back into the shard at a settling point;
+merge runs :func:`compact_pool_updates` over every pool when
+``globals.merge.compact_provenance`` / ``--compact-provenance`` is set.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from collector_core.merge.dedupe import (
+    DEFAULT_MAX_DUPLICATES,
+    DEFAULT_MAX_SOURCE_URLS,
+    merge_provenance_update,
+    merge_update_payload,
+)
+from collector_core.merge.parquet import iter_parquet_records, rewrite_parquet_shard
+from collector_core.shard_index import (
+    ShardIndex,
+    compress_block,
+    decompress_block,
+    iter_shard_blocks,
+    load_shard_index,
+    shard_index_path,
+    write_shard_index,
+)
+from collector_core.stability import stable_api
+from collector_core.utils.io import (
+    append_jsonl,
+    decode_jsonl_line,
+    json_dumps,
+    open_binary,
+    read_jsonl,
+)
+from collector_core.utils.logging import utc_now
+
+SHARD_UPDATES_DIRNAME = "shard_updates"
+PROVENANCE_UPDATE_MODES = ("sidecar", "rewrite")
+# Combined shard files that may have a sidecar (not their ``.index.json`` sidecars).
+SHARD_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.zst", ".parquet")
+# Finds candidate hashes in a decompressed block without decoding its rows.
+_CONTENT_HASH_RE = re.compile(rb'"content_sha256":\s*"([0-9a-f]+)"')
+
+
+@stable_api
+def shard_updates_path(shard_path: Path) -> Path:
+    """``combined/<pool>/shards/x.jsonl.gz`` (or ``x.parquet``) -> ``.../shard_updates/x.jsonl``."""
+    stem = shard_path.name.split(".", 1)[0]
+    return shard_path.parent.parent / SHARD_UPDATES_DIRNAME / f"{stem}.jsonl"
+
+
+@stable_api
+def write_shard_updates(shard_path: Path, updates: dict[str, dict[str, Any]]) -> Path:
+    """Append one delta row per updated hash to the shard's sidecar."""
+    path = shard_updates_path(shard_path)
+    updated_at = utc_now()
+    append_jsonl(
+        path,
+        (
+            {
+                "content_sha256": content_hash,
+                "source_urls": update.get("source_urls", []),
+                "duplicates": update.get("duplicates", []),
+                "timestamp_updated": updated_at,
+            }
+            for content_hash, update in updates.items()
+        ),
+    )
+    return path
+
+
+@stable_api
+def load_shard_updates(
+    shard_path: Path,
+    *,
+    max_source_urls: int = DEFAULT_MAX_SOURCE_URLS,
+    max_duplicates: int = DEFAULT_MAX_DUPLICATES,
+) -> dict[str, dict[str, Any]]:
+    """Collapse a shard's sidecar rows into one update per hash (empty if none)."""
+    path = shard_updates_path(shard_path)
+    merged: dict[str, dict[str, Any]] = {}
+    if not path.exists():
+        return merged
+    for row in read_jsonl(path):
+        content_hash = row.get("content_sha256")
+        if not content_hash:
+            continue
+        base = merged.get(content_hash)
+        update = (
+            merge_update_payload(
+                base, row, max_source_urls=max_source_urls, max_duplicates=max_duplicates
+            )
+            if base
+            else {
+                "source_urls": row.get("source_urls", []),
+                "duplicates": row.get("duplicates", []),
+            }
+        )
+        update["timestamp_updated"] = row.get("timestamp_updated")
+        merged[content_hash] = update
+    return merged
+
+
+def _overlay(
+    record: dict[str, Any],
+    update: dict[str, Any],
+    *,
+    max_source_urls: int,
+    max_duplicates: int,
+) -> None:
+    merge_provenance_update(
+        record, update, max_source_urls=max_source_urls, max_duplicates=max_duplicates
+    )
+    if update.get("timestamp_updated"):
+        record["timestamp_updated"] = update["timestamp_updated"]
+
+
+@stable_api
+def iter_shard_records(
+    shard_path: Path,
+    *,
+    max_source_urls: int = DEFAULT_MAX_SOURCE_URLS,
+    max_duplicates: int = DEFAULT_MAX_DUPLICATES,
+) -> Iterator[dict[str, Any]]:
+    """Read a combined shard with its provenance sidecar applied."""
+    updates = load_shard_updates(
+        shard_path, max_source_urls=max_source_urls, max_duplicates=max_duplicates
+    )
+    records = (
+        iter_parquet_records(shard_path)
+        if shard_path.suffix == ".parquet"
+        else read_jsonl(shard_path)
+    )
+    for record in records:
+        content_hash = record.get("content_sha256")
+        update = updates.get(content_hash) if updates and content_hash else None
+        if update:
+            _overlay(record, update, max_source_urls=max_source_urls, max_duplicates=max_duplicates)
+        yield record
+
+
+@stable_api
+def rewrite_shard_with_updates(
+    shard_path: Path,
+    updates: dict[str, dict[str, Any]],
+    *,
+    max_source_urls: int = DEFAULT_MAX_SOURCE_URLS,
+    max_duplicates: int = DEFAULT_MAX_DUPLICATES,
+) -> None:
+    """Rewrite ``shard_path`` in place with ``updates`` merged into matching rows."""
+    if shard_path.suffix == ".parquet":
+
+        def apply(record: dict[str, Any]) -> dict[str, Any]:
+            update = updates.get(record.get("content_sha256") or "")
+            if update:
+                _overlay(
+                    record, update, max_source_urls=max_source_urls, max_duplicates=max_duplicates
+                )
+            return record
+
+        rewrite_parquet_shard(shard_path, apply)
+        return
+    index = load_shard_index(shard_path)
+    if index is not None:
+        _rewrite_indexed_shard(
+            shard_path,
+            index,
+            updates,
+            max_source_urls=max_source_urls,
+            max_duplicates=max_duplicates,
+        )
+        return
+    # Without a valid index the rewrite loses the block layout; drop any stale sidecar.
+    shard_index_path(shard_path).unlink(missing_ok=True)
+    temp_path = shard_path.with_suffix(shard_path.suffix + ".tmp")
+    with (
+        open_binary(shard_path, "rb") as src,
+        open_binary(temp_path, "wb", suffix=shard_path.suffix) as dst,
+    ):
+        for line in src:
+            raw = line.strip()
+            if not raw:
+                continue
+            try:
+                record = decode_jsonl_line(raw)
+            except ValueError:
+                dst.write(line)
+                continue
+            content_hash = record.get("content_sha256")
+            update = updates.get(content_hash) if content_hash else None
+            if not update:
+                # Untouched rows keep their bytes; only updated rows are re-encoded.
+                dst.write(raw + b"\n")
+                continue
+            _overlay(record, update, max_source_urls=max_source_urls, max_duplicates=max_duplicates)
+            dst.write(json_dumps(record) + b"\n")
+        # P1.3C: Flush and fsync before atomic rename
+        dst.flush()
+        if hasattr(dst, "fileno"):
+            os.fsync(dst.fileno())
+    temp_path.replace(shard_path)
+
+
+def _rewrite_indexed_shard(
+    shard_path: Path,
+    index: ShardIndex,
+    updates: dict[str, dict[str, Any]],
+    *,
+    max_source_urls: int,
+    max_duplicates: int,
+) -> None:
+    """Rewrite only the blocks that hold an updated hash; copy the rest verbatim."""
+    temp_path = shard_path.with_suffix(shard_path.suffix + ".tmp")
+    offsets: list[int] = []
+    uncompressed_bytes = 0
+    with temp_path.open("wb") as dst:
+        for block in iter_shard_blocks(shard_path, index):
+            data = decompress_block(block, index.compression)
+            touched = any(
+                match.group(1).decode("ascii") in updates
+                for match in _CONTENT_HASH_RE.finditer(data)
+            )
+            if touched:
+                lines: list[bytes] = []
+                for line in data.splitlines():
+                    raw = line.strip()
+                    if not raw:
+                        continue
+                    try:
+                        record = decode_jsonl_line(raw)
+                    except ValueError:
+                        lines.append(line + b"\n")
+                        continue
+                    update = updates.get(record.get("content_sha256") or "")
+                    if update:
+                        _overlay(
+                            record,
+                            update,
+                            max_source_urls=max_source_urls,
+                            max_duplicates=max_duplicates,
+                        )
+                        raw = json_dumps(record)
+                    lines.append(raw + b"\n")
+                data = b"".join(lines)
+                block = compress_block(data, index.compression)
+            offsets.append(dst.tell())
+            uncompressed_bytes += len(data)
+            dst.write(block)
+        dst.flush()
+        os.fsync(dst.fileno())
+    temp_path.replace(shard_path)
+    write_shard_index(
+        shard_path,
+        dataclasses.replace(
+            index,
+            block_offsets=offsets,
+            shard_bytes=shard_path.stat().st_size,
+            uncompressed_bytes=uncompressed_bytes,
+        ),
+    )
+
+
+@stable_api
+def compact_shard_updates(
+    shard_path: Path,
+    *,
+    max_source_urls: int = DEFAULT_MAX_SOURCE_URLS,
+    max_duplicates: int = DEFAULT_MAX_DUPLICATES,
+) -> bool:
+    """Fold a shard's sidecar into the shard and delete it. Returns False if there was none."""
+    updates = load_shard_updates(
+        shard_path, max_source_urls=max_source_urls, max_duplicates=max_duplicates
+    )
+    if not updates:
+        return False
+    rewrite_shard_with_updates(
+        shard_path, updates, max_source_urls=max_source_urls, max_duplicates=max_duplicates
+    )
+    shard_updates_path(shard_path).unlink()
+    return True
+
+
+@stable_api
+def compact_pool_updates(
+    pool_dir: Path,
+    *,
+    max_source_urls: int = DEFAULT_MAX_SOURCE_URLS,
+    max_duplicates: int = DEFAULT_MAX_DUPLICATES,
+) -> list[Path]:
+    """Compact every shard in ``combined/<pool>/shards`` that has a sidecar.
+
+    Returns the shards that were rewritten; ``shard_updates/`` is removed once
+    it is empty.
+    """
+    updates_dir = pool_dir / SHARD_UPDATES_DIRNAME
+    if not updates_dir.is_dir():
+        return []
+    compacted = [
+        shard
+        for shard in sorted((pool_dir / "shards").glob("*"))
+        if shard.name.endswith(SHARD_SUFFIXES)
+        and compact_shard_updates(
+            shard, max_source_urls=max_source_urls, max_duplicates=max_duplicates
+        )
+    ]
+    if not any(updates_dir.iterdir()):
+        updates_dir.rmdir()
+    return compacted
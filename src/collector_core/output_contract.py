@@ -35,6 +35,29 @@ def normalize_output_record(
     now: str | None = None,
 ) -> dict[str, Any]:
     out = dict(record)
+    apply_output_defaults(
+        out,
+        target_id=target_id,
+        pool=pool,
+        pipeline=pipeline,
+        dataset_id=dataset_id,
+        config=config,
+        now=now,
+    )
+    return out
+
+
+def apply_output_defaults(
+    out: dict[str, Any],
+    *,
+    target_id: str,
+    pool: str | None,
+    pipeline: str,
+    dataset_id: str | None = None,
+    config: str | None = None,
+    now: str | None = None,
+) -> None:
+    """Fill contract fields on ``out`` in place (``normalize_output_record`` without the copy)."""
     timestamp = now or utc_now()
 
     text = out.get("text")
@@ -109,8 +132,6 @@ def normalize_output_record(
     out.setdefault("timestamp_created", timestamp)
     out.setdefault("timestamp_updated", out["timestamp_created"])
 
-    return out
-
 
 def validate_output_contract(record: dict[str, Any], context: str) -> None:
     missing: list[str] = []
@@ -49,6 +49,7 @@ from collector_core.evidence.change_detection import (
     resolve_evidence_change,
 )
 from collector_core.evidence.fetching import (
+    EVIDENCE_FETCH_WORKERS,
     fetch_evidence,
     fetch_evidence_batch,
     fetch_url_with_retry,
@@ -60,6 +61,8 @@ from collector_core.logging_config import add_logging_args, configure_logging
 from collector_core.metrics import MetricsCollector, clear_collector, set_collector
 from collector_core.policy_snapshot import build_policy_snapshot
 from collector_core.queue.emission import emit_queues
+from collector_core.utils.http import HttpSessionPool
+from collector_core.utils.http import requests as http_requests
 from collector_core.utils.io import read_json, read_jsonl_list, write_json
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir
@@ -166,6 +169,8 @@ class DriverConfig:
     require_yellow_signoff: bool
     checks_run_id: str
     content_check_actions: dict[str, str]
+    # Keep-alive sessions for evidence fetches, opened by ``run`` for the run's duration.
+    http: HttpSessionPool | None = None
 
 
 @dataclasses.dataclass(frozen=True)
@@ -798,6 +803,14 @@ class BasePipelineDriver:
             )
         run_ledger_root = cfg.ledger_root / cfg.checks_run_id
         ensure_dir(run_ledger_root)
+        if not args.no_fetch and http_requests is not None:
+            cfg = dataclasses.replace(
+                cfg,
+                http=HttpSessionPool(
+                    workers=EVIDENCE_FETCH_WORKERS,
+                    user_agent=f"{self.USER_AGENT}/{VERSION}",
+                ),
+            )
         collector = MetricsCollector(self.DOMAIN)
         set_collector(collector)
         run_timer = collector.timer("run_total_ms").start()
@@ -842,6 +855,8 @@ class BasePipelineDriver:
             cleanup_checkpoint(checkpoint_file)
         finally:
             clear_collector()
+            if cfg.http is not None:
+                cfg.http.close()
 
     def classify_targets(
         self,
@@ -46,7 +46,7 @@ from collector_core.exceptions import (
 from collector_core.logging_config import add_logging_args, configure_logging
 from collector_core.utils.hash import sha256_bytes, sha256_file, stable_unit_interval
 from collector_core.utils.http import build_user_agent, http_get_bytes
-from collector_core.utils.io import append_jsonl, write_json
+from collector_core.utils.io import LedgerWriter, encode_jsonl_rows, write_json
 from collector_core.utils.io import read_jsonl_list as read_jsonl
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir, validate_tar_archive
@@ -480,6 +480,8 @@ def run_pmc_worker(
     log_dir = Path(parsed.log_dir).expanduser().resolve()
     ensure_dir(log_dir)
     log_path = log_path_builder(log_dir) if log_path_builder else log_dir / "pmc_worker_log.jsonl"
+    # Keep the run log handle open across articles; closed after the loop (or at exit).
+    run_log = LedgerWriter()
 
     train_idx, valid_idx = 0, 0
     train_buf: list[dict] = []
@@ -495,9 +497,9 @@ def run_pmc_worker(
         if split == "train" and train_buf:
             suffix = f"train_{train_idx:05d}" if parsed.emit_train_split else f"{train_idx:05d}"
             path = train_dir / f"pmc_chunks_{suffix}.jsonl.gz"
-            with gzip.open(path, "wt", encoding="utf-8") as f:
-                for r in train_buf:
-                    f.write(json.dumps(r) + "\n")
+            with gzip.open(path, "wb") as f:
+                for chunk in encode_jsonl_rows(train_buf):
+                    f.write(chunk)
             shard_files["train"].append(
                 {"path": str(path), "rows": len(train_buf), "sha256": sha256_file(path) or ""}
             )
@@ -506,9 +508,9 @@ def run_pmc_worker(
             train_idx += 1
         elif split == "valid" and valid_buf and valid_dir:
             path = valid_dir / f"pmc_chunks_valid_{valid_idx:05d}.jsonl.gz"
-            with gzip.open(path, "wt", encoding="utf-8") as f:
-                for r in valid_buf:
-                    f.write(json.dumps(r) + "\n")
+            with gzip.open(path, "wb") as f:
+                for chunk in encode_jsonl_rows(valid_buf):
+                    f.write(chunk)
             shard_files["valid"].append(
                 {"path": str(path), "rows": len(valid_buf), "sha256": sha256_file(path) or ""}
             )
@@ -532,7 +534,7 @@ def run_pmc_worker(
         event = {"at_utc": utc_now(), "pmcid": pmcid, "file_ref": file_ref}
 
         if not parsed.execute:
-            append_jsonl(log_path, [{**event, "status": "planned"}])
+            run_log.append(log_path, {**event, "status": "planned"})
             processed.add(key)
             state["processed"] = sorted(processed)
             write_json(resume_path, state)
@@ -545,9 +547,7 @@ def run_pmc_worker(
             user_agent_version=version,
         )
         if pkg is None:
-            append_jsonl(
-                log_path, [{**event, "status": meta.get("status", "error"), "meta": meta}]
-            )
+            run_log.append(log_path, {**event, "status": meta.get("status", "error"), "meta": meta})
             processed.add(key)
             state["processed"] = sorted(processed)
             write_json(resume_path, state)
@@ -555,7 +555,7 @@ def run_pmc_worker(
 
         nxml, members = extract_nxml_fn(pkg)
         if nxml is None:
-            append_jsonl(log_path, [{**event, "status": "no_nxml", "members": members[:20]}])
+            run_log.append(log_path, {**event, "status": "no_nxml", "members": members[:20]})
             processed.add(key)
             state["processed"] = sorted(processed)
             write_json(resume_path, state)
@@ -608,9 +608,9 @@ def run_pmc_worker(
                 flush("valid")
 
         successful += 1
-        append_jsonl(
+        run_log.append(
             log_path,
-            [{**event, "status": "ok", "chunks": len(chunks), "cached": meta.get("cached", False)}],
+            {**event, "status": "ok", "chunks": len(chunks), "cached": meta.get("cached", False)},
         )
         processed.add(key)
         state["processed"] = sorted(processed)
@@ -622,6 +622,7 @@ def run_pmc_worker(
     flush("train")
     if parsed.emit_train_split:
         flush("valid")
+    run_log.close()
 
     index = {
         "created_at_utc": utc_now(),
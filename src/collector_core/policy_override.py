@@ -9,14 +9,13 @@ Issue 4.4 (v3.0): Overrides are:
 
 from __future__ import annotations
 
-import json
 from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 from collector_core.stability import stable_api
-from collector_core.utils.io import append_jsonl, read_jsonl
+from collector_core.utils.io import append_jsonl, read_jsonl, write_jsonl
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir
 
@@ -216,12 +215,7 @@ def load_override_registry(path: Path) -> OverrideRegistry:
 @stable_api
 def save_override_registry(registry: OverrideRegistry, path: Path) -> None:
     """Save override registry to a JSONL file atomically."""
-    ensure_dir(path.parent)
-    tmp_path = path.with_suffix(".tmp")
-    with tmp_path.open("w", encoding="utf-8") as f:
-        for override in registry.overrides:
-            f.write(json.dumps(override.to_dict()) + "\n")
-    tmp_path.replace(path)
+    write_jsonl(path, (override.to_dict() for override in registry.overrides))
 
 
 @stable_api
@@ -0,0 +1,314 @@
+"""Offset index sidecars for JSONL shards.
+
+Shard writers start a new gzip member (or zstd frame) every ``records_per_block``
+records, so every block can be decompressed on its own. Once the shard is in
+place they write ``<stem>.index.json`` next to it with the record count, the
+file offset of every block, and the min/max ``content_sha256``. Readers use it
+to count records without decompressing, to seek to record ``k`` by decoding at
+most one block, and to split a shard into block-aligned record ranges.
+
+An index whose ``shard_bytes`` no longer matches the shard file is stale and is
+ignored, so anything that rewrites a shard without updating its index only
+loses the fast paths.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import io
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import zstandard as zstd
+
+from collector_core.stability import stable_api
+from collector_core.utils.io import (
+    ZstdSettings,
+    decode_jsonl_line,
+    get_zstd_settings,
+    read_json,
+    write_json,
+)
+
+SHARD_INDEX_SUFFIX = ".index.json"
+SHARD_INDEX_VERSION = 1
+# Records per independently decodable block; 0 disables indexing.
+SHARD_INDEX_EVERY = 1000
+
+
+@stable_api
+def shard_index_path(shard_path: Path) -> Path:
+    """``shards/combined_00000.jsonl.gz`` -> ``shards/combined_00000.index.json``."""
+    stem = shard_path.name.split(".", 1)[0]
+    return shard_path.with_name(stem + SHARD_INDEX_SUFFIX)
+
+
+@stable_api
+@dataclasses.dataclass(frozen=True)
+class ShardIndex:
+    """Record count, block offsets and content-hash range of one JSONL shard.
+
+    Block ``b`` holds records ``[b * records_per_block, (b + 1) * records_per_block)``
+    and starts at byte ``block_offsets[b]`` of the shard file.
+    """
+
+    shard: str
+    compression: str
+    records: int
+    records_per_block: int
+    block_offsets: list[int]
+    shard_bytes: int
+    uncompressed_bytes: int
+    min_content_sha256: str | None = None
+    max_content_sha256: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"version": SHARD_INDEX_VERSION, **dataclasses.asdict(self)}
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> ShardIndex:
+        fields = {field.name for field in dataclasses.fields(cls)}
+        return cls(**{key: value for key, value in payload.items() if key in fields})
+
+    def block_of(self, record: int) -> int:
+        if not 0 <= record < self.records:
+            raise IndexError(f"record {record} out of range for {self.records} records")
+        return record // self.records_per_block
+
+    def block_span(self, block: int) -> tuple[int, int]:
+        """``(start, end)`` byte range of ``block`` in the shard file."""
+        end = (
+            self.block_offsets[block + 1]
+            if block + 1 < len(self.block_offsets)
+            else self.shard_bytes
+        )
+        return self.block_offsets[block], end
+
+    def splits(self, parts: int) -> list[tuple[int, int]]:
+        """Split the records into up to ``parts`` block-aligned ``(start, stop)`` ranges."""
+        blocks = len(self.block_offsets)
+        parts = max(min(parts, blocks), 1)
+        bounds = [blocks * part // parts for part in range(parts + 1)]
+        return [
+            (
+                bounds[part] * self.records_per_block,
+                min(bounds[part + 1] * self.records_per_block, self.records),
+            )
+            for part in range(parts)
+            if bounds[part] < bounds[part + 1]
+        ]
+
+
+class ShardIndexBuilder:
+    """Tracks the records, block boundaries and hash range of a shard being written.
+
+    ``add`` returns True when the record just added completed a block, i.e. when
+    the writer must end the current gzip member / zstd frame.
+    """
+
+    def __init__(self, records_per_block: int = SHARD_INDEX_EVERY) -> None:
+        self.records_per_block = max(int(records_per_block), 1)
+        self.records = 0
+        self.min_hash: str | None = None
+        self.max_hash: str | None = None
+
+    def add(self, content_hash: Any = None) -> bool:
+        self.records += 1
+        if isinstance(content_hash, str) and content_hash:
+            if self.min_hash is None or content_hash < self.min_hash:
+                self.min_hash = content_hash
+            if self.max_hash is None or content_hash > self.max_hash:
+                self.max_hash = content_hash
+        return self.records % self.records_per_block == 0
+
+    def build(
+        self,
+        shard_path: Path,
+        compression: str,
+        block_offsets: list[int],
+        uncompressed_bytes: int,
+    ) -> ShardIndex:
+        return ShardIndex(
+            shard=shard_path.name,
+            compression=compression,
+            records=self.records,
+            records_per_block=self.records_per_block,
+            block_offsets=block_offsets,
+            shard_bytes=shard_path.stat().st_size,
+            uncompressed_bytes=uncompressed_bytes,
+            min_content_sha256=self.min_hash,
+            max_content_sha256=self.max_hash,
+        )
+
+
+class BlockStream:
+    """Compressed output over an open binary file that can restart at block boundaries.
+
+    ``end_block`` finishes the current gzip member / zstd frame; the next write
+    starts a new one at the offset recorded in ``block_offsets``. Empty blocks
+    are never recorded. zstd blocks use ``zstd_settings`` (default: the
+    process-wide :class:`ZstdSettings`).
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        compression: str,
+        *,
+        name: str = "",
+        zstd_settings: ZstdSettings | None = None,
+    ) -> None:
+        self.file = file
+        self.compression = "zstd" if compression in ("zstd", "zst") else compression
+        self.name = name
+        self.block_offsets: list[int] = []
+        self.uncompressed_bytes = 0
+        self._stream: Any = None
+        self._compressor = (
+            (zstd_settings or get_zstd_settings()).compressor()
+            if self.compression == "zstd"
+            else None
+        )
+
+    def write(self, data: bytes) -> None:
+        if not data:
+            return
+        if self._stream is None:
+            self.block_offsets.append(self.file.tell())
+            if self.compression == "gzip":
+                self._stream = gzip.GzipFile(filename=self.name, mode="wb", fileobj=self.file)
+            elif self._compressor is not None:
+                self._stream = self._compressor.stream_writer(self.file, closefd=False)
+            else:
+                self._stream = self.file
+        self._stream.write(data)
+        self.uncompressed_bytes += len(data)
+
+    def end_block(self) -> None:
+        if self._stream is None:
+            return
+        if self._stream is not self.file:
+            self._stream.close()
+        self._stream = None
+
+    def close(self) -> None:
+        self.end_block()
+
+
+@stable_api
+def write_shard_index(shard_path: Path, index: ShardIndex) -> Path:
+    path = shard_index_path(shard_path)
+    write_json(path, index.to_dict())
+    return path
+
+
+@stable_api
+def load_shard_index(shard_path: Path) -> ShardIndex | None:
+    """The shard's index, or None when it is missing, unreadable or stale."""
+    path = shard_index_path(shard_path)
+    try:
+        payload = read_json(path)
+        index = ShardIndex.from_dict(payload)
+        current_bytes = shard_path.stat().st_size
+    except (OSError, ValueError, TypeError):
+        return None
+    if (
+        payload.get("version") != SHARD_INDEX_VERSION
+        or index.shard != shard_path.name
+        or index.shard_bytes != current_bytes
+    ):
+        return None
+    return index
+
+
+@stable_api
+def count_shard_records(shard_path: Path) -> int | None:
+    """Exact record count from the shard's index, or None without a valid index."""
+    index = load_shard_index(shard_path)
+    return index.records if index is not None else None
+
+
+def decompress_block(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression in ("zstd", "zst"):
+        return zstd.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+def compress_block(
+    data: bytes, compression: str, *, zstd_settings: ZstdSettings | None = None
+) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data)
+    if compression in ("zstd", "zst"):
+        return (zstd_settings or get_zstd_settings()).compressor(threads=0).compress(data)
+    return data
+
+
+def _open_at(shard_path: Path, offset: int, compression: str) -> Any:
+    handle = shard_path.open("rb")
+    handle.seek(offset)
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=handle, mode="rb"), handle
+    if compression in ("zstd", "zst"):
+        reader = zstd.ZstdDecompressor().stream_reader(handle, read_across_frames=True)
+        return io.BufferedReader(reader), handle
+    return handle, handle
+
+
+@stable_api
+def iter_shard_range(
+    shard_path: Path,
+    start: int = 0,
+    stop: int | None = None,
+    *,
+    index: ShardIndex | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Records ``[start, stop)`` of an indexed shard, decoding from the block holding ``start``.
+
+    Raises ``FileNotFoundError`` when the shard has no valid index.
+    """
+    index = index or load_shard_index(shard_path)
+    if index is None:
+        raise FileNotFoundError(f"No valid shard index for {shard_path}")
+    stop = index.records if stop is None else min(stop, index.records)
+    if start >= stop:
+        return
+    block = index.block_of(start)
+    position = block * index.records_per_block
+    stream, handle = _open_at(shard_path, index.block_offsets[block], index.compression)
+    try:
+        for line in stream:
+            if position >= start:
+                yield decode_jsonl_line(line.strip())
+            position += 1
+            if position >= stop:
+                return
+    finally:
+        stream.close()
+        handle.close()
+
+
+@stable_api
+def read_shard_record(
+    shard_path: Path, record: int, *, index: ShardIndex | None = None
+) -> dict[str, Any]:
+    """Record number ``record`` (0-based) of an indexed shard."""
+    index = index or load_shard_index(shard_path)
+    if index is None:
+        raise FileNotFoundError(f"No valid shard index for {shard_path}")
+    index.block_of(record)
+    return next(iter_shard_range(shard_path, record, record + 1, index=index))
+
+
+@stable_api
+def iter_shard_blocks(shard_path: Path, index: ShardIndex) -> Iterator[bytes]:
+    """Raw (still compressed) bytes of each block, in order."""
+    with shard_path.open("rb") as handle:
+        for block in range(len(index.block_offsets)):
+            start, end = index.block_span(block)
+            handle.seek(start)
+            yield handle.read(end - start)
@@ -7,6 +7,7 @@ Features:
 - Deterministic shard assignment based on target_id hash (stable across runs)
 - Stage resumption tracking via completion markers
 - Atomic shard writing (write to .tmp then rename)
+- Streaming, size-bounded shard rotation with background compression
 - Parallel worker coordination via file locking
 """
 
@@ -18,13 +19,22 @@ import hashlib
 import json
 import logging
 import os
+import queue
+import threading
 import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+from collector_core.shard_index import (
+    SHARD_INDEX_EVERY,
+    BlockStream,
+    ShardIndexBuilder,
+    write_shard_index,
+)
 from collector_core.stability import stable_api
+from collector_core.utils.io import ZstdSettings, json_dumps
 from collector_core.utils.paths import ensure_dir
 
 logger = logging.getLogger("collector_core.sharding")
@@ -41,6 +51,12 @@ DEFAULT_LOCK_TIMEOUT = 300.0
 # Temporary file suffix for atomic writes
 TMP_SUFFIX = ".tmp"
 
+# Serialized bytes handed to the StreamingShardWriter compression thread at a time
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+# Chunks queued ahead of the compression thread before the producer waits
+STREAM_MAX_PENDING_CHUNKS = 16
+
 
 @stable_api
 @dataclasses.dataclass(frozen=True)
@@ -350,12 +366,13 @@ class AtomicShardWriter:
 
     Writes to a temporary file first, then atomically renames to the
     final destination. This prevents partial/corrupted shards from
-    interruptions.
+    interruptions. Like ``StreamingShardWriter`` it starts a new gzip member /
+    zstd frame every ``index_every`` records and writes a shard index sidecar.
 
     Example:
         with AtomicShardWriter(shard_path) as writer:
             for record in records:
-                writer.write_line(json.dumps(record))
+                writer.write_record(record)
         # File is atomically moved to shard_path on successful exit
     """
 
@@ -364,6 +381,8 @@ class AtomicShardWriter:
         shard_path: Path,
         compression: str = "none",
         auto_complete: bool = True,
+        index_every: int = SHARD_INDEX_EVERY,
+        zstd_settings: ZstdSettings | None = None,
     ) -> None:
         """Initialize the atomic shard writer.
 
@@ -371,13 +390,19 @@ class AtomicShardWriter:
             shard_path: Final path for the shard file.
             compression: Compression type ('none', 'gzip', 'zstd').
             auto_complete: If True, mark shard complete after successful write.
+            index_every: Records per indexed block; 0 writes no shard index.
+            zstd_settings: zstd level/threads/long-distance matching (default:
+                the process-wide settings).
         """
         self.shard_path = shard_path
         self.tmp_path = get_tmp_path(shard_path)
         self.compression = compression
         self.auto_complete = auto_complete
+        self.index_every = max(int(index_every), 0)
+        self.zstd_settings = zstd_settings
         self._file: Any = None
-        self._wrapper: Any = None
+        self._wrapper: BlockStream | None = None
+        self._index: ShardIndexBuilder | None = None
         self._record_count = 0
         self._bytes_written = 0
 
@@ -388,19 +413,14 @@ class AtomicShardWriter:
         if self.tmp_path.exists():
             self.tmp_path.unlink()
 
-        if self.compression == "gzip":
-            import gzip
-
-            self._file = gzip.open(self.tmp_path, "wt", encoding="utf-8")
-        elif self.compression in ("zstd", "zst"):
-
-            import zstandard as zstd
-
-            self._file = self.tmp_path.open("wb")
-            self._wrapper = zstd.ZstdCompressor().stream_writer(self._file)
-        else:
-            self._file = self.tmp_path.open("w", encoding="utf-8")
-
+        self._file = self.tmp_path.open("wb")
+        self._wrapper = BlockStream(
+            self._file,
+            self.compression,
+            name=self.shard_path.name,
+            zstd_settings=self.zstd_settings,
+        )
+        self._index = ShardIndexBuilder(self.index_every) if self.index_every else None
         return self
 
     def write_line(self, line: str) -> None:
@@ -409,16 +429,15 @@ class AtomicShardWriter:
         Args:
             line: Line to write (newline will be added).
         """
-        content = line + "\n"
-        if self._wrapper is not None:
-            # zstd compression
-            encoded = content.encode("utf-8")
-            self._wrapper.write(encoded)
-            self._bytes_written += len(encoded)
-        else:
-            self._file.write(content)
-            self._bytes_written += len(content.encode("utf-8"))
+        self._write((line + "\n").encode("utf-8"))
+
+    def _write(self, encoded: bytes, content_hash: Any = None) -> None:
+        assert self._wrapper is not None
+        self._wrapper.write(encoded)
+        self._bytes_written += len(encoded)
         self._record_count += 1
+        if self._index is not None and self._index.add(content_hash):
+            self._wrapper.end_block()
 
     def write_record(self, record: dict[str, Any]) -> None:
         """Write a JSON record to the shard.
@@ -426,7 +445,7 @@ class AtomicShardWriter:
         Args:
             record: Dictionary to serialize as JSON and write.
         """
-        self.write_line(json.dumps(record, ensure_ascii=False))
+        self._write(json_dumps(record) + b"\n", record.get("content_sha256"))
 
     @property
     def record_count(self) -> int:
@@ -437,7 +456,6 @@ class AtomicShardWriter:
         try:
             # P1.3A: Flush and fsync before atomic rename
             if self._wrapper is not None:
-                self._wrapper.flush()
                 self._wrapper.close()
             if self._file is not None:
                 self._file.flush()
@@ -451,6 +469,16 @@ class AtomicShardWriter:
         if exc_type is None:
             # Success - atomically move temp to final
             self.tmp_path.replace(self.shard_path)
+            if self._index is not None and self._wrapper is not None:
+                write_shard_index(
+                    self.shard_path,
+                    self._index.build(
+                        self.shard_path,
+                        self._wrapper.compression,
+                        self._wrapper.block_offsets,
+                        self._wrapper.uncompressed_bytes,
+                    ),
+                )
             logger.debug(
                 "Atomically wrote shard: %s (%d records)",
                 self.shard_path,
@@ -475,6 +503,256 @@ class AtomicShardWriter:
             )
 
 
+class _ShardSink:
+    """Compressed output stream for one shard, written to ``.tmp`` then renamed."""
+
+    def __init__(
+        self, shard_path: Path, compression: str, zstd_settings: ZstdSettings | None = None
+    ) -> None:
+        ensure_dir(shard_path.parent)
+        self.shard_path = shard_path
+        self.tmp_path = get_tmp_path(shard_path)
+        self._file: Any = self.tmp_path.open("wb")
+        self._stream = BlockStream(
+            self._file, compression, name=shard_path.name, zstd_settings=zstd_settings
+        )
+
+    def write(self, data: bytes) -> None:
+        self._stream.write(data)
+
+    def end_block(self) -> None:
+        self._stream.end_block()
+
+    def close(self, index: ShardIndexBuilder | None = None) -> None:
+        self._stream.close()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self.tmp_path.replace(self.shard_path)
+        if index is not None:
+            write_shard_index(
+                self.shard_path,
+                index.build(
+                    self.shard_path,
+                    self._stream.compression,
+                    self._stream.block_offsets,
+                    self._stream.uncompressed_bytes,
+                ),
+            )
+
+    def abort(self) -> None:
+        try:
+            self._stream.close()
+            self._file.close()
+        except (OSError, ValueError):
+            logger.warning("Error closing shard file: %s", self.tmp_path)
+        self.tmp_path.unlink(missing_ok=True)
+
+
+@stable_api
+class StreamingShardWriter:
+    """Rotating JSONL shard writer that streams rows into an open compressed file.
+
+    Rows are serialized on the caller's thread and handed to a background thread in
+    ``chunk_bytes`` chunks; that thread owns the gzip/zstd stream, so compression
+    overlaps with producing the next rows and no shard is ever held in memory. A
+    shard is closed (its ``.tmp`` file renamed into place) once it holds
+    ``max_records`` rows or ``max_bytes`` uncompressed bytes, whichever comes first.
+    Unless ``index_every`` is 0, every ``index_every`` rows start a new gzip member
+    / zstd frame and each finished shard gets a ``collector_core.shard_index``
+    sidecar. zstd shards use ``zstd_settings`` (default: the process-wide
+    ``collector_core.utils.io.ZstdSettings``).
+
+    Example:
+        writer = StreamingShardWriter(out_dir, prefix="combined", compression="gzip")
+        for record in records:
+            closed = writer.write(record)  # path of a shard finished by this row
+        writer.close()
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        *,
+        prefix: str,
+        compression: str = "none",
+        max_records: int = 50_000,
+        max_bytes: int | None = None,
+        shard_index: int = 0,
+        background: bool = True,
+        chunk_bytes: int = STREAM_CHUNK_BYTES,
+        max_pending_chunks: int = STREAM_MAX_PENDING_CHUNKS,
+        index_every: int = SHARD_INDEX_EVERY,
+        zstd_settings: ZstdSettings | None = None,
+    ) -> None:
+        self.base_dir = base_dir
+        self.prefix = prefix
+        self.compression = compression
+        self.max_records = max(max_records, 1)
+        self.max_bytes = max_bytes if max_bytes and max_bytes > 0 else None
+        self.shard_index = shard_index
+        self.background = background
+        self.chunk_bytes = chunk_bytes
+        self.max_pending_chunks = max_pending_chunks
+        self.index_every = max(int(index_every), 0)
+        self.zstd_settings = zstd_settings
+        self.records = 0
+        self.bytes = 0
+        self._chunk: list[bytes] = []
+        self._chunk_size = 0
+        self._sink: _ShardSink | None = None
+        self._index: ShardIndexBuilder | None = None
+        self._queue: queue.Queue[tuple[str, Any]] | None = None
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+        self._path_index = -1
+        self._path = base_dir
+
+    @property
+    def current_path(self) -> Path:
+        """Path of the shard the next row is written to."""
+        if self._path_index != self.shard_index:
+            self._path = self.base_dir / get_shard_filename(
+                self.shard_index, self.prefix, compression=self.compression
+            )
+            self._path_index = self.shard_index
+        return self._path
+
+    def write(self, row: dict[str, Any]) -> Path | None:
+        """Append one row; return the shard path if this row completed a shard."""
+        data = json_dumps(row) + b"\n"
+        if self.records == 0:
+            self._submit("open", self.current_path)
+            self._index = ShardIndexBuilder(self.index_every) if self.index_every else None
+        self._chunk.append(data)
+        self._chunk_size += len(data)
+        self.records += 1
+        self.bytes += len(data)
+        if self._index is not None and self._index.add(row.get("content_sha256")):
+            self._flush_chunk()
+            self._submit("block", None)
+        elif self._chunk_size >= self.chunk_bytes:
+            self._flush_chunk()
+        if self.records >= self.max_records or (
+            self.max_bytes is not None and self.bytes >= self.max_bytes
+        ):
+            return self._finish_shard()
+        return None
+
+    def flush(self) -> Path | None:
+        """Close the open shard (if any rows) and wait until every shard is on disk."""
+        path = self._finish_shard() if self.records else None
+        self._drain()
+        return path
+
+    def close(self) -> Path | None:
+        """``flush`` and stop the background thread; later writes restart it."""
+        try:
+            return self.flush()
+        finally:
+            self._stop()
+
+    def abort(self) -> None:
+        """Drop the open shard's ``.tmp`` file and stop; finished shards are kept."""
+        self._chunk, self._chunk_size = [], 0
+        self._index = None
+        if self.records:
+            self.records = 0
+            self.bytes = 0
+            self._submit("abort", None, check=False)
+        self._stop()
+
+    def __enter__(self) -> StreamingShardWriter:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _finish_shard(self) -> Path:
+        path = self.current_path
+        self._flush_chunk()
+        index, self._index = self._index, None
+        self._submit("close", index)
+        self.records = 0
+        self.bytes = 0
+        self.shard_index += 1
+        return path
+
+    def _flush_chunk(self) -> None:
+        if self._chunk:
+            data, self._chunk, self._chunk_size = b"".join(self._chunk), [], 0
+            self._submit("write", data)
+
+    def _submit(self, op: str, arg: Any, *, check: bool = True) -> None:
+        if check:
+            self._raise_error()
+        if not self.background:
+            self._apply(op, arg)
+            return
+        if self._thread is None:
+            self._queue = queue.Queue(maxsize=self.max_pending_chunks)
+            self._thread = threading.Thread(
+                target=self._run, name=f"shard-writer-{self.prefix}", daemon=True
+            )
+            self._thread.start()
+        assert self._queue is not None
+        self._queue.put((op, arg))
+
+    def _apply(self, op: str, arg: Any) -> None:
+        if op == "open":
+            self._sink = _ShardSink(arg, self.compression, self.zstd_settings)
+        elif op == "write":
+            assert self._sink is not None
+            self._sink.write(arg)
+        elif op == "block":
+            assert self._sink is not None
+            self._sink.end_block()
+        elif op == "close":
+            assert self._sink is not None
+            sink, self._sink = self._sink, None
+            sink.close(arg)
+        elif op == "abort" and self._sink is not None:
+            sink, self._sink = self._sink, None
+            sink.abort()
+
+    def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            op, arg = self._queue.get()
+            try:
+                if op == "stop":
+                    return
+                if self._error is None or op == "abort":
+                    self._apply(op, arg)
+            except BaseException as exc:  # re-raised on the producer thread
+                self._error = exc
+                if self._sink is not None:
+                    self._sink.abort()
+                    self._sink = None
+            finally:
+                self._queue.task_done()
+
+    def _drain(self) -> None:
+        if self._queue is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def _stop(self) -> None:
+        if self._thread is not None and self._queue is not None:
+            self._queue.put(("stop", None))
+            self._thread.join()
+        self._thread = None
+        self._queue = None
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
 @stable_api
 @dataclasses.dataclass
 class ShardState:
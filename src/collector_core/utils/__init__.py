@@ -1,6 +1,7 @@
 """Shared utility functions for the Dataset Collector."""
 
 from collector_core.utils.hash import (
+    HashingSink,
     sha256_bytes,
     sha256_file,
     sha256_text,
@@ -8,6 +9,7 @@ from collector_core.utils.hash import (
     stable_unit_interval,
 )
 from collector_core.utils.io import (
+    LedgerWriter,
     append_jsonl,
     read_json,
     read_jsonl,
@@ -46,6 +48,7 @@ __all__ = [
     "sha256_bytes",
     "sha256_text",
     "sha256_file",
+    "HashingSink",
     "stable_json_hash",
     "stable_unit_interval",
     "normalize_whitespace",
@@ -59,6 +62,7 @@ __all__ = [
     "write_jsonl",
     "write_jsonl_gz",
     "append_jsonl",
+    "LedgerWriter",
     "safe_filename",
     "validate_tar_archive",
     "validate_zip_archive",
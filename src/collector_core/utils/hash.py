@@ -4,11 +4,15 @@ import hashlib
 import json
 import logging
 import re
+from collections.abc import Iterable
 from pathlib import Path
+from types import TracebackType
 from typing import Any
 
 logger = logging.getLogger("collector_core.utils")
 
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 def sha256_bytes(data: bytes) -> str:
     """Compute SHA-256 hash of bytes."""
@@ -57,6 +61,86 @@ def md5_file(path: Path) -> str | None:
         return None
 
 
+def file_hexdigests(path: Path, algorithms: Iterable[str] = ()) -> dict[str, str]:
+    """SHA-256 and any other ``hashlib`` digests of a file, in one read."""
+    hashes = {
+        name: hashlib.new(name)
+        for name in dict.fromkeys(["sha256", *(name.lower() for name in algorithms)])
+    }
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            for h in hashes.values():
+                h.update(chunk)
+    return {name: h.hexdigest() for name, h in hashes.items()}
+
+
+class HashingSink:
+    """Binary file writer that hashes bytes as they are written.
+
+    Always computes SHA-256, plus any other ``hashlib`` algorithms in
+    ``algorithms`` (e.g. ``"md5"``). Opening in append mode (``"ab"``) first
+    hashes the bytes already in the file, so a resumed download is hashed by
+    reading back only its existing prefix instead of the whole file.
+
+    Example:
+        with HashingSink(temp_path, "ab", algorithms=("md5",)) as sink:
+            for chunk in response.iter_content(HASH_CHUNK_SIZE):
+                sink.write(chunk)
+        sha256, md5 = sink.hexdigest(), sink.hexdigest("md5")
+    """
+
+    def __init__(self, path: Path, mode: str = "wb", algorithms: Iterable[str] = ()) -> None:
+        if mode not in {"wb", "ab"}:
+            raise ValueError(f"HashingSink mode must be 'wb' or 'ab', got {mode!r}")
+        names = dict.fromkeys(["sha256", *(name.lower() for name in algorithms)])
+        self.path = path
+        self._hashes = {name: hashlib.new(name) for name in names}
+        self.prefix_bytes = 0
+        self.bytes_written = 0
+        if mode == "ab" and path.exists():
+            with path.open("rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    self._update(chunk)
+                    self.prefix_bytes += len(chunk)
+        self._file = path.open(mode)
+
+    def _update(self, chunk: bytes) -> None:
+        for h in self._hashes.values():
+            h.update(chunk)
+
+    def write(self, chunk: bytes) -> int:
+        """Write ``chunk`` to the file and feed it to every digest."""
+        written = self._file.write(chunk)
+        self._update(chunk)
+        self.bytes_written += written
+        return written
+
+    @property
+    def size(self) -> int:
+        """Total bytes covered by the digests (existing prefix plus writes)."""
+        return self.prefix_bytes + self.bytes_written
+
+    def hexdigest(self, name: str = "sha256") -> str:
+        return self._hashes[name.lower()].hexdigest()
+
+    def hexdigests(self) -> dict[str, str]:
+        return {name: h.hexdigest() for name, h in self._hashes.items()}
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> HashingSink:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
 def stable_json_hash(value: Any) -> str:
     """Compute a stable SHA-256 hash for JSON-serializable values."""
     payload = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
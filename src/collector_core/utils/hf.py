@@ -0,0 +1,52 @@
+"""Batched row readers for HuggingFace ``load_from_disk`` datasets.
+
+Iterating a ``Dataset`` directly formats one row at a time. These helpers read
+``batch_size`` rows per Arrow slice from the memory-mapped table, decode them
+with one columnar conversion and hand out plain row dicts, so memory stays
+bounded by a single batch regardless of dataset size.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from datasets import Dataset, DatasetDict
+
+from collector_core.stability import stable_api
+
+HF_BATCH_SIZE = 1000
+
+
+@stable_api
+def iter_dataset_splits(
+    dataset_obj: Dataset | DatasetDict, *, sort: bool = True
+) -> Iterator[tuple[str, Dataset]]:
+    """Yield ``(split_name, dataset)``; a bare ``Dataset`` is reported as ``train``."""
+    if isinstance(dataset_obj, DatasetDict):
+        names = sorted(dataset_obj.keys()) if sort else list(dataset_obj.keys())
+        for split_name in names:
+            yield split_name, dataset_obj[split_name]
+    else:
+        yield "train", dataset_obj
+
+
+@stable_api
+def iter_dataset_batches(
+    dataset: Dataset, *, batch_size: int = HF_BATCH_SIZE
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield lists of row dicts, decoding ``batch_size`` rows per Arrow slice."""
+    for columns in dataset.iter(batch_size=max(batch_size, 1)):
+        names = list(columns)
+        yield [
+            dict(zip(names, values, strict=True)) for values in zip(*columns.values(), strict=True)
+        ]
+
+
+@stable_api
+def iter_dataset_rows(
+    dataset: Dataset, *, batch_size: int = HF_BATCH_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Row-at-a-time view over :func:`iter_dataset_batches`; each row is a fresh dict."""
+    for batch in iter_dataset_batches(dataset, batch_size=batch_size):
+        yield from batch
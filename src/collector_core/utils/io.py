@@ -1,18 +1,348 @@
+"""File I/O helpers: JSON/JSONL/YAML readers and writers plus buffered ledgers.
+
+JSONL rows go through one pluggable :class:`JsonCodec` that works on bytes:
+``orjson`` when importable, else ``msgspec``, else the stdlib ``json`` module
+(``COLLECTOR_JSON_CODEC`` or :func:`set_json_codec` pick one explicitly).
+orjson and msgspec write compact rows (no space after ``:`` or ``,``); the
+stdlib codec writes exactly what ``json.dumps(row, ensure_ascii=False)`` did, so
+``COLLECTOR_JSON_CODEC=stdlib`` reproduces earlier outputs byte for byte.
+Content identities (``stable_json_hash`` and text extraction) never go through
+the codec.
+
+``.zst`` files are written with the process-wide :class:`ZstdSettings` (level,
+long-distance matching, and a trained dictionary when the target directory
+has one; see :func:`train_zstd_dictionary`).
+"""
+
 from __future__ import annotations
 
+import atexit
+import contextlib
+import functools
 import gzip
 import io
+import itertools
 import json
+import logging
 import os
-from collections.abc import Iterable, Iterator
+import queue
+import signal
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import zstandard as zstd
 
+try:
+    from isal import igzip, igzip_threaded
+except ImportError:  # pragma: no cover - optional fast gzip
+    igzip = igzip_threaded = None
+
 from collector_core.config_validator import read_yaml as read_yaml_config
 from collector_core.utils.paths import ensure_dir
 
+logger = logging.getLogger("collector_core.utils")
+
+JSON_CODECS = ("orjson", "msgspec", "stdlib")
+JSON_CODEC_ENV = "COLLECTOR_JSON_CODEC"
+# Encoded rows are joined into writes of about this many bytes.
+JSONL_WRITE_CHUNK_BYTES = 1 << 20
+# Decompressed bytes split and decoded at a time by read_jsonl_batches.
+JSONL_READ_BLOCK_BYTES = 1 << 22
+# Decompress on a read-ahead thread only when another core can run it.
+JSONL_READ_AHEAD = (os.cpu_count() or 1) > 1
+# Blocks decompressed ahead of the decoder on the read-ahead thread.
+JSONL_READ_AHEAD_BLOCKS = 2
+# Records per list yielded by read_jsonl_batches.
+JSONL_READ_BATCH_ROWS = 1000
+# Current trained dictionary of a directory; ``zstd-<dict_id>.dict`` keeps every version.
+ZSTD_DICT_NAME = "zstd.dict"
+ZSTD_DICT_SIZE = 1 << 16
+# Long-distance matching window (128 MiB, the largest decoders accept by default).
+ZSTD_LONG_WINDOW_LOG = 27
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """``dumps(obj) -> bytes`` (UTF-8, no trailing newline) and ``loads(bytes | str)``.
+
+    Fast codecs fall back to the stdlib for values they reject (non-string keys,
+    integers beyond 64 bits, ``NaN`` literals), so they accept everything the
+    stdlib does; ``loads`` errors are always ``json.JSONDecodeError``. Two values
+    differ from the stdlib: they encode non-finite floats as ``null`` and decode
+    integer literals beyond 64 bits as floats.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes | str], Any]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec("stdlib", _stdlib_dumps, json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return _stdlib_dumps(obj)
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    return JsonCodec("orjson", dumps, loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return bytes(encoder.encode(obj))
+        except (TypeError, ValueError, OverflowError):
+            return _stdlib_dumps(obj)
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+    return JsonCodec("msgspec", dumps, loads)
+
+
+_CODEC_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "stdlib": _stdlib_codec,
+}
+_JSON_CODEC: JsonCodec | None = None
+
+
+def resolve_json_codec(name: str | None = None) -> JsonCodec:
+    """Build the codec called ``name``; ``None``/``"auto"`` picks the fastest installed."""
+    name = (name or "auto").lower()
+    if name == "auto":
+        for candidate in JSON_CODECS:
+            try:
+                return _CODEC_FACTORIES[candidate]()
+            except ImportError:
+                continue
+    if name not in _CODEC_FACTORIES:
+        raise ValueError(f"Unknown JSON codec {name!r}; expected auto or one of {JSON_CODECS}")
+    return _CODEC_FACTORIES[name]()
+
+
+def set_json_codec(name: str | None = None) -> JsonCodec:
+    """Switch the process-wide codec used by every JSONL reader and writer."""
+    global _JSON_CODEC
+    _JSON_CODEC = resolve_json_codec(name)
+    return _JSON_CODEC
+
+
+def get_json_codec() -> JsonCodec:
+    """Current codec; the first call honours ``COLLECTOR_JSON_CODEC``."""
+    return _JSON_CODEC or set_json_codec(os.environ.get(JSON_CODEC_ENV))
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` with the current codec."""
+    return get_json_codec().dumps(obj)
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode ``data`` with the current codec."""
+    return get_json_codec().loads(data)
+
+
+def encode_jsonl_rows(rows: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """Newline-terminated encoded rows, joined into chunks of about 1 MiB."""
+    dumps = get_json_codec().dumps
+    chunk: list[bytes] = []
+    size = 0
+    for row in rows:
+        line = dumps(row) + b"\n"
+        chunk.append(line)
+        size += len(line)
+        if size >= JSONL_WRITE_CHUNK_BYTES:
+            yield b"".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield b"".join(chunk)
+
+
+def decode_jsonl_line(line: bytes) -> Any:
+    """Decode one JSONL line; undecodable UTF-8 bytes are dropped before giving up.
+
+    Raises ``ValueError`` (``json.JSONDecodeError``) for malformed JSON.
+    """
+    loads = get_json_codec().loads
+    try:
+        return loads(line)
+    except ValueError:
+        return loads(line.decode("utf-8", errors="ignore"))
+
+
+@dataclass(frozen=True)
+class ZstdSettings:
+    """zstd compression parameters for shards and JSONL files.
+
+    ``threads`` only applies to shard writers (-1: one worker per core, 0:
+    compress on the writing thread); small JSONL appends always compress
+    inline. ``use_dictionary`` compresses new ``.zst`` files with their
+    directory's trained dictionary when there is one.
+    """
+
+    level: int = 3
+    threads: int = -1
+    long_distance: bool = False
+    use_dictionary: bool = True
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any] | None) -> ZstdSettings:
+        payload = payload or {}
+        return cls(
+            level=int(payload.get("level", cls.level)),
+            threads=int(payload.get("threads", cls.threads)),
+            long_distance=bool(payload.get("long_distance", cls.long_distance)),
+            use_dictionary=bool(payload.get("dictionary", cls.use_dictionary)),
+        )
+
+    def compressor(
+        self, *, threads: int | None = None, dict_data: zstd.ZstdCompressionDict | None = None
+    ) -> zstd.ZstdCompressor:
+        params = zstd.ZstdCompressionParameters.from_level(
+            self.level,
+            threads=self.threads if threads is None else threads,
+            enable_ldm=self.long_distance,
+            window_log=ZSTD_LONG_WINDOW_LOG if self.long_distance else 0,
+            # Readers pick the dictionary by the id stored in the frame header.
+            write_dict_id=True,
+        )
+        return zstd.ZstdCompressor(compression_params=params, dict_data=dict_data)
+
+
+_ZSTD_SETTINGS = ZstdSettings()
+# Largest zstd frame header (ZSTD_FRAMEHEADERSIZE_MAX).
+_ZSTD_FRAME_HEADER_MAX = 18
+
+
+def set_zstd_settings(settings: ZstdSettings) -> ZstdSettings:
+    """Switch the process-wide zstd settings used for ``.zst`` JSONL writes."""
+    global _ZSTD_SETTINGS
+    _ZSTD_SETTINGS = settings
+    return settings
+
+
+def get_zstd_settings() -> ZstdSettings:
+    return _ZSTD_SETTINGS
+
+
+def zstd_dictionary_path(directory: Path, dict_id: int | None = None) -> Path:
+    """Current dictionary of ``directory``, or the stored version with ``dict_id``."""
+    return directory / (ZSTD_DICT_NAME if dict_id is None else f"zstd-{dict_id}.dict")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_zstd_dictionary(path: Path, mtime_ns: int, level: int | None) -> zstd.ZstdCompressionDict:
+    dict_data = zstd.ZstdCompressionDict(path.read_bytes())
+    if level is not None:
+        # Digest once; every single-row append would otherwise redo it.
+        dict_data.precompute_compress(level=level)
+    return dict_data
+
+
+def load_zstd_dictionary(
+    path: Path, *, level: int | None = None
+) -> zstd.ZstdCompressionDict | None:
+    """Cached dictionary at ``path`` (None if missing), precomputed for ``level`` when given."""
+    try:
+        return _load_zstd_dictionary(path, path.stat().st_mtime_ns, level)
+    except FileNotFoundError:
+        return None
+
+
+def train_zstd_dictionary(
+    samples: Iterable[bytes], directory: Path, *, size: int = ZSTD_DICT_SIZE
+) -> Path:
+    """Train a dictionary on ``samples`` and make it ``directory``'s current one.
+
+    The dictionary is stored as ``zstd-<dict_id>.dict`` (kept for reading files
+    compressed with it) and copied to ``zstd.dict``, which new ``.zst`` files in
+    ``directory`` are compressed with. Raises ``zstd.ZstdError`` when the
+    samples are too few to train on.
+    """
+    trained = zstd.train_dictionary(size, list(samples))
+    ensure_dir(directory)
+    data = trained.as_bytes()
+    for path in (
+        zstd_dictionary_path(directory, trained.dict_id()),
+        zstd_dictionary_path(directory),
+    ):
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    return zstd_dictionary_path(directory, trained.dict_id())
+
+
+def _zstd_frame_dict_id(path: Path) -> int | None:
+    """Dictionary id of the first frame of ``path`` (0: none), or None for an empty file."""
+    try:
+        with path.open("rb") as handle:
+            header = handle.read(_ZSTD_FRAME_HEADER_MAX)
+    except FileNotFoundError:
+        return None
+    if not header:
+        return None
+    try:
+        return zstd.get_frame_parameters(header).dict_id
+    except zstd.ZstdError as e:
+        raise OSError(f"Failed to open zstd file {path}: {e}") from e
+
+
+def _zstd_decompressor(path: Path) -> zstd.ZstdDecompressor:
+    """Decompressor for ``path`` with the dictionary its frames were written with."""
+    dict_id = _zstd_frame_dict_id(path)
+    if not dict_id:
+        return zstd.ZstdDecompressor()
+    dict_data = load_zstd_dictionary(zstd_dictionary_path(path.parent, dict_id))
+    if dict_data is None:
+        raise OSError(f"Failed to open zstd file {path}: dictionary {dict_id} not found")
+    return zstd.ZstdDecompressor(dict_data=dict_data)
+
+
+def _zstd_write_dictionary(path: Path, mode: str) -> zstd.ZstdCompressionDict | None:
+    """Dictionary for writing ``path``: appends keep the one the file started with."""
+    if not _ZSTD_SETTINGS.use_dictionary:
+        return None
+    level = _ZSTD_SETTINGS.level
+    if "a" in mode:
+        dict_id = _zstd_frame_dict_id(path)
+        if dict_id is not None:
+            if not dict_id:
+                return None
+            return load_zstd_dictionary(zstd_dictionary_path(path.parent, dict_id), level=level)
+    return load_zstd_dictionary(zstd_dictionary_path(path.parent), level=level)
+
 
 def read_yaml(path: Path, *, schema_name: str | None = None) -> dict[str, Any]:
     """Read and validate YAML config file."""
@@ -21,7 +351,8 @@ def read_yaml(path: Path, *, schema_name: str | None = None) -> dict[str, Any]:
 
 def read_json(path: Path) -> dict[str, Any]:
     """Read JSON file and return as dict."""
-    return json.loads(path.read_text(encoding="utf-8"))
+    data: dict[str, Any] = json_loads(path.read_bytes())
+    return data
 
 
 def write_json(path: Path, obj: dict[str, Any], *, indent: int = 2) -> None:
@@ -36,32 +367,215 @@ def write_json(path: Path, obj: dict[str, Any], *, indent: int = 2) -> None:
     tmp_path.replace(path)
 
 
-def _open_text(path: Path, mode: str) -> io.TextIOBase:
-    if path.suffix == ".gz":
-        return gzip.open(path, mode, encoding="utf-8", errors="ignore")
-    if path.suffix == ".zst":
+def open_binary(path: Path, mode: str, *, suffix: str | None = None) -> Any:
+    """Binary stream over ``path`` (``"rb"``, ``"wb"`` or ``"ab"``), (de)compressing .gz/.zst.
+
+    ``suffix`` overrides ``path.suffix`` when choosing the codec (temp files).
+    """
+    suffix = suffix or path.suffix
+    if suffix == ".gz":
+        return gzip.open(path, mode)
+    if suffix == ".zst":
         # P1.2E: Handle zstd decompression errors
         try:
             if "r" in mode:
-                stream = zstd.ZstdDecompressor().stream_reader(path.open("rb"))
-                return io.TextIOWrapper(stream, encoding="utf-8", errors="ignore")
-            stream = zstd.ZstdCompressor().stream_writer(path.open("wb"))
-            return io.TextIOWrapper(stream, encoding="utf-8")
+                reader = _zstd_decompressor(path).stream_reader(path.open("rb"))
+                return io.BufferedReader(reader)
+            compressor = _ZSTD_SETTINGS.compressor(
+                threads=0, dict_data=_zstd_write_dictionary(path, mode)
+            )
+            return compressor.stream_writer(path.open(mode))
+        except zstd.ZstdError as e:
+            raise OSError(f"Failed to open zstd file {path}: {e}") from e
+    return open(path, mode)
+
+
+@dataclass
+class JsonlReadStats:
+    """Counts accumulated by :func:`read_jsonl` across one or more files."""
+
+    files: int = 0
+    records: int = 0
+    malformed: int = 0
+    bytes_read: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "files": self.files,
+            "records": self.records,
+            "malformed_lines": self.malformed,
+            "bytes_read": self.bytes_read,
+        }
+
+
+def _open_decompressed(path: Path, raw: BinaryIO | None = None) -> tuple[Any, bool]:
+    """Decompressed binary stream over ``path`` and whether it needs a read-ahead thread.
+
+    gzip inflates through ISA-L when ``isal`` is installed, on its own thread if
+    ``JSONL_READ_AHEAD``. zstd reads across frames so appended ledgers are read
+    whole. ``raw``, when given, is ``path`` already opened and positioned where
+    reading starts (a gzip member or zstd frame boundary); the caller closes it.
+    """
+    if path.suffix == ".gz":
+        source: Any = raw if raw is not None else path
+        if igzip is not None:
+            if JSONL_READ_AHEAD:
+                return igzip_threaded.open(source, "rb", threads=1), False
+            return igzip.open(source, "rb"), False
+        return gzip.open(source, "rb"), True
+    if path.suffix == ".zst":
+        try:
+            reader = _zstd_decompressor(path).stream_reader(
+                raw if raw is not None else path.open("rb"),
+                read_size=JSONL_READ_BLOCK_BYTES,
+                read_across_frames=True,
+            )
         except zstd.ZstdError as e:
             raise OSError(f"Failed to open zstd file {path}: {e}") from e
-    return open(path, mode, encoding="utf-8", errors="ignore")
+        return reader, True
+    if raw is not None:
+        return raw, False
+    return path.open("rb", buffering=0), False
+
 
+def _read_ahead(read: Callable[[int], bytes], block_size: int) -> Iterator[bytes]:
+    """Yield ``read(block_size)`` blocks produced up to ``JSONL_READ_AHEAD_BLOCKS`` ahead.
 
-def read_jsonl(path: Path) -> Iterator[dict[str, Any]]:
-    """Read JSONL file (supports .gz/.zst) and yield records."""
-    with _open_text(path, "rt") as f:
-        for line in f:
-            line = line.strip()
-            if line:
+    zlib and zstd release the GIL while inflating, so decompression on the
+    reader thread overlaps JSON decoding on the caller's thread.
+    """
+    blocks: queue.Queue[bytes | BaseException] = queue.Queue(maxsize=JSONL_READ_AHEAD_BLOCKS)
+    stop = threading.Event()
+
+    def put(item: bytes | BaseException) -> None:
+        while not stop.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def run() -> None:
+        try:
+            while not stop.is_set():
+                block = read(block_size)
+                put(block)
+                if not block:
+                    return
+        except BaseException as exc:  # re-raised on the consumer thread
+            put(exc)
+
+    thread = threading.Thread(target=run, name="jsonl-read-ahead", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = blocks.get()
+            if isinstance(item, BaseException):
+                raise item
+            if not item:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def iter_decompressed_blocks(
+    path: Path, block_size: int = JSONL_READ_BLOCK_BYTES, start_offset: int = 0
+) -> Iterator[bytes]:
+    """Yield the decompressed bytes of ``path`` (supports .gz/.zst) in ``block_size`` reads.
+
+    Reading starts ``start_offset`` bytes into the file on disk, which for .gz
+    and .zst must be a gzip member or zstd frame boundary.
+    """
+    with contextlib.ExitStack() as stack:
+        raw = None
+        if start_offset:
+            raw = stack.enter_context(path.open("rb", buffering=0))
+            raw.seek(start_offset)
+        stream, read_ahead = _open_decompressed(path, raw)
+        with stream:
+            if read_ahead and JSONL_READ_AHEAD:
+                yield from _read_ahead(stream.read, block_size)
+            else:
+                yield from iter(lambda: stream.read(block_size), b"")
+
+
+def read_jsonl(
+    path: Path,
+    *,
+    stats: JsonlReadStats | None = None,
+    block_size: int = JSONL_READ_BLOCK_BYTES,
+    start_offset: int = 0,
+) -> Iterator[dict[str, Any]]:
+    """Read JSONL file (supports .gz/.zst) and yield records.
+
+    The file is decompressed ``block_size`` bytes at a time and each block is
+    split on newlines in one pass, so no per-line text decoding or buffered
+    ``readline`` happens. Blank lines are ignored; lines that are not valid JSON
+    are skipped, counted in ``stats.malformed`` and logged once per file.
+    ``start_offset`` skips that many bytes of the file on disk, e.g. the part of
+    an append-only input already read; it must fall on a line boundary (and on
+    a gzip member or zstd frame boundary for compressed files).
+    """
+    stats = stats if stats is not None else JsonlReadStats()
+    stats.files += 1
+    loads = get_json_codec().loads
+    malformed = 0
+    first_malformed = 0
+    line_no = 0
+    tail = b""
+    for block in iter_decompressed_blocks(path, max(int(block_size), 1), start_offset):
+        stats.bytes_read += len(block)
+        lines = (tail + block).split(b"\n") if tail else block.split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            line_no += 1
+            if not line or line.isspace():
+                continue
+            try:
+                record = loads(line)
+            except ValueError:
                 try:
-                    yield json.loads(line)
-                except json.JSONDecodeError:
+                    record = loads(line.decode("utf-8", errors="ignore"))
+                except ValueError:
+                    stats.malformed += 1
+                    malformed += 1
+                    first_malformed = first_malformed or line_no
                     continue
+            stats.records += 1
+            yield record
+    if tail.strip():
+        line_no += 1
+        try:
+            record = decode_jsonl_line(tail)
+        except ValueError:
+            stats.malformed += 1
+            malformed += 1
+            first_malformed = first_malformed or line_no
+        else:
+            stats.records += 1
+            yield record
+    if malformed:
+        logger.warning(
+            "Skipped %d malformed JSONL line(s) in %s (first at line %d)",
+            malformed,
+            path,
+            first_malformed,
+        )
+
+
+def read_jsonl_batches(
+    path: Path,
+    *,
+    batch_size: int = JSONL_READ_BATCH_ROWS,
+    stats: JsonlReadStats | None = None,
+    block_size: int = JSONL_READ_BLOCK_BYTES,
+) -> Iterator[list[dict[str, Any]]]:
+    """Like :func:`read_jsonl` but yield lists of up to ``batch_size`` records."""
+    records = read_jsonl(path, stats=stats, block_size=block_size)
+    while batch := list(itertools.islice(records, max(int(batch_size), 1))):
+        yield batch
 
 
 def read_jsonl_list(path: Path) -> list[dict[str, Any]]:
@@ -78,30 +592,184 @@ def write_jsonl(path: Path, rows: Iterable[dict[str, Any]]) -> None:
     else:
         tmp_path = path.with_suffix(".tmp")
 
-    with _open_text(tmp_path, "wt") as f:
-        for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    # The temp name hides the compression suffix, so the codec follows ``path``.
+    with open_binary(tmp_path, "wb", suffix=path.suffix) as f:
+        for chunk in encode_jsonl_rows(rows):
+            f.write(chunk)
     tmp_path.replace(path)
 
 
 def append_jsonl(path: Path, rows: Iterable[dict[str, Any]]) -> None:
     """Append records to JSONL file (supports .gz/.zst)."""
     ensure_dir(path.parent)
-    if path.suffix == ".gz":
-        with gzip.open(path, "ab") as f:
-            for row in rows:
-                f.write((json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8"))
-        return
-    if path.suffix == ".zst":
-        with path.open("ab") as raw:
-            cctx = zstd.ZstdCompressor()
-            with cctx.stream_writer(raw) as compressor:
-                for row in rows:
-                    compressor.write((json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8"))
+    with open_binary(path, "ab") as f:
+        for chunk in encode_jsonl_rows(rows):
+            f.write(chunk)
+
+
+class _LedgerHandle:
+    """Open append handle plus pending encoded rows for a single ledger path."""
+
+    __slots__ = ("path", "stream", "pending", "pending_rows", "pending_bytes")
+
+    def __init__(self, path: Path) -> None:
+        ensure_dir(path.parent)
+        self.path = path
+        self.stream = open_binary(path, "ab")
+        self.pending: list[bytes] = []
+        self.pending_rows = 0
+        self.pending_bytes = 0
+
+    def write_pending(self) -> None:
+        if not self.pending:
+            return
+        # Swap the buffer out first so a signal-triggered close never re-writes rows.
+        chunks, self.pending = self.pending, []
+        self.pending_rows = 0
+        self.pending_bytes = 0
+        self.stream.write(b"".join(chunks))
+        self.stream.flush()
+
+    def close(self) -> None:
+        try:
+            self.write_pending()
+        finally:
+            self.stream.close()
+
+
+_OPEN_LEDGER_WRITERS: weakref.WeakSet[LedgerWriter] = weakref.WeakSet()
+_SIGTERM_HOOK_INSTALLED = False
+
+
+def close_open_ledger_writers() -> None:
+    """Flush and close every LedgerWriter that is still open."""
+    for writer in list(_OPEN_LEDGER_WRITERS):
+        try:
+            writer.close()
+        except Exception:
+            logger.warning("Failed to close ledger writer", exc_info=True)
+
+
+def _handle_sigterm(signum: int, frame: Any) -> None:
+    close_open_ledger_writers()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def _install_sigterm_hook() -> None:
+    global _SIGTERM_HOOK_INSTALLED
+    if _SIGTERM_HOOK_INSTALLED or threading.current_thread() is not threading.main_thread():
         return
-    with open(path, "a", encoding="utf-8") as f:
+    _SIGTERM_HOOK_INSTALLED = True
+    # Only take over SIGTERM when nobody else has claimed it.
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _handle_sigterm)
+
+
+atexit.register(close_open_ledger_writers)
+
+
+class LedgerWriter:
+    """Buffered JSONL appender that keeps one open handle per ledger path.
+
+    Rows are encoded on ``append`` and written once a path has buffered
+    ``max_rows`` rows or ``max_bytes`` bytes, or once ``flush_interval``
+    seconds have passed since the last flush. Handles stay open between
+    flushes, so hot loops avoid the open/close churn of :func:`append_jsonl`.
+    ``.gz`` and ``.zst`` paths are appended as new members/frames, exactly as
+    ``append_jsonl`` does, and remain readable with :func:`read_jsonl`.
+
+    Open writers are closed on context exit, at interpreter shutdown and on
+    SIGTERM (when no other SIGTERM handler is installed).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_rows: int = 1000,
+        max_bytes: int = 1 << 20,
+        flush_interval: float = 5.0,
+    ) -> None:
+        self.max_rows = max(int(max_rows), 1)
+        self.max_bytes = max(int(max_bytes), 1)
+        self.flush_interval = float(flush_interval)
+        self._handles: dict[Path, _LedgerHandle] = {}
+        self._last_flush = time.monotonic()
+        self._closed = False
+        _OPEN_LEDGER_WRITERS.add(self)
+        _install_sigterm_hook()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _handle(self, path: Path) -> _LedgerHandle:
+        handle = self._handles.get(path)
+        if handle is None:
+            handle = _LedgerHandle(path)
+            self._handles[path] = handle
+        return handle
+
+    def append(self, path: Path, row: dict[str, Any]) -> None:
+        """Buffer a single record for ``path``."""
+        self.extend(path, (row,))
+
+    def extend(self, path: Path, rows: Iterable[dict[str, Any]]) -> None:
+        """Buffer records for ``path``, flushing when a threshold is reached."""
+        if self._closed:
+            raise ValueError("LedgerWriter is closed")
+        handle = self._handle(path)
+        dumps = get_json_codec().dumps
         for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            encoded = dumps(row) + b"\n"
+            handle.pending.append(encoded)
+            handle.pending_rows += 1
+            handle.pending_bytes += len(encoded)
+        if handle.pending_rows >= self.max_rows or handle.pending_bytes >= self.max_bytes:
+            handle.write_pending()
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self, path: Path | None = None) -> None:
+        """Write buffered rows for ``path`` (or every path) to disk."""
+        if path is not None:
+            handle = self._handles.get(path)
+            if handle is not None:
+                handle.write_pending()
+            return
+        for handle in self._handles.values():
+            handle.write_pending()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush buffered rows and close every open handle."""
+        if self._closed:
+            return
+        self._closed = True
+        _OPEN_LEDGER_WRITERS.discard(self)
+        handles, self._handles = self._handles, {}
+        errors: list[BaseException] = []
+        for handle in handles.values():
+            try:
+                handle.close()
+            except Exception as exc:
+                errors.append(exc)
+        if errors:
+            raise OSError(f"Failed to close {len(errors)} ledger file(s)") from errors[0]
+
+    def __enter__(self) -> LedgerWriter:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+def append_ledger(ledger: LedgerWriter | None, path: Path, row: dict[str, Any]) -> None:
+    """Append ``row`` through ``ledger`` when given, else via :func:`append_jsonl`."""
+    if ledger is not None:
+        ledger.append(path, row)
+    else:
+        append_jsonl(path, [row])
 
 
 def write_jsonl_gz(path: Path, rows: Iterable[dict[str, Any]]) -> tuple[int, int]:
@@ -109,9 +777,15 @@ def write_jsonl_gz(path: Path, rows: Iterable[dict[str, Any]]) -> tuple[int, int
     ensure_dir(path.parent)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
     count = 0
-    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+
+    def counted() -> Iterator[dict[str, Any]]:
+        nonlocal count
         for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
             count += 1
+            yield row
+
+    with gzip.open(tmp_path, "wb") as f:
+        for chunk in encode_jsonl_rows(counted()):
+            f.write(chunk)
     tmp_path.replace(path)
     return count, path.stat().st_size
@@ -13,6 +13,27 @@ def utc_now() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
+class UtcClock:
+    """Callable ``utc_now`` for hot loops: formats once per wall-clock second.
+
+    ``utc_now`` has one-second resolution, so reusing the string within a second
+    returns exactly what a fresh call would.
+    """
+
+    __slots__ = ("_second", "_stamp")
+
+    def __init__(self) -> None:
+        self._second = -1
+        self._stamp = ""
+
+    def __call__(self) -> str:
+        second = int(time.time())
+        if second != self._second:
+            self._stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+            self._second = second
+        return self._stamp
+
+
 def log_event(logger: logging.Logger, message: str, **fields: Any) -> None:
     """Log a structured message with JSON fields."""
     if fields:
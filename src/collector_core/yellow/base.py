@@ -8,13 +8,21 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from datasets import DatasetDict, load_from_disk
+from datasets import load_from_disk
 
 from collector_core.__version__ import __version__ as VERSION
 from collector_core.artifact_metadata import build_artifact_metadata
 from collector_core.stability import stable_api
 from collector_core.utils.hash import sha256_text
-from collector_core.utils.io import append_jsonl, read_jsonl, write_json
+from collector_core.utils.hf import iter_dataset_rows, iter_dataset_splits
+from collector_core.utils.io import (
+    JsonlReadStats,
+    LedgerWriter,
+    append_ledger,
+    read_jsonl,
+    set_zstd_settings,
+    write_json,
+)
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir
 from collector_core.yellow_screen_common import (
@@ -81,6 +89,8 @@ def record_pitch(
     text: str | None = None,
     extra: dict[str, Any] | None = None,
     sample_extra: dict[str, Any] | None = None,
+    *,
+    ledger: LedgerWriter | None = None,
 ) -> None:
     row = {"target_id": target_id, "reason": reason}
     sample_id = None
@@ -90,7 +100,7 @@ def record_pitch(
             row["sample_id"] = sample_id
     if extra:
         row.update(extra)
-    append_jsonl(roots.ledger_root / "yellow_pitched.jsonl", [row])
+    append_ledger(ledger, roots.ledger_root / "yellow_pitched.jsonl", row)
 
     key = (target_id, reason)
     if pitch_counts.get(key, 0) >= pitch_cfg.sample_limit:
@@ -107,7 +117,7 @@ def record_pitch(
         sample["text"] = text[: pitch_cfg.text_limit]
     if sample_extra:
         sample.update(sample_extra)
-    append_jsonl(roots.pitches_root / "yellow_pitch.jsonl", [sample])
+    append_ledger(ledger, roots.pitches_root / "yellow_pitch.jsonl", sample)
     pitch_counts[key] = pitch_counts.get(key, 0) + 1
 
 
@@ -226,6 +236,23 @@ def process_target(
     execute: bool,
     pitch_cfg: PitchConfig,
     domain: Any,
+    *,
+    ledger: LedgerWriter | None = None,
+) -> dict[str, Any]:
+    if ledger is not None:
+        return _process_target(cfg, roots, queue_row, execute, pitch_cfg, domain, ledger)
+    with LedgerWriter() as owned_ledger:
+        return _process_target(cfg, roots, queue_row, execute, pitch_cfg, domain, owned_ledger)
+
+
+def _process_target(
+    cfg: dict[str, Any],
+    roots: Roots,
+    queue_row: dict[str, Any],
+    execute: bool,
+    pitch_cfg: PitchConfig,
+    domain: Any,
+    ledger: LedgerWriter,
 ) -> dict[str, Any]:
     """Process yellow screening target (231 lines).
 
@@ -237,6 +264,7 @@ def process_target(
     target_cfg = _resolve_target(cfg, target_id)
     screen_cfg = merge_screening_config(cfg, target_cfg)
     shard_cfg = sharding_cfg(cfg, "yellow_shard")
+    set_zstd_settings(shard_cfg.zstd)
     g = cfg.get("globals", {}) or {}
     require_signoff = bool(g.get("require_yellow_signoff", False))
     allow_without_signoff = bool(
@@ -250,6 +278,7 @@ def process_target(
     shard_paths: list[str] = []
     pitch_counts: dict[tuple[str, str], int] = {}
     pitch_reasons: Counter[str] = Counter()
+    read_stats = JsonlReadStats()
 
     # REFACTOR: Signoff validation logic (lines 253-301) could be extracted to
     # _validate_signoff_requirements(require_signoff, allow_without_signoff, status, ...)
@@ -264,6 +293,7 @@ def process_target(
                     target_id,
                     "yellow_signoff_rejected",
                     sample_extra={"details": f"manifest_dir={manifest_dir}"},
+                    ledger=ledger,
                 )
             manifest = {
                 "target_id": target_id,
@@ -288,6 +318,7 @@ def process_target(
                     target_id,
                     "yellow_signoff_missing",
                     sample_extra={"details": f"manifest_dir={manifest_dir}"},
+                    ledger=ledger,
                 )
             manifest = {
                 "target_id": target_id,
@@ -351,6 +382,7 @@ def process_target(
                         text=decision.text,
                         extra=decision.extra,
                         sample_extra=decision.sample_extra,
+                        ledger=ledger,
                     )
                 return
             if callable(dedupe_key_fn):
@@ -367,6 +399,7 @@ def process_target(
                             "duplicate_record",
                             raw=raw,
                             text=decision.text,
+                            ledger=ledger,
                         )
                     return
                 if key:
@@ -390,6 +423,7 @@ def process_target(
                         "transform_failed",
                         raw=raw,
                         text=decision.text,
+                        ledger=ledger,
                     )
                 return
             passed += 1
@@ -408,10 +442,10 @@ def process_target(
                     "output_shard": current_shard,
                     "seen_at_utc": utc_now(),
                 }
-                append_jsonl(roots.ledger_root / "yellow_passed.jsonl", [ledger_row])
+                ledger.append(roots.ledger_root / "yellow_passed.jsonl", ledger_row)
 
         for file_path in iter_raw_files(raw_dir):
-            for raw in read_jsonl(file_path):
+            for raw in read_jsonl(file_path, stats=read_stats):
                 handle_raw(raw)
 
         for ds_path in iter_hf_dataset_dirs(raw_dir):
@@ -429,16 +463,12 @@ def process_target(
                         "hf_load_failed",
                         extra={"path": str(ds_path), "error": str(exc)},
                         sample_extra={"path": str(ds_path)},
+                        ledger=ledger,
                     )
                 continue
-            datasets = (
-                list(dataset_obj.values())
-                if isinstance(dataset_obj, DatasetDict)
-                else [dataset_obj]
-            )
-            for dataset in datasets:
-                for raw in dataset:
-                    handle_raw(dict(raw))
+            for _split_name, dataset in iter_dataset_splits(dataset_obj, sort=False):
+                for raw in iter_dataset_rows(dataset):
+                    handle_raw(raw)
 
         if execute:
             flushed = sharder.flush()
@@ -452,7 +482,10 @@ def process_target(
         "shards": shard_paths,
         "status": "ok",
         "finished_at_utc": utc_now(),
-        "metrics": {"pitch_reasons": dict(pitch_reasons)},
+        "metrics": {
+            "pitch_reasons": dict(pitch_reasons),
+            "malformed_lines": read_stats.malformed,
+        },
     }
     manifest.update(build_artifact_metadata(written_at_utc=manifest["finished_at_utc"]))
     if execute:
@@ -504,7 +537,8 @@ def run_yellow_screen(*, defaults: YellowRootDefaults, domain: Any) -> None:
     ensure_dir(roots.ledger_root)
     ensure_dir(roots.pitches_root)
 
-    queue_rows = read_jsonl(Path(args.queue))
+    queue_stats = JsonlReadStats()
+    queue_rows = read_jsonl(Path(args.queue), stats=queue_stats)
     queue_rows = [r for r in queue_rows if r.get("enabled", True) and r.get("id")]
 
     summary = {
@@ -515,9 +549,10 @@ def run_yellow_screen(*, defaults: YellowRootDefaults, domain: Any) -> None:
     }
     summary.update(build_artifact_metadata(written_at_utc=summary["run_at_utc"]))
 
-    for row in queue_rows:
-        res = process_target(cfg, roots, row, args.execute, pitch_cfg, domain)
-        summary["results"].append(res)
+    with LedgerWriter() as ledger:
+        for row in queue_rows:
+            res = process_target(cfg, roots, row, args.execute, pitch_cfg, domain, ledger=ledger)
+            summary["results"].append(res)
 
     status_counts = Counter(result.get("status") or "unknown" for result in summary["results"])
     summary["counts"] = {"total": len(summary["results"]), **dict(status_counts)}
@@ -526,6 +561,9 @@ def run_yellow_screen(*, defaults: YellowRootDefaults, domain: Any) -> None:
         for result in summary["results"]
         if result.get("status") != "ok"
     ]
+    summary["malformed_lines"] = queue_stats.malformed + sum(
+        (result.get("metrics") or {}).get("malformed_lines", 0) for result in summary["results"]
+    )
 
     write_json(roots.ledger_root / "yellow_screen_summary.json", summary)
 
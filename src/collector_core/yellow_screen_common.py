@@ -8,8 +8,10 @@ from typing import Any
 from collector_core.__version__ import __version__ as VERSION
 from collector_core.config_validator import read_yaml
 from collector_core.dataset_root import ensure_data_root_allowed, resolve_dataset_root
+from collector_core.shard_index import SHARD_INDEX_EVERY
+from collector_core.sharding import StreamingShardWriter
 from collector_core.stability import stable_api
-from collector_core.utils.io import write_jsonl
+from collector_core.utils.io import ZstdSettings
 
 __all__ = ["VERSION"]
 
@@ -55,6 +57,12 @@ class ShardingConfig:
     max_records_per_shard: int
     compression: str
     prefix: str
+    # Rotate once a shard holds this many uncompressed bytes (``None``: records only).
+    max_bytes_per_shard: int | None = None
+    # Records per independently decodable block in the shard index sidecar (0: no index).
+    index_every: int = SHARD_INDEX_EVERY
+    # zstd level/threads/long-distance matching for ``compression: zstd`` shards.
+    zstd: ZstdSettings = dataclasses.field(default_factory=ZstdSettings)
 
 
 @stable_api
@@ -66,39 +74,35 @@ class PitchConfig:
 
 @stable_api
 class Sharder:
+    """Screened-shard writer; rows stream to disk through ``StreamingShardWriter``."""
+
     def __init__(self, base_dir: Path, cfg: ShardingConfig) -> None:
         self.base_dir = base_dir
         self.cfg = cfg
         self.count = 0
-        self.shard_idx = 0
-        self.current_rows: list[dict[str, Any]] = []
+        self.writer = StreamingShardWriter(
+            base_dir,
+            prefix=cfg.prefix,
+            compression=cfg.compression,
+            max_records=cfg.max_records_per_shard,
+            max_bytes=cfg.max_bytes_per_shard,
+            index_every=cfg.index_every,
+            zstd_settings=cfg.zstd,
+        )
+
+    @property
+    def shard_idx(self) -> int:
+        return self.writer.shard_index
 
     def _next_path(self) -> Path:
-        if self.cfg.compression == "gzip":
-            suffix = "jsonl.gz"
-        elif self.cfg.compression in {"zstd", "zst"}:
-            suffix = "jsonl.zst"
-        else:
-            suffix = "jsonl"
-        name = f"{self.cfg.prefix}_{self.shard_idx:05d}.{suffix}"
-        return self.base_dir / name
+        return self.writer.current_path
 
     def add(self, row: dict[str, Any]) -> Path | None:
-        self.current_rows.append(row)
         self.count += 1
-        if len(self.current_rows) >= self.cfg.max_records_per_shard:
-            path = self.flush()
-            self.shard_idx += 1
-            return path
-        return None
+        return self.writer.write(row)
 
     def flush(self) -> Path | None:
-        if not self.current_rows:
-            return None
-        path = self._next_path()
-        write_jsonl(path, self.current_rows)
-        self.current_rows = []
-        return path
+        return self.writer.close()
 
 
 @stable_api
@@ -205,6 +209,9 @@ def sharding_cfg(cfg: dict[str, Any], prefix: str) -> ShardingConfig:
         max_records_per_shard=int(g.get("max_records_per_shard", 50000)),
         compression=str(g.get("compression", "zstd")),
         prefix=prefix,
+        max_bytes_per_shard=int(g["max_bytes_per_shard"]) if g.get("max_bytes_per_shard") else None,
+        index_every=int(g.get("index_every", SHARD_INDEX_EVERY)),
+        zstd=ZstdSettings.from_dict(g.get("zstd")),
     )
 
 
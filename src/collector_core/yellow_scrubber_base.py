@@ -44,7 +44,7 @@ from collector_core.stability import stable_api
 from collector_core.utils.hash import sha256_file
 from collector_core.utils.http import requests, require_requests
 from collector_core.utils.io import read_jsonl_list as read_jsonl
-from collector_core.utils.io import read_yaml, write_json, write_jsonl_gz
+from collector_core.utils.io import read_yaml, write_json, write_jsonl, write_jsonl_gz
 from collector_core.utils.logging import utc_now
 from collector_core.utils.paths import ensure_dir
 from collector_core.utils.text import lower, normalize_whitespace, safe_text
@@ -657,11 +657,7 @@ def plan_pmc_allowlist(
     plan["unknown_rows"] = unk
 
     allow_path = out_dir / "pmc_allowlist.jsonl"
-    tmp_path = allow_path.with_suffix(".tmp")
-    with tmp_path.open("w", encoding="utf-8") as f:
-        for rr in allow_rows:
-            f.write(json.dumps(rr, ensure_ascii=False) + "\n")
-    tmp_path.replace(allow_path)
+    write_jsonl(allow_path, allow_rows)
     plan["allowlist_path"] = str(allow_path)
 
     write_json(out_dir / "_manifests" / f"pmc_allowlist_plan_{int(time.time())}.json", plan)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark exact-dedupe index backends (records/sec for add_if_new).
+
+Feeds a stream of SHA-256 hex digests with a fixed duplicate ratio through each
+``globals.merge.dedupe_backend`` and reports throughput and peak RSS.
+
+Example:
+    python -m tools.bench_dedupe_backends --sizes 1000000 10000000 50000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import resource
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from collector_core.merge.dedupe import DEDUPE_BACKENDS, dedupe_index_factory
+
+
+def iter_hashes(count: int, dup_ratio: float) -> Iterator[str]:
+    """Yield ``count`` hex digests; roughly ``dup_ratio`` of them repeat earlier ones."""
+    unique = max(int(count * (1.0 - dup_ratio)), 1)
+    for idx in range(count):
+        key = idx if idx < unique else (idx * 2654435761) % unique
+        yield hashlib.sha256(key.to_bytes(8, "little")).hexdigest()
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def bench_backend(backend: str, count: int, dup_ratio: float, workdir: Path) -> dict[str, float]:
+    factory = dedupe_index_factory(backend, expected_items=count)
+    index = factory(workdir / f"{backend}_{count}.sqlite")
+    new = 0
+    start = time.perf_counter()
+    for content_hash in iter_hashes(count, dup_ratio):
+        if index.add_if_new(content_hash):
+            new += 1
+    index.close()
+    elapsed = time.perf_counter() - start
+    return {
+        "records": count,
+        "new": new,
+        "seconds": elapsed,
+        "records_per_sec": count / elapsed if elapsed else 0.0,
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark merge dedupe index backends.")
+    ap.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[1_000_000, 10_000_000, 50_000_000],
+        help="Number of hashes to feed per run.",
+    )
+    ap.add_argument(
+        "--backends",
+        nargs="+",
+        choices=DEDUPE_BACKENDS,
+        default=list(DEDUPE_BACKENDS),
+    )
+    ap.add_argument("--dup-ratio", type=float, default=0.2, help="Fraction of repeated hashes.")
+    ap.add_argument("--workdir", default=None, help="Directory for SQLite files (default: tmp).")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as tmp:
+        workdir = Path(tmp)
+        print(
+            f"{'backend':<8} {'records':>12} {'new':>12} {'seconds':>9} {'rec/s':>12} {'rss_mb':>8}"
+        )
+        for count in args.sizes:
+            for backend in args.backends:
+                result = bench_backend(backend, count, args.dup_ratio, workdir)
+                print(
+                    f"{backend:<8} {count:>12,} {result['new']:>12,} "
+                    f"{result['seconds']:>9.1f} {result['records_per_sec']:>12,.0f} "
+                    f"{peak_rss_mb():>8.0f}",
+                    flush=True,
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
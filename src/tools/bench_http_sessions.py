@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark per-file download latency with and without pooled HTTP sessions.
+
+Starts a local HTTP/1.1 stand-in that serves many small files and downloads
+them through ``_http_download_with_resume`` on ``--workers`` threads, once with
+a module-level ``requests.get`` per file (a new connection each time) and once
+with an ``HttpSessionPool`` on the ``AcquireContext`` (keep-alive connections).
+``--connect-delay-ms`` makes the server stall once per new connection, standing
+in for the TCP and TLS handshake round trips a remote host would cost.
+
+Example:
+    python -m tools.bench_http_sessions --files 500 --workers 4 --connect-delay-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from collector_core.acquire.context import AcquireContext, Limits, RetryConfig, Roots, RunMode
+from collector_core.acquire.strategies.http import _http_download_with_resume
+from collector_core.utils.http import HttpSessionPool
+
+
+def make_server(file_bytes: int, connect_delay_s: float) -> ThreadingHTTPServer:
+    body = b"x" * file_bytes
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            time.sleep(connect_delay_s)
+            self.server.connections += 1  # type: ignore[attr-defined]
+            super().setup()
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.connections = 0  # type: ignore[attr-defined]
+    return server
+
+
+def make_ctx(root: Path, workers: int, http: HttpSessionPool | None) -> AcquireContext:
+    return AcquireContext(
+        roots=Roots(root, root, root, root),
+        limits=Limits(None, None, None),
+        mode=RunMode(True, True, False, False, False, workers),
+        retry=RetryConfig(max_attempts=1),
+        allow_non_global_download_hosts=True,
+        http=http,
+    )
+
+
+def bench(
+    server: ThreadingHTTPServer, root: Path, files: int, workers: int, pooled: bool
+) -> tuple[float, float, int]:
+    url = f"http://127.0.0.1:{server.server_address[1]}/file"
+    http = HttpSessionPool(workers=workers) if pooled else None
+    ctx = make_ctx(root, workers, http)
+    latencies: list[float] = []
+    server.connections = 0  # type: ignore[attr-defined]
+
+    def fetch(idx: int) -> None:
+        start = time.perf_counter()
+        result = _http_download_with_resume(ctx, f"{url}/{idx}", root / f"{idx}.bin")
+        latencies.append(time.perf_counter() - start)
+        assert result["status"] == "ok", result
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(fetch, range(files)))
+    finally:
+        if http is not None:
+            http.close()
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(latencies) / len(latencies), server.connections  # type: ignore[attr-defined]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark pooled vs per-request HTTP sessions.")
+    ap.add_argument("--files", type=int, default=300, help="Small files to download.")
+    ap.add_argument("--file-bytes", type=int, default=4096, help="Size of each file.")
+    ap.add_argument("--workers", type=int, default=4, help="Download threads (as --workers).")
+    ap.add_argument(
+        "--connect-delay-ms",
+        type=float,
+        default=10.0,
+        help="Server-side stall per new connection, standing in for handshakes.",
+    )
+    args = ap.parse_args()
+
+    server = make_server(args.file_bytes, args.connect_delay_ms / 1000)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    print(f"{'mode':<10} {'files/s':>9} {'ms/file':>9} {'connections':>12}")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, pooled in (("per-call", False), ("pooled", True)):
+                elapsed, latency, connections = bench(
+                    server, Path(tmp), args.files, args.workers, pooled
+                )
+                print(
+                    f"{label:<10} {args.files / elapsed:>9.1f} {latency * 1000:>9.2f} "
+                    f"{connections:>12,}",
+                    flush=True,
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
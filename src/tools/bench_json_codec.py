@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark JSONL encoding and decoding throughput per JSON codec.
+
+Encodes and decodes synthetic merge-like records with every installed codec
+(``collector_core.utils.io.JSON_CODECS``), then writes and reads a JSONL file
+through ``write_jsonl``/``read_jsonl``. A ``legacy`` row repeats the file round
+trip the way it ran before the codec layer (text-mode streams with
+``json.dumps``/``json.loads`` per line). Reports records per second.
+
+Example:
+    python -m tools.bench_json_codec --records 200000 --suffix .jsonl.gz
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from collector_core.utils.io import (
+    JSON_CODECS,
+    read_jsonl,
+    resolve_json_codec,
+    set_json_codec,
+    write_jsonl,
+)
+
+
+def make_rows(records: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "record_id": f"rec-{idx}",
+            "text": f"benchmark record {idx} — " + "lorem ipsum dolor sit amet " * 30,
+            "content_sha256": f"{idx:064x}",
+            "source_urls": [f"https://example.org/{idx}"],
+            "source": {"target_id": "bench", "license_profile": "permissive", "n": idx},
+            "score": idx / 7,
+        }
+        for idx in range(records)
+    ]
+
+
+def rate(records: int, seconds: float) -> str:
+    return f"{records / seconds:>12,.0f}" if seconds else f"{'-':>12}"
+
+
+def bench_legacy_files(rows: list[dict[str, Any]], path: Path) -> tuple[float, float]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    start = time.perf_counter()
+    with opener(path, "wt", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    write_s = time.perf_counter() - start
+    start = time.perf_counter()
+    with opener(path, "rt", encoding="utf-8", errors="ignore") as f:
+        count = sum(1 for line in f if line.strip() and json.loads(line.strip()))
+    read_s = time.perf_counter() - start
+    assert count == len(rows)
+    return write_s, read_s
+
+
+def bench_codec(name: str, rows: list[dict[str, Any]], path: Path) -> tuple[float, ...]:
+    codec = set_json_codec(name)
+    start = time.perf_counter()
+    encoded = [codec.dumps(row) for row in rows]
+    encode_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for line in encoded:
+        codec.loads(line)
+    decode_s = time.perf_counter() - start
+    start = time.perf_counter()
+    write_jsonl(path, rows)
+    write_s = time.perf_counter() - start
+    start = time.perf_counter()
+    count = sum(1 for _ in read_jsonl(path))
+    read_s = time.perf_counter() - start
+    assert count == len(rows)
+    return encode_s, decode_s, write_s, read_s
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark JSON codec throughput.")
+    ap.add_argument("--records", type=int, default=100_000, help="Synthetic records.")
+    ap.add_argument(
+        "--suffix",
+        default=".jsonl",
+        choices=[".jsonl", ".jsonl.gz", ".jsonl.zst"],
+        help="File type for the write/read round trip.",
+    )
+    args = ap.parse_args()
+
+    rows = make_rows(args.records)
+    print(f"{'codec':<8} {'encode/s':>12} {'decode/s':>12} {'write/s':>12} {'read/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"bench{args.suffix}"
+        if args.suffix != ".jsonl.zst":
+            write_s, read_s = bench_legacy_files(rows, path)
+            print(
+                f"{'legacy':<8} {rate(0, 0)} {rate(0, 0)} "
+                f"{rate(len(rows), write_s)} {rate(len(rows), read_s)}"
+            )
+        for name in JSON_CODECS:
+            try:
+                resolve_json_codec(name)
+            except ImportError:
+                print(f"{name:<8} skipped (not installed)")
+                continue
+            timings = bench_codec(name, rows, path)
+            print(f"{name:<8} " + " ".join(rate(len(rows), seconds) for seconds in timings))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
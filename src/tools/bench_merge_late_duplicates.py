@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark merge provenance updates on late-duplicate-heavy inputs.
+
+Writes a synthetic GREEN target where a fraction of records repeat content from
+shards that were already flushed, then runs the merge once per
+``globals.merge.provenance_updates`` mode and reports wall time and how many
+shards the provenance post-pass touched and how long it took.
+
+Example:
+    python -m tools.bench_merge_late_duplicates --records 500000 --late-ratio 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from collector_core import merge
+from collector_core.merge.types import MergeRuntimeConfig, RootDefaults
+from collector_core.merge.updates import PROVENANCE_UPDATE_MODES
+
+
+def write_inputs(root: Path, records: int, late_ratio: float) -> None:
+    """Write ``records`` rows; every ``1 / late_ratio``-th row repeats an early record."""
+    target_dir = root / "raw" / "green" / "permissive" / "bench_target"
+    target_dir.mkdir(parents=True)
+    stride = max(int(1 / late_ratio), 1) if late_ratio > 0 else 0
+    rng = random.Random(0)
+    with (target_dir / "rows.jsonl").open("w", encoding="utf-8") as handle:
+        for idx in range(records):
+            if stride and idx and idx % stride == 0:
+                # Repeat a uniformly chosen earlier row so most shards get one.
+                key = rng.randrange(idx)
+            else:
+                key = idx
+            row = {
+                "text": f"benchmark record {key} " + "lorem ipsum " * 20,
+                "source_urls": [f"https://example.org/{idx}"],
+            }
+            handle.write(json.dumps(row) + "\n")
+
+
+def bench_mode(mode: str, root: Path, shard_size: int) -> dict[str, float]:
+    cfg = {
+        "globals": {
+            "raw_root": str(root / "raw"),
+            "screened_yellow_root": str(root / "screened_yellow"),
+            "combined_root": str(root / f"combined_{mode}"),
+            "ledger_root": str(root / f"_ledger_{mode}"),
+            "sharding": {"max_records_per_shard": shard_size, "compression": "gzip"},
+        },
+        "targets": [{"id": "bench_target"}],
+    }
+    roots = merge.resolve_roots(cfg, RootDefaults("", "", "", ""))
+    start = time.perf_counter()
+    summary = merge.merge_records(
+        cfg,
+        roots,
+        execute=True,
+        pipeline_id="bench",
+        runtime=MergeRuntimeConfig(provenance_updates=mode),
+    )
+    elapsed = time.perf_counter() - start
+    return {
+        "seconds": elapsed,
+        "written": summary["written"],
+        "deduped": summary["deduped"],
+        "updated_shards": summary.get("updated_shards", 0),
+        "post_pass_seconds": summary.get("provenance_update_seconds", 0.0),
+        "shards": len(summary["shards"]),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark merge late-duplicate provenance updates.")
+    ap.add_argument("--records", type=int, default=200_000, help="Input rows to generate.")
+    ap.add_argument(
+        "--late-ratio", type=float, default=0.01, help="Fraction of rows that repeat early rows."
+    )
+    ap.add_argument("--shard-size", type=int, default=50_000, help="max_records_per_shard.")
+    ap.add_argument(
+        "--modes", nargs="+", choices=PROVENANCE_UPDATE_MODES, default=list(PROVENANCE_UPDATE_MODES)
+    )
+    ap.add_argument("--workdir", default=None, help="Scratch directory (default: tmp).")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as tmp:
+        root = Path(tmp)
+        write_inputs(root, args.records, args.late_ratio)
+        print(
+            f"{'mode':<8} {'written':>10} {'deduped':>9} {'shards':>7} {'touched':>8} "
+            f"{'post_pass_s':>11} {'total_s':>9}"
+        )
+        for mode in args.modes:
+            result = bench_mode(mode, root, args.shard_size)
+            print(
+                f"{mode:<8} {result['written']:>10,} {result['deduped']:>9,} "
+                f"{result['shards']:>7} {result['updated_shards']:>8} "
+                f"{result['post_pass_seconds']:>11.2f} {result['seconds']:>9.1f}",
+                flush=True,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
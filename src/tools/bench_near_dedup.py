@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark near-duplicate detector backends per document.
+
+Builds a synthetic corpus of random-word documents, then queries one
+near-duplicate (a few words replaced) and one unrelated document per indexed
+document. Reports microseconds per indexed and per queried document and how
+many planted near-duplicates each backend found. The ``numpy`` and ``simhash``
+backends are run both one document at a time and through
+``add_many``/``query_many``.
+
+Example:
+    python -m tools.bench_near_dedup --docs 20000 --backends numpy,simhash --hamming-bits 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from collector_core.checks.near_duplicate import (
+    BACKENDS,
+    DEFAULT_HAMMING_BITS,
+    DEFAULT_NUM_PERM,
+    DEFAULT_THRESHOLD,
+    _datasketch_available,
+    create_detector,
+)
+
+
+def make_corpus(docs: int, words: int, seed: int) -> tuple[list[str], list[str]]:
+    rng = random.Random(seed)
+    vocab = [f"w{idx}" for idx in range(20_000)]
+    corpus = [" ".join(rng.choices(vocab, k=words)) for _ in range(docs)]
+    queries: list[str] = []
+    for text in corpus:
+        tokens = text.split()
+        for pos in rng.sample(range(len(tokens)), k=max(len(tokens) // 100, 1)):
+            tokens[pos] = "edited"
+        queries.append(" ".join(tokens))
+    queries.extend(" ".join(rng.choices(vocab, k=words)) for _ in range(docs))
+    return corpus, queries
+
+
+def run(
+    backend: str, corpus: list[str], queries: list[str], args: argparse.Namespace, *, batch: bool
+) -> tuple[float, float, int]:
+    detector = create_detector(
+        backend=backend,
+        threshold=args.threshold,
+        num_perm=args.num_perm,
+        hamming_bits=args.hamming_bits,
+    )
+    ids = [f"doc-{idx}" for idx in range(len(corpus))]
+    start = time.perf_counter()
+    if batch:
+        for offset in range(0, len(corpus), args.batch_size):
+            detector.add_many(
+                zip(
+                    ids[offset : offset + args.batch_size],
+                    corpus[offset : offset + args.batch_size],
+                    strict=True,
+                )
+            )
+    else:
+        for doc_id, text in zip(ids, corpus, strict=True):
+            detector.add(doc_id, text)
+    index_s = time.perf_counter() - start
+    start = time.perf_counter()
+    if batch:
+        results = [
+            result
+            for offset in range(0, len(queries), args.batch_size)
+            for result in detector.query_many(queries[offset : offset + args.batch_size])
+        ]
+    else:
+        results = [detector.query(text) for text in queries]
+    query_s = time.perf_counter() - start
+    # Only the first len(ids) queries are planted near-duplicates.
+    planted = zip(results, ids, strict=False)
+    found = sum(result.match_id == doc_id for result, doc_id in planted if result.is_duplicate)
+    return index_s, query_s, found
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark near-duplicate detector backends.")
+    ap.add_argument("--docs", type=int, default=5000, help="Documents to index.")
+    ap.add_argument("--words", type=int, default=300, help="Words per synthetic document.")
+    ap.add_argument(
+        "--backends",
+        default="numpy,simhash,datasketch",
+        help=f"Comma-separated backends to run ({', '.join(BACKENDS)}).",
+    )
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    ap.add_argument("--num-perm", type=int, default=DEFAULT_NUM_PERM)
+    ap.add_argument(
+        "--hamming-bits",
+        type=int,
+        default=DEFAULT_HAMMING_BITS,
+        help="Hamming tolerance for the simhash backend.",
+    )
+    ap.add_argument("--batch-size", type=int, default=1000, help="Batch size for batched backends.")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    corpus, queries = make_corpus(args.docs, args.words, args.seed)
+    print(f"{'backend':<14} {'docs':>8} {'us/index':>10} {'us/query':>10} {'found':>8}")
+    for backend in [name.strip() for name in args.backends.split(",") if name.strip()]:
+        if backend == "datasketch" and not _datasketch_available():
+            print(f"{backend:<14} skipped (datasketch not installed)")
+            continue
+        modes = [False, True] if backend in ("numpy", "simhash") else [False]
+        for batch in modes:
+            index_s, query_s, found = run(backend, corpus, queries, args, batch=batch)
+            label = f"{backend}-batch" if batch else backend
+            print(
+                f"{label:<14} {args.docs:>8,} {index_s / args.docs * 1e6:>10.1f} "
+                f"{query_s / len(queries) * 1e6:>10.1f} {found:>8,}",
+                flush=True,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
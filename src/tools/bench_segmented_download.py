@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark single-stream against segmented range downloads of one large file.
+
+Starts a local HTTP/1.1 stand-in that serves one file with ``Range`` support and
+caps every connection at ``--conn-mbps`` (as a long-haul TCP flow is capped by
+its window and round-trip time), then downloads the file through
+``_http_download_with_resume`` once as a single stream and once for each
+``--segments`` value as concurrent byte ranges.
+
+Example:
+    python -m tools.bench_segmented_download --size-mb 256 --conn-mbps 40 --segments 2,4,8
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from collector_core.acquire.context import AcquireContext, Limits, RetryConfig, Roots, RunMode
+from collector_core.acquire.strategies.http import SegmentedDownload, _http_download_with_resume
+
+SEND_BYTES = 64 * 1024
+
+
+def make_server(size: int, conn_bytes_per_s: float) -> ThreadingHTTPServer:
+    body = bytes(range(256)) * (size // 256)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            start, end = 0, len(body) - 1
+            range_header = self.headers.get("Range")
+            if range_header:
+                first, _, last = range_header.removeprefix("bytes=").partition("-")
+                start, end = int(first), int(last) if last else end
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+            else:
+                self.send_response(200)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+            began = time.perf_counter()
+            for offset in range(start, end + 1, SEND_BYTES):
+                self.wfile.write(body[offset : min(offset + SEND_BYTES, end + 1)])
+                due = began + (offset + SEND_BYTES - start) / conn_bytes_per_s
+                time.sleep(max(0.0, due - time.perf_counter()))
+
+        def log_message(self, *args: object) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def bench(url: str, root: Path, segments: int) -> tuple[float, dict[str, Any]]:
+    ctx = AcquireContext(
+        roots=Roots(root, root, root, root),
+        limits=Limits(None, None, None),
+        mode=RunMode(True, True, False, False, True, 1),
+        retry=RetryConfig(max_attempts=1),
+        allow_non_global_download_hosts=True,
+    )
+    out_path = root / f"file_{segments}.bin"
+    segmented = SegmentedDownload(segments=segments, min_bytes=0) if segments > 1 else None
+    start = time.perf_counter()
+    result = _http_download_with_resume(ctx, url, out_path, segmented=segmented)
+    elapsed = time.perf_counter() - start
+    assert result["status"] == "ok", result
+    out_path.unlink()
+    return elapsed, result
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark segmented vs single-stream downloads.")
+    ap.add_argument("--size-mb", type=int, default=64, help="Size of the served file.")
+    ap.add_argument("--conn-mbps", type=float, default=40.0, help="Per-connection cap, MB/s.")
+    ap.add_argument("--segments", default="2,4,8", help="Comma-separated segment counts.")
+    args = ap.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    server = make_server(size, args.conn_mbps * 1e6)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/file.bin"
+    counts = [1] + [int(n) for n in args.segments.split(",") if n.strip()]
+    print(f"{'segments':>8} {'seconds':>9} {'MB/s':>9} {'sha256':>14}")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for segments in counts:
+                elapsed, result = bench(url, Path(tmp), segments)
+                print(
+                    f"{result.get('segments', 1):>8} {elapsed:>9.2f} "
+                    f"{size / elapsed / 1e6:>9.1f} {result['sha256'][:12]:>14}",
+                    flush=True,
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Benchmark gzip against zstd for combined shards and small-record ledgers.
+
+Shards: synthetic merge-like records are written through ``AtomicShardWriter``
+(indexed blocks, as merge writes them) with gzip and with zstd at several
+levels, with and without long-distance matching, then read back with
+``read_jsonl``. Ledgers: small ledger-like rows are appended one call at a
+time with ``append_jsonl``, so every row becomes its own gzip member or zstd
+frame, with and without a dictionary trained on earlier rows. Reports the
+compression ratio and MB/s of uncompressed JSONL written and read.
+
+Example:
+    python -m tools.bench_zstd_codec --records 50000 --ledger-rows 5000 --levels 1,3,9
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from collector_core.sharding import AtomicShardWriter
+from collector_core.utils.io import (
+    ZstdSettings,
+    append_jsonl,
+    json_dumps,
+    read_jsonl,
+    set_zstd_settings,
+    train_zstd_dictionary,
+)
+
+
+def make_shard_rows(records: int, seed: int = 0) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    vocab = [f"w{idx}" for idx in range(5000)]
+    return [
+        {
+            "record_id": f"rec-{idx}",
+            "text": " ".join(rng.choices(vocab, k=200 + idx % 400)),
+            "content_sha256": f"{idx * 2654435761 % (1 << 64):064x}",
+            "source_urls": [f"https://example.org/{idx % 997}/{idx}"],
+            "source": {"target_id": f"target_{idx % 13}", "license_profile": "permissive"},
+        }
+        for idx in range(records)
+    ]
+
+
+def make_ledger_rows(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "content_sha256": f"{idx * 40503 % (1 << 64):064x}",
+            "target_id": f"target_{idx % 13}",
+            "event": "deduped" if idx % 3 else "written",
+            "shard": f"combined_{idx // 50000:05d}.jsonl.gz",
+            "timestamp": f"2026-01-01T00:{idx // 60 % 60:02d}:{idx % 60:02d}Z",
+        }
+        for idx in range(rows)
+    ]
+
+
+def mb_per_s(size: int, seconds: float) -> str:
+    return f"{size / seconds / 1e6:>9.1f}" if seconds else f"{'-':>9}"
+
+
+def report(label: str, raw: int, stored: int, write_s: float, read_s: float) -> None:
+    print(
+        f"{label:<22} {raw / stored:>7.2f} {mb_per_s(raw, write_s)} {mb_per_s(raw, read_s)}",
+        flush=True,
+    )
+
+
+def bench_shard(
+    rows: list[dict[str, Any]], path: Path, compression: str, settings: ZstdSettings | None
+) -> tuple[int, float, float]:
+    start = time.perf_counter()
+    with AtomicShardWriter(
+        path, compression=compression, auto_complete=False, zstd_settings=settings
+    ) as writer:
+        for row in rows:
+            writer.write_record(row)
+    write_s = time.perf_counter() - start
+    start = time.perf_counter()
+    count = sum(1 for _ in read_jsonl(path))
+    read_s = time.perf_counter() - start
+    assert count == len(rows)
+    return path.stat().st_size, write_s, read_s
+
+
+def bench_ledger(rows: list[dict[str, Any]], path: Path) -> tuple[int, float, float]:
+    start = time.perf_counter()
+    for row in rows:
+        append_jsonl(path, [row])
+    write_s = time.perf_counter() - start
+    start = time.perf_counter()
+    count = sum(1 for _ in read_jsonl(path))
+    read_s = time.perf_counter() - start
+    assert count == len(rows)
+    return path.stat().st_size, write_s, read_s
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark gzip vs zstd shard and ledger codecs.")
+    ap.add_argument("--records", type=int, default=20_000, help="Synthetic shard records.")
+    ap.add_argument("--ledger-rows", type=int, default=5_000, help="Rows appended one by one.")
+    ap.add_argument("--levels", default="1,3,9", help="Comma-separated zstd levels to run.")
+    ap.add_argument("--threads", type=int, default=0, help="zstd shard threads (-1: per core).")
+    args = ap.parse_args()
+
+    levels = [int(level) for level in args.levels.split(",") if level.strip()]
+    shard_rows = make_shard_rows(args.records)
+    shard_raw = sum(len(json_dumps(row)) + 1 for row in shard_rows)
+    ledger_rows = make_ledger_rows(args.ledger_rows)
+    ledger_raw = sum(len(json_dumps(row)) + 1 for row in ledger_rows)
+    print(f"{'codec':<22} {'ratio':>7} {'write MB/s':>9} {'read MB/s':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        print(f"shards: {args.records:,} records, {shard_raw / 1e6:.1f} MB")
+        report("gzip", shard_raw, *bench_shard(shard_rows, root / "g.jsonl.gz", "gzip", None))
+        for level in levels:
+            for long_distance in (False, True):
+                settings = ZstdSettings(
+                    level=level, threads=args.threads, long_distance=long_distance
+                )
+                path = root / f"z{level}{'l' if long_distance else ''}.jsonl.zst"
+                label = f"zstd-{level}" + ("+long" if long_distance else "")
+                report(label, shard_raw, *bench_shard(shard_rows, path, "zstd", settings))
+
+        print(f"ledgers: {args.ledger_rows:,} single-row appends, {ledger_raw / 1e6:.2f} MB")
+        report("gzip", ledger_raw, *bench_ledger(ledger_rows, root / "ledger.jsonl.gz"))
+        for level in levels:
+            set_zstd_settings(ZstdSettings(level=level, use_dictionary=False))
+            path = root / f"plain{level}" / "ledger.jsonl.zst"
+            report(f"zstd-{level}", ledger_raw, *bench_ledger(ledger_rows, path))
+            set_zstd_settings(ZstdSettings(level=level))
+            dict_dir = root / f"dict{level}"
+            # Train on rows the benchmark does not write, as a previous run's ledger would be.
+            train_zstd_dictionary(
+                [json_dumps(row) + b"\n" for row in make_ledger_rows(args.ledger_rows * 2)[::2]],
+                dict_dir,
+            )
+            report(
+                f"zstd-{level}+dict",
+                ledger_raw,
+                *bench_ledger(ledger_rows, dict_dir / "ledger.jsonl.zst"),
+            )
+        set_zstd_settings(ZstdSettings())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Train a zstd dictionary for the small-record JSONL files of one directory.
+
+Samples rows from existing JSONL files (any compression) and stores the
+dictionary next to them (``zstd.dict`` plus ``zstd-<dict_id>.dict``); ``.zst``
+files created in that directory afterwards are compressed with it. Point it at
+a previous run's ledgers to give a pipeline's ``_ledger`` directory its own
+dictionary.
+
+Example:
+    python -m tools.train_zstd_dictionary --sample _ledger/combined_index.jsonl --out-dir _ledger
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+from pathlib import Path
+
+from collector_core.utils.io import ZSTD_DICT_SIZE, json_dumps, read_jsonl, train_zstd_dictionary
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Train a zstd dictionary from JSONL samples.")
+    ap.add_argument("--sample", type=Path, nargs="+", required=True, help="JSONL files to sample.")
+    ap.add_argument(
+        "--out-dir",
+        type=Path,
+        default=None,
+        help="Directory to store the dictionary in (default: the first sample's directory).",
+    )
+    ap.add_argument("--max-samples", type=int, default=20_000, help="Rows to train on.")
+    ap.add_argument("--size", type=int, default=ZSTD_DICT_SIZE, help="Dictionary size in bytes.")
+    args = ap.parse_args()
+
+    rows = itertools.chain.from_iterable(read_jsonl(path) for path in args.sample)
+    samples = [json_dumps(row) + b"\n" for row in itertools.islice(rows, args.max_samples)]
+    out_dir = args.out_dir or args.sample[0].parent
+    path = train_zstd_dictionary(samples, out_dir, size=args.size)
+    print(f"Trained {path} from {len(samples):,} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from collector_core import acquire_strategies as aw
+from collector_core.acquire.context import RootsDefaults
+from collector_core.acquire.strategies import http_async
+from collector_core.acquire.strategies.registry import build_default_handlers
+from collector_core.acquire.worker import run_acquire_worker, run_target_async
+
+pytestmark = pytest.mark.skipif(
+    not http_async.is_async_available(), reason="aiohttp or httpx not installed"
+)
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        server = self.server
+        with server.lock:  # type: ignore[attr-defined]
+            server.paths.append(self.path)  # type: ignore[attr-defined]
+            server.in_flight += 1  # type: ignore[attr-defined]
+            server.peak = max(server.peak, server.in_flight)  # type: ignore[attr-defined]
+        time.sleep(0.02)
+        body = self.path.encode("utf-8") * 10
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:  # type: ignore[attr-defined]
+            server.in_flight -= 1  # type: ignore[attr-defined]
+
+    def log_message(self, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()  # type: ignore[attr-defined]
+    httpd.paths = []  # type: ignore[attr-defined]
+    httpd.in_flight = 0  # type: ignore[attr-defined]
+    httpd.peak = 0  # type: ignore[attr-defined]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def run_worker(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    rows: list[dict],
+    engine: str,
+    *extra: str,
+) -> dict:
+    root = tmp_path / engine
+    queue = root / "queue.jsonl"
+    queue.parent.mkdir(parents=True)
+    queue.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    handlers = build_default_handlers()
+    handlers["local"] = lambda ctx, row, out_dir: [{"status": "ok", "path": str(out_dir)}]
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "acquire",
+            "--queue",
+            str(queue),
+            "--bucket",
+            "green",
+            "--dataset-root",
+            str(root),
+            "--execute",
+            "--allow-non-global-download-hosts",
+            "--engine",
+            engine,
+            *extra,
+        ],
+    )
+    run_acquire_worker(
+        defaults=RootsDefaults(
+            raw_root=str(root / "raw"),
+            manifests_root=str(root / "_manifests"),
+            ledger_root=str(root / "_ledger"),
+            logs_root=str(root / "_logs"),
+        ),
+        targets_yaml_label="targets.yaml",
+        strategy_handlers=handlers,
+    )
+    return json.loads((root / "_logs" / "acquire_summary_green.json").read_text())
+
+
+def test_async_engine_matches_threaded_outputs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, server: ThreadingHTTPServer
+) -> None:
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    rows = [
+        {
+            "id": f"t{idx}",
+            "license_profile": "permissive",
+            "download": {
+                "strategy": "http",
+                "urls": [f"{base}/t{idx}/a.txt", f"{base}/t{idx}/b.txt"],
+            },
+        }
+        for idx in range(12)
+    ]
+    rows.append({"id": "other", "license_profile": "permissive", "download": {"strategy": "local"}})
+
+    threaded = run_worker(tmp_path, monkeypatch, rows, "threads", "--workers", "2")
+    server.peak = 0  # type: ignore[attr-defined]
+    async_summary = run_worker(
+        tmp_path, monkeypatch, rows, "async", "--max-concurrent", "16", "--per-host-concurrency=3"
+    )
+
+    assert async_summary["results"] == threaded["results"]
+    assert async_summary["counts"] == {"total": 13, "ok": 13}
+    assert async_summary["engine"] == "async"
+    assert async_summary["async_engine"]["downloads"] == 24
+    assert async_summary["async_engine"]["peak_in_flight"] <= 3
+    assert server.peak <= 3  # type: ignore[attr-defined]
+    for idx in range(12):
+        out_dir = tmp_path / "async" / "raw" / "green" / "permissive" / f"t{idx}"
+        assert (out_dir / "a.txt").read_bytes() == f"/t{idx}/a.txt".encode() * 10
+        manifest = json.loads((out_dir / "download_manifest.json").read_text())
+        assert [result["status"] for result in manifest["results"]] == ["ok", "ok"]
+        marker = tmp_path / "async" / "_manifests" / f"t{idx}" / "acquire_done.json"
+        assert json.loads(marker.read_text())["status"] == "ok"
+    assert (tmp_path / "async" / "_manifests" / "other" / "acquire_done.json").exists()
+
+
+def test_async_engine_stops_fetching_at_target_byte_limit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, server: ThreadingHTTPServer
+) -> None:
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/f{idx}.bin" for idx in range(6)]
+    rows = [
+        {
+            "id": "capped",
+            "license_profile": "permissive",
+            "download": {"strategy": "http", "urls": urls, "max_bytes": 150},
+        }
+    ]
+
+    # One connection per host serialises the files so the budget trips deterministically.
+    summary = run_worker(tmp_path, monkeypatch, rows, "async", "--per-host-concurrency", "1")
+
+    out_dir = tmp_path / "async" / "raw" / "green" / "permissive" / "capped"
+    manifest = json.loads((out_dir / "download_manifest.json").read_text())
+    statuses = [(r["status"], r.get("limit_type")) for r in manifest["results"]]
+    assert summary["counts"]["ok"] == 1
+    # 70 + 70 bytes fit, the third file overshoots and is removed, then fetching stops.
+    assert statuses == [
+        ("ok", None),
+        ("ok", None),
+        ("error", "bytes_per_target"),
+        ("error", "bytes_per_target"),
+    ]
+    assert not (out_dir / "f2.bin").exists()
+    assert server.paths == ["/f0.bin", "/f1.bin", "/f2.bin"]  # type: ignore[attr-defined]
+
+
+def test_async_target_finishes_off_the_event_loop(tmp_path: Path) -> None:
+    ctx = aw.AcquireContext(
+        roots=aw.Roots(tmp_path / "raw", tmp_path / "m", tmp_path / "l", tmp_path / "logs"),
+        limits=aw.Limits(None, None, None),
+        mode=aw.RunMode(True, True, False, False, True, 1),
+        retry=aw.RetryConfig(max_attempts=1),
+    )
+    row = {"id": "slow_post", "license_profile": "permissive", "download": {"strategy": "local"}}
+    threads: list[int] = []
+    ticks: list[int] = []
+    ticks_during_postprocess: list[int] = []
+
+    def postprocess(*_args: object) -> dict:
+        threads.append(threading.get_ident())
+        time.sleep(0.2)
+        ticks_during_postprocess.append(len(ticks))
+        return {"slow": {"status": "ok"}}
+
+    async def tick() -> None:
+        for idx in range(5):
+            await asyncio.sleep(0.01)
+            ticks.append(idx)
+
+    async def run() -> dict:
+        result, _ = await asyncio.gather(
+            run_target_async(
+                ctx,
+                "green",
+                row,
+                {"local": lambda ctx, row, out_dir: [{"status": "ok"}]},
+                postprocess,
+            ),
+            tick(),
+        )
+        return result
+
+    loop_thread = threading.get_ident()
+    result = asyncio.run(run())
+
+    assert result["status"] == "ok"
+    assert threads and threads[0] != loop_thread
+    # The loop kept running other tasks while the postprocessor blocked.
+    assert ticks_during_postprocess == [5]
+    manifest = tmp_path / "raw" / "green" / "permissive" / "slow_post" / "download_manifest.json"
+    assert json.loads(manifest.read_text())["post_processors"] == {"slow": {"status": "ok"}}
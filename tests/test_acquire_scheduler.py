@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from collector_core.acquire.context import RootsDefaults
+from collector_core.acquire.scheduler import (
+    TargetScheduler,
+    expected_bytes,
+    parse_size_hint,
+    target_host,
+)
+from collector_core.acquire.worker import run_acquire_worker
+
+
+def row(target_id: str, **download: object) -> dict:
+    return {"id": target_id, "license_profile": "permissive", "download": download}
+
+
+def test_target_host_and_size_hints() -> None:
+    assert target_host(row("a", strategy="http", urls=["https://Files.Example.org/a"])) == (
+        "files.example.org"
+    )
+    assert target_host(row("z", strategy="zenodo", record_id="123")) == "zenodo.org"
+    assert target_host(row("s", strategy="s3_sync", urls=["s3://open-data/x/"])) == (
+        "open-data.s3.amazonaws.com"
+    )
+    assert target_host(row("t", strategy="torrent", magnet="magnet:?xt=1")) == "<torrent>"
+
+    assert parse_size_hint("~100GB+") == 100 * 1000**3
+    assert parse_size_hint("1.5 GiB") == 3 * 1024**3 // 2
+    assert parse_size_hint("unknown") is None
+    assert expected_bytes(row("a", expected_size=[10, "20", None])) == 30
+    assert expected_bytes(row("b", expected_size={"x.bin": 5})) == 5
+    assert expected_bytes(row("c", expected={"size_hint": "~2TB"})) == 2 * 1000**4
+    assert expected_bytes(row("d", config={"size_hint": "500MB"})) == 500 * 1000**2
+    assert expected_bytes(row("e", strategy="http")) is None
+
+
+def test_scheduler_interleaves_hosts_largest_first_under_cap() -> None:
+    rows = [
+        row("z1", strategy="zenodo", expected_size=10),
+        row("z2", strategy="zenodo", expected_size=30),
+        row("z3", strategy="zenodo"),
+        row("z4", strategy="zenodo", expected_size=20),
+        row("a1", url="https://a.example/1", expected_size=5),
+        row("big", url="https://b.example/big", expected={"size_hint": "~1TB"}),
+    ]
+    scheduler = TargetScheduler(rows, per_host=2, snapshot_every=4)
+
+    started = [scheduler.next() for _ in range(5)]
+    ids = [picked[1]["id"] for picked in started if picked is not None]
+    # One per host first (largest head first), then zenodo up to its cap of 2.
+    assert ids == ["big", "z2", "a1", "z4"]
+    assert started[-1] is None
+
+    scheduler.done(1)  # z2 finishes
+    assert scheduler.next() == (0, rows[0])
+    scheduler.done(3)
+    assert scheduler.next() == (2, rows[2])  # size unknown: last
+    assert scheduler.next() is None and scheduler.pending == 0
+
+    stats = scheduler.stats()
+    assert stats["hosts"]["zenodo.org"] == {
+        "targets": 4,
+        "expected_bytes": 60,
+        "unknown_size": 1,
+        "peak_in_flight": 2,
+        "capped": 1,
+    }
+    assert stats["decisions"][0] == {
+        "id": "big",
+        "host": "b.example",
+        "expected_bytes": 1000**4,
+        "host_in_flight": 1,
+        "queue_depth": 0,
+    }
+    assert [d["queue_depth"] for d in stats["decisions"]] == [0, 3, 0, 2, 1, 0]
+    # Full per-host depths only every ``snapshot_every`` decisions.
+    assert stats["depth_snapshots"] == [
+        {"decision": 0, "queue_depths": {"zenodo.org": 4, "a.example": 1}},
+        {"decision": 4, "queue_depths": {"zenodo.org": 1}},
+    ]
+
+
+def test_threaded_worker_enforces_per_host_concurrency(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lock = threading.Lock()
+    in_flight: Counter[str] = Counter()
+    peak: Counter[str] = Counter()
+
+    def slow(ctx: object, target: dict, out_dir: Path) -> list[dict]:
+        host = target_host(target)
+        with lock:
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+        time.sleep(0.02)
+        with lock:
+            in_flight[host] -= 1
+        return [{"status": "ok", "path": str(out_dir)}]
+
+    rows = [
+        row(f"h{idx}", strategy="slow", url=f"https://h{idx % 2}.example/f") for idx in range(6)
+    ]
+    queue = tmp_path / "queue.jsonl"
+    queue.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "acquire",
+            "--queue",
+            str(queue),
+            "--bucket",
+            "green",
+            "--dataset-root",
+            str(tmp_path),
+            "--execute",
+            "--workers",
+            "4",
+            "--per-host-concurrency",
+            "1",
+        ],
+    )
+    run_acquire_worker(
+        defaults=RootsDefaults(
+            raw_root=str(tmp_path / "raw"),
+            manifests_root=str(tmp_path / "_manifests"),
+            ledger_root=str(tmp_path / "_ledger"),
+            logs_root=str(tmp_path / "_logs"),
+        ),
+        targets_yaml_label="targets.yaml",
+        strategy_handlers={"slow": slow},
+    )
+
+    summary = json.loads((tmp_path / "_logs" / "acquire_summary_green.json").read_text())
+    assert [r["id"] for r in summary["results"]] == [r["id"] for r in rows]
+    assert summary["counts"] == {"total": 6, "ok": 6}
+    assert peak == {"h0.example": 1, "h1.example": 1}
+    scheduler = summary["scheduler"]
+    assert scheduler["per_host"] == 1
+    assert [d["host"] for d in scheduler["decisions"][:2]] == ["h0.example", "h1.example"]
+    assert scheduler["hosts"]["h0.example"]["targets"] == 3
@@ -276,7 +276,11 @@ def test_zenodo_md5_mismatch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
         )
 
     def fake_download(
-        ctx: aw.AcquireContext, url: str, out_path: Path, expected_size: int | None = None
+        ctx: aw.AcquireContext,
+        url: str,
+        out_path: Path,
+        expected_size: int | None = None,
+        **_kwargs: object,
     ):
         out_path.write_bytes(b"actual")
         return {"status": "ok", "path": str(out_path)}
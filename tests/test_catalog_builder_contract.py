@@ -215,6 +215,27 @@ class TestCatalogHelpers:
         count = count_lines(gz_file)
         assert count == 4
 
+    def test_count_lines_with_zstd_file(self, tmp_path: Path) -> None:
+        """count_lines should count decompressed lines of .zst files."""
+        import zstandard
+
+        zst_file = tmp_path / "test.jsonl.zst"
+        zst_file.write_bytes(zstandard.ZstdCompressor().compress(b"line1\nline2\nline3"))
+
+        assert count_lines(zst_file) == 3
+        assert count_lines(zst_file, max_lines=2) == 2
+
+    def test_collect_queue_stats_reports_malformed_lines(self, tmp_path: Path) -> None:
+        """collect_queue_stats should count queue lines that are not valid JSON."""
+        (tmp_path / "green_download.jsonl").write_text(
+            '{"id": "a", "license_profile": "permissive"}\n{"id": \n', encoding="utf-8"
+        )
+
+        stats = collect_queue_stats(tmp_path)
+        assert stats["buckets"]["green"]["targets"] == 1
+        assert stats["buckets"]["green"]["malformed_lines"] == 1
+        assert stats["buckets"]["red"]["malformed_lines"] == 0
+
     def test_count_lines_with_encoding_errors(self, tmp_path: Path) -> None:
         """count_lines should handle encoding errors gracefully."""
         test_file = tmp_path / "bad_encoding.txt"
@@ -303,3 +324,15 @@ class TestCollectShardStage:
 
         stats = collect_shard_stage(tmp_path)
         assert stats["pools"]["permissive"]["files"] == 2
+
+    def test_reports_provenance_sidecars(self, tmp_path: Path) -> None:
+        """Should count merge provenance sidecars without treating them as shards."""
+        (tmp_path / "permissive" / "shards").mkdir(parents=True)
+        (tmp_path / "permissive" / "shards" / "combined_00000.jsonl").write_text("{}\n")
+        (tmp_path / "permissive" / "shard_updates").mkdir()
+        (tmp_path / "permissive" / "shard_updates" / "combined_00000.jsonl").write_text("{}\n{}\n")
+
+        stats = collect_shard_stage(tmp_path)
+        assert stats["pools"]["permissive"]["files"] == 1
+        assert stats["pools"]["permissive"]["update_files"] == 1
+        assert stats["pools"]["permissive"]["update_rows"] == 2
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from collector_core.shard_index import count_shard_records
+
+CODE_WORKER = Path(__file__).resolve().parents[1] / "code_pipeline_v2" / "code_worker.py"
+
+
+def load_code_worker() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("code_pipeline_v2_code_worker", CODE_WORKER)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_code_worker_streams_rotating_shards(tmp_path: Path) -> None:
+    code_worker = load_code_worker()
+    src = tmp_path / "repo"
+    src.mkdir()
+    for idx in range(5):
+        body = "".join(f"def f{idx}_{n}(x):\n    return x + {n}\n\n" for n in range(20))
+        (src / f"mod{idx}.py").write_text(body, encoding="utf-8")
+
+    out_dir = tmp_path / "out" / "shards"
+    manifest = code_worker.run_extraction(
+        input_dir=src,
+        target_id="repo",
+        license_profile="permissive",
+        bucket="green",
+        processing_defaults={"min_chunk_chars": 10, "max_chunk_chars": 200},
+        sharding={"max_records_per_shard": 4, "index_every": 2},
+        output_dir=out_dir,
+    )
+
+    shards = sorted(out_dir.glob("code_*.jsonl.gz"))
+    assert [Path(p) for p in sorted(manifest["shards"])] == shards
+    rows = [
+        json.loads(line)
+        for shard in shards
+        for line in gzip.open(shard, "rt", encoding="utf-8").read().splitlines()
+    ]
+    assert len(rows) == manifest["records_emitted"] > 4
+    assert all(len(gzip.open(s, "rt").read().splitlines()) == 4 for s in shards[:-1])
+    assert count_shard_records(shards[0]) == 4
+    assert not list(out_dir.glob("*.tmp"))
+
+    # Re-running replaces the shards instead of appending to them.
+    rerun = code_worker.run_extraction(
+        input_dir=src,
+        target_id="repo",
+        license_profile="permissive",
+        bucket="green",
+        processing_defaults={"min_chunk_chars": 10, "max_chunk_chars": 200},
+        sharding={"max_records_per_shard": 4, "index_every": 2},
+        output_dir=out_dir,
+    )
+    assert rerun["records_emitted"] == manifest["records_emitted"]
+    assert sum(len(gzip.open(s, "rt").read().splitlines()) for s in shards) == len(rows)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from collector_core import acquire_strategies as aw
+from collector_core.acquire.strategies import http as http_mod
+from collector_core.acquire.strategies import http_async
+from collector_core.acquire.strategies.http_base import HttpDownloadBase
+from collector_core.utils.hash import HashingSink
+
+PAYLOAD = bytes(range(256)) * 4096
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header:
+            start = int(range_header.removeprefix("bytes=").split("-", 1)[0])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}")
+        else:
+            self.send_response(200)
+        body = PAYLOAD[start:]
+        self.server.ranges.append(range_header)  # type: ignore[attr-defined]
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    httpd.daemon_threads = True
+    httpd.ranges = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def no_rehash(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*_args: object, **_kwargs: object) -> str:
+        raise AssertionError("downloaded file was re-read to hash it")
+
+    monkeypatch.setattr(HttpDownloadBase, "sha256_file", staticmethod(fail))
+
+
+def make_ctx(tmp_path: Path) -> aw.AcquireContext:
+    return aw.AcquireContext(
+        roots=aw.Roots(tmp_path / "raw", tmp_path / "m", tmp_path / "l", tmp_path / "logs"),
+        limits=aw.Limits(None, None, None),
+        mode=aw.RunMode(True, True, False, False, True, 1),
+        retry=aw.RetryConfig(max_attempts=1, backoff_base=0.0, backoff_max=0.0),
+        allow_non_global_download_hosts=True,
+    )
+
+
+def test_hashing_sink_hashes_writes_and_resumed_prefix(tmp_path: Path) -> None:
+    path = tmp_path / "payload.part"
+    with HashingSink(path, algorithms=("MD5",)) as sink:
+        sink.write(PAYLOAD[:1000])
+    with HashingSink(path, "ab", algorithms=("md5", "sha1")) as sink:
+        sink.write(PAYLOAD[1000:])
+
+    assert path.read_bytes() == PAYLOAD
+    assert (sink.prefix_bytes, sink.bytes_written, sink.size) == (
+        1000,
+        len(PAYLOAD) - 1000,
+        len(PAYLOAD),
+    )
+    assert sink.hexdigests() == {
+        "sha256": hashlib.sha256(PAYLOAD).hexdigest(),
+        "md5": hashlib.md5(PAYLOAD).hexdigest(),
+        "sha1": hashlib.sha1(PAYLOAD).hexdigest(),
+    }
+    with pytest.raises(ValueError):
+        HashingSink(path, "rb")
+
+
+def test_http_resume_hashes_in_one_pass(
+    tmp_path: Path, server: ThreadingHTTPServer, no_rehash: None
+) -> None:
+    out_path = tmp_path / "payload.bin"
+    out_path.with_name("payload.bin.part").write_bytes(PAYLOAD[:300_000])
+
+    result = http_mod._http_download_with_resume(
+        make_ctx(tmp_path),
+        f"http://127.0.0.1:{server.server_address[1]}/payload.bin",
+        out_path,
+        expected_sha256=hashlib.sha256(PAYLOAD).hexdigest(),
+        digests=("md5",),
+    )
+
+    assert result["status"] == "ok"
+    assert server.ranges == ["bytes=300000-"]  # type: ignore[attr-defined]
+    assert out_path.read_bytes() == PAYLOAD
+    assert result["sha256"] == hashlib.sha256(PAYLOAD).hexdigest()
+    assert result["md5"] == hashlib.md5(PAYLOAD).hexdigest()
+
+
+@pytest.mark.skipif(not http_async.is_async_available(), reason="aiohttp or httpx not installed")
+def test_async_download_hashes_while_streaming(
+    tmp_path: Path, server: ThreadingHTTPServer, no_rehash: None
+) -> None:
+    out_path = tmp_path / "payload.bin"
+    out_path.with_name("payload.bin.part").write_bytes(PAYLOAD[:5])
+
+    result = asyncio.run(
+        http_async.async_download_with_resume(
+            make_ctx(tmp_path), f"http://127.0.0.1:{server.server_address[1]}/p", out_path
+        )
+    )
+
+    assert result["status"] == "ok"
+    assert server.ranges == ["bytes=5-"]  # type: ignore[attr-defined]
+    assert result["sha256"] == hashlib.sha256(PAYLOAD).hexdigest()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from collector_core import acquire_strategies as aw
+from collector_core.acquire.strategies import http as http_mod
+from collector_core.utils.http import HttpSessionPool, pooled_get
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        body = self.path.encode("utf-8")
+        self.server.seen.append((self.client_address, dict(self.headers)))  # type: ignore[attr-defined]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RecordingHandler)
+    httpd.seen = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def base_url(httpd: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{httpd.server_address[1]}"
+
+
+def test_pool_reuses_connections_and_sets_default_headers(server: ThreadingHTTPServer) -> None:
+    with HttpSessionPool(workers=2, user_agent="tester/1", headers={"X-Run": "r1"}) as pool:
+        for idx in range(5):
+            with pool.get(f"{base_url(server)}/file/{idx}", timeout=5) as resp:
+                assert resp.content == f"/file/{idx}".encode()
+        with pool.get(f"{base_url(server)}/ua", headers={"User-Agent": "override/2"}, timeout=5):
+            pass
+
+    clients = {client for client, _ in server.seen}
+    assert len(server.seen) == 6
+    assert len(clients) == 1
+    assert [headers["User-Agent"] for _, headers in server.seen[:5]] == ["tester/1"] * 5
+    assert server.seen[-1][1]["User-Agent"] == "override/2"
+    assert all(headers["X-Run"] == "r1" for _, headers in server.seen)
+
+
+def test_pool_gives_each_thread_its_own_session(server: ThreadingHTTPServer) -> None:
+    with HttpSessionPool(workers=4) as pool:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = list(executor.map(lambda _: id(pool.session()), range(16)))
+        assert pool.session() is pool.session()
+    assert len(set(sessions)) <= 4
+
+
+def test_pooled_get_falls_back_without_pool() -> None:
+    def fallback(url: str, **kwargs: object) -> str:
+        return url
+
+    assert pooled_get(None, fallback) is fallback
+    with HttpSessionPool() as pool:
+        assert pooled_get(pool, fallback) == pool.get
+
+
+def test_http_download_uses_context_pool(tmp_path: Path, server: ThreadingHTTPServer) -> None:
+    ctx = aw.AcquireContext(
+        roots=aw.Roots(tmp_path / "raw", tmp_path / "m", tmp_path / "l", tmp_path / "logs"),
+        limits=aw.Limits(None, None, None),
+        mode=aw.RunMode(True, True, False, False, False, 1),
+        retry=aw.RetryConfig(max_attempts=1, backoff_base=0.0, backoff_max=0.0),
+        allow_non_global_download_hosts=True,
+        http=HttpSessionPool(user_agent="acquire-test/1"),
+    )
+    try:
+        for idx in range(3):
+            result = http_mod._http_download_with_resume(
+                ctx, f"{base_url(server)}/data/{idx}.txt", tmp_path / f"{idx}.txt"
+            )
+            assert result["status"] == "ok"
+            assert (tmp_path / f"{idx}.txt").read_bytes() == f"/data/{idx}.txt".encode()
+    finally:
+        ctx.http.close()
+
+    assert len({client for client, _ in server.seen}) == 1
+    assert {headers["User-Agent"] for _, headers in server.seen} == {"acquire-test/1"}
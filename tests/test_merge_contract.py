@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from collector_core.merge.contract import canonicalize_row, normalize_record, resolve_canonicalize_config
+from collector_core.merge.contract import (
+    canonicalize_row,
+    normalize_record,
+    resolve_canonicalize_config,
+)
 
 
 def test_canonicalize_row_uses_candidates_and_limits() -> None:
@@ -170,3 +174,56 @@ def test_resolve_routing_empty_when_no_routing() -> None:
     raw = {"text": "hello", "other": "value"}
     result = resolve_routing(raw)
     assert result == {}
+
+
+def test_canonicalize_plans_match_row_path() -> None:
+    """Compiled plans produce the same record as canonicalize_row + normalize_record."""
+    from collector_core.merge.contract import CanonicalizePlans
+
+    target_canon = {"t1": (["title", "body"], 8)}
+    target_meta = {"t1": {"dataset_id": "ds1", "config": "cfg1"}}
+    plans = CanonicalizePlans(
+        target_canon,
+        (["text"], None),
+        target_meta,
+        pipeline_id="pipe",
+        clock=lambda: "2024-01-01T00:00:00Z",
+    )
+    rows = [
+        {"title": "hello world", "source": {"license_profile": "permissive"}},
+        {"body": "abc", "id": 7, "source_urls": ["https://example.org/a"]},
+    ]
+    for raw in rows:
+        expected, reason = canonicalize_row(
+            raw, "t1", "permissive", ["title", "body"], 8, target_meta["t1"], pipeline_id="pipe"
+        )
+        assert reason is None and expected is not None
+        expected = normalize_record(
+            expected,
+            target_id="t1",
+            pool="permissive",
+            pipeline_id="pipe",
+            target_meta=target_meta["t1"],
+            context="green/t1",
+        )
+        record, reason = plans.canonicalize(raw, "t1", "permissive")
+        assert reason is None and record is not None
+        for key in ("timestamp_created", "timestamp_updated"):
+            expected.pop(key)
+            assert record.pop(key) == "2024-01-01T00:00:00Z"
+        assert record == expected
+        assert "record_id" not in raw
+
+    assert plans.canonicalize("nope", "t1", "permissive") == (None, "unsupported_row_type")  # type: ignore[arg-type]
+    record, _ = plans.canonicalize({"text": "x" * 20}, "unknown", "permissive")
+    assert record is not None and record["dataset_id"] == "unknown"
+    assert plans.for_target("unknown").candidates == ("text",)
+
+
+def test_utc_clock_matches_utc_now() -> None:
+    from collector_core.utils.logging import UtcClock, utc_now
+
+    clock = UtcClock()
+    first = clock()
+    assert clock() in {first, utc_now()}
+    assert len(first) == len("2024-01-01T00:00:00Z")
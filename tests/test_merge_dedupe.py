@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import sqlite3
+
 import pytest
 
 from collector_core.merge.dedupe import (
+    BloomDedupeIndex,
     DedupeIndex,
+    MemoryDedupeIndex,
     PartitionedDedupeIndex,
     build_dedupe_update,
+    dedupe_index_factory,
     merge_distinct_urls,
     merge_provenance_update,
     merge_update_payload,
 )
+from collector_core.utils.hash import sha256_text
 
 
 def test_merge_distinct_urls_dedupes_and_limits() -> None:
@@ -34,6 +40,46 @@ def test_partitioned_dedupe_index_partitions(tmp_path) -> None:
         PartitionedDedupeIndex(tmp_path / "other.sqlite", partitions=1)
 
 
+def test_memory_dedupe_index_grows_and_keeps_contract() -> None:
+    index = MemoryDedupeIndex(capacity=4)
+    hashes = [sha256_text(str(idx)) for idx in range(5000)]
+    assert all(index.add_if_new(content_hash) for content_hash in hashes)
+    assert not any(index.add_if_new(content_hash) for content_hash in hashes)
+    assert len(index) == 5000
+    # Non-hex keys and the all-zero digest (the empty-slot marker) still dedupe.
+    assert index.add_if_new("hash1") is True
+    assert index.add_if_new("hash1") is False
+    assert index.add_if_new("0" * 64) is True
+    assert index.add_if_new("0" * 64) is False
+    index.close()
+
+
+def test_bloom_dedupe_index_batches_and_spills(tmp_path) -> None:
+    path = tmp_path / "dedupe.sqlite"
+    # Deliberately undersized so the filter saturates and falls back to SQLite.
+    index = BloomDedupeIndex(path, expected_items=16, batch_size=7)
+    hashes = [sha256_text(str(idx)) for idx in range(500)]
+    assert [index.add_if_new(content_hash) for content_hash in hashes] == [True] * 500
+    assert [index.add_if_new(content_hash) for content_hash in hashes] == [False] * 500
+    assert index.stats()["db_lookups"] > 0
+    index.close()
+
+    conn = sqlite3.connect(str(path))
+    assert conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0] == 500
+    conn.close()
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "bloom", "memory"])
+def test_dedupe_index_factory_backends(tmp_path, backend: str) -> None:
+    index = dedupe_index_factory(backend, expected_items=100)(tmp_path / "dedupe.sqlite")
+    assert index.add_if_new("ab" * 32) is True
+    assert index.add_if_new("ab" * 32) is False
+    index.close()
+
+    with pytest.raises(ValueError, match="Unknown dedupe backend"):
+        dedupe_index_factory("redis")
+
+
 def test_merge_update_payload_and_provenance() -> None:
     base = {"source_urls": ["a"], "duplicates": []}
     update = build_dedupe_update(
@@ -50,3 +96,62 @@ def test_merge_update_payload_and_provenance() -> None:
     assert record["source_urls"] == ["a", "b"]
     assert record["provenance"]["duplicates"]
     assert "timestamp_updated" in record
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "bloom", "memory"])
+def test_dedupe_index_tracks_shard_ids(tmp_path, backend: str) -> None:
+    index = dedupe_index_factory(backend, expected_items=100, batch_size=3)(
+        tmp_path / "dedupe.sqlite"
+    )
+    hashes = [sha256_text(str(idx)) for idx in range(200)]
+    for content_hash in hashes:
+        index.add_if_new(content_hash)
+    index.assign_shard(hashes[:100], "shards/combined_00000.jsonl.gz")
+    index.assign_shard(hashes[100:150], "shards/combined_00001.jsonl.gz")
+
+    assert index.shard_id("shards/combined_00001.jsonl.gz") == 1
+    assert index.shard_for(hashes[0]) == "shards/combined_00000.jsonl.gz"
+    assert index.shard_for(hashes[120]) == "shards/combined_00001.jsonl.gz"
+    assert index.shard_for(hashes[199]) is None
+    assert index.shard_for(sha256_text("never added")) is None
+    index.close()
+
+
+def test_persisted_dedupe_index_keeps_shard_registry(tmp_path) -> None:
+    path = tmp_path / "dedupe.sqlite"
+    index = BloomDedupeIndex(path, expected_items=100)
+    index.add_if_new("ab" * 32)
+    index.assign_shard(["ab" * 32], "combined_00007.jsonl.gz")
+    index.close()
+
+    reopened = DedupeIndex(path, reset=False)
+    assert reopened.add_if_new("ab" * 32) is False
+    assert reopened.shard_for("ab" * 32) == "combined_00007.jsonl.gz"
+    assert reopened.shard_id("combined_00008.jsonl.gz") == 1
+    reopened.close()
+
+
+def test_partitioned_dedupe_index_shares_shard_registry(tmp_path) -> None:
+    index = PartitionedDedupeIndex(tmp_path / "dedupe.sqlite", partitions=3)
+    hashes = [sha256_text(str(idx)) for idx in range(30)]
+    for content_hash in hashes:
+        index.add_if_new(content_hash)
+    index.assign_shard(hashes, "combined_00000.jsonl.gz")
+    assert {index.shard_for(content_hash) for content_hash in hashes} == {"combined_00000.jsonl.gz"}
+    index.close()
+
+
+def test_memory_dedupe_index_keeps_shard_ids_when_growing() -> None:
+    index = MemoryDedupeIndex(capacity=4)
+    early = [sha256_text(str(idx)) for idx in range(10)]
+    for content_hash in early:
+        index.add_if_new(content_hash)
+    index.assign_shard(early + ["0" * 64], "combined_00000.jsonl")
+    for idx in range(10, 3000):
+        index.add_if_new(sha256_text(str(idx)))
+    index.add_if_new("0" * 64)
+    index.assign_shard(["0" * 64], "combined_00001.jsonl")
+    assert [index.shard_for(content_hash) for content_hash in early] == [
+        "combined_00000.jsonl"
+    ] * 10
+    assert index.shard_for("0" * 64) == "combined_00001.jsonl"
@@ -22,3 +22,22 @@ def test_iter_hf_dataset_dirs_and_inputs(tmp_path) -> None:
     assert len(items) == 1
     assert items[0].raw["text"] == "hello"
     assert items[0].raw["split"] == "train"
+
+
+def test_iter_hf_inputs_batches_match_row_iteration(tmp_path) -> None:
+    from datasets import DatasetDict
+
+    from collector_core.utils.hf import iter_dataset_batches
+
+    rows = {"text": [f"row {idx}" for idx in range(5)], "meta": [{"n": idx} for idx in range(5)]}
+    dataset_dir = tmp_path / "hf_dataset"
+    DatasetDict(
+        {"validation": Dataset.from_dict(rows), "train": Dataset.from_dict(rows)}
+    ).save_to_disk(str(dataset_dir))
+
+    train = Dataset.from_dict(rows)
+    assert [len(batch) for batch in iter_dataset_batches(train, batch_size=2)] == [2, 2, 1]
+
+    items = list(iter_hf_inputs([dataset_dir], target_id="t1", pool="permissive", batch_size=2))
+    expected = [{**dict(raw), "split": split} for split in ("train", "validation") for raw in train]
+    assert [item.raw for item in items] == expected
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from collector_core import merge as merge_worker
+from collector_core.merge.incremental import (
+    INPUT_MANIFEST_NAME,
+    NEAR_DEDUP_INDEX_NAME,
+    InputWatermarks,
+    append_offset,
+    fingerprint_unchanged,
+    input_fingerprint,
+)
+from collector_core.merge.shard import Sharder
+from collector_core.merge.types import MergeRuntimeConfig, RootDefaults, ShardingConfig
+from collector_core.merge.updates import iter_shard_records
+
+
+def write_rows(path: Path, texts: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        for text in texts:
+            handle.write(json.dumps({"text": text}) + "\n")
+
+
+def run_merge(root: Path, **runtime: object) -> dict:
+    cfg = {
+        "globals": {
+            "raw_root": str(root / "raw"),
+            "screened_yellow_root": str(root / "screened_yellow"),
+            "combined_root": str(root / "combined"),
+            "ledger_root": str(root / "_ledger"),
+            "sharding": {"max_records_per_shard": 4, "compression": "gzip"},
+        },
+        "targets": [{"id": "target_a"}],
+    }
+    roots = merge_worker.resolve_roots(cfg, RootDefaults("", "", "", ""))
+    return merge_worker.merge_records(
+        cfg,
+        roots,
+        execute=True,
+        pipeline_id="test",
+        runtime=MergeRuntimeConfig(**runtime),
+    )
+
+
+def read_shards(root: Path) -> list[dict]:
+    shards = sorted((root / "combined" / "permissive" / "shards").glob("combined_*.jsonl.gz"))
+    return [row for shard in shards for row in iter_shard_records(shard)]
+
+
+def test_input_fingerprint_detects_changes(tmp_path: Path) -> None:
+    path = tmp_path / "rows.jsonl"
+    write_rows(path, ["a"])
+    first = input_fingerprint(path, with_sha256=True)
+    assert fingerprint_unchanged(first, input_fingerprint(path, with_sha256=True))
+    write_rows(path, ["a", "b"])
+    assert not fingerprint_unchanged(first, input_fingerprint(path, with_sha256=True))
+
+    watermarks = InputWatermarks({str(path): input_fingerprint(path)})
+    assert watermarks.should_process(path) is False
+    assert watermarks.should_process(tmp_path) is True
+    assert watermarks.summary() == {
+        "processed_inputs": 1,
+        "unchanged_inputs": 1,
+        "appended_inputs": 0,
+    }
+
+
+def test_append_offset_requires_unchanged_prefix(tmp_path: Path) -> None:
+    path = tmp_path / "rows.jsonl"
+    write_rows(path, ["a", "b"])
+    previous = input_fingerprint(path, with_sha256=True)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"text": "c"}) + "\n")
+    watermarks = InputWatermarks({str(path): previous}, with_sha256=True)
+    assert watermarks.should_process(path) is True
+    assert watermarks.resume_offset(path) == previous["size"]
+    assert watermarks.summary()["appended_inputs"] == 1
+
+    write_rows(path, ["x", "b", "c", "d"])
+    assert append_offset(path, previous, input_fingerprint(path, with_sha256=True)) == 0
+    assert append_offset(tmp_path, previous, input_fingerprint(tmp_path)) == 0
+
+
+def test_sharder_resume_continues_numbering(tmp_path: Path) -> None:
+    cfg = ShardingConfig(max_records_per_shard=2, compression="none", prefix="combined")
+    (tmp_path / "combined_00003.jsonl").write_text("", encoding="utf-8")
+    (tmp_path / "other_00009.jsonl").write_text("", encoding="utf-8")
+    sharder = Sharder(tmp_path, cfg)
+    assert sharder.resume() == 4
+    assert sharder._path().name == "combined_00004.jsonl"
+
+
+def test_incremental_merge_only_reads_new_inputs(tmp_path: Path) -> None:
+    target_dir = tmp_path / "raw" / "green" / "permissive" / "target_a"
+    write_rows(target_dir / "day1.jsonl", [f"record {idx}" for idx in range(6)])
+    first = run_merge(tmp_path, incremental=True)
+    assert first["incremental"] is False
+    assert first["written"] == 6
+    assert (tmp_path / "_ledger" / INPUT_MANIFEST_NAME).exists()
+
+    write_rows(target_dir / "day2.jsonl", ["record 1", "record 6", "record 7"])
+    second = run_merge(tmp_path, incremental=True)
+    assert second["incremental"] is True
+    assert second["unchanged_inputs"] == 1
+    assert second["processed_inputs"] == 1
+    assert second["written"] == 2
+    assert second["deduped"] == 1
+    assert second["peak_rss_mb"] > 0
+    assert [Path(p).name for p in second["shards"]] == ["combined_00002.jsonl.gz"]
+
+    rows = read_shards(tmp_path)
+    assert sorted(row["text"] for row in rows) == [f"record {idx}" for idx in range(8)]
+    retained = next(row for row in rows if row["text"] == "record 1")
+    duplicates = retained["provenance"]["duplicates"]
+    assert [Path(entry["source_path"]).name for entry in duplicates] == ["day2.jsonl"]
+
+    third = run_merge(tmp_path, incremental=True)
+    assert third["written"] == 0
+    assert third["processed_inputs"] == 0
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+def test_incremental_merge_resumes_appended_input(tmp_path: Path, suffix: str) -> None:
+    target_dir = tmp_path / "raw" / "green" / "permissive" / "target_a"
+    target_dir.mkdir(parents=True)
+    path = target_dir / f"day1{suffix}"
+
+    def append(texts: list[str]) -> None:
+        data = "".join(json.dumps({"text": text}) + "\n" for text in texts).encode("utf-8")
+        with path.open("ab") as handle:
+            handle.write(gzip.compress(data) if suffix.endswith(".gz") else data)
+
+    append([f"record {idx}" for idx in range(6)])
+    assert run_merge(tmp_path, incremental=True)["written"] == 6
+
+    append(["record 6", "record 7"])
+    second = run_merge(tmp_path, incremental=True)
+    assert second["incremental"] is True
+    assert second["appended_inputs"] == 1
+    assert second["written"] == 2
+    assert second["deduped"] == 0
+
+    rows = read_shards(tmp_path)
+    assert sorted(row["text"] for row in rows) == [f"record {idx}" for idx in range(8)]
+    assert not any(row.get("provenance", {}).get("duplicates") for row in rows)
+    assert run_merge(tmp_path, incremental=True)["written"] == 0
+
+
+def test_incremental_merge_rereads_rewritten_input(tmp_path: Path) -> None:
+    path = tmp_path / "raw" / "green" / "permissive" / "target_a" / "day1.jsonl"
+    write_rows(path, ["record 0", "record 1"])
+    run_merge(tmp_path, incremental=True)
+
+    write_rows(path, ["record 9", "record 1", "record 2"])
+    second = run_merge(tmp_path, incremental=True)
+    assert second["appended_inputs"] == 0
+    assert second["written"] == 2
+    assert second["deduped"] == 1
+
+
+def test_failed_incremental_merge_forces_full_rerun(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "raw" / "green" / "permissive" / "target_a" / "day1.jsonl"
+    write_rows(path, ["a", "b"])
+    run_merge(tmp_path, incremental=True)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.writelines(json.dumps({"text": text}) + "\n" for text in ["c", "d", "e"])
+
+    def boom(*args: object) -> None:
+        raise RuntimeError("disk full")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(merge_worker, "get_sharder", boom)
+        with pytest.raises(RuntimeError, match="disk full"):
+            run_merge(tmp_path, incremental=True)
+    assert not (tmp_path / "_ledger" / INPUT_MANIFEST_NAME).exists()
+
+    rerun = run_merge(tmp_path, incremental=True)
+    assert rerun["incremental"] is False
+    assert rerun["deduped"] == 0
+    assert sorted(row["text"] for row in read_shards(tmp_path)) == ["a", "b", "c", "d", "e"]
+
+
+def test_incremental_merge_rejects_memory_backend() -> None:
+    cfg = {"globals": {"merge": {"incremental": True, "dedupe_backend": "memory"}}}
+    with pytest.raises(ValueError, match="persistent dedupe backend"):
+        merge_worker.resolve_merge_runtime(cfg)
+
+
+def test_incremental_merge_reuses_near_dedup_index(tmp_path: Path) -> None:
+    target_dir = tmp_path / "raw" / "green" / "permissive" / "target_a"
+    base = "the quick brown fox jumps over the lazy dog near the river bank"
+    write_rows(target_dir / "day1.jsonl", [base, "completely different words for a second row"])
+    near = {"near_dedup": True, "near_dedup_backend": "numpy", "near_dedup_threshold": 0.6}
+    first = run_merge(tmp_path, incremental=True, **near)
+    assert first["near_dedup"]["indexed_documents"] == 2
+    assert (tmp_path / "_ledger" / NEAR_DEDUP_INDEX_NAME / "signatures.npy").exists()
+
+    write_rows(target_dir / "day2.jsonl", [base + " today", "another unrelated sentence here"])
+    second = run_merge(tmp_path, incremental=True, **near)
+    assert second["incremental"] is True
+    assert second["processed_inputs"] == 1
+    assert second["near_deduped"] == 1
+    assert second["written"] == 1
+    assert second["near_dedup"]["indexed_documents"] == 3
+
+    write_rows(target_dir / "day3.jsonl", ["one more row"])
+    changed = run_merge(tmp_path, incremental=True, **{**near, "near_dedup_threshold": 0.7})
+    assert changed["incremental"] is False
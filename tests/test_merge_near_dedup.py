@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from collector_core import merge as merge_worker
+from collector_core.checks.near_duplicate import create_detector
+from collector_core.merge.near_dedup import SignaturePrefetcher
+from collector_core.merge.types import MergeRuntimeConfig, RootDefaults
+from collector_core.merge.updates import iter_shard_records
+
+
+def write_rows(path: Path, rows: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        for row in rows:
+            handle.write(json.dumps(row) + "\n")
+
+
+def write_inputs(root: Path) -> None:
+    rng = random.Random(7)
+    vocab = [f"w{idx}" for idx in range(400)]
+    texts: list[str] = []
+    for _ in range(60):
+        tokens = rng.choices(vocab, k=40)
+        texts.append(" ".join(tokens))
+        if rng.random() < 0.5:
+            tokens[rng.randrange(len(tokens))] = "edited"
+            texts.append(" ".join(tokens))
+    green = [{"text": text} for text in texts[:70]] + [{"text": "  "}, {"text": texts[3]}]
+    write_rows(root / "green" / "permissive" / "target_a" / "rows.jsonl", green)
+    yellow = [
+        {"text": text, "pool": "permissive", "source": {"target_id": "target_a"}}
+        for text in texts[60:] + texts[:5]
+    ]
+    write_rows(root / "screened_yellow" / "permissive" / "shards" / "yellow_00000.jsonl", yellow)
+
+
+def run_merge(root: Path, raw_root: Path, **runtime: object) -> dict:
+    cfg = {
+        "globals": {
+            "raw_root": str(raw_root / "raw"),
+            "screened_yellow_root": str(raw_root / "screened_yellow"),
+            "combined_root": str(root / "combined"),
+            "ledger_root": str(root / "_ledger"),
+            "sharding": {"max_records_per_shard": 10, "compression": "gzip"},
+        },
+        "targets": [{"id": "target_a"}],
+    }
+    roots = merge_worker.resolve_roots(cfg, RootDefaults("", "", "", ""))
+    return merge_worker.merge_records(
+        cfg, roots, execute=True, pipeline_id="test", runtime=MergeRuntimeConfig(**runtime)
+    )
+
+
+def read_outputs(root: Path) -> tuple[list[dict], list[tuple]]:
+    shards = sorted((root / "combined" / "permissive" / "shards").glob("*.jsonl.gz"))
+    rows = [row for shard in shards for row in iter_shard_records(shard)]
+    for row in rows:
+        row.pop("timestamp_created")
+        row.pop("timestamp_updated")
+    ledger = root / "_ledger" / "combined_near_deduped.jsonl"
+    events = [
+        (event["content_sha256"], event["near_duplicate_match"], event["near_duplicate_score"])
+        for event in map(json.loads, ledger.read_text(encoding="utf-8").splitlines())
+    ]
+    return rows, events
+
+
+@pytest.mark.parametrize("backend", ["numpy", "python", "simhash"])
+def test_pipelined_near_dedup_matches_sequential(tmp_path: Path, backend: str) -> None:
+    write_inputs(tmp_path / "raw")
+    near = {
+        "near_dedup": True,
+        "near_dedup_backend": backend,
+        "near_dedup_threshold": 0.8,
+        "near_dedup_hamming_bits": 6,
+    }
+    sequential = run_merge(tmp_path / "seq", tmp_path / "raw", **near)
+    pipelined = run_merge(
+        tmp_path / "pipe",
+        tmp_path / "raw",
+        near_dedup_workers=2,
+        near_dedup_batch_size=7,
+        **near,
+    )
+
+    assert sequential["near_deduped"] > 0
+    for key in ("written", "deduped", "near_deduped", "skipped"):
+        assert pipelined[key] == sequential[key]
+    assert read_outputs(tmp_path / "pipe") == read_outputs(tmp_path / "seq")
+    stats = pipelined["near_dedup"]["stats"]
+    assert stats["queries"] == sequential["near_dedup"]["stats"]["queries"]
+    assert stats["prepared"] >= stats["queries"]
+    assert {"total_prepare_ms", "avg_prepare_ms", "total_wait_ms"} <= set(stats)
+    assert pipelined["near_dedup"]["workers"] == 2
+
+
+def test_signature_prefetcher_yields_items_in_order() -> None:
+    detector = create_detector(backend="python", shingle_size=2)
+    items = [{"text": f"row {idx} shared words here"} for idx in range(9)] + [{"text": None}]
+    with SignaturePrefetcher(detector, workers=2, batch_size=2, max_pending=2) as prefetcher:
+        out = list(prefetcher.iter(items, lambda item: item["text"]))
+
+    assert [item for item, _ in out] == items
+    assert out[-1][1] is None
+    for item, (text, sketch) in (entry for entry in out if entry[1] is not None):
+        assert text == item["text"]
+        assert (sketch == detector.prepare(text)).all()
+    assert detector.stats.prepared == 9 + 9
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from collector_core import merge as merge_worker
+from collector_core.merge.types import MergeRuntimeConfig, RootDefaults
+
+
+def write_inputs(root: Path) -> None:
+    green_dir = root / "raw" / "green" / "permissive" / "target_a"
+    green_dir.mkdir(parents=True)
+    with (green_dir / "rows.jsonl").open("w", encoding="utf-8") as handle:
+        for idx in range(300):
+            handle.write(json.dumps({"text": f"green record {idx % 240}"}) + "\n")
+        handle.write(json.dumps(["not", "a", "mapping"]) + "\n")
+        handle.write('{"text": "truncated\n')
+    (green_dir / "notes.txt").write_text("not a dataset", encoding="utf-8")
+
+    shards_dir = root / "screened_yellow" / "permissive" / "shards"
+    shards_dir.mkdir(parents=True)
+    with (shards_dir / "yellow_shard_00000.jsonl").open("w", encoding="utf-8") as handle:
+        for idx in range(200):
+            text = f"green record {idx}" if idx % 10 == 0 else f"yellow record {idx}"
+            record = {
+                "text": text,
+                "source": {"target_id": "target_b", "license_profile": "permissive"},
+            }
+            handle.write(json.dumps(record) + "\n")
+        handle.write("not json\n")
+
+
+def run_merge(
+    root: Path, workers: int, dedupe_backend: str = "sqlite"
+) -> tuple[dict, list[str], list[str]]:
+    write_inputs(root)
+    cfg = {
+        "globals": {
+            "raw_root": str(root / "raw"),
+            "screened_yellow_root": str(root / "screened_yellow"),
+            "combined_root": str(root / "combined"),
+            "ledger_root": str(root / "_ledger"),
+            "sharding": {"max_records_per_shard": 50, "compression": "gzip"},
+        },
+        "targets": [{"id": "target_a"}, {"id": "target_b"}],
+    }
+    roots = merge_worker.resolve_roots(cfg, RootDefaults("raw", "screened", "combined", "ledger"))
+    summary = merge_worker.merge_records(
+        cfg,
+        roots,
+        execute=True,
+        pipeline_id="test",
+        runtime=MergeRuntimeConfig(merge_workers=workers, dedupe_backend=dedupe_backend),
+    )
+    shard_hashes: list[str] = []
+    for shard in summary["shards"]:
+        shard_hashes.extend(row["content_sha256"] for row in merge_worker.read_jsonl(Path(shard)))
+    index_hashes = [
+        row["content_sha256"]
+        for row in merge_worker.read_jsonl(roots.ledger_root / "combined_index.jsonl")
+    ]
+    return summary, shard_hashes, index_hashes
+
+
+def test_parallel_merge_matches_sequential_dedupe(tmp_path: Path) -> None:
+    sequential, seq_shards, seq_index = run_merge(tmp_path / "seq", workers=1)
+    parallel, par_shards, par_index = run_merge(tmp_path / "par", workers=3)
+
+    assert parallel["counts"] == sequential["counts"]
+    assert parallel["merge_workers"] == 3
+    assert sequential["counts"]["malformed_lines"] == 2
+    assert sorted(par_shards) == sorted(seq_shards)
+    assert len(par_shards) == len(set(par_shards))
+    assert sorted(par_index) == sorted(seq_index)
+    assert not (tmp_path / "par" / "_ledger" / "merge_parallel").exists()
+    skipped = merge_worker.read_jsonl(tmp_path / "par" / "_ledger" / "combined_skipped.jsonl")
+    assert [row["reason"] for row in skipped] == [
+        "unsupported_row_type",
+        "unsupported_green_format",
+    ]
+
+
+def test_parallel_merge_is_deterministic(tmp_path: Path) -> None:
+    first, first_shards, first_index = run_merge(tmp_path / "a", workers=2)
+    second, second_shards, second_index = run_merge(tmp_path / "b", workers=2)
+
+    assert first["counts"] == second["counts"]
+    assert [Path(p).name for p in first["shards"]] == [Path(p).name for p in second["shards"]]
+    assert first_shards == second_shards
+    assert first_index == second_index
+
+
+@pytest.mark.parametrize(("backend", "workers"), [("memory", 1), ("bloom", 1), ("bloom", 2)])
+def test_dedupe_backends_match_sqlite(tmp_path: Path, backend: str, workers: int) -> None:
+    baseline, base_shards, base_index = run_merge(tmp_path / "sqlite", workers=1)
+    summary, shards, index = run_merge(tmp_path / backend, workers=workers, dedupe_backend=backend)
+
+    assert summary["dedupe_backend"] == backend
+    assert summary["counts"] == baseline["counts"]
+    assert sorted(shards) == sorted(base_shards)
+    assert sorted(index) == sorted(base_index)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+from collector_core import merge as merge_worker
+from collector_core.catalog_builder import collect_shard_stage
+from collector_core.merge.parquet import (
+    OUTPUT_PARQUET_SCHEMA,
+    columns_to_record,
+    record_to_columns,
+)
+from collector_core.merge.shard import sharding_cfg
+from collector_core.merge.types import MergeRuntimeConfig, RootDefaults
+from collector_core.merge.updates import iter_shard_records
+
+
+def run_merge(root: Path, sharding: dict, *, raw_root: Path, **runtime: object) -> dict:
+    cfg = {
+        "globals": {
+            "raw_root": str(raw_root),
+            "screened_yellow_root": str(root / "screened_yellow"),
+            "combined_root": str(root / "combined"),
+            "ledger_root": str(root / "_ledger"),
+            "sharding": {"max_records_per_shard": 3, **sharding},
+        },
+        "targets": [{"id": "target_a"}],
+    }
+    roots = merge_worker.resolve_roots(cfg, RootDefaults("", "", "", ""))
+    return merge_worker.merge_records(
+        cfg, roots, execute=True, pipeline_id="test", runtime=MergeRuntimeConfig(**runtime)
+    )
+
+
+def write_inputs(root: Path) -> None:
+    target_dir = root / "green" / "permissive" / "target_a"
+    target_dir.mkdir(parents=True)
+    texts = ["alpha", "beta", "gamma", "delta", "alpha", "epsilon", "beta"]
+    with (target_dir / "rows.jsonl").open("w", encoding="utf-8") as handle:
+        for idx, text in enumerate(texts):
+            row = {"text": text, "source_urls": [f"https://example.org/{idx}"], "meta": {"n": idx}}
+            handle.write(json.dumps(row) + "\n")
+
+
+def read_all(root: Path, pattern: str) -> list[dict]:
+    shards = sorted((root / "combined" / "permissive" / "shards").glob(pattern))
+    rows = [row for shard in shards for row in iter_shard_records(shard)]
+    for row in rows:
+        row.pop("timestamp_created")
+        row.pop("timestamp_updated")
+        for duplicate in row.get("provenance", {}).get("duplicates", []):
+            duplicate.pop("seen_at_utc")
+    return sorted(rows, key=lambda row: row["content_sha256"])
+
+
+def test_record_columns_round_trip() -> None:
+    record = {"text": "t", "record_id": 5, "source_urls": ["u"], "pool": None, "nested": {"a": 1}}
+    columns = record_to_columns(record)
+    assert columns["text"] == "t"
+    assert "record_id" not in columns and "pool" not in columns
+    assert columns_to_record(columns) == record
+
+
+def test_sharding_cfg_parquet_defaults_and_validation() -> None:
+    resolved = sharding_cfg({"globals": {"sharding": {"format": "parquet"}}})
+    assert (resolved.format, resolved.compression) == ("parquet", "zstd")
+    with pytest.raises(ValueError, match="format"):
+        sharding_cfg({"globals": {"sharding": {"format": "csv"}}})
+    with pytest.raises(ValueError, match="compression"):
+        sharding_cfg({"globals": {"sharding": {"format": "parquet", "compression": "bz2"}}})
+
+
+@pytest.mark.parametrize("provenance_updates", ["sidecar", "rewrite"])
+def test_parquet_merge_matches_jsonl(tmp_path: Path, provenance_updates: str) -> None:
+    raw_root = tmp_path / "raw"
+    jsonl_root = tmp_path / "jsonl"
+    parquet_root = tmp_path / "parquet"
+    write_inputs(raw_root)
+    run_merge(
+        jsonl_root,
+        {"compression": "gzip"},
+        raw_root=raw_root,
+        provenance_updates=provenance_updates,
+    )
+    summary = run_merge(
+        parquet_root,
+        {"format": "parquet"},
+        raw_root=raw_root,
+        provenance_updates=provenance_updates,
+    )
+
+    assert [Path(p).name for p in summary["shards"]] == [
+        "combined_00000.parquet",
+        "combined_00001.parquet",
+    ]
+    assert read_all(parquet_root, "*.parquet") == read_all(jsonl_root, "*.jsonl.gz")
+
+    shard = Path(summary["shards"][0])
+    parquet_file = pq.ParquetFile(str(shard))
+    assert parquet_file.schema_arrow == OUTPUT_PARQUET_SCHEMA
+    pool_column = parquet_file.metadata.row_group(0).column(
+        OUTPUT_PARQUET_SCHEMA.get_field_index("pool")
+    )
+    assert "RLE_DICTIONARY" in pool_column.encodings
+    assert pool_column.statistics.min == pool_column.statistics.max == "permissive"
+
+    table = ds.dataset(str(shard.parent), format="parquet").to_table(
+        columns=["text"], filter=ds.field("pool") == "permissive"
+    )
+    assert table.num_rows == 5
+
+    stage = collect_shard_stage(parquet_root / "combined")
+    assert stage["pools"]["permissive"]["files"] == 2
+    assert stage["pools"]["permissive"]["examples"][0]["lines_estimate"] in {2, 3}
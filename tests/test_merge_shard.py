@@ -3,20 +3,22 @@ from __future__ import annotations
 from collector_core.merge.shard import Sharder, sharding_cfg
 from collector_core.merge.types import ShardingConfig
 from collector_core.utils import read_jsonl
+from collector_core.utils.io import ZstdSettings
 
 
 def test_sharder_add_and_flush(tmp_path) -> None:
     cfg = ShardingConfig(max_records_per_shard=2, compression="gzip", prefix="combined")
     sharder = Sharder(tmp_path, cfg)
 
-    path, flushed = sharder.add({"text": "a"})
+    path, flushed = sharder.add({"text": "a", "content_sha256": "h1"})
     assert path is None
     assert flushed == []
 
-    path, flushed = sharder.add({"text": "b"})
+    path, flushed = sharder.add({"text": "b", "content_sha256": "h2"})
     assert path is not None
+    assert flushed == ["h1", "h2"]
+    sharder.flush()
     assert path.exists()
-    assert len(flushed) == 2
 
     records = list(read_jsonl(path))
     assert [row["text"] for row in records] == ["a", "b"]
@@ -47,15 +49,15 @@ def test_sharder_flush_partial_shard(tmp_path) -> None:
     sharder = Sharder(tmp_path, cfg)
 
     # Add fewer records than max
-    sharder.add({"text": "record1"})
-    sharder.add({"text": "record2"})
+    sharder.add({"text": "record1", "content_sha256": "h1"})
+    sharder.add({"text": "record2", "content_sha256": "h2"})
 
     # Manually flush partial shard
     path, flushed = sharder.flush()
 
     assert path is not None
     assert path.exists()
-    assert len(flushed) == 2
+    assert flushed == ["h1", "h2"]
 
 
 def test_sharder_no_compression(tmp_path) -> None:
@@ -68,6 +70,7 @@ def test_sharder_no_compression(tmp_path) -> None:
 
     assert path is not None
     assert path.suffix == ".jsonl"
+    sharder.flush()
     assert path.exists()
 
 
@@ -99,3 +102,45 @@ def test_sharding_cfg_missing_sharding_section() -> None:
     resolved = sharding_cfg(cfg)
     assert resolved.max_records_per_shard == 50000
     assert resolved.compression == "gzip"
+
+
+def test_sharder_rotates_on_byte_budget(tmp_path) -> None:
+    cfg = ShardingConfig(
+        max_records_per_shard=100, compression="gzip", prefix="combined", max_bytes_per_shard=64
+    )
+    sharder = Sharder(tmp_path, cfg)
+    paths = [sharder.add({"text": "x" * 40})[0] for _ in range(4)]
+    sharder.flush()
+
+    assert [p.name if p else None for p in paths] == [
+        None,
+        "combined_00000.jsonl.gz",
+        None,
+        "combined_00001.jsonl.gz",
+    ]
+    assert [len(list(read_jsonl(p))) for p in paths if p] == [2, 2]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_sharder_writes_zstd_shards(tmp_path) -> None:
+    cfg = {
+        "globals": {
+            "sharding": {
+                "max_records_per_shard": 2,
+                "compression": "zstd",
+                "zstd": {"level": 5, "threads": 0, "long_distance": True},
+            }
+        }
+    }
+    resolved = sharding_cfg(cfg)
+    assert resolved.zstd == ZstdSettings(level=5, threads=0, long_distance=True)
+    sharder = Sharder(tmp_path, resolved)
+
+    sharder.add({"text": "a", "content_sha256": "h1"})
+    path, flushed = sharder.add({"text": "b", "content_sha256": "h2"})
+
+    assert path is not None
+    assert path.name.endswith(".jsonl.zst")
+    assert flushed == ["h1", "h2"]
+    sharder.flush()
+    assert [row["text"] for row in read_jsonl(path)] == ["a", "b"]
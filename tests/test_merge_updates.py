@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from collector_core import merge as merge_worker
+from collector_core.merge.types import MergeRuntimeConfig, RootDefaults
+from collector_core.merge.updates import (
+    compact_shard_updates,
+    iter_shard_records,
+    shard_updates_path,
+    write_shard_updates,
+)
+from collector_core.utils.io import append_jsonl, read_jsonl
+
+
+def run_merge(root: Path, provenance_updates: str, **runtime: object) -> dict:
+    green_dir = root / "raw" / "green" / "permissive" / "target_a"
+    green_dir.mkdir(parents=True, exist_ok=True)
+    with (green_dir / "rows.jsonl").open("w", encoding="utf-8") as handle:
+        for idx in range(40):
+            # Every record reappears once its shard has been flushed.
+            handle.write(json.dumps({"text": f"record {idx % 20}", "source_urls": [f"u{idx}"]}))
+            handle.write("\n")
+    cfg = {
+        "globals": {
+            "raw_root": str(root / "raw"),
+            "screened_yellow_root": str(root / "screened_yellow"),
+            "combined_root": str(root / "combined"),
+            "ledger_root": str(root / "_ledger"),
+            "sharding": {"max_records_per_shard": 5, "compression": "gzip"},
+        },
+        "targets": [{"id": "target_a"}],
+    }
+    roots = merge_worker.resolve_roots(cfg, RootDefaults("", "", "", ""))
+    return merge_worker.merge_records(
+        cfg,
+        roots,
+        execute=True,
+        pipeline_id="test",
+        runtime=MergeRuntimeConfig(provenance_updates=provenance_updates, **runtime),
+    )
+
+
+def overlay_rows(summary: dict) -> list[tuple]:
+    return [
+        (
+            row["content_sha256"],
+            row["source_urls"],
+            [entry["source_urls"] for entry in row.get("provenance", {}).get("duplicates", [])],
+        )
+        for shard in summary["shards"]
+        for row in iter_shard_records(Path(shard))
+    ]
+
+
+@pytest.mark.parametrize("compressed", [True, False])
+def test_sidecar_overlay_and_compaction(tmp_path: Path, compressed: bool) -> None:
+    shard = (
+        tmp_path
+        / "permissive"
+        / "shards"
+        / ("combined_00000.jsonl.gz" if compressed else "combined_00000.jsonl")
+    )
+    append_jsonl(shard, [{"content_sha256": "a", "source_urls": ["x"]}, {"content_sha256": "b"}])
+    write_shard_updates(shard, {"a": {"source_urls": ["y"], "duplicates": [{"id": 1}]}})
+    write_shard_updates(shard, {"a": {"source_urls": ["z"], "duplicates": [{"id": 2}]}})
+    assert shard_updates_path(shard) == tmp_path / "permissive" / "shard_updates" / (
+        "combined_00000.jsonl"
+    )
+
+    overlaid = list(iter_shard_records(shard))
+    assert overlaid[0]["source_urls"] == ["x", "y", "z"]
+    assert overlaid[0]["provenance"]["duplicates"] == [{"id": 1}, {"id": 2}]
+    assert "provenance" not in overlaid[1]
+    assert "provenance" not in next(iter(read_jsonl(shard)))
+
+    assert compact_shard_updates(shard) is True
+    assert not shard_updates_path(shard).exists()
+    assert list(read_jsonl(shard)) == overlaid
+    assert compact_shard_updates(shard) is False
+
+
+def test_sidecar_merge_matches_rewrite(tmp_path: Path) -> None:
+    sidecar = run_merge(tmp_path / "sidecar", "sidecar")
+    rewrite = run_merge(tmp_path / "rewrite", "rewrite")
+
+    assert sidecar["counts"] == rewrite["counts"]
+    assert sidecar["updated_shards"] == rewrite["updated_shards"] == 4
+    sidecar_dir = tmp_path / "sidecar" / "combined" / "permissive" / "shard_updates"
+    assert len(list(sidecar_dir.glob("*.jsonl"))) == 4
+    assert not (tmp_path / "rewrite" / "combined" / "permissive" / "shard_updates").exists()
+    assert overlay_rows(sidecar) == overlay_rows(rewrite)
+
+
+@pytest.mark.parametrize("merge_workers", [1, 2])
+def test_merge_compacts_provenance_sidecars(tmp_path: Path, merge_workers: int) -> None:
+    rewrite = run_merge(tmp_path / "rewrite", "rewrite")
+    compacted = run_merge(
+        tmp_path / "compact", "sidecar", compact_provenance=True, merge_workers=merge_workers
+    )
+
+    assert compacted["compacted_shards"] == 4
+    assert not (tmp_path / "compact" / "combined" / "permissive" / "shard_updates").exists()
+    plain = [row for shard in compacted["shards"] for row in read_jsonl(Path(shard))]
+    assert plain == [
+        row for shard in compacted["shards"] for row in iter_shard_records(Path(shard))
+    ]
+    assert sorted(overlay_rows(compacted)) == sorted(overlay_rows(rewrite))
+
+
+def test_incremental_run_settles_outstanding_sidecars(tmp_path: Path) -> None:
+    first = run_merge(tmp_path, "sidecar", incremental=True)
+    updates_dir = tmp_path / "combined" / "permissive" / "shard_updates"
+    assert len(list(updates_dir.glob("*.jsonl"))) == 4
+
+    # No new inputs: the run only folds the sidecars written by the first one.
+    settled = run_merge(tmp_path, "sidecar", incremental=True, compact_provenance=True)
+    assert settled["written"] == 0
+    assert settled["compacted_shards"] == 4
+    assert not updates_dir.exists()
+    assert overlay_rows(first) == [
+        (
+            row["content_sha256"],
+            row["source_urls"],
+            [entry["source_urls"] for entry in row.get("provenance", {}).get("duplicates", [])],
+        )
+        for shard in first["shards"]
+        for row in read_jsonl(Path(shard))
+    ]
+
+
+def test_compact_provenance_from_config() -> None:
+    cfg = {"globals": {"merge": {"compact_provenance": True}}}
+    assert merge_worker.resolve_merge_runtime(cfg).compact_provenance is True
+    assert merge_worker.resolve_merge_runtime({}).compact_provenance is False
+
+
+def test_unknown_provenance_update_mode() -> None:
+    with pytest.raises(ValueError, match="Unknown provenance update mode"):
+        merge_worker.resolve_merge_runtime({}, provenance_updates="inline")
@@ -1,9 +1,27 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+import numpy as np
 import pytest
 from hypothesis import given, strategies as st
 
-from collector_core.checks.near_duplicate import _build_shingles, _jaccard, create_detector
+from collector_core.checks import near_duplicate
+from collector_core.checks.near_duplicate import (
+    INITIAL_CAPACITY,
+    NearDuplicateDetector,
+    _build_shingles,
+    _hash_jaccard,
+    _jaccard,
+    _minhash_permutations,
+    _minhash_signatures,
+    _PrefixIndex,
+    _shingle_hashes,
+    _ShingleHashStore,
+    _SignatureStore,
+    _SimhashIndex,
+    create_detector,
+)
 
 
 def test_python_detector_reports_duplicates_and_stats() -> None:
@@ -80,3 +98,172 @@ def test_build_shingles_size_matches_tokens(tokens: list[str], size: int) -> Non
         assert shingles == tokens
     else:
         assert len(shingles) == len(tokens) - size + 1
+
+
+def test_python_detector_stores_flat_shingle_hashes() -> None:
+    detector = create_detector(backend="python", threshold=0.5, shingle_size=1)
+    for idx in range(1500):
+        detector.add(f"doc-{idx}", f"alpha beta gamma token{idx}")
+    detector.add("doc-0", "ignored because the id is already indexed")
+
+    store = detector._store
+    assert len(detector) == 1500
+    assert store.data.dtype == np.uint64
+    assert store.offsets[len(detector)] == 1500 * 4
+    assert np.array_equal(
+        store.get_row(7), _shingle_hashes(["alpha", "beta", "gamma", "token7"], 1)
+    )
+
+    result = create_detector(backend="python", shingle_size=1)
+    result.add("a", "one two three four")
+    scored = result.query("one two three five")
+    assert scored.score == _jaccard(
+        ["one", "two", "three", "four"], ["one", "two", "three", "five"]
+    )
+
+
+def test_signature_store_estimates_jaccard_from_matrix() -> None:
+    store = _SignatureStore(4)
+    for idx in range(INITIAL_CAPACITY + 1):
+        store.add(f"doc-{idx}", np.array([idx, 1, 2, 3], dtype=np.uint64))
+
+    assert store.matrix.shape == (2 * INITIAL_CAPACITY, 4)
+    scores = store.similarities(np.array([5, 9]), np.array([5, 1, 2, 0], dtype=np.uint64))
+    assert scores.tolist() == [0.75, 0.5]
+
+
+def test_numpy_detector_batches_match_single_calls() -> None:
+    texts = [f"shared prefix words for document number {idx} with a tail" for idx in range(20)]
+    batched = create_detector(backend="numpy", threshold=0.5, num_perm=64, shingle_size=2)
+    single = create_detector(backend="numpy", threshold=0.5, num_perm=64, shingle_size=2)
+    batched.add_many((f"doc-{idx}", text) for idx, text in enumerate(texts))
+    for idx, text in enumerate(texts):
+        single.add(f"doc-{idx}", text)
+
+    assert np.array_equal(batched._store.matrix[:20], single._store.matrix[:20])
+    queries = [texts[3], "completely unrelated sentence here", ""]
+    many = batched.query_many(queries)
+    one = [single.query(text) for text in queries]
+    assert [(r.score, r.match_id, r.is_duplicate) for r in many] == [
+        (r.score, r.match_id, r.is_duplicate) for r in one
+    ]
+    assert many[0].match_id == "doc-3" and many[0].score == 1.0
+    assert many[0].backend == "numpy"
+    assert many[1].is_duplicate is False and many[2].candidates_checked == 0
+    assert batched.stats.indexed == 20 and batched.stats.queries == 3
+
+
+def test_minhash_signatures_estimate_jaccard(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(7)
+    shared = rng.integers(0, 2**63, size=300, dtype=np.uint64)
+    lhs = np.unique(np.concatenate([shared, rng.integers(0, 2**63, size=100, dtype=np.uint64)]))
+    rhs = np.unique(np.concatenate([shared, rng.integers(0, 2**63, size=100, dtype=np.uint64)]))
+    a, b = _minhash_permutations(256)
+
+    whole = _minhash_signatures([lhs, rhs], a, b)
+    monkeypatch.setattr(near_duplicate, "SIGNATURE_BLOCK_ROWS", 1)
+    assert np.array_equal(_minhash_signatures([lhs, rhs], a, b), whole)
+    estimate = (whole[0] == whole[1]).mean()
+    assert abs(estimate - _hash_jaccard(lhs, rhs)) < 0.1
+
+
+def test_python_detector_finds_best_match_beyond_first_candidates() -> None:
+    detector = create_detector(backend="python", threshold=0.6, shingle_size=1, max_candidates=5)
+    for idx in range(200):
+        detector.add(f"filler-{idx}", f"common words shared filler{idx} extra{idx}")
+    detector.add("target", "common words shared alpha beta gamma delta")
+    detector.add("closer", "common words shared alpha beta gamma delta epsilon")
+
+    result = detector.query("common words shared alpha beta gamma delta epsilon zeta")
+    assert result.match_id == "closer"
+    assert result.score == pytest.approx(8 / 9)
+    assert result.candidates_checked <= 5
+
+
+@given(
+    st.lists(st.sets(st.sampled_from("abcdefgh"), min_size=1), min_size=1, max_size=8),
+    st.sets(st.sampled_from("abcdefgh"), min_size=1),
+    st.sampled_from([0.3, 0.5, 0.8, 1.0]),
+)
+def test_prefix_index_keeps_every_pair_above_threshold(
+    docs: list[set[str]], query: set[str], threshold: float
+) -> None:
+    store = _ShingleHashStore()
+    index = _PrefixIndex(threshold)
+    for idx, doc in enumerate(docs):
+        hashes = _shingle_hashes(sorted(doc), 1)
+        index.add(idx, hashes)
+        store.add(f"doc-{idx}", hashes)
+    candidates = set(index.candidates(_shingle_hashes(sorted(query), 1), store))
+    for idx, doc in enumerate(docs):
+        if _jaccard(doc, query) >= threshold:
+            assert idx in candidates
+
+
+def test_simhash_detector_flags_within_hamming_tolerance() -> None:
+    words = [f"w{idx}" for idx in range(200)]
+    detector = create_detector(backend="simhash", shingle_size=1, hamming_bits=6)
+    detector.add_many(
+        (f"doc-{idx}", " ".join(words[idx:] + words[:idx])) for idx in range(0, 200, 20)
+    )
+    assert detector._store.all_signatures().nbytes == 8 * len(detector)
+
+    edited = words[:]
+    edited[7] = "changed"
+    result = detector.query(" ".join(edited))
+    assert result.backend == "simhash"
+    assert result.is_duplicate and result.match_id == "doc-0"
+    assert result.score >= 1 - 6 / 64
+    unrelated = detector.query(" ".join(f"other{idx}" for idx in range(200)))
+    assert not unrelated.is_duplicate
+    assert detector.settings()["hamming_bits"] == 6
+    with pytest.raises(ValueError, match="hamming_bits"):
+        create_detector(backend="simhash", hamming_bits=40)
+
+
+@given(
+    st.integers(min_value=0, max_value=2**64 - 1),
+    st.sets(st.integers(min_value=0, max_value=63), max_size=5),
+    st.integers(min_value=0, max_value=5),
+)
+def test_simhash_tables_find_every_fingerprint_within_tolerance(
+    fingerprint: int, flips: set[int], hamming_bits: int
+) -> None:
+    index = _SimhashIndex(hamming_bits)
+    stored = np.array([[fingerprint]], dtype=np.uint64)
+    index.insert(0, index.keys(stored)[0])
+    query = fingerprint
+    for bit in flips:
+        query ^= 1 << bit
+    candidates = index.candidates(index.keys(np.array([[query]], dtype=np.uint64))[0])
+    if len(flips) <= hamming_bits:
+        assert candidates == [0]
+
+
+@pytest.mark.parametrize("backend", ["numpy", "python", "simhash"])
+def test_detector_save_load_round_trip(tmp_path: Path, backend: str) -> None:
+    texts = [f"alpha beta gamma delta epsilon document {idx} zeta eta" for idx in range(30)]
+    detector = create_detector(backend=backend, threshold=0.6, shingle_size=2)
+    for idx, text in enumerate(texts[:20]):
+        detector.add(f"doc-{idx}", text)
+    index_path = tmp_path / "near_dedup_index"
+    detector.save(index_path)
+
+    loaded = NearDuplicateDetector.load(index_path)
+    assert loaded.settings() == detector.settings()
+    assert len(loaded) == 20 and "doc-3" in loaded and "doc-25" not in loaded
+    assert isinstance(np.load(index_path / "ids.npy", mmap_mode="r"), np.memmap)
+    for text in (texts[3], texts[25], "unrelated words only"):
+        before, after = detector.query(text), loaded.query(text)
+        assert (after.score, after.match_id) == (before.score, before.match_id)
+
+    for idx, text in enumerate(texts[20:], start=20):
+        loaded.add(f"doc-{idx}", text)
+    loaded.add("doc-3", "already indexed, ignored")
+    assert loaded.query(texts[25]).match_id == "doc-25"
+    loaded.save(index_path)
+    reloaded = NearDuplicateDetector.load(index_path, mmap=False)
+    assert len(reloaded) == 30
+    assert reloaded.query(texts[3]).match_id == "doc-3"
+    assert reloaded.query(texts[29]).match_id == "doc-29"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["near_dedup_index"]
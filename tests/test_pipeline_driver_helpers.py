@@ -64,6 +64,7 @@ def test_snapshot_evidence_manifest_redacts_headers(
         headers: dict[str, str] | None = None,
         max_bytes: int | None = None,
         allow_private_hosts: bool = False,
+        http: object | None = None,
     ) -> tuple[bytes | None, str | None, dict[str, object]]:
         return b"ok", "text/plain", {"retries": 0, "errors": [], "final_url": url}
 
@@ -91,6 +92,7 @@ def test_snapshot_evidence_write_mismatch_marks_error(
         headers: dict[str, str] | None = None,
         max_bytes: int | None = None,
         allow_private_hosts: bool = False,
+        http: object | None = None,
     ) -> tuple[bytes | None, str | None, dict[str, object]]:
         return b"ok", "text/plain", {"retries": 0, "errors": [], "final_url": url}
 
@@ -125,6 +127,7 @@ def test_snapshot_evidence_removes_stale_siblings(
         headers: dict[str, str] | None = None,
         max_bytes: int | None = None,
         allow_private_hosts: bool = False,
+        http: object | None = None,
     ) -> tuple[bytes | None, str | None, dict[str, object]]:
         return b"%PDF-1.4\nbody", "application/pdf", {"retries": 0, "errors": [], "final_url": url}
 
@@ -347,6 +350,7 @@ def test_fetch_evidence_batch_dedupes_duplicate_urls(
         headers: dict[str, str] | None = None,
         max_bytes: int | None = None,
         allow_private_hosts: bool = False,
+        http: object | None = None,
     ) -> tuple[bytes | None, str | None, dict[str, object]]:
         calls.append(url)
         return b"ok", "text/plain", {"retries": 0, "errors": [], "final_url": url}
@@ -376,6 +380,7 @@ def test_fetch_evidence_batch_dedupes_duplicate_urls(
         retry_max=1,
         retry_backoff=0.1,
         headers={"Authorization": "token"},
+        http=None,
     )
 
     evidence_fetching.fetch_evidence_batch(
@@ -404,6 +409,7 @@ def test_snapshot_evidence_cache_keys_include_headers(
         headers: dict[str, str] | None = None,
         max_bytes: int | None = None,
         allow_private_hosts: bool = False,
+        http: object | None = None,
     ) -> tuple[bytes | None, str | None, dict[str, object]]:
         calls.append(headers)
         return b"ok", "text/plain", {"retries": 0, "errors": [], "final_url": url}
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from collector_core import acquire_strategies as aw
+from collector_core.acquire.strategies import http as http_mod
+from collector_core.acquire.strategies.http import SegmentedDownload, segmented_kwargs
+
+PAYLOAD = bytes(range(256)) * (4 * 4096)  # 4 MiB: four 1 MiB segments
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        range_header = self.headers.get("Range")
+        self.server.ranges.append(range_header)  # type: ignore[attr-defined]
+        if range_header and self.server.ranges_supported:  # type: ignore[attr-defined]
+            first, _, last = range_header.removeprefix("bytes=").partition("-")
+            start, end = int(first), int(last) if last else len(PAYLOAD) - 1
+            body = PAYLOAD[start : end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        else:
+            body = PAYLOAD
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    httpd.daemon_threads = True
+    httpd.ranges = []  # type: ignore[attr-defined]
+    httpd.ranges_supported = True  # type: ignore[attr-defined]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_ctx(tmp_path: Path) -> aw.AcquireContext:
+    return aw.AcquireContext(
+        roots=aw.Roots(tmp_path / "raw", tmp_path / "m", tmp_path / "l", tmp_path / "logs"),
+        limits=aw.Limits(None, None, None),
+        mode=aw.RunMode(True, True, False, False, True, 1),
+        retry=aw.RetryConfig(max_attempts=2, backoff_base=0.0, backoff_max=0.0),
+        allow_non_global_download_hosts=True,
+    )
+
+
+def download_row(server: ThreadingHTTPServer, **download: object) -> dict:
+    url = f"http://127.0.0.1:{server.server_address[1]}/big.bin"
+    return {"id": "big", "download": {"strategy": "http", "url": url, **download}}
+
+
+def test_segmented_settings_from_download() -> None:
+    assert SegmentedDownload.from_download({}) is None
+    assert SegmentedDownload.from_download({"segments": 1}) is None
+    assert segmented_kwargs({"url": "https://example.org/a"}) == {}
+    config = SegmentedDownload.from_download({"segments": "3", "segmented_min_bytes": 10})
+    assert config == SegmentedDownload(segments=3, min_bytes=10)
+    assert config.plan(3 * http_mod.MIN_SEGMENT_BYTES + 1)[-1][1] == 3 * http_mod.MIN_SEGMENT_BYTES
+    # Small files are never split below MIN_SEGMENT_BYTES per segment.
+    assert config.plan(100) == [[0, 99, 0]]
+
+
+def test_segmented_download_fetches_ranges_in_parallel(
+    tmp_path: Path, server: ThreadingHTTPServer
+) -> None:
+    row = download_row(
+        server,
+        segments=4,
+        segmented_min_bytes=0,
+        expected_sha256=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+
+    results = http_mod.handle_http_single(make_ctx(tmp_path), row, tmp_path / "out")
+
+    out_path = tmp_path / "out" / "big.bin"
+    assert results[0]["status"] == "ok"
+    assert results[0]["segments"] == 4
+    assert results[0]["content_length"] == len(PAYLOAD)
+    assert out_path.read_bytes() == PAYLOAD
+    assert sorted(server.ranges) == sorted(  # type: ignore[attr-defined]
+        ["bytes=0-0", "bytes=0-1048575", "bytes=1048576-2097151"]
+        + ["bytes=2097152-3145727", "bytes=3145728-4194303"]
+    )
+    assert sorted(p.name for p in out_path.parent.iterdir()) == ["big.bin"]
+
+
+def test_segmented_download_resumes_unfinished_segments(
+    tmp_path: Path, server: ThreadingHTTPServer
+) -> None:
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    temp_path = out_dir / "big.bin.part"
+    with temp_path.open("wb") as f:
+        f.truncate(len(PAYLOAD))
+        f.write(PAYLOAD[:1_500_000])
+    url = download_row(server)["download"]["url"]
+    segments = SegmentedDownload(segments=4, min_bytes=0).plan(len(PAYLOAD))
+    segments[0][2] = segments[0][1] + 1
+    segments[1][2] = 1_500_000
+    (out_dir / "big.bin.part.segments.json").write_text(
+        json.dumps({"url": url, "resolved_url": url, "size": len(PAYLOAD), "segments": segments})
+    )
+
+    results = http_mod.handle_http_single(
+        make_ctx(tmp_path), download_row(server, segments=4, segmented_min_bytes=0), out_dir
+    )
+
+    assert results[0]["status"] == "ok"
+    assert results[0]["sha256"] == hashlib.sha256(PAYLOAD).hexdigest()
+    assert sorted(server.ranges) == [  # type: ignore[attr-defined]
+        "bytes=1500000-2097151",
+        "bytes=2097152-3145727",
+        "bytes=3145728-4194303",
+    ]
+    assert not (out_dir / "big.bin.part.segments.json").exists()
+
+
+def test_segmented_download_streams_without_range_support_or_below_threshold(
+    tmp_path: Path, server: ThreadingHTTPServer
+) -> None:
+    server.ranges_supported = False  # type: ignore[attr-defined]
+    ctx = make_ctx(tmp_path)
+
+    no_ranges = http_mod.handle_http_single(
+        ctx, download_row(server, segments=4, segmented_min_bytes=0), tmp_path / "a"
+    )
+    small = http_mod.handle_http_single(
+        ctx,
+        download_row(server, segments=4, expected_size=len(PAYLOAD)),
+        tmp_path / "b",
+    )
+
+    assert [r["status"] for r in no_ranges + small] == ["ok", "ok"]
+    assert "segments" not in no_ranges[0] and "segments" not in small[0]
+    assert (tmp_path / "a" / "big.bin").read_bytes() == PAYLOAD
+    # One probe for the first target; the second is below the 64 MiB default threshold.
+    assert server.ranges == ["bytes=0-0", None, None]  # type: ignore[attr-defined]
+
+
+def test_segmented_download_keeps_sha256_check(tmp_path: Path, server: ThreadingHTTPServer) -> None:
+    row = download_row(server, segments=2, segmented_min_bytes=0, expected_sha256="0" * 64)
+
+    results = http_mod.handle_http_single(make_ctx(tmp_path), row, tmp_path / "out")
+
+    assert results[0]["status"] == "error"
+    assert results[0]["error"] == "sha256_mismatch"
+    assert list((tmp_path / "out").iterdir()) == []
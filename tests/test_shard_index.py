@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from collector_core.merge.updates import rewrite_shard_with_updates
+from collector_core.shard_index import (
+    count_shard_records,
+    iter_shard_range,
+    load_shard_index,
+    read_shard_record,
+    shard_index_path,
+)
+from collector_core.sharding import AtomicShardWriter, StreamingShardWriter
+from collector_core.utils.io import read_jsonl
+
+SUFFIXES = {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+def rows(count: int) -> list[dict]:
+    return [{"idx": idx, "content_sha256": f"{(idx * 7) % count:064x}"} for idx in range(count)]
+
+
+def write_atomic(path: Path, compression: str, records: list[dict], index_every: int) -> None:
+    with AtomicShardWriter(
+        path, compression=compression, auto_complete=False, index_every=index_every
+    ) as writer:
+        for record in records:
+            writer.write_record(record)
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+def test_streaming_writer_index_seeks_to_any_record(tmp_path: Path, compression: str) -> None:
+    writer = StreamingShardWriter(
+        tmp_path, prefix="shard", compression=compression, max_records=10, index_every=3
+    )
+    shard = [writer.write(record) for record in rows(10)][-1]
+    assert shard is not None and writer.close() is None
+
+    assert shard_index_path(shard) == tmp_path / "shard_00000.index.json"
+    index = load_shard_index(shard)
+    assert index is not None
+    assert (index.records, index.records_per_block) == (10, 3)
+    assert len(index.block_offsets) == 4
+    assert index.min_content_sha256 == f"{0:064x}"
+    assert index.max_content_sha256 == f"{9:064x}"
+    assert count_shard_records(shard) == 10
+    assert [read_shard_record(shard, k)["idx"] for k in range(10)] == list(range(10))
+    assert [row["idx"] for row in iter_shard_range(shard, 4, 8)] == [4, 5, 6, 7]
+    splits = index.splits(2)
+    assert splits == [(0, 6), (6, 10)]
+    covered = [row["idx"] for start, stop in splits for row in iter_shard_range(shard, start, stop)]
+    assert covered == list(range(10))
+    assert [row["idx"] for row in read_jsonl(shard)] == list(range(10))
+    with pytest.raises(IndexError):
+        read_shard_record(shard, 10)
+
+
+def test_stale_or_disabled_index_is_ignored(tmp_path: Path) -> None:
+    shard = tmp_path / "shard_00000.jsonl.gz"
+    write_atomic(shard, "gzip", rows(5), index_every=2)
+    assert count_shard_records(shard) == 5
+
+    with shard.open("ab") as handle:
+        handle.write(b"\n")
+    assert load_shard_index(shard) is None
+    with pytest.raises(FileNotFoundError):
+        read_shard_record(shard, 0)
+
+    unindexed = tmp_path / "shard_00001.jsonl"
+    write_atomic(unindexed, "none", rows(5), index_every=0)
+    assert not shard_index_path(unindexed).exists()
+    assert count_shard_records(unindexed) is None
+
+
+def read_rows(path: Path) -> list[dict]:
+    out = list(read_jsonl(path))
+    for row in out:
+        row.pop("timestamp_updated", None)
+    return out
+
+
+# The line-by-line fallback rewrite only handles plain and gzip shards.
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+def test_indexed_rewrite_matches_full_rewrite(tmp_path: Path, compression: str) -> None:
+    records = rows(10)
+    indexed = tmp_path / "indexed" / f"shard_00000{SUFFIXES[compression]}"
+    plain = tmp_path / "plain" / f"shard_00000{SUFFIXES[compression]}"
+    write_atomic(indexed, compression, records, index_every=4)
+    write_atomic(plain, compression, records, index_every=0)
+    before = load_shard_index(indexed)
+    assert before is not None
+    untouched = indexed.read_bytes()[before.block_offsets[0] : before.block_offsets[1]]
+
+    updates = {records[5]["content_sha256"]: {"source_urls": ["u5"]}}
+    rewrite_shard_with_updates(indexed, updates)
+    rewrite_shard_with_updates(plain, updates)
+
+    assert read_rows(indexed) == read_rows(plain)
+    assert [row["idx"] for row in read_rows(indexed)] == list(range(10))
+    after = load_shard_index(indexed)
+    assert after is not None
+    assert after.records == 10
+    assert indexed.read_bytes()[after.block_offsets[0] : after.block_offsets[1]] == untouched
+    assert read_shard_record(indexed, 5)["source_urls"] == ["u5"]
+
+
+def test_indexed_rewrite_handles_zstd_shards(tmp_path: Path) -> None:
+    records = rows(10)
+    shard = tmp_path / "shard_00000.jsonl.zst"
+    write_atomic(shard, "zstd", records, index_every=4)
+
+    rewrite_shard_with_updates(shard, {records[9]["content_sha256"]: {"source_urls": ["u9"]}})
+
+    rewritten = read_rows(shard)
+    assert rewritten[:9] == records[:9]
+    assert rewritten[9]["source_urls"] == ["u9"]
+    assert count_shard_records(shard) == 10
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from collector_core.sharding import StreamingShardWriter
+from collector_core.utils.io import read_jsonl
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+@pytest.mark.parametrize("background", [True, False])
+def test_streaming_writer_round_trips_and_rotates(
+    tmp_path: Path, compression: str, background: bool
+) -> None:
+    writer = StreamingShardWriter(
+        tmp_path,
+        prefix="shard",
+        compression=compression,
+        max_records=3,
+        background=background,
+        chunk_bytes=16,
+    )
+    closed = [writer.write({"idx": idx}) for idx in range(7)]
+    last = writer.close()
+
+    finished = [path for path in closed if path] + [last]
+    assert [p.name.split(".")[0] for p in finished] == ["shard_00000", "shard_00001", "shard_00002"]
+    rows = [row["idx"] for path in finished for row in read_jsonl(path)]
+    assert rows == list(range(7))
+    assert writer.close() is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_streaming_writer_abort_drops_open_shard(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError):
+        with StreamingShardWriter(tmp_path, prefix="shard", max_records=2) as writer:
+            for idx in range(3):
+                writer.write({"idx": idx})
+            raise RuntimeError("boom")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "shard_00000.index.json",
+        "shard_00000.jsonl",
+    ]
+
+
+def test_streaming_writer_surfaces_background_errors(tmp_path: Path) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    writer = StreamingShardWriter(blocker / "shards", prefix="shard")
+    writer.write({"idx": 0})
+    with pytest.raises(OSError):
+        writer.close()
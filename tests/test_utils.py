@@ -8,6 +8,7 @@ import zipfile
 from pathlib import Path
 import pytest
 from collector_core.utils import (
+    LedgerWriter,
     append_jsonl,
     coerce_int,
     contains_any,
@@ -26,6 +27,22 @@ from collector_core.utils import (
     write_json,
     write_jsonl,
 )
+from collector_core.utils import io as utils_io
+from collector_core.utils.io import (
+    JSON_CODEC_ENV,
+    JSON_CODECS,
+    JsonlReadStats,
+    ZstdSettings,
+    get_json_codec,
+    get_zstd_settings,
+    read_jsonl,
+    read_jsonl_batches,
+    resolve_json_codec,
+    set_json_codec,
+    set_zstd_settings,
+    train_zstd_dictionary,
+    zstd_dictionary_path,
+)
 
 
 class TestUtcNow:
@@ -193,6 +210,192 @@ class TestJsonlIO:
         with pytest.raises(FileNotFoundError):
             read_jsonl_list(file)
 
+    @pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz", ".jsonl.zst"])
+    @pytest.mark.parametrize("read_ahead", [False, True])
+    def test_read_jsonl_blocks_count_malformed_lines(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, suffix: str, read_ahead: bool
+    ):
+        """Records spanning block boundaries decode; malformed lines are counted, not raised."""
+        monkeypatch.setattr(utils_io, "JSONL_READ_AHEAD", read_ahead)
+        file = tmp_path / f"rows{suffix}"
+        rows = [{"n": idx, "text": "x" * idx} for idx in range(40)]
+        write_jsonl(file, rows[:20])
+        # Appended gzip members / zstd frames, a bad line and a final line without newline.
+        append_jsonl(file, rows[20:39])
+        with utils_io.open_binary(file, "ab") as handle:
+            handle.write(b'{"n": broken\n\n   \n' + utils_io.json_dumps(rows[39]))
+
+        stats = JsonlReadStats()
+        assert list(read_jsonl(file, stats=stats, block_size=7)) == rows
+        assert (stats.files, stats.records, stats.malformed) == (1, 40, 1)
+        batches = list(read_jsonl_batches(file, batch_size=16, block_size=64))
+        assert [len(batch) for batch in batches] == [16, 16, 8]
+        assert [row for batch in batches for row in batch] == rows
+
+
+def _available_codecs() -> list[str]:
+    available = []
+    for name in JSON_CODECS:
+        try:
+            resolve_json_codec(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+@pytest.fixture
+def restore_json_codec():
+    previous = get_json_codec()
+    yield
+    set_json_codec(previous.name)
+
+
+class TestJsonCodec:
+    ROWS = [
+        {"text": "héllo ✓", "n": 3, "f": 0.1, "nested": {"list": [1, None, True]}},
+        {"empty": "", "escape": 'quote " and \\ backslash\nnewline'},
+    ]
+
+    def test_stdlib_codec_matches_json_dumps_bytes(self):
+        import json
+
+        codec = resolve_json_codec("stdlib")
+        for row in self.ROWS:
+            assert codec.dumps(row) == json.dumps(row, ensure_ascii=False).encode("utf-8")
+
+    @pytest.mark.parametrize("name", _available_codecs())
+    def test_codecs_round_trip_and_fall_back(self, name: str):
+        import json
+
+        codec = resolve_json_codec(name)
+        for row in self.ROWS:
+            assert codec.loads(codec.dumps(row)) == row
+            assert codec.loads(codec.dumps(row).decode("utf-8")) == row
+        assert codec.loads(codec.dumps({1: "int key"})) == {"1": "int key"}
+        assert codec.loads(b'{"v": NaN}')["v"] != 0
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"{broken")
+
+    @pytest.mark.parametrize("name", _available_codecs())
+    def test_jsonl_files_round_trip_with_each_codec(
+        self, tmp_path: Path, name: str, restore_json_codec
+    ):
+        set_json_codec(name)
+        for suffix in ("jsonl", "jsonl.gz", "jsonl.zst"):
+            file = tmp_path / f"{name}.{suffix}"
+            write_jsonl(file, self.ROWS)
+            append_jsonl(file, self.ROWS[:1])
+            assert read_jsonl_list(file) == [*self.ROWS, self.ROWS[0]]
+        assert (tmp_path / f"{name}.jsonl.gz").read_bytes()[:2] == b"\x1f\x8b"
+
+    def test_codec_selection(self, monkeypatch: pytest.MonkeyPatch, restore_json_codec):
+        from collector_core.utils import io as io_utils
+
+        monkeypatch.setenv(JSON_CODEC_ENV, "stdlib")
+        monkeypatch.setattr(io_utils, "_JSON_CODEC", None)
+        assert get_json_codec().name == "stdlib"
+        assert set_json_codec("auto").name == _available_codecs()[0]
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            set_json_codec("yaml")
+
+    def test_read_jsonl_drops_undecodable_bytes(self, tmp_path: Path):
+        file = tmp_path / "mixed.jsonl"
+        file.write_bytes(b'{"a": 1}\n{"b": "x\xffy"}\r\nnot json\n\n{"c": 3}')
+        assert read_jsonl_list(file) == [{"a": 1}, {"b": "xy"}, {"c": 3}]
+
+
+class TestLedgerWriter:
+    def test_buffers_until_close(self, tmp_path: Path):
+        file = tmp_path / "ledger" / "rows.jsonl"
+        with LedgerWriter(max_rows=100, flush_interval=3600) as ledger:
+            ledger.append(file, {"a": 1})
+            ledger.extend(file, [{"b": 2}, {"c": 3}])
+            assert file.read_bytes() == b""
+        assert read_jsonl_list(file) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+    def test_flushes_on_row_threshold(self, tmp_path: Path):
+        file = tmp_path / "rows.jsonl"
+        ledger = LedgerWriter(max_rows=2, flush_interval=3600)
+        ledger.append(file, {"a": 1})
+        ledger.append(file, {"b": 2})
+        assert read_jsonl_list(file) == [{"a": 1}, {"b": 2}]
+        ledger.close()
+        assert ledger.closed
+
+    def test_appends_to_existing_compressed_files(self, tmp_path: Path):
+        for name in ("rows.jsonl.gz", "rows.jsonl.zst"):
+            file = tmp_path / name
+            append_jsonl(file, [{"a": 1}])
+            with LedgerWriter(max_rows=1) as ledger:
+                ledger.append(file, {"b": 2})
+                ledger.append(file, {"c": 3})
+            assert read_jsonl_list(file) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+    def test_rejects_writes_after_close(self, tmp_path: Path):
+        ledger = LedgerWriter()
+        ledger.close()
+        with pytest.raises(ValueError, match="closed"):
+            ledger.append(tmp_path / "rows.jsonl", {"a": 1})
+
+
+@pytest.fixture
+def restore_zstd_settings():
+    previous = get_zstd_settings()
+    yield
+    set_zstd_settings(previous)
+
+
+class TestZstd:
+    @staticmethod
+    def ledger_rows(count: int, offset: int = 0) -> list[dict]:
+        return [
+            {"content_sha256": f"{idx * 7919:064x}", "target_id": f"t{idx % 7}", "event": "seen"}
+            for idx in range(offset, offset + count)
+        ]
+
+    def test_settings_from_config(self):
+        settings = ZstdSettings.from_dict({"level": 9, "threads": 0, "long_distance": True})
+        assert settings == ZstdSettings(level=9, threads=0, long_distance=True)
+        assert ZstdSettings.from_dict(None) == ZstdSettings()
+        assert not ZstdSettings.from_dict({"dictionary": False}).use_dictionary
+
+    def test_long_distance_round_trip(self, tmp_path: Path, restore_zstd_settings):
+        set_zstd_settings(ZstdSettings(level=1, long_distance=True))
+        file = tmp_path / "long.jsonl.zst"
+        write_jsonl(file, self.ledger_rows(50))
+        assert read_jsonl_list(file) == self.ledger_rows(50)
+
+    def test_dictionary_frames_round_trip(self, tmp_path: Path, restore_zstd_settings):
+        import zstandard as zstd
+
+        samples = [utils_io.json_dumps(row) + b"\n" for row in self.ledger_rows(2000, 5000)]
+        dict_path = train_zstd_dictionary(samples, tmp_path, size=8192)
+        assert zstd_dictionary_path(tmp_path).read_bytes() == dict_path.read_bytes()
+
+        with_dict = tmp_path / "with_dict.jsonl.zst"
+        without = tmp_path / "without" / "rows.jsonl.zst"
+        for row in self.ledger_rows(200):
+            append_jsonl(with_dict, [row])
+            append_jsonl(without, [row])
+        assert read_jsonl_list(with_dict) == self.ledger_rows(200)
+        assert with_dict.stat().st_size < without.stat().st_size / 2
+        first_id = zstd.get_frame_parameters(with_dict.read_bytes()).dict_id
+        assert dict_path.name == f"zstd-{first_id}.dict"
+
+        # A retrained dictionary applies to new files; existing ones keep theirs.
+        train_zstd_dictionary(samples[::-1][:1500], tmp_path, size=4096)
+        append_jsonl(with_dict, self.ledger_rows(1, 200))
+        assert read_jsonl_list(with_dict) == self.ledger_rows(201)
+        set_zstd_settings(ZstdSettings(use_dictionary=False))
+        plain = tmp_path / "plain.jsonl.zst"
+        append_jsonl(plain, self.ledger_rows(3))
+        assert zstd.get_frame_parameters(plain.read_bytes()).dict_id == 0
+
+        dict_path.unlink()
+        with pytest.raises(OSError, match="dictionary"):
+            read_jsonl_list(with_dict)
+
 
 class TestSafeFilename:
     def test_replaces_special_chars(self):